@@ -18,8 +18,9 @@ import mlflow.sagemaker.cli
 import mlflow.store.artifact.cli
 import mlflow.store.db.utils
 from mlflow import tracking
+from mlflow.exceptions import MlflowException
 from mlflow.server import _run_server
-from mlflow.server.handlers import initialize_backend_stores
+from mlflow.server.handlers import initialize_backend_stores, _response_cache_registry
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow.utils import cli_args
 from mlflow.utils.logging_utils import eprint
@@ -138,8 +139,15 @@ def run(uri, entry_point, version, param_list, experiment_name, experiment_id, b
         sys.exit(1)
 
 
-def _validate_server_args(gunicorn_opts=None, workers=None, waitress_opts=None):
-    if sys.platform == "win32":
+def _validate_server_args(gunicorn_opts=None, workers=None, waitress_opts=None, asgi=False):
+    if asgi:
+        if gunicorn_opts is not None or waitress_opts is not None:
+            raise NotImplementedError(
+                "uvicorn replaces gunicorn and waitress in ASGI mode, "
+                "cannot specify --gunicorn-opts or --waitress-opts")
+        if sys.version_info < (3, 6):
+            raise NotImplementedError("ASGI mode requires Python 3.6 or later")
+    elif sys.platform == "win32":
         if gunicorn_opts is not None or workers is not None:
             raise NotImplementedError(
                 "waitress replaces gunicorn on Windows, "
@@ -241,8 +249,53 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
               help="Path to the directory where metrics will be stored. If the directory"
                    "doesn't exist, it will be created."
                    "Activate prometheus exporter to expose metrics on /metrics endpoint.")
+@click.option("--response-cache-uri", metavar="URI", default=None,
+              help="URI of a cache in which to store responses to read-heavy endpoints "
+                   "(e.g. search-runs, get-history). Use 'memory://' to cache responses in the "
+                   "memory of each worker, optionally configured as "
+                   "'memory://?max_entries=1024&ttl_seconds=5'. Since each worker has its own "
+                   "cache, in-memory entries may be stale for up to ttl_seconds when running "
+                   "more than one worker. By default, responses are not cached.")
+@click.option("--asgi", is_flag=True, default=False,
+              help="Serve the tracking server as an ASGI application using uvicorn instead of "
+                   "gunicorn or waitress. Requests are handled in a bounded pool of threads in "
+                   "each worker and responses such as artifact downloads are streamed "
+                   "asynchronously. Requires the uvicorn package.")
+@click.option("--asgi-max-threads", type=click.INT, default=None,
+              help="Maximum number of requests handled concurrently by each worker in ASGI "
+                   "mode. Default: 16.")
+@click.option("--slow-request-threshold", type=click.FLOAT, default=None, metavar="SECONDS",
+              help="If specified, log a warning including the parsed request for each REST API "
+                   "request that takes at least this many seconds to handle.")
+@click.option("--rate-limit", type=click.FLOAT, default=None, metavar="REQUESTS_PER_SECOND",
+              help="If specified, maximum average number of requests per second each client "
+                   "(identified by its IP address, see --rate-limit-trust-auth) "
+                   "can make to each worker. Requests exceeding the limit receive a 429 response, "
+                   "which MLflow clients retry with exponential backoff.")
+@click.option("--rate-limit-burst", type=click.INT, default=None,
+              help="Maximum number of requests each client can make at once to each worker when "
+                   "--rate-limit is specified. Defaults to the rate limit.")
+@click.option("--rate-limit-trust-auth", is_flag=True, default=False,
+              help="Identify clients for --rate-limit by the basic authentication user or bearer "
+                   "token of their Authorization header instead of their IP address. The server "
+                   "does not verify this header, so only use this option if a proxy in front of "
+                   "the server authenticates requests.")
+@click.option("--max-concurrent-expensive-requests", type=click.INT, default=None,
+              help="If specified, maximum number of requests to expensive endpoints (run search, "
+                   "artifact listing and artifact download) handled concurrently by each "
+                   "worker. Requests exceeding the limit receive a 429 response.")
+@click.option("--max-concurrent-long-polls", type=click.IntRange(min=0), default=None,
+              help="Maximum number of registry event requests waiting for new events (long "
+                   "polls) handled concurrently by each worker. Requests exceeding the limit "
+                   "receive a 429 response. Long polls hold a worker thread for up to 20 seconds, "
+                   "so they need threaded or asynchronous workers: the limit defaults to 2 with "
+                   "--asgi, and to 0 otherwise, which returns these requests immediately. Only set "
+                   "it with threaded gunicorn workers (e.g. --gunicorn-opts '--threads 8').")
 def server(backend_store_uri, default_artifact_root, host, port,
-           workers, static_prefix, gunicorn_opts, waitress_opts, expose_prometheus):
+           workers, static_prefix, gunicorn_opts, waitress_opts, expose_prometheus,
+           response_cache_uri, asgi, asgi_max_threads, slow_request_threshold, rate_limit,
+           rate_limit_burst, rate_limit_trust_auth, max_concurrent_expensive_requests,
+           max_concurrent_long_polls):
     """
     Run the MLflow tracking server.
 
@@ -252,7 +305,8 @@ def server(backend_store_uri, default_artifact_root, host, port,
     (or a specific interface address).
     """
 
-    _validate_server_args(gunicorn_opts=gunicorn_opts, workers=workers, waitress_opts=waitress_opts)
+    _validate_server_args(gunicorn_opts=gunicorn_opts, workers=workers, waitress_opts=waitress_opts,
+                          asgi=asgi)
 
     # Ensure that both backend_store_uri and default_artifact_uri are set correctly.
     if not backend_store_uri:
@@ -273,9 +327,19 @@ def server(backend_store_uri, default_artifact_root, host, port,
         _logger.exception(e)
         sys.exit(1)
 
+    if response_cache_uri:
+        try:
+            _response_cache_registry.get_cache(response_cache_uri)
+        except MlflowException as e:
+            eprint(e.message)
+            sys.exit(1)
+
     try:
         _run_server(backend_store_uri, default_artifact_root, host, port,
-                    static_prefix, workers, gunicorn_opts, waitress_opts, expose_prometheus)
+                    static_prefix, workers, gunicorn_opts, waitress_opts, expose_prometheus,
+                    response_cache_uri, asgi, asgi_max_threads, slow_request_threshold,
+                    rate_limit, rate_limit_burst, max_concurrent_expensive_requests,
+                    rate_limit_trust_auth, max_concurrent_long_polls)
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
         sys.exit(1)
@@ -1,5 +1,6 @@
 from mlflow.entities._mlflow_object import _MLflowObject
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
+from mlflow.utils.proto_json_utils import double_to_json, int64_to_json, omit_unset_fields
 
 
 class Metric(_MLflowObject):
@@ -41,6 +42,15 @@ class Metric(_MLflowObject):
         metric.step = self.step
         return metric
 
+    def _to_json_dict(self):
+        """JSON-ready dictionary equivalent to ``message_to_json(self.to_proto())``."""
+        return omit_unset_fields({
+            "key": self.key,
+            "value": double_to_json(self.value),
+            "timestamp": int64_to_json(self.timestamp),
+            "step": int64_to_json(self.step),
+        })
+
     @classmethod
     def from_proto(cls, proto):
         return cls(proto.key, proto.value, proto.timestamp, proto.step)
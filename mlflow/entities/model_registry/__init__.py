@@ -2,10 +2,12 @@ from mlflow.entities.model_registry.registered_model import RegisteredModel
 from mlflow.entities.model_registry.registered_model_detailed import RegisteredModelDetailed
 from mlflow.entities.model_registry.model_version import ModelVersion
 from mlflow.entities.model_registry.model_version_detailed import ModelVersionDetailed
+from mlflow.entities.model_registry.registry_event import RegistryEvent
 
 __all__ = [
     "RegisteredModel",
     "RegisteredModelDetailed",
     "ModelVersion",
-    "ModelVersionDetailed"
+    "ModelVersionDetailed",
+    "RegistryEvent"
 ]
@@ -0,0 +1,89 @@
+from mlflow.entities.model_registry._model_registry_entity import _ModelRegistryEntity
+from mlflow.entities.model_registry.registry_event_type import RegistryEventType
+from mlflow.protos.model_registry_pb2 import RegistryEvent as ProtoRegistryEvent
+
+
+class RegistryEvent(_ModelRegistryEntity):
+    """
+    .. note::
+        Experimental: This entity may change or be removed in a future release without warning.
+
+    MLflow entity for Registry Event.
+    A registry event records a change made to a registered model or to one of its versions.
+    Events are numbered consecutively in the order in which their changes were committed.
+    """
+
+    def __init__(self, sequence, timestamp, event_type, name, version=None, stage=None,
+                 previous_name=None):
+        # Constructor is called only from within the system by various backend stores.
+        super(RegistryEvent, self).__init__()
+        self._sequence = sequence
+        self._timestamp = timestamp
+        self._event_type = event_type
+        self._name = name
+        self._version = version
+        self._stage = stage
+        self._previous_name = previous_name
+
+    @property
+    def sequence(self):
+        """Integer. Sequence number of the event."""
+        return self._sequence
+
+    @property
+    def timestamp(self):
+        """Integer. Timestamp of the change (milliseconds since the Unix epoch)."""
+        return self._timestamp
+
+    @property
+    def event_type(self):
+        """String. Type of the change, such as ``TRANSITION_MODEL_VERSION_STAGE``."""
+        return self._event_type
+
+    @property
+    def name(self):
+        """String. Name of the registered model after the change."""
+        return self._name
+
+    @property
+    def version(self):
+        """Integer. Version number of the model version, for changes to a model version."""
+        return self._version
+
+    @property
+    def stage(self):
+        """String. New stage of the model version, for stage transitions."""
+        return self._stage
+
+    @property
+    def previous_name(self):
+        """String. Name of the registered model before it was renamed, for renames."""
+        return self._previous_name
+
+    # proto mappers
+    @classmethod
+    def from_proto(cls, proto):
+        # input: mlflow.protos.model_registry_pb2.RegistryEvent
+        # returns: RegistryEvent entity
+        return cls(proto.sequence,
+                   proto.timestamp,
+                   RegistryEventType.to_string(proto.event_type),
+                   proto.name,
+                   proto.version if proto.HasField("version") else None,
+                   proto.stage if proto.HasField("stage") else None,
+                   proto.previous_name if proto.HasField("previous_name") else None)
+
+    def to_proto(self):
+        # returns mlflow.protos.model_registry_pb2.RegistryEvent
+        registry_event = ProtoRegistryEvent()
+        registry_event.sequence = self.sequence
+        registry_event.timestamp = self.timestamp
+        registry_event.event_type = RegistryEventType.from_string(self.event_type)
+        registry_event.name = self.name
+        if self.version is not None:
+            registry_event.version = self.version
+        if self.stage is not None:
+            registry_event.stage = self.stage
+        if self.previous_name is not None:
+            registry_event.previous_name = self.previous_name
+        return registry_event
@@ -0,0 +1,32 @@
+from mlflow.protos.model_registry_pb2 import RegistryEventType as ProtoRegistryEventType
+
+
+class RegistryEventType(object):
+    """Enum for type of an :py:class:`mlflow.entities.model_registry.RegistryEvent`."""
+    CREATE_REGISTERED_MODEL = ProtoRegistryEventType.Value('CREATE_REGISTERED_MODEL')
+    RENAME_REGISTERED_MODEL = ProtoRegistryEventType.Value('RENAME_REGISTERED_MODEL')
+    UPDATE_REGISTERED_MODEL = ProtoRegistryEventType.Value('UPDATE_REGISTERED_MODEL')
+    DELETE_REGISTERED_MODEL = ProtoRegistryEventType.Value('DELETE_REGISTERED_MODEL')
+    CREATE_MODEL_VERSION = ProtoRegistryEventType.Value('CREATE_MODEL_VERSION')
+    TRANSITION_MODEL_VERSION_STAGE = ProtoRegistryEventType.Value('TRANSITION_MODEL_VERSION_STAGE')
+    UPDATE_MODEL_VERSION = ProtoRegistryEventType.Value('UPDATE_MODEL_VERSION')
+    DELETE_MODEL_VERSION = ProtoRegistryEventType.Value('DELETE_MODEL_VERSION')
+
+    _STRING_TO_TYPE = {k: ProtoRegistryEventType.Value(k) for k in ProtoRegistryEventType.keys()}
+    _TYPE_TO_STRING = {value: key for key, value in _STRING_TO_TYPE.items()}
+
+    @staticmethod
+    def from_string(type_str):
+        if type_str not in RegistryEventType._STRING_TO_TYPE:
+            raise Exception(
+                "Could not get registry event type corresponding to string %s. Valid type "
+                "strings: %s" % (type_str, list(RegistryEventType._STRING_TO_TYPE.keys())))
+        return RegistryEventType._STRING_TO_TYPE[type_str]
+
+    @staticmethod
+    def to_string(event_type):
+        if event_type not in RegistryEventType._TYPE_TO_STRING:
+            raise Exception("Could not get string corresponding to registry event type %s. Valid "
+                            "types: %s" % (event_type,
+                                           list(RegistryEventType._TYPE_TO_STRING.keys())))
+        return RegistryEventType._TYPE_TO_STRING[event_type]
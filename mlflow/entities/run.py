@@ -41,6 +41,13 @@ class Run(_MLflowObject):
             run.data.MergeFrom(self.data.to_proto())
         return run
 
+    def _to_json_dict(self):
+        """JSON-ready dictionary equivalent to ``message_to_json(self.to_proto())``."""
+        run = {"info": self.info._to_json_dict()}
+        if self.data:
+            run["data"] = self.data._to_json_dict()
+        return run
+
     @classmethod
     def from_proto(cls, proto):
         return cls(RunInfo.from_proto(proto.info), RunData.from_proto(proto.data))
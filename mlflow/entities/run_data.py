@@ -60,6 +60,17 @@ class RunData(_MLflowObject):
         run_data.tags.extend([ProtoRunTag(key=key, value=val) for key, val in self.tags.items()])
         return run_data
 
+    def _to_json_dict(self):
+        """JSON-ready dictionary equivalent to ``message_to_json(self.to_proto())``."""
+        run_data = {}
+        if self._metric_objs:
+            run_data["metrics"] = [m._to_json_dict() for m in self._metric_objs]
+        if self.params:
+            run_data["params"] = [{"key": key, "value": val} for key, val in self.params.items()]
+        if self.tags:
+            run_data["tags"] = [{"key": key, "value": val} for key, val in self.tags.items()]
+        return run_data
+
     def to_dictionary(self):
         return {
             "metrics": self.metrics,
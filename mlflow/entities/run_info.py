@@ -4,6 +4,7 @@ from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
 
 from mlflow.protos.service_pb2 import RunInfo as ProtoRunInfo
+from mlflow.utils.proto_json_utils import int64_to_json, omit_unset_fields
 
 
 def check_run_is_active(run_info):
@@ -139,6 +140,23 @@ class RunInfo(_MLflowObject):
         proto.lifecycle_stage = self.lifecycle_stage
         return proto
 
+    def _to_json_dict(self):
+        """JSON-ready dictionary equivalent to ``message_to_json(self.to_proto())``."""
+        info = {
+            "run_uuid": self.run_uuid,
+            "experiment_id": self.experiment_id,
+            "user_id": self.user_id,
+            "status": RunStatus.to_string(RunStatus.from_string(self.status)),
+            "start_time": int64_to_json(self.start_time),
+        }
+        if self.end_time:
+            info["end_time"] = int64_to_json(self.end_time)
+        if self.artifact_uri:
+            info["artifact_uri"] = self.artifact_uri
+        info["lifecycle_stage"] = self.lifecycle_stage
+        info["run_id"] = self.run_id
+        return omit_unset_fields(info)
+
     @classmethod
     def from_proto(cls, proto):
         end_time = proto.end_time
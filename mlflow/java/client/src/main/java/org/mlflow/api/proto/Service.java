@@ -34685,6 +34685,1611 @@ public final class Service {
 
   }
 
+  public interface GetRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.GetRuns)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
+     */
+    java.util.List<java.lang.String>
+        getRunIdsList();
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
+     */
+    int getRunIdsCount();
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The runIds at the given index.
+     */
+    java.lang.String getRunIds(int index);
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the runIds at the given index.
+     */
+    com.google.protobuf.ByteString
+        getRunIdsBytes(int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.GetRuns}
+   */
+  public  static final class GetRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.GetRuns)
+      GetRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use GetRuns.newBuilder() to construct.
+    private GetRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private GetRuns() {
+      runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new GetRuns();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private GetRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                runIds_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              runIds_.add(bs);
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) != 0)) {
+          runIds_ = runIds_.getUnmodifiableView();
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.GetRuns.class, org.mlflow.api.proto.Service.GetRuns.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.GetRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Run> 
+          getRunsList();
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Run getRuns(int index);
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      int getRunsCount();
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList();
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index);
+    }
+    /**
+     * Protobuf type {@code mlflow.GetRuns.Response}
+     */
+    public  static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.GetRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        runs_ = java.util.Collections.emptyList();
+      }
+
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runs_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) != 0)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.GetRuns.Response.class, org.mlflow.api.proto.Service.GetRuns.Response.Builder.class);
+      }
+
+      public static final int RUNS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public int getRunsCount() {
+        return runs_.size();
+      }
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.Run getRuns(int index) {
+        return runs_.get(index);
+      }
+      /**
+       * <pre>
+       * Runs, in the same order as the requested run IDs.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index) {
+        return runs_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runs_.size(); i++) {
+          output.writeMessage(1, runs_.get(i));
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runs_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runs_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.GetRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.GetRuns.Response other = (org.mlflow.api.proto.Service.GetRuns.Response) obj;
+
+        if (!getRunsList()
+            .equals(other.getRunsList())) return false;
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunsCount() > 0) {
+          hash = (37 * hash) + RUNS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunsList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.GetRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.GetRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.GetRuns.Response)
+          org.mlflow.api.proto.Service.GetRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.GetRuns.Response.class, org.mlflow.api.proto.Service.GetRuns.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.GetRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.GetRuns.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetRuns.Response build() {
+          org.mlflow.api.proto.Service.GetRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.GetRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.GetRuns.Response result = new org.mlflow.api.proto.Service.GetRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          if (runsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) == 0x00000001)) {
+              runs_ = java.util.Collections.unmodifiableList(runs_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runs_ = runs_;
+          } else {
+            result.runs_ = runsBuilder_.build();
+          }
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.GetRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.GetRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.GetRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.GetRuns.Response.getDefaultInstance()) return this;
+          if (runsBuilder_ == null) {
+            if (!other.runs_.isEmpty()) {
+              if (runs_.isEmpty()) {
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunsIsMutable();
+                runs_.addAll(other.runs_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runs_.isEmpty()) {
+              if (runsBuilder_.isEmpty()) {
+                runsBuilder_.dispose();
+                runsBuilder_ = null;
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunsFieldBuilder() : null;
+              } else {
+                runsBuilder_.addAllMessages(other.runs_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.GetRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.GetRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
+          java.util.Collections.emptyList();
+        private void ensureRunsIsMutable() {
+          if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            bitField0_ |= 0x00000001;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
+
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+          if (runsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runs_);
+          } else {
+            return runsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public int getRunsCount() {
+          if (runsBuilder_ == null) {
+            return runs_.size();
+          } else {
+            return runsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run getRuns(int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);
+          } else {
+            return runsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.set(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addAllRuns(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runs_);
+            onChanged();
+          } else {
+            runsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder clearRuns() {
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder removeRuns(int index) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.remove(index);
+            onChanged();
+          } else {
+            runsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+            int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);  } else {
+            return runsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+             getRunsOrBuilderList() {
+          if (runsBuilder_ != null) {
+            return runsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runs_);
+          }
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
+          return getRunsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs, in the same order as the requested run IDs.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
+             getRunsBuilderList() {
+          return getRunsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
+            getRunsFieldBuilder() {
+          if (runsBuilder_ == null) {
+            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
+                    runs_,
+                    ((bitField0_ & 0x00000001) == 0x00000001),
+                    getParentForChildren(),
+                    isClean());
+            runs_ = null;
+          }
+          return runsBuilder_;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.GetRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.GetRuns.Response)
+      private static final org.mlflow.api.proto.Service.GetRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    public static final int RUN_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList runIds_;
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
+     */
+    public com.google.protobuf.ProtocolStringList
+        getRunIdsList() {
+      return runIds_;
+    }
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
+     */
+    public int getRunIdsCount() {
+      return runIds_.size();
+    }
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The runIds at the given index.
+     */
+    public java.lang.String getRunIds(int index) {
+      return runIds_.get(index);
+    }
+    /**
+     * <pre>
+     * IDs of the runs to fetch.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the runIds at the given index.
+     */
+    public com.google.protobuf.ByteString
+        getRunIdsBytes(int index) {
+      return runIds_.getByteString(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < runIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < runIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(runIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getRunIdsList().size();
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.GetRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.GetRuns other = (org.mlflow.api.proto.Service.GetRuns) obj;
+
+      if (!getRunIdsList()
+          .equals(other.getRunIdsList())) return false;
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getRunIdsCount() > 0) {
+        hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunIdsList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.GetRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.GetRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.GetRuns)
+        org.mlflow.api.proto.Service.GetRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.GetRuns.class, org.mlflow.api.proto.Service.GetRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.GetRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.GetRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns build() {
+        org.mlflow.api.proto.Service.GetRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns buildPartial() {
+        org.mlflow.api.proto.Service.GetRuns result = new org.mlflow.api.proto.Service.GetRuns(this);
+        int from_bitField0_ = bitField0_;
+        if (((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = runIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
+        }
+        result.runIds_ = runIds_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.GetRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.GetRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.GetRuns other) {
+        if (other == org.mlflow.api.proto.Service.GetRuns.getDefaultInstance()) return this;
+        if (!other.runIds_.isEmpty()) {
+          if (runIds_.isEmpty()) {
+            runIds_ = other.runIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureRunIdsIsMutable();
+            runIds_.addAll(other.runIds_);
+          }
+          onChanged();
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.GetRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.GetRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
+      }
+      private int bitField0_;
+
+      private com.google.protobuf.LazyStringList runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureRunIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = new com.google.protobuf.LazyStringArrayList(runIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return A list containing the runIds.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getRunIdsList() {
+        return runIds_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return The count of runIds.
+       */
+      public int getRunIdsCount() {
+        return runIds_.size();
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the element to return.
+       * @return The runIds at the given index.
+       */
+      public java.lang.String getRunIds(int index) {
+        return runIds_.get(index);
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the runIds at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdsBytes(int index) {
+        return runIds_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index to set the value at.
+       * @param value The runIds to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addRunIds(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param values The runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllRunIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureRunIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, runIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunIds() {
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The bytes of the runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addRunIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.GetRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.GetRuns)
+    private static final org.mlflow.api.proto.Service.GetRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.GetRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetRuns>
+        PARSER = new com.google.protobuf.AbstractParser<GetRuns>() {
+      @java.lang.Override
+      public GetRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new GetRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<GetRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<GetRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.GetRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
   public interface SearchRunsOrBuilder extends
       // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns)
       com.google.protobuf.MessageOrBuilder {
@@ -37538,6 +39143,48 @@ public final class Service {
      */
     com.google.protobuf.ByteString
         getPathBytes();
+
+    /**
+     * <pre>
+     * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+     * instead of only the artifacts directly under ``path``.
+     * </pre>
+     *
+     * <code>optional bool recursive = 4;</code>
+     * @return Whether the recursive field is set.
+     */
+    boolean hasRecursive();
+    /**
+     * <pre>
+     * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+     * instead of only the artifacts directly under ``path``.
+     * </pre>
+     *
+     * <code>optional bool recursive = 4;</code>
+     * @return The recursive.
+     */
+    boolean getRecursive();
+
+    /**
+     * <pre>
+     * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+     * If unspecified, the whole tree is listed.
+     * </pre>
+     *
+     * <code>optional int32 max_depth = 5;</code>
+     * @return Whether the maxDepth field is set.
+     */
+    boolean hasMaxDepth();
+    /**
+     * <pre>
+     * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+     * If unspecified, the whole tree is listed.
+     * </pre>
+     *
+     * <code>optional int32 max_depth = 5;</code>
+     * @return The maxDepth.
+     */
+    int getMaxDepth();
   }
   /**
    * Protobuf type {@code mlflow.ListArtifacts}
@@ -37599,6 +39246,16 @@ public final class Service {
               runId_ = bs;
               break;
             }
+            case 32: {
+              bitField0_ |= 0x00000008;
+              recursive_ = input.readBool();
+              break;
+            }
+            case 40: {
+              bitField0_ |= 0x00000010;
+              maxDepth_ = input.readInt32();
+              break;
+            }
             default: {
               if (!parseUnknownField(
                   input, unknownFields, extensionRegistry, tag)) {
@@ -38907,6 +40564,60 @@ public final class Service {
       }
     }
 
+    public static final int RECURSIVE_FIELD_NUMBER = 4;
+    private boolean recursive_;
+    /**
+     * <pre>
+     * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+     * instead of only the artifacts directly under ``path``.
+     * </pre>
+     *
+     * <code>optional bool recursive = 4;</code>
+     * @return Whether the recursive field is set.
+     */
+    public boolean hasRecursive() {
+      return ((bitField0_ & 0x00000008) == 0x00000008);
+    }
+    /**
+     * <pre>
+     * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+     * instead of only the artifacts directly under ``path``.
+     * </pre>
+     *
+     * <code>optional bool recursive = 4;</code>
+     * @return The recursive.
+     */
+    public boolean getRecursive() {
+      return recursive_;
+    }
+
+    public static final int MAX_DEPTH_FIELD_NUMBER = 5;
+    private int maxDepth_;
+    /**
+     * <pre>
+     * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+     * If unspecified, the whole tree is listed.
+     * </pre>
+     *
+     * <code>optional int32 max_depth = 5;</code>
+     * @return Whether the maxDepth field is set.
+     */
+    public boolean hasMaxDepth() {
+      return ((bitField0_ & 0x00000010) == 0x00000010);
+    }
+    /**
+     * <pre>
+     * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+     * If unspecified, the whole tree is listed.
+     * </pre>
+     *
+     * <code>optional int32 max_depth = 5;</code>
+     * @return The maxDepth.
+     */
+    public int getMaxDepth() {
+      return maxDepth_;
+    }
+
     private byte memoizedIsInitialized = -1;
     @java.lang.Override
     public final boolean isInitialized() {
@@ -38930,6 +40641,12 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
       }
+      if (((bitField0_ & 0x00000008) == 0x00000008)) {
+        output.writeBool(4, recursive_);
+      }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        output.writeInt32(5, maxDepth_);
+      }
       unknownFields.writeTo(output);
     }
 
@@ -38948,6 +40665,14 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
       }
+      if (((bitField0_ & 0x00000008) == 0x00000008)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeBoolSize(4, recursive_);
+      }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt32Size(5, maxDepth_);
+      }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
       return size;
@@ -38979,6 +40704,16 @@ public final class Service {
         result = result && getPath()
             .equals(other.getPath());
       }
+      result = result && (hasRecursive() == other.hasRecursive());
+      if (hasRecursive()) {
+        result = result && (getRecursive()
+            == other.getRecursive());
+      }
+      result = result && (hasMaxDepth() == other.hasMaxDepth());
+      if (hasMaxDepth()) {
+        result = result && (getMaxDepth()
+            == other.getMaxDepth());
+      }
       result = result && unknownFields.equals(other.unknownFields);
       return result;
     }
@@ -39002,6 +40737,15 @@ public final class Service {
         hash = (37 * hash) + PATH_FIELD_NUMBER;
         hash = (53 * hash) + getPath().hashCode();
       }
+      if (hasRecursive()) {
+        hash = (37 * hash) + RECURSIVE_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashBoolean(
+            getRecursive());
+      }
+      if (hasMaxDepth()) {
+        hash = (37 * hash) + MAX_DEPTH_FIELD_NUMBER;
+        hash = (53 * hash) + getMaxDepth();
+      }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
@@ -39141,6 +40885,10 @@ public final class Service {
         bitField0_ = (bitField0_ & ~0x00000002);
         path_ = "";
         bitField0_ = (bitField0_ & ~0x00000004);
+        recursive_ = false;
+        bitField0_ = (bitField0_ & ~0x00000008);
+        maxDepth_ = 0;
+        bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
 
@@ -39181,6 +40929,14 @@ public final class Service {
           to_bitField0_ |= 0x00000004;
         }
         result.path_ = path_;
+        if (((from_bitField0_ & 0x00000008) == 0x00000008)) {
+          result.recursive_ = recursive_;
+          to_bitField0_ |= 0x00000008;
+        }
+        if (((from_bitField0_ & 0x00000010) == 0x00000010)) {
+          result.maxDepth_ = maxDepth_;
+          to_bitField0_ |= 0x00000010;
+        }
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -39245,6 +41001,12 @@ public final class Service {
           path_ = other.path_;
           onChanged();
         }
+        if (other.hasRecursive()) {
+          setRecursive(other.getRecursive());
+        }
+        if (other.hasMaxDepth()) {
+          setMaxDepth(other.getMaxDepth());
+        }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
         return this;
@@ -39580,6 +41342,120 @@ public final class Service {
         onChanged();
         return this;
       }
+
+      private boolean recursive_ ;
+      /**
+       * <pre>
+       * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+       * instead of only the artifacts directly under ``path``.
+       * </pre>
+       *
+       * <code>optional bool recursive = 4;</code>
+       * @return Whether the recursive field is set.
+       */
+      public boolean hasRecursive() {
+        return ((bitField0_ & 0x00000008) == 0x00000008);
+      }
+      /**
+       * <pre>
+       * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+       * instead of only the artifacts directly under ``path``.
+       * </pre>
+       *
+       * <code>optional bool recursive = 4;</code>
+       * @return The recursive.
+       */
+      public boolean getRecursive() {
+        return recursive_;
+      }
+      /**
+       * <pre>
+       * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+       * instead of only the artifacts directly under ``path``.
+       * </pre>
+       *
+       * <code>optional bool recursive = 4;</code>
+       * @param value The recursive to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRecursive(boolean value) {
+        bitField0_ |= 0x00000008;
+        recursive_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * If true, list all the artifacts under ``path`` and, recursively, under its subdirectories,
+       * instead of only the artifacts directly under ``path``.
+       * </pre>
+       *
+       * <code>optional bool recursive = 4;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRecursive() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        recursive_ = false;
+        onChanged();
+        return this;
+      }
+
+      private int maxDepth_ ;
+      /**
+       * <pre>
+       * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+       * If unspecified, the whole tree is listed.
+       * </pre>
+       *
+       * <code>optional int32 max_depth = 5;</code>
+       * @return Whether the maxDepth field is set.
+       */
+      public boolean hasMaxDepth() {
+        return ((bitField0_ & 0x00000010) == 0x00000010);
+      }
+      /**
+       * <pre>
+       * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+       * If unspecified, the whole tree is listed.
+       * </pre>
+       *
+       * <code>optional int32 max_depth = 5;</code>
+       * @return The maxDepth.
+       */
+      public int getMaxDepth() {
+        return maxDepth_;
+      }
+      /**
+       * <pre>
+       * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+       * If unspecified, the whole tree is listed.
+       * </pre>
+       *
+       * <code>optional int32 max_depth = 5;</code>
+       * @param value The maxDepth to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMaxDepth(int value) {
+        bitField0_ |= 0x00000010;
+        maxDepth_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Maximum number of levels below ``path`` of the artifacts listed when ``recursive`` is true.
+       * If unspecified, the whole tree is listed.
+       * </pre>
+       *
+       * <code>optional int32 max_depth = 5;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMaxDepth() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        maxDepth_ = 0;
+        onChanged();
+        return this;
+      }
       @java.lang.Override
       public final Builder setUnknownFields(
           final com.google.protobuf.UnknownFieldSet unknownFields) {
@@ -46547,6 +48423,16 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_GetRun_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_GetRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_GetRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_GetRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_GetRuns_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_SearchRuns_descriptor;
   private static final 
@@ -46687,133 +48573,140 @@ public final class Service {
       "rpc.RPC[$this.Response]\"}\n\006GetRun\022\016\n\006run" +
       "_id\030\002 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\032$\n\010Response\022" +
       "\030\n\003run\030\001 \001(\0132\013.mlflow.Run:+\342?(\n&com.data" +
-      "bricks.rpc.RPC[$this.Response]\"\230\002\n\nSearc" +
-      "hRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n\006filter\030" +
-      "\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.mlflow.Vi" +
-      "ewType:\013ACTIVE_ONLY\022\031\n\013max_results\030\005 \001(\005" +
-      ":\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage_token\030\007" +
-      " \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow." +
-      "Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&com.d" +
-      "atabricks.rpc.RPC[$this.Response]\"\253\001\n\rLi" +
-      "stArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030" +
-      "\001 \001(\t\022\014\n\004path\030\002 \001(\t\032=\n\010Response\022\020\n\010root_" +
-      "uri\030\001 \001(\t\022\037\n\005files\030\002 \003(\0132\020.mlflow.FileIn" +
-      "fo:+\342?(\n&com.databricks.rpc.RPC[$this.Re" +
-      "sponse]\";\n\010FileInfo\022\014\n\004path\030\001 \001(\t\022\016\n\006is_" +
-      "dir\030\002 \001(\010\022\021\n\tfile_size\030\003 \001(\003\"\250\001\n\020GetMetr" +
-      "icHistory\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030\001 " +
-      "\001(\t\022\030\n\nmetric_key\030\002 \001(\tB\004\370\206\031\001\032+\n\010Respons" +
-      "e\022\037\n\007metrics\030\001 \003(\0132\016.mlflow.Metric:+\342?(\n" +
-      "&com.databricks.rpc.RPC[$this.Response]\"" +
-      "\261\001\n\010LogBatch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030" +
-      "\002 \003(\0132\016.mlflow.Metric\022\035\n\006params\030\003 \003(\0132\r." +
-      "mlflow.Param\022\034\n\004tags\030\004 \003(\0132\016.mlflow.RunT" +
-      "ag\032\n\n\010Response:+\342?(\n&com.databricks.rpc." +
-      "RPC[$this.Response]\"\225\001\n\023GetExperimentByN" +
-      "ame\022\035\n\017experiment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Re" +
-      "sponse\022&\n\nexperiment\030\001 \001(\0132\022.mlflow.Expe" +
-      "riment:+\342?(\n&com.databricks.rpc.RPC[$thi" +
-      "s.Response]*6\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001" +
-      "\022\020\n\014DELETED_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceTyp" +
-      "e\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n" +
-      "\005LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007R" +
-      "UNNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n" +
-      "\006FAILED\020\004\022\n\n\006KILLED\020\0052\300\035\n\rMlflowService\022" +
-      "\246\001\n\023getExperimentByName\022\033.mlflow.GetExpe" +
-      "rimentByName\032$.mlflow.GetExperimentByNam" +
-      "e.Response\"L\362\206\031H\n,\n\003GET\022\037/mlflow/experim" +
-      "ents/get-by-name\032\004\010\002\020\000\020\001*\026Get Experiment" +
-      " By Name\022\306\001\n\020createExperiment\022\030.mlflow.C" +
-      "reateExperiment\032!.mlflow.CreateExperimen" +
-      "t.Response\"u\362\206\031q\n(\n\004POST\022\032/mlflow/experi" +
-      "ments/create\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlf" +
-      "low/experiments/create\032\004\010\002\020\000\020\001*\021Create E" +
-      "xperiment\022\274\001\n\017listExperiments\022\027.mlflow.L" +
-      "istExperiments\032 .mlflow.ListExperiments." +
-      "Response\"n\362\206\031j\n%\n\003GET\022\030/mlflow/experimen" +
-      "ts/list\032\004\010\002\020\000\n-\n\003GET\022 /preview/mlflow/ex" +
-      "periments/list\032\004\010\002\020\000\020\001*\020List Experiments" +
-      "\022\262\001\n\rgetExperiment\022\025.mlflow.GetExperimen" +
-      "t\032\036.mlflow.GetExperiment.Response\"j\362\206\031f\n" +
-      "$\n\003GET\022\027/mlflow/experiments/get\032\004\010\002\020\000\n,\n" +
-      "\003GET\022\037/preview/mlflow/experiments/get\032\004\010" +
-      "\002\020\000\020\001*\016Get Experiment\022\306\001\n\020deleteExperime" +
-      "nt\022\030.mlflow.DeleteExperiment\032!.mlflow.De" +
-      "leteExperiment.Response\"u\362\206\031q\n(\n\004POST\022\032/" +
-      "mlflow/experiments/delete\032\004\010\002\020\000\n0\n\004POST\022" +
-      "\"/preview/mlflow/experiments/delete\032\004\010\002\020" +
-      "\000\020\001*\021Delete Experiment\022\314\001\n\021restoreExperi" +
-      "ment\022\031.mlflow.RestoreExperiment\032\".mlflow" +
-      ".RestoreExperiment.Response\"x\362\206\031t\n)\n\004POS" +
-      "T\022\033/mlflow/experiments/restore\032\004\010\002\020\000\n1\n\004" +
-      "POST\022#/preview/mlflow/experiments/restor" +
-      "e\032\004\010\002\020\000\020\001*\022Restore Experiment\022\306\001\n\020update" +
-      "Experiment\022\030.mlflow.UpdateExperiment\032!.m" +
-      "lflow.UpdateExperiment.Response\"u\362\206\031q\n(\n" +
-      "\004POST\022\032/mlflow/experiments/update\032\004\010\002\020\000\n" +
-      "0\n\004POST\022\"/preview/mlflow/experiments/upd" +
-      "ate\032\004\010\002\020\000\020\001*\021Update Experiment\022\234\001\n\tcreat" +
-      "eRun\022\021.mlflow.CreateRun\032\032.mlflow.CreateR" +
-      "un.Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/" +
-      "create\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/ru" +
-      "ns/create\032\004\010\002\020\000\020\001*\nCreate Run\022\234\001\n\tupdate" +
-      "Run\022\021.mlflow.UpdateRun\032\032.mlflow.UpdateRu" +
-      "n.Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/u" +
-      "pdate\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/run" +
-      "s/update\032\004\010\002\020\000\020\001*\nUpdate Run\022\234\001\n\tdeleteR" +
-      "un\022\021.mlflow.DeleteRun\032\032.mlflow.DeleteRun" +
-      ".Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/de" +
-      "lete\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/runs" +
-      "/delete\032\004\010\002\020\000\020\001*\nDelete Run\022\242\001\n\nrestoreR" +
-      "un\022\022.mlflow.RestoreRun\032\033.mlflow.RestoreR" +
-      "un.Response\"c\362\206\031_\n\"\n\004POST\022\024/mlflow/runs/" +
-      "restore\032\004\010\002\020\000\n*\n\004POST\022\034/preview/mlflow/r" +
-      "uns/restore\032\004\010\002\020\000\020\001*\013Restore Run\022\244\001\n\tlog" +
-      "Metric\022\021.mlflow.LogMetric\032\032.mlflow.LogMe" +
-      "tric.Response\"h\362\206\031d\n%\n\004POST\022\027/mlflow/run" +
-      "s/log-metric\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlf" +
-      "low/runs/log-metric\032\004\010\002\020\000\020\001*\nLog Metric\022" +
-      "\246\001\n\010logParam\022\020.mlflow.LogParam\032\031.mlflow." +
-      "LogParam.Response\"m\362\206\031i\n(\n\004POST\022\032/mlflow" +
-      "/runs/log-parameter\032\004\010\002\020\000\n0\n\004POST\022\"/prev" +
-      "iew/mlflow/runs/log-parameter\032\004\010\002\020\000\020\001*\tL" +
-      "og Param\022\341\001\n\020setExperimentTag\022\030.mlflow.S" +
-      "etExperimentTag\032!.mlflow.SetExperimentTa" +
-      "g.Response\"\217\001\362\206\031\212\001\n4\n\004POST\022&/mlflow/expe" +
-      "riments/set-experiment-tag\032\004\010\002\020\000\n<\n\004POST" +
-      "\022./preview/mlflow/experiments/set-experi" +
-      "ment-tag\032\004\010\002\020\000\020\001*\022Set Experiment Tag\022\222\001\n" +
-      "\006setTag\022\016.mlflow.SetTag\032\027.mlflow.SetTag." +
-      "Response\"_\362\206\031[\n\"\n\004POST\022\024/mlflow/runs/set" +
-      "-tag\032\004\010\002\020\000\n*\n\004POST\022\034/preview/mlflow/runs" +
-      "/set-tag\032\004\010\002\020\000\020\001*\007Set Tag\022\244\001\n\tdeleteTag\022" +
-      "\021.mlflow.DeleteTag\032\032.mlflow.DeleteTag.Re" +
-      "sponse\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs/delet" +
-      "e-tag\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlflow/run" +
-      "s/delete-tag\032\004\010\002\020\000\020\001*\nDelete Tag\022\210\001\n\006get" +
-      "Run\022\016.mlflow.GetRun\032\027.mlflow.GetRun.Resp" +
-      "onse\"U\362\206\031Q\n\035\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020" +
-      "\000\n%\n\003GET\022\030/preview/mlflow/runs/get\032\004\010\002\020\000" +
-      "\020\001*\007Get Run\022\314\001\n\nsearchRuns\022\022.mlflow.Sear" +
-      "chRuns\032\033.mlflow.SearchRuns.Response\"\214\001\362\206" +
-      "\031\207\001\n!\n\004POST\022\023/mlflow/runs/search\032\004\010\002\020\000\n)" +
-      "\n\004POST\022\033/preview/mlflow/runs/search\032\004\010\002\020" +
-      "\000\n(\n\003GET\022\033/preview/mlflow/runs/search\032\004\010" +
-      "\002\020\000\020\001*\013Search Runs\022\260\001\n\rlistArtifacts\022\025.m" +
-      "lflow.ListArtifacts\032\036.mlflow.ListArtifac" +
-      "ts.Response\"h\362\206\031d\n#\n\003GET\022\026/mlflow/artifa" +
-      "cts/list\032\004\010\002\020\000\n+\n\003GET\022\036/preview/mlflow/a" +
-      "rtifacts/list\032\004\010\002\020\000\020\001*\016List Artifacts\022\307\001" +
-      "\n\020getMetricHistory\022\030.mlflow.GetMetricHis" +
-      "tory\032!.mlflow.GetMetricHistory.Response\"" +
-      "v\362\206\031r\n(\n\003GET\022\033/mlflow/metrics/get-histor" +
-      "y\032\004\010\002\020\000\n0\n\003GET\022#/preview/mlflow/metrics/" +
-      "get-history\032\004\010\002\020\000\020\001*\022Get Metric History\022" +
-      "\236\001\n\010logBatch\022\020.mlflow.LogBatch\032\031.mlflow." +
-      "LogBatch.Response\"e\362\206\031a\n$\n\004POST\022\026/mlflow" +
-      "/runs/log-batch\032\004\010\002\020\000\n,\n\004POST\022\036/preview/" +
-      "mlflow/runs/log-batch\032\004\010\002\020\000\020\001*\tLog Batch" +
-      "B\036\n\024org.mlflow.api.proto\220\001\001\342?\002\020\001"
+      "bricks.rpc.RPC[$this.Response]\"n\n\007GetRun" +
+      "s\022\017\n\007run_ids\030\001 \003(\t\032%\n\010Response\022\031\n\004runs\030\001" +
+      " \003(\0132\013.mlflow.Run:+\342?(\n&com.databricks.r" +
+      "pc.RPC[$this.Response]\"\230\002\n\nSearchRuns\022\026\n" +
+      "\016experiment_ids\030\001 \003(\t\022\016\n\006filter\030\004 \001(\t\0224\n" +
+      "\rrun_view_type\030\003 \001(\0162\020.mlflow.ViewType:\013" +
+      "ACTIVE_ONLY\022\031\n\013max_results\030\005 \001(\005:\0041000\022\020" +
+      "\n\010order_by\030\006 \003(\t\022\022\n\npage_token\030\007 \001(\t\032>\n\010" +
+      "Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow.Run\022\027\n\017n" +
+      "ext_page_token\030\002 \001(\t:+\342?(\n&com.databrick" +
+      "s.rpc.RPC[$this.Response]\"\321\001\n\rListArtifa" +
+      "cts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\022\014\n" +
+      "\004path\030\002 \001(\t\022\021\n\trecursive\030\004 \001(\010\022\021\n\tmax_de" +
+      "pth\030\005 \001(\005\032=\n\010Response\022\020\n\010root_uri\030\001 \001(\t\022" +
+      "\037\n\005files\030\002 \003(\0132\020.mlflow.FileInfo:+\342?(\n&c" +
+      "om.databricks.rpc.RPC[$this.Response]\";\n" +
+      "\010FileInfo\022\014\n\004path\030\001 \001(\t\022\016\n\006is_dir\030\002 \001(\010\022" +
+      "\021\n\tfile_size\030\003 \001(\003\"\250\001\n\020GetMetricHistory\022" +
+      "\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\022\030\n\nmet" +
+      "ric_key\030\002 \001(\tB\004\370\206\031\001\032+\n\010Response\022\037\n\007metri" +
+      "cs\030\001 \003(\0132\016.mlflow.Metric:+\342?(\n&com.datab" +
+      "ricks.rpc.RPC[$this.Response]\"\261\001\n\010LogBat" +
+      "ch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030\002 \003(\0132\016.ml" +
+      "flow.Metric\022\035\n\006params\030\003 \003(\0132\r.mlflow.Par" +
+      "am\022\034\n\004tags\030\004 \003(\0132\016.mlflow.RunTag\032\n\n\010Resp" +
+      "onse:+\342?(\n&com.databricks.rpc.RPC[$this." +
+      "Response]\"\225\001\n\023GetExperimentByName\022\035\n\017exp" +
+      "eriment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Response\022&\n\n" +
+      "experiment\030\001 \001(\0132\022.mlflow.Experiment:+\342?" +
+      "(\n&com.databricks.rpc.RPC[$this.Response" +
+      "]*6\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001\022\020\n\014DELETE" +
+      "D_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceType\022\014\n\010NOTEB" +
+      "OOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n\005LOCAL\020\004\022\014" +
+      "\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007RUNNING\020\001\022\r" +
+      "\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n\006FAILED\020\004\022" +
+      "\n\n\006KILLED\020\0052\256\036\n\rMlflowService\022\246\001\n\023getExp" +
+      "erimentByName\022\033.mlflow.GetExperimentByNa" +
+      "me\032$.mlflow.GetExperimentByName.Response" +
+      "\"L\362\206\031H\n,\n\003GET\022\037/mlflow/experiments/get-b" +
+      "y-name\032\004\010\002\020\000\020\001*\026Get Experiment By Name\022\306" +
+      "\001\n\020createExperiment\022\030.mlflow.CreateExper" +
+      "iment\032!.mlflow.CreateExperiment.Response" +
+      "\"u\362\206\031q\n(\n\004POST\022\032/mlflow/experiments/crea" +
+      "te\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlflow/experi" +
+      "ments/create\032\004\010\002\020\000\020\001*\021Create Experiment\022" +
+      "\274\001\n\017listExperiments\022\027.mlflow.ListExperim" +
+      "ents\032 .mlflow.ListExperiments.Response\"n" +
+      "\362\206\031j\n%\n\003GET\022\030/mlflow/experiments/list\032\004\010" +
+      "\002\020\000\n-\n\003GET\022 /preview/mlflow/experiments/" +
+      "list\032\004\010\002\020\000\020\001*\020List Experiments\022\262\001\n\rgetEx" +
+      "periment\022\025.mlflow.GetExperiment\032\036.mlflow" +
+      ".GetExperiment.Response\"j\362\206\031f\n$\n\003GET\022\027/m" +
+      "lflow/experiments/get\032\004\010\002\020\000\n,\n\003GET\022\037/pre" +
+      "view/mlflow/experiments/get\032\004\010\002\020\000\020\001*\016Get" +
+      " Experiment\022\306\001\n\020deleteExperiment\022\030.mlflo" +
+      "w.DeleteExperiment\032!.mlflow.DeleteExperi" +
+      "ment.Response\"u\362\206\031q\n(\n\004POST\022\032/mlflow/exp" +
+      "eriments/delete\032\004\010\002\020\000\n0\n\004POST\022\"/preview/" +
+      "mlflow/experiments/delete\032\004\010\002\020\000\020\001*\021Delet" +
+      "e Experiment\022\314\001\n\021restoreExperiment\022\031.mlf" +
+      "low.RestoreExperiment\032\".mlflow.RestoreEx" +
+      "periment.Response\"x\362\206\031t\n)\n\004POST\022\033/mlflow" +
+      "/experiments/restore\032\004\010\002\020\000\n1\n\004POST\022#/pre" +
+      "view/mlflow/experiments/restore\032\004\010\002\020\000\020\001*" +
+      "\022Restore Experiment\022\306\001\n\020updateExperiment" +
+      "\022\030.mlflow.UpdateExperiment\032!.mlflow.Upda" +
+      "teExperiment.Response\"u\362\206\031q\n(\n\004POST\022\032/ml" +
+      "flow/experiments/update\032\004\010\002\020\000\n0\n\004POST\022\"/" +
+      "preview/mlflow/experiments/update\032\004\010\002\020\000\020" +
+      "\001*\021Update Experiment\022\234\001\n\tcreateRun\022\021.mlf" +
+      "low.CreateRun\032\032.mlflow.CreateRun.Respons" +
+      "e\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/create\032\004\010\002" +
+      "\020\000\n)\n\004POST\022\033/preview/mlflow/runs/create\032" +
+      "\004\010\002\020\000\020\001*\nCreate Run\022\234\001\n\tupdateRun\022\021.mlfl" +
+      "ow.UpdateRun\032\032.mlflow.UpdateRun.Response" +
+      "\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/update\032\004\010\002\020" +
+      "\000\n)\n\004POST\022\033/preview/mlflow/runs/update\032\004" +
+      "\010\002\020\000\020\001*\nUpdate Run\022\234\001\n\tdeleteRun\022\021.mlflo" +
+      "w.DeleteRun\032\032.mlflow.DeleteRun.Response\"" +
+      "`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/delete\032\004\010\002\020\000" +
+      "\n)\n\004POST\022\033/preview/mlflow/runs/delete\032\004\010" +
+      "\002\020\000\020\001*\nDelete Run\022\242\001\n\nrestoreRun\022\022.mlflo" +
+      "w.RestoreRun\032\033.mlflow.RestoreRun.Respons" +
+      "e\"c\362\206\031_\n\"\n\004POST\022\024/mlflow/runs/restore\032\004\010" +
+      "\002\020\000\n*\n\004POST\022\034/preview/mlflow/runs/restor" +
+      "e\032\004\010\002\020\000\020\001*\013Restore Run\022\244\001\n\tlogMetric\022\021.m" +
+      "lflow.LogMetric\032\032.mlflow.LogMetric.Respo" +
+      "nse\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs/log-metr" +
+      "ic\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlflow/runs/l" +
+      "og-metric\032\004\010\002\020\000\020\001*\nLog Metric\022\246\001\n\010logPar" +
+      "am\022\020.mlflow.LogParam\032\031.mlflow.LogParam.R" +
+      "esponse\"m\362\206\031i\n(\n\004POST\022\032/mlflow/runs/log-" +
+      "parameter\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlflow" +
+      "/runs/log-parameter\032\004\010\002\020\000\020\001*\tLog Param\022\341" +
+      "\001\n\020setExperimentTag\022\030.mlflow.SetExperime" +
+      "ntTag\032!.mlflow.SetExperimentTag.Response" +
+      "\"\217\001\362\206\031\212\001\n4\n\004POST\022&/mlflow/experiments/se" +
+      "t-experiment-tag\032\004\010\002\020\000\n<\n\004POST\022./preview" +
+      "/mlflow/experiments/set-experiment-tag\032\004" +
+      "\010\002\020\000\020\001*\022Set Experiment Tag\022\222\001\n\006setTag\022\016." +
+      "mlflow.SetTag\032\027.mlflow.SetTag.Response\"_" +
+      "\362\206\031[\n\"\n\004POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000" +
+      "\n*\n\004POST\022\034/preview/mlflow/runs/set-tag\032\004" +
+      "\010\002\020\000\020\001*\007Set Tag\022\244\001\n\tdeleteTag\022\021.mlflow.D" +
+      "eleteTag\032\032.mlflow.DeleteTag.Response\"h\362\206" +
+      "\031d\n%\n\004POST\022\027/mlflow/runs/delete-tag\032\004\010\002\020" +
+      "\000\n-\n\004POST\022\037/preview/mlflow/runs/delete-t" +
+      "ag\032\004\010\002\020\000\020\001*\nDelete Tag\022\210\001\n\006getRun\022\016.mlfl" +
+      "ow.GetRun\032\027.mlflow.GetRun.Response\"U\362\206\031Q" +
+      "\n\035\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020\000\n%\n\003GET\022\030" +
+      "/preview/mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get Ru" +
+      "n\022l\n\007getRuns\022\017.mlflow.GetRuns\032\030.mlflow.G" +
+      "etRuns.Response\"6\362\206\0312\n$\n\004POST\022\026/mlflow/r" +
+      "uns/get-batch\032\004\010\002\020\000\020\001*\010Get Runs\022\314\001\n\nsear" +
+      "chRuns\022\022.mlflow.SearchRuns\032\033.mlflow.Sear" +
+      "chRuns.Response\"\214\001\362\206\031\207\001\n!\n\004POST\022\023/mlflow" +
+      "/runs/search\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlf" +
+      "low/runs/search\032\004\010\002\020\000\n(\n\003GET\022\033/preview/m" +
+      "lflow/runs/search\032\004\010\002\020\000\020\001*\013Search Runs\022\260" +
+      "\001\n\rlistArtifacts\022\025.mlflow.ListArtifacts\032" +
+      "\036.mlflow.ListArtifacts.Response\"h\362\206\031d\n#\n" +
+      "\003GET\022\026/mlflow/artifacts/list\032\004\010\002\020\000\n+\n\003GE" +
+      "T\022\036/preview/mlflow/artifacts/list\032\004\010\002\020\000\020" +
+      "\001*\016List Artifacts\022\307\001\n\020getMetricHistory\022\030" +
+      ".mlflow.GetMetricHistory\032!.mlflow.GetMet" +
+      "ricHistory.Response\"v\362\206\031r\n(\n\003GET\022\033/mlflo" +
+      "w/metrics/get-history\032\004\010\002\020\000\n0\n\003GET\022#/pre" +
+      "view/mlflow/metrics/get-history\032\004\010\002\020\000\020\001*" +
+      "\022Get Metric History\022\236\001\n\010logBatch\022\020.mlflo" +
+      "w.LogBatch\032\031.mlflow.LogBatch.Response\"e\362" +
+      "\206\031a\n$\n\004POST\022\026/mlflow/runs/log-batch\032\004\010\002\020" +
+      "\000\n,\n\004POST\022\036/preview/mlflow/runs/log-batc" +
+      "h\032\004\010\002\020\000\020\001*\tLog BatchB\036\n\024org.mlflow.api.p" +
+      "roto\220\001\001\342?\002\020\001"
     };
     com.google.protobuf.Descriptors.FileDescriptor.InternalDescriptorAssigner assigner =
         new com.google.protobuf.Descriptors.FileDescriptor.    InternalDescriptorAssigner() {
@@ -47069,8 +48962,20 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetRun_Response_descriptor,
         new java.lang.String[] { "Run", });
-    internal_static_mlflow_SearchRuns_descriptor =
+    internal_static_mlflow_GetRuns_descriptor =
       getDescriptor().getMessageTypes().get(24);
+    internal_static_mlflow_GetRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_GetRuns_descriptor,
+        new java.lang.String[] { "RunIds", });
+    internal_static_mlflow_GetRuns_Response_descriptor =
+      internal_static_mlflow_GetRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_GetRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_GetRuns_Response_descriptor,
+        new java.lang.String[] { "Runs", });
+    internal_static_mlflow_SearchRuns_descriptor =
+      getDescriptor().getMessageTypes().get(25);
     internal_static_mlflow_SearchRuns_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchRuns_descriptor,
@@ -47082,11 +48987,11 @@ public final class Service {
         internal_static_mlflow_SearchRuns_Response_descriptor,
         new java.lang.String[] { "Runs", "NextPageToken", });
     internal_static_mlflow_ListArtifacts_descriptor =
-      getDescriptor().getMessageTypes().get(25);
+      getDescriptor().getMessageTypes().get(26);
     internal_static_mlflow_ListArtifacts_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_ListArtifacts_descriptor,
-        new java.lang.String[] { "RunId", "RunUuid", "Path", });
+        new java.lang.String[] { "RunId", "RunUuid", "Path", "Recursive", "MaxDepth", });
     internal_static_mlflow_ListArtifacts_Response_descriptor =
       internal_static_mlflow_ListArtifacts_descriptor.getNestedTypes().get(0);
     internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable = new
@@ -47094,13 +48999,13 @@ public final class Service {
         internal_static_mlflow_ListArtifacts_Response_descriptor,
         new java.lang.String[] { "RootUri", "Files", });
     internal_static_mlflow_FileInfo_descriptor =
-      getDescriptor().getMessageTypes().get(26);
+      getDescriptor().getMessageTypes().get(27);
     internal_static_mlflow_FileInfo_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_FileInfo_descriptor,
         new java.lang.String[] { "Path", "IsDir", "FileSize", });
     internal_static_mlflow_GetMetricHistory_descriptor =
-      getDescriptor().getMessageTypes().get(27);
+      getDescriptor().getMessageTypes().get(28);
     internal_static_mlflow_GetMetricHistory_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetMetricHistory_descriptor,
@@ -47112,7 +49017,7 @@ public final class Service {
         internal_static_mlflow_GetMetricHistory_Response_descriptor,
         new java.lang.String[] { "Metrics", });
     internal_static_mlflow_LogBatch_descriptor =
-      getDescriptor().getMessageTypes().get(28);
+      getDescriptor().getMessageTypes().get(29);
     internal_static_mlflow_LogBatch_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_descriptor,
@@ -47124,7 +49029,7 @@ public final class Service {
         internal_static_mlflow_LogBatch_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetExperimentByName_descriptor =
-      getDescriptor().getMessageTypes().get(29);
+      getDescriptor().getMessageTypes().get(30);
     internal_static_mlflow_GetExperimentByName_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetExperimentByName_descriptor,
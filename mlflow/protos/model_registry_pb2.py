@@ -24,7 +24,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='mlflow',
   syntax='proto2',
   serialized_options=_b('\n\024org.mlflow.api.proto\220\001\001\240\001\001\342?\002\020\001'),
-  serialized_pb=_b('\n\x14model_registry.proto\x12\x06mlflow\x1a\x15scalapb/scalapb.proto\x1a\x10\x64\x61tabricks.proto\"\x1f\n\x0fRegisteredModel\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xe5\x01\n\x17RegisteredModelDetailed\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel\x12\x1a\n\x12\x63reation_timestamp\x18\x02 \x01(\x03\x12\x1e\n\x16last_updated_timestamp\x18\x03 \x01(\x03\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x35\n\x0flatest_versions\x18\x06 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed\"R\n\x0cModelVersion\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel\x12\x0f\n\x07version\x18\x02 \x01(\x03\"\xa0\x02\n\x14ModelVersionDetailed\x12+\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersion\x12\x1a\n\x12\x63reation_timestamp\x18\x02 \x01(\x03\x12\x1e\n\x16last_updated_timestamp\x18\x03 \x01(\x03\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x15\n\rcurrent_stage\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x0e\n\x06source\x18\x07 \x01(\t\x12\x0e\n\x06run_id\x18\x08 \x01(\t\x12*\n\x06status\x18\t \x01(\x0e\x32\x1a.mlflow.ModelVersionStatus\x12\x16\n\x0estatus_message\x18\n \x01(\t\"\x97\x01\n\x15\x43reateRegisteredModel\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xf8\x86\x19\x01\x1a=\n\x08Response\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xdf\x01\n\x15UpdateRegisteredModel\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x1a=\n\x08Response\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x89\x01\n\x15\x44\x65leteRegisteredModel\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xd1\x01\n\x19GetRegisteredModelDetails\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x1aN\n\x08Response\x12\x42\n\x19registered_model_detailed\x18\x01 \x01(\x0b\x32\x1f.mlflow.RegisteredModelDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x94\x01\n\x14ListRegisteredModels\x1aO\n\x08Response\x12\x43\n\x1aregistered_models_detailed\x18\x01 \x03(\x0b\x32\x1f.mlflow.RegisteredModelDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xd4\x01\n\x11GetLatestVersions\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x12\x0e\n\x06stages\x18\x02 \x03(\t\x1aI\n\x08Response\x12=\n\x17model_versions_detailed\x18\x01 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xb4\x01\n\x12\x43reateModelVersion\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xf8\x86\x19\x01\x12\x14\n\x06source\x18\x02 \x01(\tB\x04\xf8\x86\x19\x01\x12\x0e\n\x06run_id\x18\x03 \x01(\t\x1a\x37\n\x08Response\x12+\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersion:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xa4\x01\n\x12UpdateModelVersion\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x12\r\n\x05stage\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x80\x01\n\x12\x44\x65leteModelVersion\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xc2\x01\n\x16GetModelVersionDetails\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1aH\n\x08Response\x12<\n\x16model_version_detailed\x18\x01 \x01(\x0b\x32\x1c.mlflow.ModelVersionDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xf6\x01\n\x13SearchModelVersions\x12\x0e\n\x06\x66ilter\x18\x01 \x01(\t\x12\x18\n\x0bmax_results\x18\x02 \x01(\x03:\x03\x31\x30\x30\x12\x10\n\x08order_by\x18\x03 \x03(\t\x12\x12\n\npage_token\x18\x04 \x01(\t\x1a\x62\n\x08Response\x12=\n\x17model_versions_detailed\x18\x01 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x93\x01\n\x15GetModelVersionStages\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a\x1a\n\x08Response\x12\x0e\n\x06stages\x18\x01 \x03(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x9e\x01\n\x1aGetModelVersionDownloadUri\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a \n\x08Response\x12\x14\n\x0c\x61rtifact_uri\x18\x01 \x01(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]*}\n\x12ModelVersionStatus\x12\x18\n\x14PENDING_REGISTRATION\x10\x01\x12\x17\n\x13\x46\x41ILED_REGISTRATION\x10\x02\x12\t\n\x05READY\x10\x03\x12\x14\n\x10PENDING_DELETION\x10\x04\x12\x13\n\x0f\x46\x41ILED_DELETION\x10\x05\x32\x8e\x13\n\x14ModelRegistryService\x12\xb6\x01\n\x15\x63reateRegisteredModel\x12\x1d.mlflow.CreateRegisteredModel\x1a&.mlflow.CreateRegisteredModel.Response\"V\xf2\x86\x19R\n6\n\x04POST\x12(/preview/mlflow/registered-models/create\x1a\x04\x08\x02\x10\x00\x10\x01*\x16\x43reate RegisteredModel\x12\xb7\x01\n\x15updateRegisteredModel\x12\x1d.mlflow.UpdateRegisteredModel\x1a&.mlflow.UpdateRegisteredModel.Response\"W\xf2\x86\x19S\n7\n\x05PATCH\x12(/preview/mlflow/registered-models/update\x1a\x04\x08\x02\x10\x00\x10\x01*\x16Update RegisteredModel\x12\xb8\x01\n\x15\x64\x65leteRegisteredModel\x12\x1d.mlflow.DeleteRegisteredModel\x1a&.mlflow.DeleteRegisteredModel.Response\"X\xf2\x86\x19T\n8\n\x06\x44\x45LETE\x12(/preview/mlflow/registered-models/delete\x1a\x04\x08\x02\x10\x00\x10\x01*\x16\x44\x65lete RegisteredModel\x12\xcc\x01\n\x19getRegisteredModelDetails\x12!.mlflow.GetRegisteredModelDetails\x1a*.mlflow.GetRegisteredModelDetails.Response\"`\xf2\x86\x19\\\n;\n\x04POST\x12-/preview/mlflow/registered-models/get-details\x1a\x04\x08\x02\x10\x00\x10\x01*\x1bGet RegisteredModel Details\x12\xaf\x01\n\x14listRegisteredModels\x12\x1c.mlflow.ListRegisteredModels\x1a%.mlflow.ListRegisteredModels.Response\"R\xf2\x86\x19N\n3\n\x03GET\x12&/preview/mlflow/registered-models/list\x1a\x04\x08\x02\x10\x00\x10\x01*\x15List RegisteredModels\x12\xb9\x01\n\x11getLatestVersions\x12\x19.mlflow.GetLatestVersions\x1a\".mlflow.GetLatestVersions.Response\"e\xf2\x86\x19\x61\nC\n\x04POST\x12\x35/preview/mlflow/registered-models/get-latest-versions\x1a\x04\x08\x02\x10\x00\x10\x01*\x18Get Latest ModelVersions\x12\xa7\x01\n\x12\x63reateModelVersion\x12\x1a.mlflow.CreateModelVersion\x1a#.mlflow.CreateModelVersion.Response\"P\xf2\x86\x19L\n3\n\x04POST\x12%/preview/mlflow/model-versions/create\x1a\x04\x08\x02\x10\x00\x10\x01*\x13\x43reate ModelVersion\x12\xa8\x01\n\x12updateModelVersion\x12\x1a.mlflow.UpdateModelVersion\x1a#.mlflow.UpdateModelVersion.Response\"Q\xf2\x86\x19M\n4\n\x05PATCH\x12%/preview/mlflow/model-versions/update\x1a\x04\x08\x02\x10\x00\x10\x01*\x13Update ModelVersion\x12\xa9\x01\n\x12\x64\x65leteModelVersion\x12\x1a.mlflow.DeleteModelVersion\x1a#.mlflow.DeleteModelVersion.Response\"R\xf2\x86\x19N\n5\n\x06\x44\x45LETE\x12%/preview/mlflow/model-versions/delete\x1a\x04\x08\x02\x10\x00\x10\x01*\x13\x44\x65lete ModelVersion\x12\xbd\x01\n\x16getModelVersionDetails\x12\x1e.mlflow.GetModelVersionDetails\x1a\'.mlflow.GetModelVersionDetails.Response\"Z\xf2\x86\x19V\n8\n\x04POST\x12*/preview/mlflow/model-versions/get-details\x1a\x04\x08\x02\x10\x00\x10\x01*\x18Get ModelVersion Details\x12\xaa\x01\n\x13searchModelVersions\x12\x1b.mlflow.SearchModelVersions\x1a$.mlflow.SearchModelVersions.Response\"P\xf2\x86\x19L\n2\n\x03GET\x12%/preview/mlflow/model-versions/search\x1a\x04\x08\x02\x10\x00\x10\x01*\x14Search ModelVersions\x12\xb8\x01\n\x15getModelVersionStages\x12\x1d.mlflow.GetModelVersionStages\x1a&.mlflow.GetModelVersionStages.Response\"X\xf2\x86\x19T\n7\n\x04POST\x12)/preview/mlflow/model-versions/get-stages\x1a\x04\x08\x02\x10\x00\x10\x03*\x17Get ModelVersion Stages\x12\xe1\x01\n\x1agetModelVersionDownloadUri\x12\".mlflow.GetModelVersionDownloadUri\x1a+.mlflow.GetModelVersionDownloadUri.Response\"r\xf2\x86\x19n\n=\n\x04POST\x12//preview/mlflow/model-versions/get-download-uri\x1a\x04\x08\x02\x10\x00\x10\x01*+Get Download URI For ModelVersion ArtifactsB!\n\x14org.mlflow.api.proto\x90\x01\x01\xa0\x01\x01\xe2?\x02\x10\x01')
+  serialized_pb=_b('\n\x14model_registry.proto\x12\x06mlflow\x1a\x15scalapb/scalapb.proto\x1a\x10\x64\x61tabricks.proto\"\x1f\n\x0fRegisteredModel\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xe5\x01\n\x17RegisteredModelDetailed\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel\x12\x1a\n\x12\x63reation_timestamp\x18\x02 \x01(\x03\x12\x1e\n\x16last_updated_timestamp\x18\x03 \x01(\x03\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x35\n\x0flatest_versions\x18\x06 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed\"R\n\x0cModelVersion\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel\x12\x0f\n\x07version\x18\x02 \x01(\x03\"\xa0\x02\n\x14ModelVersionDetailed\x12+\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersion\x12\x1a\n\x12\x63reation_timestamp\x18\x02 \x01(\x03\x12\x1e\n\x16last_updated_timestamp\x18\x03 \x01(\x03\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x15\n\rcurrent_stage\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x0e\n\x06source\x18\x07 \x01(\t\x12\x0e\n\x06run_id\x18\x08 \x01(\t\x12*\n\x06status\x18\t \x01(\x0e\x32\x1a.mlflow.ModelVersionStatus\x12\x16\n\x0estatus_message\x18\n \x01(\t\"\xa8\x01\n\rRegistryEvent\x12\x10\n\x08sequence\x18\x01 \x01(\x03\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\x12-\n\nevent_type\x18\x03 \x01(\x0e\x32\x19.mlflow.RegistryEventType\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0f\n\x07version\x18\x05 \x01(\x03\x12\r\n\x05stage\x18\x06 \x01(\t\x12\x15\n\rprevious_name\x18\x07 \x01(\t\"\x97\x01\n\x15\x43reateRegisteredModel\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xf8\x86\x19\x01\x1a=\n\x08Response\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xdf\x01\n\x15UpdateRegisteredModel\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x1a=\n\x08Response\x12\x31\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModel:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x89\x01\n\x15\x44\x65leteRegisteredModel\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xd1\x01\n\x19GetRegisteredModelDetails\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x1aN\n\x08Response\x12\x42\n\x19registered_model_detailed\x18\x01 \x01(\x0b\x32\x1f.mlflow.RegisteredModelDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xe8\x01\n\x14ListRegisteredModels\x12\x13\n\x0bmax_results\x18\x01 \x01(\x03\x12\x10\n\x08order_by\x18\x02 \x03(\t\x12\x12\n\npage_token\x18\x03 \x01(\t\x1ah\n\x08Response\x12\x43\n\x1aregistered_models_detailed\x18\x01 \x03(\x0b\x32\x1f.mlflow.RegisteredModelDetailed\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xd4\x01\n\x11GetLatestVersions\x12\x37\n\x10registered_model\x18\x01 \x01(\x0b\x32\x17.mlflow.RegisteredModelB\x04\xf8\x86\x19\x01\x12\x0e\n\x06stages\x18\x02 \x03(\t\x1aI\n\x08Response\x12=\n\x17model_versions_detailed\x18\x01 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xb4\x01\n\x12\x43reateModelVersion\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xf8\x86\x19\x01\x12\x14\n\x06source\x18\x02 \x01(\tB\x04\xf8\x86\x19\x01\x12\x0e\n\x06run_id\x18\x03 \x01(\t\x1a\x37\n\x08Response\x12+\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersion:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xa4\x01\n\x12UpdateModelVersion\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x12\r\n\x05stage\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x80\x01\n\x12\x44\x65leteModelVersion\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a\n\n\x08Response:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xc2\x01\n\x16GetModelVersionDetails\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1aH\n\x08Response\x12<\n\x16model_version_detailed\x18\x01 \x01(\x0b\x32\x1c.mlflow.ModelVersionDetailed:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xf6\x01\n\x13SearchModelVersions\x12\x0e\n\x06\x66ilter\x18\x01 \x01(\t\x12\x18\n\x0bmax_results\x18\x02 \x01(\x03:\x03\x31\x30\x30\x12\x10\n\x08order_by\x18\x03 \x03(\t\x12\x12\n\npage_token\x18\x04 \x01(\t\x1a\x62\n\x08Response\x12=\n\x17model_versions_detailed\x18\x01 \x03(\x0b\x32\x1c.mlflow.ModelVersionDetailed\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x93\x01\n\x15GetModelVersionStages\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a\x1a\n\x08Response\x12\x0e\n\x06stages\x18\x01 \x03(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\x9e\x01\n\x1aGetModelVersionDownloadUri\x12\x31\n\rmodel_version\x18\x01 \x01(\x0b\x32\x14.mlflow.ModelVersionB\x04\xf8\x86\x19\x01\x1a \n\x08Response\x12\x14\n\x0c\x61rtifact_uri\x18\x01 \x01(\t:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]\"\xcf\x01\n\x11GetRegistryEvents\x12\x10\n\x05since\x18\x01 \x01(\x03:\x01\x30\x12\x18\n\x0bmax_results\x18\x02 \x01(\x03:\x03\x31\x30\x30\x12\x17\n\x0ftimeout_seconds\x18\x03 \x01(\x03\x1aH\n\x08Response\x12%\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x15.mlflow.RegistryEvent\x12\x15\n\rlast_sequence\x18\x02 \x01(\x03:+\xe2?(\n&com.databricks.rpc.RPC[$this.Response]*}\n\x12ModelVersionStatus\x12\x18\n\x14PENDING_REGISTRATION\x10\x01\x12\x17\n\x13\x46\x41ILED_REGISTRATION\x10\x02\x12\t\n\x05READY\x10\x03\x12\x14\n\x10PENDING_DELETION\x10\x04\x12\x13\n\x0f\x46\x41ILED_DELETION\x10\x05*\xf9\x01\n\x11RegistryEventType\x12\x1b\n\x17\x43REATE_REGISTERED_MODEL\x10\x01\x12\x1b\n\x17RENAME_REGISTERED_MODEL\x10\x02\x12\x1b\n\x17UPDATE_REGISTERED_MODEL\x10\x03\x12\x1b\n\x17\x44\x45LETE_REGISTERED_MODEL\x10\x04\x12\x18\n\x14\x43REATE_MODEL_VERSION\x10\x05\x12\"\n\x1eTRANSITION_MODEL_VERSION_STAGE\x10\x06\x12\x18\n\x14UPDATE_MODEL_VERSION\x10\x07\x12\x18\n\x14\x44\x45LETE_MODEL_VERSION\x10\x08\x32\xb2\x14\n\x14ModelRegistryService\x12\xb6\x01\n\x15\x63reateRegisteredModel\x12\x1d.mlflow.CreateRegisteredModel\x1a&.mlflow.CreateRegisteredModel.Response\"V\xf2\x86\x19R\n6\n\x04POST\x12(/preview/mlflow/registered-models/create\x1a\x04\x08\x02\x10\x00\x10\x01*\x16\x43reate RegisteredModel\x12\xb7\x01\n\x15updateRegisteredModel\x12\x1d.mlflow.UpdateRegisteredModel\x1a&.mlflow.UpdateRegisteredModel.Response\"W\xf2\x86\x19S\n7\n\x05PATCH\x12(/preview/mlflow/registered-models/update\x1a\x04\x08\x02\x10\x00\x10\x01*\x16Update RegisteredModel\x12\xb8\x01\n\x15\x64\x65leteRegisteredModel\x12\x1d.mlflow.DeleteRegisteredModel\x1a&.mlflow.DeleteRegisteredModel.Response\"X\xf2\x86\x19T\n8\n\x06\x44\x45LETE\x12(/preview/mlflow/registered-models/delete\x1a\x04\x08\x02\x10\x00\x10\x01*\x16\x44\x65lete RegisteredModel\x12\xcc\x01\n\x19getRegisteredModelDetails\x12!.mlflow.GetRegisteredModelDetails\x1a*.mlflow.GetRegisteredModelDetails.Response\"`\xf2\x86\x19\\\n;\n\x04POST\x12-/preview/mlflow/registered-models/get-details\x1a\x04\x08\x02\x10\x00\x10\x01*\x1bGet RegisteredModel Details\x12\xaf\x01\n\x14listRegisteredModels\x12\x1c.mlflow.ListRegisteredModels\x1a%.mlflow.ListRegisteredModels.Response\"R\xf2\x86\x19N\n3\n\x03GET\x12&/preview/mlflow/registered-models/list\x1a\x04\x08\x02\x10\x00\x10\x01*\x15List RegisteredModels\x12\xb9\x01\n\x11getLatestVersions\x12\x19.mlflow.GetLatestVersions\x1a\".mlflow.GetLatestVersions.Response\"e\xf2\x86\x19\x61\nC\n\x04POST\x12\x35/preview/mlflow/registered-models/get-latest-versions\x1a\x04\x08\x02\x10\x00\x10\x01*\x18Get Latest ModelVersions\x12\xa7\x01\n\x12\x63reateModelVersion\x12\x1a.mlflow.CreateModelVersion\x1a#.mlflow.CreateModelVersion.Response\"P\xf2\x86\x19L\n3\n\x04POST\x12%/preview/mlflow/model-versions/create\x1a\x04\x08\x02\x10\x00\x10\x01*\x13\x43reate ModelVersion\x12\xa8\x01\n\x12updateModelVersion\x12\x1a.mlflow.UpdateModelVersion\x1a#.mlflow.UpdateModelVersion.Response\"Q\xf2\x86\x19M\n4\n\x05PATCH\x12%/preview/mlflow/model-versions/update\x1a\x04\x08\x02\x10\x00\x10\x01*\x13Update ModelVersion\x12\xa9\x01\n\x12\x64\x65leteModelVersion\x12\x1a.mlflow.DeleteModelVersion\x1a#.mlflow.DeleteModelVersion.Response\"R\xf2\x86\x19N\n5\n\x06\x44\x45LETE\x12%/preview/mlflow/model-versions/delete\x1a\x04\x08\x02\x10\x00\x10\x01*\x13\x44\x65lete ModelVersion\x12\xbd\x01\n\x16getModelVersionDetails\x12\x1e.mlflow.GetModelVersionDetails\x1a\'.mlflow.GetModelVersionDetails.Response\"Z\xf2\x86\x19V\n8\n\x04POST\x12*/preview/mlflow/model-versions/get-details\x1a\x04\x08\x02\x10\x00\x10\x01*\x18Get ModelVersion Details\x12\xaa\x01\n\x13searchModelVersions\x12\x1b.mlflow.SearchModelVersions\x1a$.mlflow.SearchModelVersions.Response\"P\xf2\x86\x19L\n2\n\x03GET\x12%/preview/mlflow/model-versions/search\x1a\x04\x08\x02\x10\x00\x10\x01*\x14Search ModelVersions\x12\xb8\x01\n\x15getModelVersionStages\x12\x1d.mlflow.GetModelVersionStages\x1a&.mlflow.GetModelVersionStages.Response\"X\xf2\x86\x19T\n7\n\x04POST\x12)/preview/mlflow/model-versions/get-stages\x1a\x04\x08\x02\x10\x00\x10\x03*\x17Get ModelVersion Stages\x12\xe1\x01\n\x1agetModelVersionDownloadUri\x12\".mlflow.GetModelVersionDownloadUri\x1a+.mlflow.GetModelVersionDownloadUri.Response\"r\xf2\x86\x19n\n=\n\x04POST\x12//preview/mlflow/model-versions/get-download-uri\x1a\x04\x08\x02\x10\x00\x10\x01*+Get Download URI For ModelVersion Artifacts\x12\xa1\x01\n\x11getRegistryEvents\x12\x19.mlflow.GetRegistryEvents\x1a\".mlflow.GetRegistryEvents.Response\"M\xf2\x86\x19I\n0\n\x03GET\x12#/preview/mlflow/registry-events/get\x1a\x04\x08\x02\x10\x00\x10\x01*\x13Get Registry EventsB!\n\x14org.mlflow.api.proto\x90\x01\x01\xa0\x01\x01\xe2?\x02\x10\x01')
   ,
   dependencies=[scalapb_dot_scalapb__pb2.DESCRIPTOR,databricks__pb2.DESCRIPTOR,])
 
@@ -57,17 +57,72 @@ _MODELVERSIONSTATUS = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=3049,
-  serialized_end=3174,
+  serialized_start=3514,
+  serialized_end=3639,
 )
 _sym_db.RegisterEnumDescriptor(_MODELVERSIONSTATUS)
 
 ModelVersionStatus = enum_type_wrapper.EnumTypeWrapper(_MODELVERSIONSTATUS)
+_REGISTRYEVENTTYPE = _descriptor.EnumDescriptor(
+  name='RegistryEventType',
+  full_name='mlflow.RegistryEventType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='CREATE_REGISTERED_MODEL', index=0, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RENAME_REGISTERED_MODEL', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UPDATE_REGISTERED_MODEL', index=2, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DELETE_REGISTERED_MODEL', index=3, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CREATE_MODEL_VERSION', index=4, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TRANSITION_MODEL_VERSION_STAGE', index=5, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UPDATE_MODEL_VERSION', index=6, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DELETE_MODEL_VERSION', index=7, number=8,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3642,
+  serialized_end=3891,
+)
+_sym_db.RegisterEnumDescriptor(_REGISTRYEVENTTYPE)
+
+RegistryEventType = enum_type_wrapper.EnumTypeWrapper(_REGISTRYEVENTTYPE)
 PENDING_REGISTRATION = 1
 FAILED_REGISTRATION = 2
 READY = 3
 PENDING_DELETION = 4
 FAILED_DELETION = 5
+CREATE_REGISTERED_MODEL = 1
+RENAME_REGISTERED_MODEL = 2
+UPDATE_REGISTERED_MODEL = 3
+DELETE_REGISTERED_MODEL = 4
+CREATE_MODEL_VERSION = 5
+TRANSITION_MODEL_VERSION_STAGE = 6
+UPDATE_MODEL_VERSION = 7
+DELETE_MODEL_VERSION = 8
 
 
 
@@ -300,6 +355,79 @@ _MODELVERSIONDETAILED = _descriptor.Descriptor(
 )
 
 
+_REGISTRYEVENT = _descriptor.Descriptor(
+  name='RegistryEvent',
+  full_name='mlflow.RegistryEvent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sequence', full_name='mlflow.RegistryEvent.sequence', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='mlflow.RegistryEvent.timestamp', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='event_type', full_name='mlflow.RegistryEvent.event_type', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='mlflow.RegistryEvent.name', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='mlflow.RegistryEvent.version', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stage', full_name='mlflow.RegistryEvent.stage', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='previous_name', full_name='mlflow.RegistryEvent.previous_name', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=714,
+  serialized_end=882,
+)
+
+
 _CREATEREGISTEREDMODEL_RESPONSE = _descriptor.Descriptor(
   name='Response',
   full_name='mlflow.CreateRegisteredModel.Response',
@@ -326,8 +454,8 @@ _CREATEREGISTEREDMODEL_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=759,
-  serialized_end=820,
+  serialized_start=930,
+  serialized_end=991,
 )
 
 _CREATEREGISTEREDMODEL = _descriptor.Descriptor(
@@ -356,8 +484,8 @@ _CREATEREGISTEREDMODEL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=714,
-  serialized_end=865,
+  serialized_start=885,
+  serialized_end=1036,
 )
 
 
@@ -387,8 +515,8 @@ _UPDATEREGISTEREDMODEL_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=759,
-  serialized_end=820,
+  serialized_start=930,
+  serialized_end=991,
 )
 
 _UPDATEREGISTEREDMODEL = _descriptor.Descriptor(
@@ -431,8 +559,8 @@ _UPDATEREGISTEREDMODEL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=868,
-  serialized_end=1091,
+  serialized_start=1039,
+  serialized_end=1262,
 )
 
 
@@ -455,8 +583,8 @@ _DELETEREGISTEREDMODEL_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=759,
-  serialized_end=769,
+  serialized_start=930,
+  serialized_end=940,
 )
 
 _DELETEREGISTEREDMODEL = _descriptor.Descriptor(
@@ -485,8 +613,8 @@ _DELETEREGISTEREDMODEL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1094,
-  serialized_end=1231,
+  serialized_start=1265,
+  serialized_end=1402,
 )
 
 
@@ -516,8 +644,8 @@ _GETREGISTEREDMODELDETAILS_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1320,
-  serialized_end=1398,
+  serialized_start=1491,
+  serialized_end=1569,
 )
 
 _GETREGISTEREDMODELDETAILS = _descriptor.Descriptor(
@@ -546,8 +674,8 @@ _GETREGISTEREDMODELDETAILS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1234,
-  serialized_end=1443,
+  serialized_start=1405,
+  serialized_end=1614,
 )
 
 
@@ -565,6 +693,13 @@ _LISTREGISTEREDMODELS_RESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_page_token', full_name='mlflow.ListRegisteredModels.Response.next_page_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -577,8 +712,8 @@ _LISTREGISTEREDMODELS_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1470,
-  serialized_end=1549,
+  serialized_start=1700,
+  serialized_end=1804,
 )
 
 _LISTREGISTEREDMODELS = _descriptor.Descriptor(
@@ -588,6 +723,27 @@ _LISTREGISTEREDMODELS = _descriptor.Descriptor(
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
+    _descriptor.FieldDescriptor(
+      name='max_results', full_name='mlflow.ListRegisteredModels.max_results', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='order_by', full_name='mlflow.ListRegisteredModels.order_by', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_token', full_name='mlflow.ListRegisteredModels.page_token', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -600,8 +756,8 @@ _LISTREGISTEREDMODELS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1446,
-  serialized_end=1594,
+  serialized_start=1617,
+  serialized_end=1849,
 )
 
 
@@ -631,8 +787,8 @@ _GETLATESTVERSIONS_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1691,
-  serialized_end=1764,
+  serialized_start=1946,
+  serialized_end=2019,
 )
 
 _GETLATESTVERSIONS = _descriptor.Descriptor(
@@ -668,8 +824,8 @@ _GETLATESTVERSIONS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1597,
-  serialized_end=1809,
+  serialized_start=1852,
+  serialized_end=2064,
 )
 
 
@@ -699,8 +855,8 @@ _CREATEMODELVERSION_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1892,
-  serialized_end=1947,
+  serialized_start=2147,
+  serialized_end=2202,
 )
 
 _CREATEMODELVERSION = _descriptor.Descriptor(
@@ -743,8 +899,8 @@ _CREATEMODELVERSION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1812,
-  serialized_end=1992,
+  serialized_start=2067,
+  serialized_end=2247,
 )
 
 
@@ -767,8 +923,8 @@ _UPDATEMODELVERSION_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=759,
-  serialized_end=769,
+  serialized_start=930,
+  serialized_end=940,
 )
 
 _UPDATEMODELVERSION = _descriptor.Descriptor(
@@ -811,8 +967,8 @@ _UPDATEMODELVERSION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1995,
-  serialized_end=2159,
+  serialized_start=2250,
+  serialized_end=2414,
 )
 
 
@@ -835,8 +991,8 @@ _DELETEMODELVERSION_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=759,
-  serialized_end=769,
+  serialized_start=930,
+  serialized_end=940,
 )
 
 _DELETEMODELVERSION = _descriptor.Descriptor(
@@ -865,8 +1021,8 @@ _DELETEMODELVERSION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2162,
-  serialized_end=2290,
+  serialized_start=2417,
+  serialized_end=2545,
 )
 
 
@@ -896,8 +1052,8 @@ _GETMODELVERSIONDETAILS_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2370,
-  serialized_end=2442,
+  serialized_start=2625,
+  serialized_end=2697,
 )
 
 _GETMODELVERSIONDETAILS = _descriptor.Descriptor(
@@ -926,8 +1082,8 @@ _GETMODELVERSIONDETAILS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2293,
-  serialized_end=2487,
+  serialized_start=2548,
+  serialized_end=2742,
 )
 
 
@@ -964,8 +1120,8 @@ _SEARCHMODELVERSIONS_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2593,
-  serialized_end=2691,
+  serialized_start=2848,
+  serialized_end=2946,
 )
 
 _SEARCHMODELVERSIONS = _descriptor.Descriptor(
@@ -1015,8 +1171,8 @@ _SEARCHMODELVERSIONS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2490,
-  serialized_end=2736,
+  serialized_start=2745,
+  serialized_end=2991,
 )
 
 
@@ -1046,8 +1202,8 @@ _GETMODELVERSIONSTAGES_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2815,
-  serialized_end=2841,
+  serialized_start=3070,
+  serialized_end=3096,
 )
 
 _GETMODELVERSIONSTAGES = _descriptor.Descriptor(
@@ -1076,8 +1232,8 @@ _GETMODELVERSIONSTAGES = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2739,
-  serialized_end=2886,
+  serialized_start=2994,
+  serialized_end=3141,
 )
 
 
@@ -1107,8 +1263,8 @@ _GETMODELVERSIONDOWNLOADURI_RESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2970,
-  serialized_end=3002,
+  serialized_start=3225,
+  serialized_end=3257,
 )
 
 _GETMODELVERSIONDOWNLOADURI = _descriptor.Descriptor(
@@ -1137,8 +1293,90 @@ _GETMODELVERSIONDOWNLOADURI = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2889,
-  serialized_end=3047,
+  serialized_start=3144,
+  serialized_end=3302,
+)
+
+
+_GETREGISTRYEVENTS_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='mlflow.GetRegistryEvents.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='events', full_name='mlflow.GetRegistryEvents.Response.events', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_sequence', full_name='mlflow.GetRegistryEvents.Response.last_sequence', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3395,
+  serialized_end=3467,
+)
+
+_GETREGISTRYEVENTS = _descriptor.Descriptor(
+  name='GetRegistryEvents',
+  full_name='mlflow.GetRegistryEvents',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='since', full_name='mlflow.GetRegistryEvents.since', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_results', full_name='mlflow.GetRegistryEvents.max_results', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=True, default_value=100,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timeout_seconds', full_name='mlflow.GetRegistryEvents.timeout_seconds', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETREGISTRYEVENTS_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=_b('\342?(\n&com.databricks.rpc.RPC[$this.Response]'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3305,
+  serialized_end=3512,
 )
 
 _REGISTEREDMODELDETAILED.fields_by_name['registered_model'].message_type = _REGISTEREDMODEL
@@ -1146,6 +1384,7 @@ _REGISTEREDMODELDETAILED.fields_by_name['latest_versions'].message_type = _MODEL
 _MODELVERSION.fields_by_name['registered_model'].message_type = _REGISTEREDMODEL
 _MODELVERSIONDETAILED.fields_by_name['model_version'].message_type = _MODELVERSION
 _MODELVERSIONDETAILED.fields_by_name['status'].enum_type = _MODELVERSIONSTATUS
+_REGISTRYEVENT.fields_by_name['event_type'].enum_type = _REGISTRYEVENTTYPE
 _CREATEREGISTEREDMODEL_RESPONSE.fields_by_name['registered_model'].message_type = _REGISTEREDMODEL
 _CREATEREGISTEREDMODEL_RESPONSE.containing_type = _CREATEREGISTEREDMODEL
 _UPDATEREGISTEREDMODEL_RESPONSE.fields_by_name['registered_model'].message_type = _REGISTEREDMODEL
@@ -1176,10 +1415,13 @@ _GETMODELVERSIONSTAGES_RESPONSE.containing_type = _GETMODELVERSIONSTAGES
 _GETMODELVERSIONSTAGES.fields_by_name['model_version'].message_type = _MODELVERSION
 _GETMODELVERSIONDOWNLOADURI_RESPONSE.containing_type = _GETMODELVERSIONDOWNLOADURI
 _GETMODELVERSIONDOWNLOADURI.fields_by_name['model_version'].message_type = _MODELVERSION
+_GETREGISTRYEVENTS_RESPONSE.fields_by_name['events'].message_type = _REGISTRYEVENT
+_GETREGISTRYEVENTS_RESPONSE.containing_type = _GETREGISTRYEVENTS
 DESCRIPTOR.message_types_by_name['RegisteredModel'] = _REGISTEREDMODEL
 DESCRIPTOR.message_types_by_name['RegisteredModelDetailed'] = _REGISTEREDMODELDETAILED
 DESCRIPTOR.message_types_by_name['ModelVersion'] = _MODELVERSION
 DESCRIPTOR.message_types_by_name['ModelVersionDetailed'] = _MODELVERSIONDETAILED
+DESCRIPTOR.message_types_by_name['RegistryEvent'] = _REGISTRYEVENT
 DESCRIPTOR.message_types_by_name['CreateRegisteredModel'] = _CREATEREGISTEREDMODEL
 DESCRIPTOR.message_types_by_name['UpdateRegisteredModel'] = _UPDATEREGISTEREDMODEL
 DESCRIPTOR.message_types_by_name['DeleteRegisteredModel'] = _DELETEREGISTEREDMODEL
@@ -1193,7 +1435,9 @@ DESCRIPTOR.message_types_by_name['GetModelVersionDetails'] = _GETMODELVERSIONDET
 DESCRIPTOR.message_types_by_name['SearchModelVersions'] = _SEARCHMODELVERSIONS
 DESCRIPTOR.message_types_by_name['GetModelVersionStages'] = _GETMODELVERSIONSTAGES
 DESCRIPTOR.message_types_by_name['GetModelVersionDownloadUri'] = _GETMODELVERSIONDOWNLOADURI
+DESCRIPTOR.message_types_by_name['GetRegistryEvents'] = _GETREGISTRYEVENTS
 DESCRIPTOR.enum_types_by_name['ModelVersionStatus'] = _MODELVERSIONSTATUS
+DESCRIPTOR.enum_types_by_name['RegistryEventType'] = _REGISTRYEVENTTYPE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 RegisteredModel = _reflection.GeneratedProtocolMessageType('RegisteredModel', (_message.Message,), dict(
@@ -1224,6 +1468,13 @@ ModelVersionDetailed = _reflection.GeneratedProtocolMessageType('ModelVersionDet
   ))
 _sym_db.RegisterMessage(ModelVersionDetailed)
 
+RegistryEvent = _reflection.GeneratedProtocolMessageType('RegistryEvent', (_message.Message,), dict(
+  DESCRIPTOR = _REGISTRYEVENT,
+  __module__ = 'model_registry_pb2'
+  # @@protoc_insertion_point(class_scope:mlflow.RegistryEvent)
+  ))
+_sym_db.RegisterMessage(RegistryEvent)
+
 CreateRegisteredModel = _reflection.GeneratedProtocolMessageType('CreateRegisteredModel', (_message.Message,), dict(
 
   Response = _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), dict(
@@ -1419,6 +1670,21 @@ GetModelVersionDownloadUri = _reflection.GeneratedProtocolMessageType('GetModelV
 _sym_db.RegisterMessage(GetModelVersionDownloadUri)
 _sym_db.RegisterMessage(GetModelVersionDownloadUri.Response)
 
+GetRegistryEvents = _reflection.GeneratedProtocolMessageType('GetRegistryEvents', (_message.Message,), dict(
+
+  Response = _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), dict(
+    DESCRIPTOR = _GETREGISTRYEVENTS_RESPONSE,
+    __module__ = 'model_registry_pb2'
+    # @@protoc_insertion_point(class_scope:mlflow.GetRegistryEvents.Response)
+    ))
+  ,
+  DESCRIPTOR = _GETREGISTRYEVENTS,
+  __module__ = 'model_registry_pb2'
+  # @@protoc_insertion_point(class_scope:mlflow.GetRegistryEvents)
+  ))
+_sym_db.RegisterMessage(GetRegistryEvents)
+_sym_db.RegisterMessage(GetRegistryEvents.Response)
+
 
 DESCRIPTOR._options = None
 _CREATEREGISTEREDMODEL.fields_by_name['name']._options = None
@@ -1446,6 +1712,7 @@ _GETMODELVERSIONSTAGES.fields_by_name['model_version']._options = None
 _GETMODELVERSIONSTAGES._options = None
 _GETMODELVERSIONDOWNLOADURI.fields_by_name['model_version']._options = None
 _GETMODELVERSIONDOWNLOADURI._options = None
+_GETREGISTRYEVENTS._options = None
 
 _MODELREGISTRYSERVICE = _descriptor.ServiceDescriptor(
   name='ModelRegistryService',
@@ -1453,8 +1720,8 @@ _MODELREGISTRYSERVICE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=3177,
-  serialized_end=5623,
+  serialized_start=3894,
+  serialized_end=6504,
   methods=[
   _descriptor.MethodDescriptor(
     name='createRegisteredModel',
@@ -1573,6 +1840,15 @@ _MODELREGISTRYSERVICE = _descriptor.ServiceDescriptor(
     output_type=_GETMODELVERSIONDOWNLOADURI_RESPONSE,
     serialized_options=_b('\362\206\031n\n=\n\004POST\022//preview/mlflow/model-versions/get-download-uri\032\004\010\002\020\000\020\001*+Get Download URI For ModelVersion Artifacts'),
   ),
+  _descriptor.MethodDescriptor(
+    name='getRegistryEvents',
+    full_name='mlflow.ModelRegistryService.getRegistryEvents',
+    index=13,
+    containing_service=None,
+    input_type=_GETREGISTRYEVENTS,
+    output_type=_GETREGISTRYEVENTS_RESPONSE,
+    serialized_options=_b('\362\206\031I\n0\n\003GET\022#/preview/mlflow/registry-events/get\032\004\010\002\020\000\020\001*\023Get Registry Events'),
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_MODELREGISTRYSERVICE)
 
@@ -1,11 +1,16 @@
+import mimetypes
 import os
+import posixpath
+import re
 import shlex
 import sys
 
-from flask import Flask, send_from_directory
+from flask import Flask, request, send_from_directory
+from werkzeug.security import safe_join
 
 from mlflow.server import handlers
-from mlflow.server.handlers import get_artifact_handler, STATIC_PREFIX_ENV_VAR, _add_static_prefix
+from mlflow.server.handlers import get_artifact_handler, get_artifact_bundle_handler, \
+    STATIC_PREFIX_ENV_VAR, _add_static_prefix
 from mlflow.utils.process import exec_cmd
 
 # NB: These are intenrnal environment variables used for communication between
@@ -13,9 +18,29 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+RESPONSE_CACHE_URI_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE_URI"
+ASGI_MAX_THREADS_ENV_VAR = "_MLFLOW_SERVER_ASGI_MAX_THREADS"
+SLOW_REQUEST_THRESHOLD_ENV_VAR = "_MLFLOW_SERVER_SLOW_REQUEST_THRESHOLD"
+RATE_LIMIT_ENV_VAR = "_MLFLOW_SERVER_RATE_LIMIT"
+RATE_LIMIT_BURST_ENV_VAR = "_MLFLOW_SERVER_RATE_LIMIT_BURST"
+RATE_LIMIT_TRUST_AUTHORIZATION_ENV_VAR = "_MLFLOW_SERVER_RATE_LIMIT_TRUST_AUTHORIZATION"
+MAX_CONCURRENT_EXPENSIVE_REQUESTS_ENV_VAR = "_MLFLOW_SERVER_MAX_CONCURRENT_EXPENSIVE_REQUESTS"
+MAX_CONCURRENT_LONG_POLLS_ENV_VAR = "_MLFLOW_SERVER_MAX_CONCURRENT_LONG_POLLS"
+# Default maximum number of long polls for registry events handled concurrently by each ASGI
+# worker. Synchronous gunicorn workers handle a single request at a time, so they do not long poll
+# unless a limit is specified.
+_DEFAULT_ASGI_MAX_CONCURRENT_LONG_POLLS = 2
 
 REL_STATIC_DIR = "js/build"
 
+# Encodings and file extensions of the precompressed variants of static files written when
+# building the UI (see js/scripts/precompress.js), in order of preference.
+_PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+# Static files emitted by the UI build under a name containing a hash of their content, e.g.
+# static/js/main.1a2b3c4d.chunk.js, which never change and can be cached indefinitely.
+_CONTENT_HASHED_FILE_REGEX = re.compile(r"^static/.*\.[0-9a-f]{8,}\.[^/]+$")
+_IMMUTABLE_MAX_AGE_SECONDS = 365 * 24 * 3600
+
 app = Flask(__name__, static_folder=REL_STATIC_DIR)
 STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 
@@ -23,6 +48,9 @@ STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
+app.before_request(handlers.enforce_rate_limit)
+app.after_request(handlers.make_conditional_response)
+
 if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
     from mlflow.server.prometheus_exporter import activate_prometheus_exporter
     prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
@@ -30,6 +58,9 @@ if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
         os.makedirs(prometheus_metrics_path)
     activate_prometheus_exporter(app)
 
+if os.getenv(SLOW_REQUEST_THRESHOLD_ENV_VAR):
+    handlers.activate_slow_request_log(app, float(os.getenv(SLOW_REQUEST_THRESHOLD_ENV_VAR)))
+
 
 # Serve the "get-artifact" route.
 @app.route(_add_static_prefix('/get-artifact'))
@@ -37,17 +68,52 @@ def serve_artifacts():
     return get_artifact_handler()
 
 
+# Serve the "get-artifact-bundle" route, streaming whole artifact directories as tar archives.
+@app.route(_add_static_prefix('/get-artifact-bundle'))
+def serve_artifact_bundle():
+    return get_artifact_bundle_handler()
+
+
 # We expect the react app to be built assuming it is hosted at /static-files, so that requests for
 # CSS/JS resources will be made to e.g. /static-files/main.css and we can handle them here.
 @app.route(_add_static_prefix('/static-files/<path:path>'))
 def serve_static_file(path):
-    return send_from_directory(STATIC_DIR, path)
+    return _send_static_file(path)
 
 
 # Serve the index.html for the React App for all other routes.
 @app.route(_add_static_prefix('/'))
 def serve():
-    return send_from_directory(STATIC_DIR, 'index.html')
+    return _send_static_file('index.html')
+
+
+def _send_static_file(path):
+    """
+    Send a file of the UI build, using its precompressed variant if the client accepts its
+    encoding. Content-hashed files are cached by browsers for a year, while the others (e.g.
+    index.html, which references the current content-hashed files) are revalidated with their
+    ETag on each use.
+    """
+    response = None
+    for encoding, extension in _PRECOMPRESSED_ENCODINGS:
+        compressed_path = safe_join(STATIC_DIR, path + extension)
+        if request.accept_encodings[encoding] and compressed_path is not None \
+                and os.path.isfile(compressed_path):
+            response = send_from_directory(STATIC_DIR, path + extension,
+                                           mimetype=mimetypes.guess_type(path)[0])
+            response.content_encoding = encoding
+            break
+    if response is None:
+        response = send_from_directory(STATIC_DIR, path)
+    response.vary.add("Accept-Encoding")
+    if _CONTENT_HASHED_FILE_REGEX.match(posixpath.normpath(path)):
+        response.cache_control.public = True
+        response.cache_control.max_age = _IMMUTABLE_MAX_AGE_SECONDS
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = 0
+        response.cache_control.no_cache = True
+    return response
 
 
 def _build_waitress_command(waitress_opts, host, port):
@@ -67,12 +133,44 @@ def _build_gunicorn_command(gunicorn_opts, host, port, workers):
     return ["gunicorn"] + opts + ["-b", bind_address, "-w", "%s" % workers, "mlflow.server:app"]
 
 
+def _build_uvicorn_command(host, port, workers):
+    return ["uvicorn", "--host", host, "--port", "%s" % port, "--workers", "%s" % workers,
+            "mlflow.server.asgi:app"]
+
+
 def _run_server(file_store_path, default_artifact_root, host, port, static_prefix=None,
-                workers=None, gunicorn_opts=None, waitress_opts=None, expose_prometheus=None):
+                workers=None, gunicorn_opts=None, waitress_opts=None, expose_prometheus=None,
+                response_cache_uri=None, asgi=False, asgi_max_threads=None,
+                slow_request_threshold=None, rate_limit=None, rate_limit_burst=None,
+                max_concurrent_expensive_requests=None, rate_limit_trust_auth=False,
+                max_concurrent_long_polls=None):
     """
-    Run the MLflow server, wrapping it in gunicorn or waitress on windows
+    Run the MLflow server, wrapping it in gunicorn or waitress on windows, or in uvicorn if
+    ``asgi`` is True.
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param response_cache_uri: If set, responses to read-heavy endpoints are cached in the
+                               response cache specified by this URI.
+    :param asgi: If True, serve the ASGI application defined in :py:mod:`mlflow.server.asgi`.
+    :param asgi_max_threads: Maximum number of threads handling requests in each worker when
+                             ``asgi`` is True.
+    :param slow_request_threshold: If set, requests taking at least this many seconds to handle
+                                   are logged along with their parsed request message.
+    :param rate_limit: If set, maximum average number of requests per second each client can make
+                       to each worker. Requests exceeding it receive a 429 response.
+    :param rate_limit_burst: Maximum number of requests each client can make at once to each
+                             worker when ``rate_limit`` is set. Defaults to ``rate_limit``.
+    :param max_concurrent_expensive_requests: If set, maximum number of requests to expensive
+                                              endpoints (run search and artifact listing and
+                                              download) each worker handles concurrently.
+    :param rate_limit_trust_auth: If True, clients are identified for ``rate_limit`` by the user
+                                  or bearer token of their Authorization header, which must be
+                                  verified by a proxy in front of the server, rather than by
+                                  their address.
+    :param max_concurrent_long_polls: Maximum number of registry event requests waiting for new
+                                      events (long polls) each worker handles concurrently.
+                                      Defaults to 2 if ``asgi`` is True, and to 0 otherwise, in
+                                      which case these requests return immediately.
     :return: None
     """
     env_map = {}
@@ -86,8 +184,36 @@ def _run_server(file_store_path, default_artifact_root, host, port, static_prefi
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
 
+    if response_cache_uri:
+        env_map[RESPONSE_CACHE_URI_ENV_VAR] = response_cache_uri
+
+    if asgi_max_threads:
+        env_map[ASGI_MAX_THREADS_ENV_VAR] = str(asgi_max_threads)
+
+    if slow_request_threshold is not None:
+        env_map[SLOW_REQUEST_THRESHOLD_ENV_VAR] = str(slow_request_threshold)
+
+    if rate_limit:
+        env_map[RATE_LIMIT_ENV_VAR] = str(rate_limit)
+
+    if rate_limit_burst:
+        env_map[RATE_LIMIT_BURST_ENV_VAR] = str(rate_limit_burst)
+
+    if max_concurrent_expensive_requests:
+        env_map[MAX_CONCURRENT_EXPENSIVE_REQUESTS_ENV_VAR] = str(max_concurrent_expensive_requests)
+
+    if rate_limit_trust_auth:
+        env_map[RATE_LIMIT_TRUST_AUTHORIZATION_ENV_VAR] = "true"
+
+    if max_concurrent_long_polls is None and asgi:
+        max_concurrent_long_polls = _DEFAULT_ASGI_MAX_CONCURRENT_LONG_POLLS
+    if max_concurrent_long_polls is not None:
+        env_map[MAX_CONCURRENT_LONG_POLLS_ENV_VAR] = str(max_concurrent_long_polls)
+
     # TODO: eventually may want waitress on non-win32
-    if sys.platform == 'win32':
+    if asgi:
+        full_command = _build_uvicorn_command(host, port, workers or 4)
+    elif sys.platform == 'win32':
         full_command = _build_waitress_command(waitress_opts, host, port)
     else:
         full_command = _build_gunicorn_command(gunicorn_opts, host, port, workers or 4)
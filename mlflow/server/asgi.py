@@ -0,0 +1,163 @@
+"""
+ASGI entrypoint for the MLflow tracking server, used by ``mlflow server --asgi``.
+
+The Flask application is served by an ASGI server (uvicorn) through a thin WSGI-to-ASGI adapter.
+Each request is handled in a bounded thread pool, so that slow store calls (e.g. long searches)
+only occupy a pool thread rather than a whole server worker, and response bodies (e.g. artifact
+downloads and listings) are read from the application in the pool and sent to the client
+asynchronously, chunk by chunk, so that slow clients do not hold on to pool threads.
+
+This module requires Python 3.6+.
+"""
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.server import app as _flask_app, ASGI_MAX_THREADS_ENV_VAR
+
+_DEFAULT_MAX_THREADS = 16
+# Response chunks produced by the application are coalesced up to this size before being sent,
+# to limit the number of round trips between the event loop and the thread pool.
+_SEND_CHUNK_SIZE = 64 * 1024
+
+
+class WsgiToAsgi(object):
+    """
+    Adapts a WSGI application to the ASGI 3.0 interface, running the application in a thread pool
+    of at most ``max_threads`` threads.
+
+    Unlike ``asgiref.wsgi.WsgiToAsgi``, which runs all requests of a worker in a single thread and
+    sends response chunks from that thread, response chunks are sent from the event loop, so that
+    a client reading a response slowly does not hold a thread.
+    """
+
+    def __init__(self, wsgi_app, max_threads=_DEFAULT_MAX_THREADS):
+        self.wsgi_app = wsgi_app
+        self.max_threads = max_threads
+        self._executor = ThreadPoolExecutor(max_workers=max_threads)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._handle_http(scope, receive, send)
+        else:
+            raise ValueError("Unsupported ASGI scope type '%s'" % scope["type"])
+
+    async def _handle_lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle_http(self, scope, receive, send):
+        body = await _read_request_body(receive)
+        environ = _build_environ(scope, body)
+        response_start = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and response_start.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response_start["status"] = int(status.split(" ", 1)[0])
+            response_start["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                         for name, value in headers]
+
+        async def send_start():
+            if not response_start.get("sent"):
+                response_start["sent"] = True
+                await send({
+                    "type": "http.response.start",
+                    "status": response_start["status"],
+                    "headers": response_start["headers"],
+                })
+
+        loop = asyncio.get_event_loop()
+        iterable = await loop.run_in_executor(
+            self._executor, self.wsgi_app, environ, start_response)
+        try:
+            iterator = iter(iterable)
+            while True:
+                chunk = await loop.run_in_executor(self._executor, _read_chunk, iterator)
+                if not chunk:
+                    break
+                await send_start()
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send_start()
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            if hasattr(iterable, "close"):
+                await loop.run_in_executor(self._executor, iterable.close)
+
+
+async def _read_request_body(receive):
+    body = io.BytesIO()
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        body.write(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    body.seek(0)
+    return body
+
+
+def _read_chunk(iterator):
+    """
+    :return: The concatenation of the next response chunks produced by ``iterator``, up to
+             ``_SEND_CHUNK_SIZE`` bytes, or an empty byte string if ``iterator`` is exhausted.
+    """
+    chunks = []
+    size = 0
+    for data in iterator:
+        chunks.append(data)
+        size += len(data)
+        if size >= _SEND_CHUNK_SIZE:
+            break
+    return b"".join(chunks)
+
+
+def _build_environ(scope, body):
+    """Build a PEP 3333 WSGI environment for an ASGI HTTP connection scope."""
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": "HTTP/%s" % scope.get("http_version", "1.1"),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1")
+        value = value.decode("latin-1")
+        if name == "content-type":
+            key = "CONTENT_TYPE"
+        elif name == "content-length":
+            key = "CONTENT_LENGTH"
+        else:
+            key = "HTTP_%s" % name.upper().replace("-", "_")
+        if key in environ:
+            value = environ[key] + "," + value
+        environ[key] = value
+    return environ
+
+
+app = WsgiToAsgi(
+    _flask_app, max_threads=int(os.environ.get(ASGI_MAX_THREADS_ENV_VAR, _DEFAULT_MAX_THREADS)))
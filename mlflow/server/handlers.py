@@ -1,38 +1,74 @@
 # Define all the service endpoint handlers here.
 import json
+import logging
+import math
+import mimetypes
 import os
+import posixpath
 import re
+import time
 
 from functools import wraps
-from flask import Response, request, send_file
+from flask import Response, g, request
+from google.protobuf.json_format import MessageToDict
 from querystring_parser import parser
+from werkzeug.datastructures import ContentRange
+from werkzeug.wsgi import ClosingIterator
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
 from mlflow.entities.model_registry import RegisteredModel, ModelVersion
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
-    GetRun, SearchRuns, ListArtifacts, GetMetricHistory, CreateRun, \
+    GetRun, GetRuns, SearchRuns, ListArtifacts, GetMetricHistory, CreateRun, \
     UpdateRun, LogMetric, LogParam, SetTag, ListExperiments, \
     DeleteExperiment, RestoreExperiment, RestoreRun, DeleteRun, UpdateExperiment, LogBatch, \
     DeleteTag, SetExperimentTag, GetExperimentByName
 from mlflow.protos.model_registry_pb2 import ModelRegistryService, CreateRegisteredModel, \
     UpdateRegisteredModel, DeleteRegisteredModel, ListRegisteredModels, GetRegisteredModelDetails, \
     GetLatestVersions, CreateModelVersion, UpdateModelVersion, DeleteModelVersion, \
-    GetModelVersionDetails, GetModelVersionDownloadUri, SearchModelVersions, GetModelVersionStages
+    GetModelVersionDetails, GetModelVersionDownloadUri, SearchModelVersions, \
+    GetModelVersionStages, GetRegistryEvents
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.server.rate_limiter import RateLimitExceeded, TokenBucketRateLimiter, \
+    ConcurrencyLimiter, get_client_key
+from mlflow.server.response_cache import ResponseCacheRegistry, _get_in_memory_response_cache, \
+    compute_etag, get_response_key, invalidate_scopes
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.bundle import ArtifactBundle, get_bundle_filename, get_bundle_mimetype
 from mlflow.store.db.db_types import DATABASE_ENGINES
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict, dict_to_json
 from mlflow.utils.validation import _validate_batch_log_api_req
 from mlflow.utils.string_utils import is_string_type
 
 _tracking_store = None
 _model_registry_store = None
+_response_cache = None
+_rate_limiter = None
+_concurrency_limiter = None
+_long_poll_limiter = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
 
+# Functions called with each backend store (and its type, "tracking" or "model_registry") and
+# each artifact repository created by the server, e.g. to instrument them with metrics.
+_store_instrumenters = []
+_artifact_repo_instrumenters = []
+
+# Maximum length of the request messages logged for slow requests
+_SLOW_REQUEST_LOG_MAX_LENGTH = 2000
+
+_logger = logging.getLogger(__name__)
+
+# Scopes of cached responses, invalidated by the handlers that mutate the corresponding data
+_EXPERIMENTS_CACHE_SCOPE = "experiments"
+_RUNS_CACHE_SCOPE = "runs"
+
+
+def _run_metrics_cache_scope(run_id):
+    return "runs/{}/metrics".format(run_id)
+
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
     def __init__(self):
@@ -70,8 +106,16 @@ class ModelRegistryStoreRegistryWrapper(ModelRegistryStoreRegistry):
         return SqlAlchemyStore(store_uri)
 
 
+class ResponseCacheRegistryWrapper(ResponseCacheRegistry):
+    def __init__(self):
+        super(ResponseCacheRegistryWrapper, self).__init__()
+        self.register('memory', _get_in_memory_response_cache)
+        self.register_entrypoints()
+
+
 _tracking_store_registry = TrackingStoreRegistryWrapper()
 _model_registry_store_registry = ModelRegistryStoreRegistryWrapper()
+_response_cache_registry = ResponseCacheRegistryWrapper()
 
 
 def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
@@ -81,6 +125,8 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
         _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        for instrument_store in _store_instrumenters:
+            instrument_store(_tracking_store, "tracking")
     return _tracking_store
 
 
@@ -90,9 +136,71 @@ def _get_model_registry_store(backend_store_uri=None):
     if _model_registry_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         _model_registry_store = _model_registry_store_registry.get_store(store_uri)
+        if _model_registry_store is not None:
+            for instrument_store in _store_instrumenters:
+                instrument_store(_model_registry_store, "model_registry")
     return _model_registry_store
 
 
+def _get_response_cache():
+    """
+    :return: The response cache configured for the server, or ``None`` if response caching is
+             disabled.
+    """
+    from mlflow.server import RESPONSE_CACHE_URI_ENV_VAR
+    global _response_cache
+    if _response_cache is None:
+        cache_uri = os.environ.get(RESPONSE_CACHE_URI_ENV_VAR, None)
+        if cache_uri:
+            _response_cache = _response_cache_registry.get_cache(cache_uri)
+    return _response_cache
+
+
+def _get_rate_limiter():
+    """
+    :return: The per-client rate limiter configured for the server, or ``None`` if requests are
+             not rate limited.
+    """
+    from mlflow.server import RATE_LIMIT_ENV_VAR, RATE_LIMIT_BURST_ENV_VAR
+    global _rate_limiter
+    if _rate_limiter is None:
+        rate_limit = os.environ.get(RATE_LIMIT_ENV_VAR, None)
+        if rate_limit:
+            burst = os.environ.get(RATE_LIMIT_BURST_ENV_VAR, None)
+            _rate_limiter = TokenBucketRateLimiter(float(rate_limit),
+                                                   int(burst) if burst else None)
+    return _rate_limiter
+
+
+def _get_concurrency_limiter():
+    """
+    :return: The limiter bounding the number of concurrent requests to expensive endpoints, or
+             ``None`` if their concurrency is not limited.
+    """
+    from mlflow.server import MAX_CONCURRENT_EXPENSIVE_REQUESTS_ENV_VAR
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        max_concurrent_requests = os.environ.get(MAX_CONCURRENT_EXPENSIVE_REQUESTS_ENV_VAR, None)
+        if max_concurrent_requests:
+            _concurrency_limiter = ConcurrencyLimiter(int(max_concurrent_requests))
+    return _concurrency_limiter
+
+
+def _get_long_poll_limiter():
+    """
+    :return: The limiter bounding the number of concurrent long polls for registry events, or
+             ``None`` if long polling is disabled.
+    """
+    from mlflow.server import MAX_CONCURRENT_LONG_POLLS_ENV_VAR
+    global _long_poll_limiter
+    if _long_poll_limiter is None:
+        max_concurrent_long_polls = int(os.environ.get(MAX_CONCURRENT_LONG_POLLS_ENV_VAR, 0))
+        if max_concurrent_long_polls > 0:
+            _long_poll_limiter = ConcurrencyLimiter(
+                max_concurrent_long_polls, description="long polls for registry events")
+    return _long_poll_limiter
+
+
 def initialize_backend_stores(backend_store_uri=None, default_artifact_root=None):
     _get_tracking_store(backend_store_uri, default_artifact_root)
     _get_model_registry_store(backend_store_uri)
@@ -111,6 +219,14 @@ def _get_request_message(request_message, flask_request=request):
         # result.
         query_string = re.sub('%5B%5D', '%5B0%5D', flask_request.query_string.decode("utf-8"))
         request_dict = parser.parse(query_string, normalized=True)
+        # Query strings carry booleans as strings, which the JSON parser rejects, and a single
+        # value of a repeated field, like order_by=name, as a scalar
+        for field in request_message.DESCRIPTOR.fields:
+            value = request_dict.get(field.name)
+            if field.label == field.LABEL_REPEATED and is_string_type(value):
+                request_dict[field.name] = [value]
+            elif field.type == field.TYPE_BOOL and is_string_type(value):
+                request_dict[field.name] = value.lower() in ("true", "1")
         parse_dict(request_dict, request_message)
         return request_message
 
@@ -143,24 +259,218 @@ def catch_mlflow_exception(func):
     return wrapper
 
 
+def _rate_limit_exceeded_response(e):
+    response = Response(mimetype='application/json')
+    response.set_data(e.serialize_as_json())
+    response.status_code = e.get_http_status_code()
+    response.headers['Retry-After'] = str(int(math.ceil(e.retry_after_seconds)))
+    return response
+
+
+def enforce_rate_limit(flask_request=request):
+    """
+    Reject requests to the REST API and artifact download endpoints with a
+    ``429 Too Many Requests`` response when their client exceeds the configured rate limit.
+    """
+    from mlflow.server import RATE_LIMIT_TRUST_AUTHORIZATION_ENV_VAR
+    rate_limiter = _get_rate_limiter()
+    if rate_limiter is None or flask_request.endpoint not in _RATE_LIMITED_ENDPOINTS:
+        return None
+    trust_authorization = os.environ.get(RATE_LIMIT_TRUST_AUTHORIZATION_ENV_VAR) == "true"
+    try:
+        rate_limiter.acquire(get_client_key(flask_request, trust_authorization))
+    except RateLimitExceeded as e:
+        return _rate_limit_exceeded_response(e)
+    return None
+
+
+def limit_concurrency(func, get_limiter=None):
+    """
+    Decorator for handlers of expensive endpoints, rejecting requests with a
+    ``429 Too Many Requests`` response while the maximum number of concurrent expensive requests
+    are being handled. Streamed responses hold their slot until they have been sent.
+
+    :param get_limiter: Function returning the ``ConcurrencyLimiter`` bounding the concurrency of
+                        ``func``, or ``None`` if it is not limited. Defaults to the limiter shared
+                        by expensive endpoints.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        limiter = (get_limiter or _get_concurrency_limiter)()
+        if limiter is None:
+            return func(*args, **kwargs)
+        try:
+            limiter.acquire()
+        except RateLimitExceeded as e:
+            return _rate_limit_exceeded_response(e)
+        try:
+            response = func(*args, **kwargs)
+        except Exception:
+            limiter.release()
+            raise
+        if response.direct_passthrough:
+            # Passthrough responses are returned as is to the WSGI server, which closes them
+            # without calling the response's close callbacks
+            response.response = ClosingIterator(response.response, limiter.release)
+        else:
+            response.call_on_close(limiter.release)
+        return response
+    return wrapper
+
+
+def make_conditional_response(response, flask_request=request):
+    """
+    Set a strong ETag on successful JSON responses to GET requests, so that clients polling an
+    endpoint can send it back in an If-None-Match header and receive an empty
+    ``304 Not Modified`` response when the result has not changed.
+    """
+    if flask_request.method == 'GET' and response.status_code == 200 and \
+            response.mimetype == 'application/json' and not response.direct_passthrough:
+        response.set_etag(compute_etag(response.get_data()))
+        response.make_conditional(flask_request)
+    return response
+
+
+def cache_response(request_class, get_scopes):
+    """
+    Decorator for handlers of read-only endpoints whose responses can be served from the
+    server's response cache, if one is configured.
+
+    :param request_class: The type of protobuf message handled by the decorated handler.
+    :param get_scopes: Function mapping the request message to the list of cache scopes the
+                       response depends on.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _get_response_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+            request_message = _get_request_message(request_class())
+            key = get_response_key(cache, request_message, get_scopes(request_message))
+            body = cache.get(key)
+            if body is not None:
+                response = Response(mimetype='application/json')
+                response.set_data(body)
+                return response
+            response = func(*args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.get_data())
+            return response
+        return wrapper
+    return decorator
+
+
+def _invalidate_cached_responses(*scopes):
+    cache = _get_response_cache()
+    if cache is not None:
+        invalidate_scopes(cache, scopes)
+
+
 _TEXT_EXTENSIONS = ['txt', 'log', 'yaml', 'yml', 'json', 'js', 'py',
                     'csv', 'tsv', 'md', 'rst', 'MLmodel', 'MLproject']
 
 
 @catch_mlflow_exception
+@limit_concurrency
 def get_artifact_handler():
     query_string = request.query_string.decode('utf-8')
     request_dict = parser.parse(query_string, normalized=True)
     run_id = request_dict.get('run_id') or request_dict.get('run_uuid')
     run = _get_tracking_store().get_run(run_id)
-    filename = os.path.abspath(_get_artifact_repo(run).download_artifacts(request_dict['path']))
+    artifact_path = request_dict['path']
+    stream = _get_artifact_repo(run).open_stream(artifact_path)
+    return _send_artifact_stream(stream, posixpath.basename(artifact_path))
+
+
+def _send_artifact_stream(stream, filename, flask_request=request):
+    """
+    Stream the contents of an artifact to the client without buffering them on the server,
+    serving the byte range requested in the Range header of the request if any.
+    """
     extension = os.path.splitext(filename)[-1].replace(".", "")
-    # Always send artifacts as attachments to prevent the browser from displaying them on our web
-    # server's domain, which might enable XSS.
     if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype='text/plain', as_attachment=True)
+        mimetype = 'text/plain'
     else:
-        return send_file(filename, as_attachment=True)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    start, stop = 0, stream.size
+    byte_range = flask_request.range
+    # Multiple ranges are not supported, in which case the whole artifact is sent
+    if byte_range is not None and len(byte_range.ranges) == 1:
+        satisfiable_range = byte_range.range_for_length(stream.size)
+        if satisfiable_range is None:
+            stream.close()
+            response = Response(status=416)
+            response.content_range = ContentRange('bytes', None, None, stream.size)
+            return response
+        start, stop = satisfiable_range
+        stream.seek(start)
+    response = Response(ClosingIterator(stream.iter_chunks(stop - start), stream.close),
+                        mimetype=mimetype, direct_passthrough=True)
+    response.content_length = stop - start
+    response.accept_ranges = 'bytes'
+    if start != 0 or stop != stream.size:
+        response.status_code = 206
+        response.content_range = ContentRange('bytes', start, stop, stream.size)
+    # Always send artifacts as attachments to prevent the browser from displaying them on our web
+    # server's domain, which might enable XSS.
+    response.headers.add('Content-Disposition', 'attachment', filename=filename)
+    return response
+
+
+@catch_mlflow_exception
+@limit_concurrency
+def get_artifact_bundle_handler():
+    """
+    Stream an artifact file or directory (by default, all the artifacts of the run) as a tar
+    archive produced on the fly, optionally compressed with the algorithm specified by the
+    ``compression`` query parameter (``none``, ``gzip`` or ``zstd``).
+    """
+    query_string = request.query_string.decode('utf-8')
+    request_dict = parser.parse(query_string, normalized=True)
+    run_id = request_dict.get('run_id') or request_dict.get('run_uuid')
+    run = _get_tracking_store().get_run(run_id)
+    artifact_path = request_dict.get('path') or None
+    bundle = ArtifactBundle(_get_artifact_repo(run), artifact_path,
+                            compression=request_dict.get('compression'))
+    # The size of the archive is not known in advance, so it is sent with chunked encoding
+    response = Response(ClosingIterator(bundle.iter_chunks(), bundle.close),
+                        mimetype=get_bundle_mimetype(bundle.compression), direct_passthrough=True)
+    response.headers.add('Content-Disposition', 'attachment',
+                         filename=get_bundle_filename(artifact_path, bundle.compression))
+    return response
+
+
+def activate_slow_request_log(app, threshold_seconds):
+    """
+    Log a warning, including the parsed request message, for each request to the REST API that
+    takes at least ``threshold_seconds`` to handle.
+    """
+    request_classes = dict((handler.__name__, request_class)
+                           for request_class, handler in HANDLERS.items())
+
+    @app.before_request
+    def record_request_start_time():  # pylint: disable=unused-variable
+        g.mlflow_request_start_time = time.time()
+
+    @app.after_request
+    def log_slow_request(response):  # pylint: disable=unused-variable
+        duration = time.time() - g.mlflow_request_start_time
+        request_class = request_classes.get(request.endpoint)
+        if duration < threshold_seconds or request_class is None:
+            return response
+        try:
+            request_message = _get_request_message(request_class())
+            request_json = dict_to_json(
+                MessageToDict(request_message, preserving_proto_field_name=True))
+        except MlflowException as e:
+            request_json = "<invalid request: %s>" % e.message
+        if len(request_json) > _SLOW_REQUEST_LOG_MAX_LENGTH:
+            request_json = request_json[:_SLOW_REQUEST_LOG_MAX_LENGTH] + "..."
+        _logger.warning("Slow request: %s %s took %.3f seconds (status %s). %s: %s",
+                        request.method, request.path, duration, response.status_code,
+                        request_class.__name__, request_json)
+        return response
 
 
 def _not_implemented():
@@ -174,6 +484,7 @@ def _create_experiment():
     request_message = _get_request_message(CreateExperiment())
     experiment_id = _get_tracking_store().create_experiment(request_message.name,
                                                             request_message.artifact_location)
+    _invalidate_cached_responses(_EXPERIMENTS_CACHE_SCOPE)
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
     response = Response(mimetype='application/json')
@@ -182,6 +493,7 @@ def _create_experiment():
 
 
 @catch_mlflow_exception
+@cache_response(GetExperiment, lambda _: [_EXPERIMENTS_CACHE_SCOPE])
 def _get_experiment():
     request_message = _get_request_message(GetExperiment())
     response_message = GetExperiment.Response()
@@ -212,6 +524,7 @@ def _get_experiment_by_name():
 def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
+    _invalidate_cached_responses(_EXPERIMENTS_CACHE_SCOPE, _RUNS_CACHE_SCOPE)
     response_message = DeleteExperiment.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -222,6 +535,7 @@ def _delete_experiment():
 def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
+    _invalidate_cached_responses(_EXPERIMENTS_CACHE_SCOPE, _RUNS_CACHE_SCOPE)
     response_message = RestoreExperiment.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -234,6 +548,7 @@ def _update_experiment():
     if request_message.new_name:
         _get_tracking_store().rename_experiment(request_message.experiment_id,
                                                 request_message.new_name)
+        _invalidate_cached_responses(_EXPERIMENTS_CACHE_SCOPE)
     response_message = UpdateExperiment.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -250,12 +565,9 @@ def _create_run():
         user_id=request_message.user_id,
         start_time=request_message.start_time,
         tags=tags)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
 
-    response_message = CreateRun.Response()
-    response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_json_dict_response({"run": run._to_json_dict()})
 
 
 @catch_mlflow_exception
@@ -264,16 +576,15 @@ def _update_run():
     run_id = request_message.run_id or request_message.run_uuid
     updated_info = _get_tracking_store().update_run_info(run_id, request_message.status,
                                                          request_message.end_time)
-    response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
+    return _wrap_json_dict_response({"run_info": updated_info._to_json_dict()})
 
 
 @catch_mlflow_exception
 def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
     response_message = DeleteRun.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -284,6 +595,7 @@ def _delete_run():
 def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
     response_message = RestoreRun.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -297,6 +609,7 @@ def _log_metric():
                     request_message.step)
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_metric(run_id, metric)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE, _run_metrics_cache_scope(run_id))
     response_message = LogMetric.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -309,6 +622,7 @@ def _log_param():
     param = Param(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_param(run_id, param)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
     response_message = LogParam.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -320,6 +634,7 @@ def _set_experiment_tag():
     request_message = _get_request_message(SetExperimentTag())
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
+    _invalidate_cached_responses(_EXPERIMENTS_CACHE_SCOPE)
     response_message = SetExperimentTag.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -332,6 +647,7 @@ def _set_tag():
     tag = RunTag(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().set_tag(run_id, tag)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
     response_message = SetTag.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -342,6 +658,7 @@ def _set_tag():
 def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE)
     response_message = DeleteTag.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -351,18 +668,26 @@ def _delete_tag():
 @catch_mlflow_exception
 def _get_run():
     request_message = _get_request_message(GetRun())
-    response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    run = _get_tracking_store().get_run(run_id)
+    return _wrap_json_dict_response({"run": run._to_json_dict()})
+
+
+@catch_mlflow_exception
+def _get_runs():
+    request_message = _get_request_message(GetRuns())
+    runs = _get_tracking_store().get_runs(request_message.run_ids)
+    response_dict = {}
+    if runs:
+        response_dict["runs"] = [run._to_json_dict() for run in runs]
+    return _wrap_json_dict_response(response_dict)
 
 
 @catch_mlflow_exception
+@cache_response(SearchRuns, lambda _: [_RUNS_CACHE_SCOPE])
+@limit_concurrency
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
-    response_message = SearchRuns.Response()
     run_view_type = ViewType.ACTIVE_ONLY
     if request_message.HasField('run_view_type'):
         run_view_type = ViewType.from_proto(request_message.run_view_type)
@@ -373,15 +698,21 @@ def _search_runs():
     page_token = request_message.page_token
     run_entities = _get_tracking_store().search_runs(experiment_ids, filter_string, run_view_type,
                                                      max_results, order_by, page_token)
-    response_message.runs.extend([r.to_proto() for r in run_entities])
+    response_dict = {}
+    if run_entities:
+        response_dict["runs"] = [r._to_json_dict() for r in run_entities]
     if run_entities.token:
-        response_message.next_page_token = run_entities.token
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+        response_dict["next_page_token"] = _decode_page_token(run_entities.token)
+    return _wrap_json_dict_response(response_dict)
+
+
+def _decode_page_token(token):
+    # Stores may return the token as bytes, which the proto string field used to decode
+    return token.decode("utf-8") if isinstance(token, bytes) else token
 
 
 @catch_mlflow_exception
+@limit_concurrency
 def _list_artifacts():
     request_message = _get_request_message(ListArtifacts())
     response_message = ListArtifacts.Response()
@@ -391,28 +722,35 @@ def _list_artifacts():
         path = None
     run_id = request_message.run_id or request_message.run_uuid
     run = _get_tracking_store().get_run(run_id)
-    artifact_entities = _get_artifact_repo(run).list_artifacts(path)
+    artifact_repo = _get_artifact_repo(run)
+    if request_message.recursive:
+        artifact_entities = artifact_repo.list_artifacts_recursive(
+            path, max_depth=request_message.max_depth or None)
+    else:
+        artifact_entities = artifact_repo.list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
-    response_message.root_uri = _get_artifact_repo(run).artifact_uri
+    response_message.root_uri = artifact_repo.artifact_uri
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@cache_response(GetMetricHistory, lambda request_message: [
+    _run_metrics_cache_scope(request_message.run_id or request_message.run_uuid)])
 def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
-    response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
     metric_entites = _get_tracking_store().get_metric_history(run_id,
                                                               request_message.metric_key)
-    response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    response_dict = {}
+    if metric_entites:
+        response_dict["metrics"] = [m._to_json_dict() for m in metric_entites]
+    return _wrap_json_dict_response(response_dict)
 
 
 @catch_mlflow_exception
+@cache_response(ListExperiments, lambda _: [_EXPERIMENTS_CACHE_SCOPE])
 def _list_experiments():
     request_message = _get_request_message(ListExperiments())
     experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
@@ -425,7 +763,10 @@ def _list_experiments():
 
 @catch_mlflow_exception
 def _get_artifact_repo(run):
-    return get_artifact_repository(run.info.artifact_uri)
+    artifact_repo = get_artifact_repository(run.info.artifact_uri)
+    for instrument_artifact_repo in _artifact_repo_instrumenters:
+        instrument_artifact_repo(artifact_repo)
+    return artifact_repo
 
 
 @catch_mlflow_exception
@@ -437,6 +778,8 @@ def _log_batch():
     tags = [RunTag.from_proto(proto_tag) for proto_tag in request_message.tags]
     _get_tracking_store().log_batch(run_id=request_message.run_id, metrics=metrics,
                                     params=params, tags=tags)
+    _invalidate_cached_responses(_RUNS_CACHE_SCOPE,
+                                 _run_metrics_cache_scope(request_message.run_id))
     response_message = LogBatch.Response()
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
@@ -449,6 +792,17 @@ def _wrap_response(response_message):
     return response
 
 
+def _wrap_json_dict_response(response_dict):
+    """
+    Fast path for hot response types (runs and metrics): ``response_dict`` is built directly from
+    entities via their ``_to_json_dict`` methods and serialized compactly, skipping the
+    intermediate response proto.
+    """
+    response = Response(mimetype='application/json')
+    response.set_data(dict_to_json(response_dict))
+    return response
+
+
 @catch_mlflow_exception
 def _create_registered_model():
     request_message = _get_request_message(CreateRegisteredModel())
@@ -494,11 +848,16 @@ def _delete_registered_model():
 
 @catch_mlflow_exception
 def _list_registered_models():
-    _get_request_message(ListRegisteredModels())
-    registered_models_detailed = _get_model_registry_store().list_registered_models()
+    request_message = _get_request_message(ListRegisteredModels())
+    max_results = request_message.max_results if request_message.HasField('max_results') else None
+    registered_models_detailed = _get_model_registry_store().list_registered_models(
+        max_results=max_results, order_by=request_message.order_by,
+        page_token=request_message.page_token)
     response_message = ListRegisteredModels.Response()
     response_message.registered_models_detailed.extend([e.to_proto()
                                                         for e in registered_models_detailed])
+    if registered_models_detailed.token:
+        response_message.next_page_token = _decode_page_token(registered_models_detailed.token)
     return _wrap_response(response_message)
 
 
@@ -579,12 +938,46 @@ def _get_model_version_stages():
 def _search_model_versions():
     request_message = _get_request_message(SearchModelVersions())
     model_versions_detailed = _get_model_registry_store().search_model_versions(
-        request_message.filter)
+        request_message.filter, max_results=request_message.max_results,
+        order_by=request_message.order_by, page_token=request_message.page_token)
     response_message = SearchModelVersions.Response()
     response_message.model_versions_detailed.extend([e.to_proto() for e in model_versions_detailed])
+    if model_versions_detailed.token:
+        response_message.next_page_token = _decode_page_token(model_versions_detailed.token)
+    return _wrap_response(response_message)
+
+
+@catch_mlflow_exception
+def _get_registry_events():
+    """
+    Long polls, which wait for up to ``timeout_seconds`` for new events, hold a server thread
+    while waiting, so they are only enabled with ``--max-concurrent-long-polls``, for threaded or
+    asynchronous workers. Each worker then handles at most that many of them at once, and rejects
+    further ones with a ``429 Too Many Requests`` response. Otherwise, requests return
+    immediately.
+    """
+    request_message = _get_request_message(GetRegistryEvents())
+    if request_message.timeout_seconds <= 0:
+        return _registry_events_response(request_message)
+    if _get_long_poll_limiter() is None:
+        request_message.timeout_seconds = 0
+        return _registry_events_response(request_message)
+    return _long_poll_registry_events(request_message)
+
+
+def _registry_events_response(request_message):
+    events = _get_model_registry_store().get_registry_events(
+        since=request_message.since, max_results=request_message.max_results,
+        timeout_seconds=request_message.timeout_seconds)
+    response_message = GetRegistryEvents.Response(last_sequence=events.token)
+    response_message.events.extend([e.to_proto() for e in events])
     return _wrap_response(response_message)
 
 
+_long_poll_registry_events = limit_concurrency(_registry_events_response,
+                                               get_limiter=_get_long_poll_limiter)
+
+
 def _add_static_prefix(route):
     prefix = os.environ.get(STATIC_PREFIX_ENV_VAR)
     if prefix:
@@ -645,6 +1038,7 @@ HANDLERS = {
     DeleteTag: _delete_tag,
     LogBatch: _log_batch,
     GetRun: _get_run,
+    GetRuns: _get_runs,
     SearchRuns: _search_runs,
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
@@ -664,4 +1058,10 @@ HANDLERS = {
     GetModelVersionDownloadUri: _get_model_version_download_uri,
     GetModelVersionStages: _get_model_version_stages,
     SearchModelVersions: _search_model_versions,
+    GetRegistryEvents: _get_registry_events,
 }
+
+# Names of the Flask endpoints subject to the per-client rate limit
+_RATE_LIMITED_ENDPOINTS = frozenset(
+    ['serve_artifacts', 'serve_artifact_bundle'] +
+    [handler.__name__ for handler in HANDLERS.values()])
@@ -0,0 +1,57 @@
+/**
+ * Writes gzip (.gz) and brotli (.br) compressed copies of the text assets in the UI build
+ * directory, which the MLflow server sends to browsers accepting those encodings instead of
+ * compressing responses on the fly.
+ *
+ * Usage: node scripts/precompress.js [build directory]
+ */
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const COMPRESSIBLE_EXTENSIONS = ['.js', '.css', '.html', '.json', '.map', '.svg', '.txt', '.ico'];
+// Compressing very small files does not save a request and may make them larger
+const MIN_SIZE_BYTES = 1024;
+
+function listFiles(directory) {
+  return fs.readdirSync(directory).reduce((files, name) => {
+    const filePath = path.join(directory, name);
+    return files.concat(fs.statSync(filePath).isDirectory() ? listFiles(filePath) : [filePath]);
+  }, []);
+}
+
+function writeIfSmaller(filePath, contents, compressed) {
+  if (compressed.length < contents.length) {
+    fs.writeFileSync(filePath, compressed);
+    return true;
+  }
+  return false;
+}
+
+function precompress(buildDirectory) {
+  let numCompressed = 0;
+  listFiles(buildDirectory)
+    .filter((filePath) => COMPRESSIBLE_EXTENSIONS.includes(path.extname(filePath)))
+    .forEach((filePath) => {
+      const contents = fs.readFileSync(filePath);
+      if (contents.length < MIN_SIZE_BYTES) {
+        return;
+      }
+      const gzipped = zlib.gzipSync(contents, { level: zlib.constants.Z_BEST_COMPRESSION });
+      const brotlied = zlib.brotliCompressSync(contents, {
+        params: {
+          [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+          [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+          [zlib.constants.BROTLI_PARAM_SIZE_HINT]: contents.length,
+        },
+      });
+      const wroteGzip = writeIfSmaller(filePath + '.gz', contents, gzipped);
+      const wroteBrotli = writeIfSmaller(filePath + '.br', contents, brotlied);
+      if (wroteGzip || wroteBrotli) {
+        numCompressed += 1;
+      }
+    });
+  console.log('Precompressed ' + numCompressed + ' files in ' + buildDirectory);
+}
+
+precompress(path.resolve(process.argv[2] || 'build'));
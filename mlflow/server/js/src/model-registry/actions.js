@@ -1,5 +1,6 @@
 import Services from './services';
 import { getUUID, wrapDeferred } from '../Actions';
+import { MODEL_VERSIONS_SEARCH_PAGE_SIZE } from './constants';
 
 export const CREATE_REGISTERED_MODEL = 'CREATE_REGISTERED_MODEL';
 export const createRegisteredModelApi = (name, id = getUUID()) => ({
@@ -42,12 +43,26 @@ export const createModelVersionApi = (name, source, runId, id = getUUID()) => ({
   meta: { id, name, runId },
 });
 
+// Fetches the pages of results of a model version search, following their next_page_token, and
+// resolves with a response containing all the model versions found
+export const searchAllModelVersions = (data, previousModelVersions = []) =>
+  wrapDeferred(Services.searchModelVersions, data).then((response) => {
+    const modelVersions = previousModelVersions.concat(response.model_versions_detailed || []);
+    if (response.next_page_token) {
+      return searchAllModelVersions(
+        { ...data, page_token: response.next_page_token },
+        modelVersions,
+      );
+    }
+    return { model_versions_detailed: modelVersions };
+  });
+
 export const SEARCH_MODEL_VERSIONS = 'SEARCH_MODEL_VERSIONS';
 export const searchModelVersionsApi = (filterObj, id = getUUID()) => {
-  const filter = Object.keys(filterObj).map((key) => `${key}='${filterObj[key]}'`).join('&');
+  const filter = Object.keys(filterObj).map((key) => `${key}='${filterObj[key]}'`).join(' AND ');
   return {
     type: SEARCH_MODEL_VERSIONS,
-    payload: wrapDeferred(Services.searchModelVersions, { filter }),
+    payload: searchAllModelVersions({ filter, max_results: MODEL_VERSIONS_SEARCH_PAGE_SIZE }),
     meta: { id },
   };
 };
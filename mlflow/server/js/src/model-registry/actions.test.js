@@ -0,0 +1,25 @@
+import Services from './services';
+import { searchAllModelVersions } from './actions';
+
+test('searchAllModelVersions follows next_page_token until the last page', (done) => {
+  const pages = {
+    '': { model_versions_detailed: [{ version: '3' }, { version: '2' }], next_page_token: 'p2' },
+    'p2': { model_versions_detailed: [{ version: '1' }], next_page_token: 'p3' },
+    'p3': {},
+  };
+  const requests = [];
+  Services.searchModelVersions = jest.fn(({ data, success }) => {
+    requests.push(data);
+    success(pages[data.page_token || '']);
+  });
+  searchAllModelVersions({ filter: "name='model'", max_results: 2 }).then((response) => {
+    expect(response).toEqual({
+      model_versions_detailed: [{ version: '3' }, { version: '2' }, { version: '1' }],
+    });
+    expect(requests).toEqual([
+      { filter: "name='model'", max_results: 2 },
+      { filter: "name='model'", max_results: 2, page_token: 'p2' },
+      { filter: "name='model'", max_results: 2, page_token: 'p3' },
+    ]);
+  }).then(() => done());
+});
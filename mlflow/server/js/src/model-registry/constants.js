@@ -9,6 +9,10 @@ export const Stages = {
   ARCHIVED: 'Archived',
 };
 
+// Model versions are searched in pages of this many versions, which is the maximum page size of
+// the server
+export const MODEL_VERSIONS_SEARCH_PAGE_SIZE = 1000;
+
 export const ACTIVE_STAGES = [
   Stages.STAGING,
   Stages.PRODUCTION,
@@ -1,6 +1,54 @@
+import time
+from functools import wraps
+
+from prometheus_client import Histogram
 from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
 from flask import request
 
+from mlflow.server import handlers
+from mlflow.store.model_registry.abstract_store import AbstractStore as AbstractModelRegistryStore
+from mlflow.store.tracking.abstract_store import AbstractStore as AbstractTrackingStore
+
+_LATENCY_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, float("inf"))
+_SIZE_BUCKETS = tuple(4 ** i for i in range(3, 16)) + (float("inf"),)
+
+HANDLER_LATENCY = Histogram(
+    "mlflow_handler_latency_seconds",
+    "Latency of requests to MLflow REST API endpoints, by handler and status code",
+    ["handler", "status"], buckets=_LATENCY_BUCKETS)
+HANDLER_REQUEST_SIZE = Histogram(
+    "mlflow_handler_request_size_bytes",
+    "Size of the bodies of requests to MLflow REST API endpoints, by handler",
+    ["handler"], buckets=_SIZE_BUCKETS)
+HANDLER_RESPONSE_SIZE = Histogram(
+    "mlflow_handler_response_size_bytes",
+    "Size of the bodies of responses from MLflow REST API endpoints, by handler",
+    ["handler"], buckets=_SIZE_BUCKETS)
+STORE_CALL_LATENCY = Histogram(
+    "mlflow_store_call_latency_seconds",
+    "Latency of calls to backend store methods, by store type and method",
+    ["store", "method"], buckets=_LATENCY_BUCKETS)
+DB_POOL_WAIT = Histogram(
+    "mlflow_db_pool_wait_seconds",
+    "Time spent waiting to check out a database connection from the connection pool of a "
+    "SQLAlchemy backend store, by store type",
+    ["store"], buckets=_LATENCY_BUCKETS)
+ARTIFACT_REPO_LATENCY = Histogram(
+    "mlflow_artifact_repo_latency_seconds",
+    "Latency of artifact repository operations, by repository type and operation",
+    ["repository", "operation"], buckets=_LATENCY_BUCKETS)
+ARTIFACT_REPO_PAYLOAD_SIZE = Histogram(
+    "mlflow_artifact_repo_payload_size_bytes",
+    "Size of artifacts read from artifact repositories, by repository type and operation",
+    ["repository", "operation"], buckets=_SIZE_BUCKETS)
+
+_TRACKING_STORE_METHODS = [name for name in dir(AbstractTrackingStore)
+                           if not name.startswith("_")]
+_MODEL_REGISTRY_STORE_METHODS = [name for name in dir(AbstractModelRegistryStore)
+                                 if not name.startswith("_")]
+_ARTIFACT_REPO_OPERATIONS = ["list_artifacts", "open_stream", "download_artifacts",
+                             "log_artifact", "log_artifacts"]
+
 
 def activate_prometheus_exporter(app):
     metrics = GunicornInternalPrometheusMetrics(app, export_defaults=False)
@@ -14,6 +62,14 @@ def activate_prometheus_exporter(app):
         if func_name in ["_search_runs", "_log_metric", "_log_param", "_set_tag", "_create_run"]:
             app.view_functions[func_name] = histogram(func)
 
+    handler_names = set(handler.__name__ for _, handler, _ in handlers.get_endpoints())
+    for func_name in handler_names:
+        if func_name in app.view_functions:
+            app.view_functions[func_name] = instrument_handler(app.view_functions[func_name],
+                                                               func_name)
+
+    handlers._store_instrumenters.append(instrument_store)
+    handlers._artifact_repo_instrumenters.append(instrument_artifact_repo)
     return app
 
 
@@ -26,3 +82,80 @@ def change_path_for_metric(path):
     if 'mlflow/' in path:
         path = path.split('mlflow/')[-1]
     return path.replace('/', '_')
+
+
+def instrument_handler(func, handler_name):
+    """
+    Wrap a Flask view function to observe its latency and the sizes of its requests and responses.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.time()
+        response = func(*args, **kwargs)
+        HANDLER_LATENCY.labels(handler_name, response.status_code).observe(
+            time.time() - start_time)
+        HANDLER_REQUEST_SIZE.labels(handler_name).observe(request.content_length or 0)
+        if response.content_length is not None:
+            HANDLER_RESPONSE_SIZE.labels(handler_name).observe(response.content_length)
+        return response
+    return wrapper
+
+
+def _instrument_methods(obj, method_names, observe_call):
+    """
+    Replace the specified methods of ``obj`` by wrappers calling
+    ``observe_call(method_name, duration, result)`` after each successful call.
+    """
+    for method_name in method_names:
+        method = getattr(obj, method_name, None)
+        if not callable(method):
+            continue
+
+        def make_wrapper(method, method_name):
+            @wraps(method)
+            def wrapper(*args, **kwargs):
+                start_time = time.time()
+                result = method(*args, **kwargs)
+                observe_call(method_name, time.time() - start_time, result)
+                return result
+            return wrapper
+
+        setattr(obj, method_name, make_wrapper(method, method_name))
+
+
+def instrument_store(store, store_type):
+    """
+    Observe the latencies of the methods of a backend store, as well as the time spent waiting
+    for database connections if it is backed by a SQLAlchemy engine.
+
+    :param store_type: "tracking" or "model_registry".
+    """
+    method_names = _TRACKING_STORE_METHODS if store_type == "tracking" \
+        else _MODEL_REGISTRY_STORE_METHODS
+
+    def observe_call(method_name, duration, _):
+        STORE_CALL_LATENCY.labels(store_type, method_name).observe(duration)
+
+    _instrument_methods(store, method_names, observe_call)
+
+    engine = getattr(store, "engine", None)
+    if engine is not None:
+        def observe_pool_wait(_, duration, __):
+            DB_POOL_WAIT.labels(store_type).observe(duration)
+
+        _instrument_methods(engine.pool, ["connect"], observe_pool_wait)
+
+
+def instrument_artifact_repo(artifact_repo):
+    """
+    Observe the latencies of the operations of an artifact repository, and the sizes of the
+    artifacts streamed from it.
+    """
+    repository = type(artifact_repo).__name__
+
+    def observe_call(operation, duration, result):
+        ARTIFACT_REPO_LATENCY.labels(repository, operation).observe(duration)
+        if operation == "open_stream":
+            ARTIFACT_REPO_PAYLOAD_SIZE.labels(repository, operation).observe(result.size)
+
+    _instrument_methods(artifact_repo, _ARTIFACT_REPO_OPERATIONS, observe_call)
@@ -0,0 +1,117 @@
+"""
+Admission control for the tracking server: per-client token-bucket rate limits and a bound on the
+number of expensive requests handled concurrently. Requests rejected by either limit receive a
+``429 Too Many Requests`` response, which MLflow clients retry with exponential backoff.
+
+Limits are enforced independently by each server worker process.
+"""
+import base64
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import REQUEST_LIMIT_EXCEEDED, INVALID_PARAMETER_VALUE
+
+
+class RateLimitExceeded(MlflowException):
+    """Exception raised when a request is rejected by a rate or concurrency limit."""
+    def __init__(self, message, retry_after_seconds):
+        super(RateLimitExceeded, self).__init__(message, error_code=REQUEST_LIMIT_EXCEEDED)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class TokenBucketRateLimiter(object):
+    """
+    Rate limiter allowing each client to make ``requests_per_second`` requests per second on
+    average, in bursts of up to ``burst`` requests. Buckets are kept for at most ``max_clients``
+    clients, evicting the least recently seen ones, whose buckets are then full again.
+    """
+
+    def __init__(self, requests_per_second, burst=None, max_clients=10000):
+        if requests_per_second <= 0:
+            raise MlflowException("Rate limit must be positive, got %s" % requests_per_second,
+                                  INVALID_PARAMETER_VALUE)
+        self.requests_per_second = float(requests_per_second)
+        self.burst = burst or max(1, int(math.ceil(self.requests_per_second)))
+        self.max_clients = max_clients
+        # Mapping from client key to (number of tokens, time at which it was computed)
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client_key):
+        """
+        Consume a token from the bucket of the specified client.
+
+        :raises RateLimitExceeded: If the bucket of the client is empty.
+        """
+        now = time.time()
+        with self._lock:
+            tokens, last_time = self._buckets.pop(client_key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last_time) * self.requests_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[client_key] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        if not allowed:
+            retry_after_seconds = (1 - tokens) / self.requests_per_second
+            raise RateLimitExceeded(
+                "Rate limit of %s requests per second exceeded. Retry in %.1f seconds." % (
+                    self.requests_per_second, retry_after_seconds),
+                retry_after_seconds)
+
+
+class ConcurrencyLimiter(object):
+    """
+    Limit on the number of requests that can be handled concurrently. Requests exceeding the limit
+    are rejected immediately instead of queueing behind the ones in progress.
+
+    :param description: Description of the limited requests, used in the message of rejections.
+    """
+
+    def __init__(self, max_concurrent_requests, description="requests to expensive endpoints"):
+        if max_concurrent_requests <= 0:
+            raise MlflowException(
+                "Concurrency limit must be positive, got %s" % max_concurrent_requests,
+                INVALID_PARAMETER_VALUE)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.description = description
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+
+    def acquire(self):
+        """
+        Acquire a slot for a request, which must be released with :py:meth:`release`.
+
+        :raises RateLimitExceeded: If ``max_concurrent_requests`` requests are in progress.
+        """
+        if not self._semaphore.acquire(False):
+            raise RateLimitExceeded(
+                "Too many concurrent %s (at most %d). Retry later." % (
+                    self.description, self.max_concurrent_requests), retry_after_seconds=1)
+
+    def release(self):
+        self._semaphore.release()
+
+
+def get_client_key(flask_request, trust_authorization=False):
+    """
+    :param trust_authorization: Whether the Authorization header of requests has been verified
+                                upstream, e.g. by an authenticating proxy. The server does not
+                                verify it, so clients could otherwise get a new rate limit for
+                                each request by sending a different header.
+    :return: Key identifying the client making a request, for the purpose of rate limiting: the
+             remote address, or if ``trust_authorization`` is True, the user name for HTTP basic
+             authentication or a digest of the token for bearer token authentication.
+    """
+    if trust_authorization:
+        authorization = flask_request.headers.get("Authorization", "")
+        if flask_request.authorization is not None and flask_request.authorization.username:
+            return "user:" + flask_request.authorization.username
+        if authorization.startswith("Bearer "):
+            token = authorization[len("Bearer "):].encode("utf-8")
+            return "token:" + base64.b64encode(hashlib.sha1(token).digest()).decode("utf-8")
+    return "ip:%s" % flask_request.remote_addr
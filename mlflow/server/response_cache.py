@@ -0,0 +1,177 @@
+"""
+Caching of responses to read-heavy tracking server endpoints.
+
+Cached responses are keyed on the serialized request proto together with a token for each
+"scope" of data the response depends on (e.g. all experiments, or the metrics of a single run).
+Mutating handlers invalidate a scope by replacing its token, which makes every response cached
+under the old token unreachable. Because invalidation only ever writes a fresh token, a cache
+that evicts tokens (or loses them on restart) can never serve a stale response for a scope that
+was invalidated through it.
+
+Cache implementations are selected by the scheme of the cache URI passed to ``mlflow server
+--response-cache-uri``. The built-in ``memory`` scheme keeps responses in the memory of each
+server worker process; since invalidations performed by one worker are not visible to the other
+workers, in-memory entries expire after a short TTL. Caches shared across workers (e.g. backed by
+Redis or memcached) can be provided by other packages through the ``mlflow.response_cache``
+entrypoint group, mapping a URI scheme to a callable that takes the cache URI and returns an
+:py:class:`AbstractResponseCache`.
+"""
+import hashlib
+import threading
+import time
+import uuid
+import warnings
+from abc import abstractmethod, ABCMeta
+from collections import OrderedDict
+
+import entrypoints
+from six.moves import urllib
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.uri import get_uri_scheme
+
+_SCOPE_TOKEN_KEY_PREFIX = "mlflow-response-scope:"
+_RESPONSE_KEY_PREFIX = "mlflow-response:"
+
+
+class AbstractResponseCache:
+    """
+    Abstract class for response caches. Keys are strings; values are byte strings (serialized
+    responses) or strings (scope tokens).
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def get(self, key):
+        """
+        :return: The value stored under ``key``, or ``None`` if it is absent or has expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key, value):
+        """
+        Store ``value`` under ``key``, replacing any existing value. Implementations may evict
+        entries at any time.
+        """
+        pass
+
+
+class InMemoryResponseCache(AbstractResponseCache):
+    """
+    Thread-safe LRU cache local to the current process, whose entries expire ``ttl_seconds``
+    after being written.
+    """
+
+    def __init__(self, max_entries=1024, ttl_seconds=5):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expiration_time = entry
+            if time.time() >= expiration_time:
+                del self._entries[key]
+                return None
+            # Move the entry to the end of the LRU order
+            del self._entries[key]
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.time() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _get_in_memory_response_cache(cache_uri):
+    params = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(cache_uri).query))
+    try:
+        return InMemoryResponseCache(max_entries=int(params.get("max_entries", 1024)),
+                                     ttl_seconds=float(params.get("ttl_seconds", 5)))
+    except ValueError:
+        raise MlflowException(
+            "Invalid in-memory response cache URI '{}'. Expected a URI of the form "
+            "'memory://?max_entries=<int>&ttl_seconds=<float>'.".format(cache_uri),
+            INVALID_PARAMETER_VALUE)
+
+
+class ResponseCacheRegistry(object):
+    """
+    Scheme-based registry for response cache implementations, populated with the built-in
+    ``memory`` scheme and with implementations declared through the ``mlflow.response_cache``
+    entrypoint group.
+    """
+
+    def __init__(self):
+        self._registry = {}
+        self.group_name = "mlflow.response_cache"
+
+    def register(self, scheme, cache_builder):
+        self._registry[scheme] = cache_builder
+
+    def register_entrypoints(self):
+        """Register response caches provided by other packages"""
+        for entrypoint in entrypoints.get_group_all(self.group_name):
+            try:
+                self.register(entrypoint.name, entrypoint.load())
+            except (AttributeError, ImportError) as exc:
+                warnings.warn(
+                    'Failure attempting to register response cache for scheme "{}": {}'.format(
+                        entrypoint.name, str(exc)
+                    ),
+                    stacklevel=2
+                )
+
+    def get_cache(self, cache_uri):
+        scheme = get_uri_scheme(cache_uri)
+        try:
+            cache_builder = self._registry[scheme]
+        except KeyError:
+            raise MlflowException(
+                "Unsupported URI '{}' for response cache. Supported schemes are: {}".format(
+                    cache_uri, list(self._registry.keys())),
+                INVALID_PARAMETER_VALUE)
+        return cache_builder(cache_uri)
+
+
+def _get_scope_token(cache, scope):
+    token_key = _SCOPE_TOKEN_KEY_PREFIX + scope
+    token = cache.get(token_key)
+    if token is None:
+        token = uuid.uuid4().hex
+        cache.set(token_key, token)
+    return token
+
+
+def invalidate_scopes(cache, scopes):
+    """Make all responses cached under any of ``scopes`` unreachable."""
+    for scope in scopes:
+        cache.set(_SCOPE_TOKEN_KEY_PREFIX + scope, uuid.uuid4().hex)
+
+
+def get_response_key(cache, request_message, scopes):
+    """
+    :return: Cache key for the response to ``request_message``, which depends on the data in each
+             of ``scopes``.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(request_message.SerializeToString(deterministic=True))
+    for scope in scopes:
+        hasher.update(_get_scope_token(cache, scope).encode("utf-8"))
+    return "{}{}:{}".format(_RESPONSE_KEY_PREFIX, type(request_message).__name__,
+                            hasher.hexdigest())
+
+
+def compute_etag(body):
+    """:return: A strong entity tag for a response body."""
+    return hashlib.sha1(body).hexdigest()
@@ -1,12 +1,21 @@
 import os
 import posixpath
+import shutil
+import sys
 import tempfile
 from abc import abstractmethod, ABCMeta
 
+from six import reraise
+
 from mlflow.utils.validation import path_not_unique, bad_path_message
 
+from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.download_cache import get_artifact_download_cache
+from mlflow.store.artifact.transfer import get_max_workers, run_concurrently
+
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 class ArtifactRepository:
@@ -34,7 +43,7 @@ class ArtifactRepository:
         pass
 
     @abstractmethod
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
         """
         Log the files in the specified local directory as artifacts, optionally taking
         an ``artifact_path`` to place them in within the run's artifacts.
@@ -42,6 +51,10 @@ class ArtifactRepository:
         :param local_dir: Directory of local artifacts to log
         :param artifact_path: Directory within the run's artifact directory in which to log the
                               artifacts
+        :param sync: If True, only upload the files that are new or whose contents differ from
+                     the artifacts already logged at their path, e.g. to log a checkpoint
+                     directory repeatedly. Repositories that cannot tell whether files changed
+                     upload all the files.
         """
         pass
 
@@ -57,10 +70,48 @@ class ArtifactRepository:
         """
         pass
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        """
+        Return all the artifacts under path, i.e. the artifacts listed by :py:meth:`list_artifacts`
+        for path and, recursively, for each of its subdirectories. If path is a file, returns an
+        empty list.
+
+        The default implementation lists the directories of each level of the tree concurrently
+        with :py:meth:`list_artifacts`. Repositories whose storage backend can list all objects
+        with a given prefix at once override this method to list the whole tree in a single
+        (paginated) request.
+
+        :param path: Relative source path of the directory whose artifacts to list.
+        :param max_depth: If specified, only list the artifacts up to this many levels below path.
+                          ``max_depth=1`` lists the same artifacts as :py:meth:`list_artifacts`.
+
+        :return: List of artifacts as FileInfo, sorted by path.
+        """
+        validate_max_depth(max_depth)
+        infos = []
+        dirs = [path]
+        depth = 0
+        while dirs and (max_depth is None or depth < max_depth):
+            listings = run_concurrently(self.list_artifacts, [(dir_path,) for dir_path in dirs],
+                                        max_workers=self._get_max_download_workers())
+            subdirs = []
+            for dir_path, dir_infos in zip(dirs, listings):
+                for file_info in dir_infos:
+                    # prevent an infinite loop (sometimes the current path is listed e.g. as ".")
+                    if file_info.path == "." or file_info.path == dir_path:
+                        continue
+                    infos.append(file_info)
+                    if file_info.is_dir:
+                        subdirs.append(file_info.path)
+            dirs = subdirs
+            depth += 1
+        return sorted(infos, key=lambda f: f.path)
+
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
-        local path for it.
+        local path for it. The files of a directory are downloaded concurrently, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads.
         The caller is responsible for managing the lifecycle of the downloaded artifacts.
 
         :param artifact_path: Relative source path to the desired artifacts.
@@ -73,26 +124,6 @@ class ArtifactRepository:
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
 
-        # TODO: Probably need to add a more efficient method to stream just a single artifact
-        #       without downloading it, or to get a pre-signed URL for cloud storage.
-
-        def download_artifacts_into(artifact_path, dest_dir):
-            basename = posixpath.basename(artifact_path)
-            local_path = os.path.join(dest_dir, basename)
-            listing = self.list_artifacts(artifact_path)
-            if len(listing) > 0:
-                # Artifact_path is a directory, so make a directory for it and download everything
-                if not os.path.exists(local_path):
-                    os.mkdir(local_path)
-                for file_info in listing:
-                    # prevent an infinite loop (sometimes the current path is listed e.g. as ".")
-                    if file_info.path == "." or file_info.path == artifact_path:
-                        continue
-                    download_artifacts_into(artifact_path=file_info.path, dest_dir=local_path)
-            else:
-                self._download_file(remote_file_path=artifact_path, local_path=local_path)
-            return local_path
-
         if dst_path is None:
             dst_path = tempfile.mkdtemp()
         dst_path = os.path.abspath(dst_path)
@@ -110,7 +141,148 @@ class ArtifactRepository:
                     " Destination path: {dst_path}".format(dst_path=dst_path)),
                 error_code=INVALID_PARAMETER_VALUE)
 
-        return download_artifacts_into(artifact_path, dst_path)
+        files = self._list_files_with_versions(artifact_path)
+        local_path = os.path.join(dst_path, posixpath.basename(artifact_path))
+        if len(files) == 0:
+            # The artifact path is a file or a directory containing no files. It is downloaded as
+            # a file first, so that downloading a file does not list its parent directory.
+            if artifact_path.strip("/"):
+                try:
+                    self._download_file_with_cache(artifact_path, local_path)
+                    return local_path
+                except Exception:  # pylint: disable=broad-except
+                    exc_info = sys.exc_info()
+                    if not self._is_directory(artifact_path):
+                        reraise(*exc_info)
+                    # Failed downloads may leave an empty file behind
+                    if os.path.isfile(local_path):
+                        os.remove(local_path)
+            if not os.path.exists(local_path):
+                os.makedirs(local_path)
+            return local_path
+
+        dir_prefix = artifact_path.strip("/") + "/" if artifact_path.strip("/") else ""
+        download_args = []
+        for file_info, version in files:
+            rel_path = file_info.path.strip("/")
+            if rel_path.startswith(dir_prefix):
+                rel_path = rel_path[len(dir_prefix):]
+            local_file_path = os.path.join(local_path, *rel_path.split(posixpath.sep))
+            local_file_dir = os.path.dirname(local_file_path)
+            if not os.path.exists(local_file_dir):
+                os.makedirs(local_file_dir)
+            download_args.append((file_info.path, local_file_path, version))
+        run_concurrently(self._download_file_with_cache, download_args,
+                         max_workers=self._get_max_download_workers())
+        return local_path
+
+    def _download_file_with_cache(self, remote_file_path, local_path, version=None):
+        """
+        Download a file with :py:meth:`_download_file`, through the local artifact download cache
+        if it is enabled and the repository reports versions of its files.
+
+        :param version: Version of the file if it is already known from a listing, in which case
+                        it is not requested with :py:meth:`_get_file_version`.
+        """
+        cache = get_artifact_download_cache()
+        if cache is not None and version is None:
+            version = self._get_file_version(remote_file_path)
+        if cache is None or version is None:
+            self._download_file(remote_file_path=remote_file_path, local_path=local_path)
+            return
+        cache.download(
+            key="%s@%s" % (posixpath.join(self.artifact_uri, remote_file_path), version),
+            local_path=local_path,
+            download_file=lambda path: self._download_file(remote_file_path=remote_file_path,
+                                                           local_path=path))
+
+    def _get_file_version(self, remote_file_path):
+        """
+        :param remote_file_path: Source path to the remote file, relative to the root directory of
+                                 the artifact repository.
+
+        :return: A string identifying the current contents of the file, such as its ETag, used to
+                 key the file in the local artifact download cache. The default implementation
+                 returns ``None``, in which case files are not cached.
+        """
+        return None
+
+    def _list_files_recursive(self, path):
+        """
+        List the files under the specified artifact directory and all its subdirectories, with
+        :py:meth:`list_artifacts_recursive`. Used to download directories of artifacts.
+
+        :param path: Relative source path of the directory.
+
+        :return: List of FileInfo of the files under ``path``, or an empty list if ``path`` is a
+                 file or does not exist.
+        """
+        return [file_info for file_info in self.list_artifacts_recursive(path)
+                if not file_info.is_dir]
+
+    def _list_files_with_versions(self, path):
+        """
+        List the files under the specified artifact directory like
+        :py:meth:`_list_files_recursive`, along with their versions as returned by
+        :py:meth:`_get_file_version` if the listing reports them, so that downloading a directory
+        through the download cache does not take an additional request per file.
+
+        The default implementation reports no versions. Repositories whose listings report
+        versions of the files override this method.
+
+        :param path: Relative source path of the directory.
+
+        :return: List of (FileInfo, version) pairs, where version is ``None`` if not reported.
+        """
+        return [(file_info, None) for file_info in self._list_files_recursive(path)]
+
+    def _is_directory(self, path):
+        """
+        :return: True if the specified artifact path is the root directory of the repository or a
+                 directory listed by :py:meth:`list_artifacts` in its parent directory. Only used
+                 when downloading the path as a file failed, as the parent directory may be large.
+        """
+        path = path.strip("/") if path else ""
+        if not path:
+            return True
+        parent = posixpath.dirname(path)
+        for file_info in self.list_artifacts(parent or None):
+            if file_info.path.strip("/") == path:
+                return file_info.is_dir
+        return False
+
+    def _get_max_download_workers(self):
+        """
+        :return: Maximum number of files downloaded concurrently by
+                 :py:meth:`download_artifacts`. Repositories whose ``_download_file`` cannot be
+                 called from multiple threads at once return 1.
+        """
+        return get_max_workers()
+
+    def open_stream(self, artifact_path):
+        """
+        Open a stream over the contents of an artifact file. Contents are read lazily from the
+        storage backend, from a position that can be changed with
+        :py:meth:`ArtifactStream.seek`, so that large artifacts (or byte ranges of them) can be
+        served without first downloading them to the local filesystem.
+
+        The default implementation downloads the file to a temporary directory, which is deleted
+        when the stream is closed. Repositories whose storage backend supports reading objects
+        incrementally override this method.
+
+        :param artifact_path: Relative source path to the desired artifact file.
+
+        :return: An :py:class:`ArtifactStream`, which the caller is responsible for closing.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            local_path = os.path.join(tmp_dir, posixpath.basename(artifact_path) or "artifact")
+            self._download_file(remote_file_path=artifact_path, local_path=local_path)
+            return open_local_file_stream(
+                local_path, on_close=lambda: shutil.rmtree(tmp_dir, ignore_errors=True))
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -125,6 +297,166 @@ class ArtifactRepository:
         pass
 
 
+class ArtifactStream(object):
+    """
+    Readable binary file-like object over the contents of an artifact file, returned by
+    :py:meth:`ArtifactRepository.open_stream`.
+
+    :param size: Size of the artifact file in bytes.
+    :param open_reader: Function taking a byte offset and returning a readable binary file-like
+                        object over the contents of the artifact file, starting at that offset.
+                        It is called lazily on the first read after each change of position.
+    :param on_close: Optional function called when the stream is closed, to release resources
+                     that are not owned by the readers.
+    """
+
+    def __init__(self, size, open_reader, on_close=None):
+        self.size = size
+        self.closed = False
+        self._open_reader = open_reader
+        self._on_close = on_close
+        self._reader = None
+        self._position = 0
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset):
+        """Move the stream to the specified byte offset from the start of the artifact file."""
+        if offset < 0:
+            raise ValueError("Negative seek position %d" % offset)
+        if offset != self._position:
+            self._close_reader()
+            self._position = offset
+        return offset
+
+    def read(self, size=-1):
+        """
+        Read at most ``size`` bytes from the current position, or until the end of the artifact
+        file if ``size`` is negative. Returns an empty byte string at the end of the file.
+        """
+        if size < 0:
+            return b"".join(self.iter_chunks())
+        if size == 0 or self._position >= self.size:
+            return b""
+        if self._reader is None:
+            self._reader = self._open_reader(self._position)
+        data = self._reader.read(min(size, self.size - self._position))
+        self._position += len(data)
+        return data
+
+    def iter_chunks(self, length=None, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Yield the contents of the artifact file in chunks of at most ``chunk_size`` bytes,
+        starting at the current position.
+
+        :param length: Number of bytes to read. If unspecified, read until the end of the file.
+        """
+        remaining = self.size - self._position if length is None else length
+        while remaining > 0:
+            data = self.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    def _close_reader(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._close_reader()
+            if self._on_close is not None:
+                self._on_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RangeReader(object):
+    """
+    Readable binary file-like object over the contents of a remote file from a given offset, for
+    storage backends that can fetch byte ranges of objects but do not provide streaming readers.
+    Consecutive reads are served from a buffer filled by fetches of at least ``chunk_size`` bytes.
+
+    :param fetch_range: Function taking a start (inclusive) and end (exclusive) byte offset and
+                        returning the corresponding bytes of the file.
+    """
+
+    def __init__(self, fetch_range, start, size, chunk_size=STREAM_CHUNK_SIZE):
+        self._fetch_range = fetch_range
+        self._position = start
+        self._size = size
+        self._chunk_size = chunk_size
+        self._buffer = b""
+
+    def read(self, size):
+        if not self._buffer:
+            if self._position >= self._size:
+                return b""
+            end = min(self._size, self._position + max(size, self._chunk_size))
+            self._buffer = self._fetch_range(self._position, end)
+            self._position = end
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self):
+        self._buffer = b""
+
+
+def open_local_file_stream(local_path, on_close=None):
+    """:return: An :py:class:`ArtifactStream` over the contents of a local file."""
+    if not os.path.isfile(local_path):
+        raise MlflowException("No such artifact file: '{}'".format(local_path),
+                              error_code=RESOURCE_DOES_NOT_EXIST)
+
+    def open_reader(offset):
+        f = open(local_path, "rb")
+        f.seek(offset)
+        return f
+
+    return ArtifactStream(os.path.getsize(local_path), open_reader, on_close=on_close)
+
+
+def validate_max_depth(max_depth):
+    if max_depth is not None and (not isinstance(max_depth, int) or max_depth <= 0):
+        raise MlflowException("max_depth must be a positive integer, got %s" % max_depth,
+                              INVALID_PARAMETER_VALUE)
+
+
+def get_recursive_listing(path, files, max_depth=None):
+    """
+    Build the result of :py:meth:`ArtifactRepository.list_artifacts_recursive` from the files
+    under ``path``, adding the directories containing them.
+
+    :param path: Relative source path of the listed directory.
+    :param files: List of FileInfo of all the files under ``path``, with paths relative to the root
+                  directory of the artifact repository.
+    :param max_depth: Maximum number of levels below ``path`` of the returned artifacts.
+    """
+    validate_max_depth(max_depth)
+    prefix = path.strip("/") + "/" if path and path.strip("/") else ""
+    infos = {}
+    for file_info in files:
+        parts = file_info.path[len(prefix):].split("/")
+        for depth in range(1, min(len(parts), (max_depth or len(parts)) + 1)):
+            dir_path = prefix + "/".join(parts[:depth])
+            if dir_path not in infos:
+                infos[dir_path] = FileInfo(dir_path, True, None)
+        if max_depth is None or len(parts) <= max_depth:
+            infos[file_info.path] = file_info
+    return sorted(infos.values(), key=lambda f: f.path)
+
+
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException("Invalid artifact path: '%s'. %s" % (artifact_path,
@@ -1,12 +1,25 @@
+import base64
 import os
 import posixpath
 import re
+import threading
 
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream, RangeReader, \
+    get_recursive_listing
+from mlflow.store.artifact.transfer import TransferProgress, compute_file_md5, \
+    filter_changed_files, get_positive_int_from_env, list_local_files, run_concurrently
+
+# Environment variable setting the maximum number of blocks of a file uploaded concurrently, and
+# of ranges of a file downloaded concurrently, for files too large to transfer in one request.
+AZURE_MAX_CONNECTIONS_ENV_VAR = "MLFLOW_AZURE_MAX_CONNECTIONS"
+
+_azure_clients = {}
+_azure_clients_lock = threading.Lock()
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -27,19 +40,35 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             self.client = client
             return
 
-        from azure.storage.blob import BlockBlobService
         (_, account, _) = AzureBlobArtifactRepository.parse_wasbs_uri(artifact_uri)
-        if "AZURE_STORAGE_CONNECTION_STRING" in os.environ:
-            self.client = BlockBlobService(
-                account_name=account,
-                connection_string=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"))
-        elif "AZURE_STORAGE_ACCESS_KEY" in os.environ:
-            self.client = BlockBlobService(
-                account_name=account,
-                account_key=os.environ.get("AZURE_STORAGE_ACCESS_KEY"))
-        else:
-            raise Exception("You need to set one of AZURE_STORAGE_CONNECTION_STRING or "
-                            "AZURE_STORAGE_ACCESS_KEY to access Azure storage.")
+        self.client = AzureBlobArtifactRepository._get_client(account)
+
+    @staticmethod
+    def _get_client(account):
+        """
+        :return: A ``BlockBlobService`` for the specified storage account, shared by all
+                 repositories using the same credentials so that its connections are reused.
+        """
+        from azure.storage.blob import BlockBlobService
+        connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+        access_key = os.environ.get("AZURE_STORAGE_ACCESS_KEY")
+        key = (account, connection_string, access_key)
+        with _azure_clients_lock:
+            if key not in _azure_clients:
+                if connection_string is not None:
+                    _azure_clients[key] = BlockBlobService(
+                        account_name=account, connection_string=connection_string)
+                elif access_key is not None:
+                    _azure_clients[key] = BlockBlobService(
+                        account_name=account, account_key=access_key)
+                else:
+                    raise Exception("You need to set one of AZURE_STORAGE_CONNECTION_STRING or "
+                                    "AZURE_STORAGE_ACCESS_KEY to access Azure storage.")
+            return _azure_clients[key]
+
+    @staticmethod
+    def _get_max_connections():
+        return get_positive_int_from_env(AZURE_MAX_CONNECTIONS_ENV_VAR, 4)
 
     @staticmethod
     def parse_wasbs_uri(uri):
@@ -64,22 +93,65 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(
                 dest_path, os.path.basename(local_file))
-        self.client.create_blob_from_path(container, dest_path, local_file)
+        self.client.create_blob_from_path(container, dest_path, local_file,
+                                          max_connections=self._get_max_connections())
+
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        Upload the files of ``local_dir`` concurrently, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads (8 by default). Files larger than
+        ``BlockBlobService.MAX_SINGLE_PUT_SIZE`` are additionally uploaded as block blobs whose
+        blocks are uploaded by up to ``MLFLOW_AZURE_MAX_CONNECTIONS`` threads (4 by default).
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+        With ``sync=True``, files are compared with the blobs at their path by size and MD5 hash.
+        The service only computes the MD5 hash of blobs uploaded in a single request, so the hash
+        of larger files is computed locally and stored with their blob. Blobs without an MD5 hash
+        are always uploaded again.
+        """
+        from azure.storage.blob import BlockBlobService
+        from azure.storage.blob.models import ContentSettings
         (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                self.client.create_blob_from_path(
-                    container, path, os.path.join(root, f))
+        max_connections = self._get_max_connections()
+        files = list_local_files(local_dir)
+        if sync:
+            files = filter_changed_files(files, self._list_remote_files(container, dest_path),
+                                         _is_same_file)
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % posixpath.join(self.artifact_uri, artifact_path or ""),
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+
+        def upload_file(local_path, rel_path):
+            kwargs = {}
+            if sync and os.path.getsize(local_path) > BlockBlobService.MAX_SINGLE_PUT_SIZE:
+                kwargs["content_settings"] = ContentSettings(
+                    content_md5=_get_base64_md5(local_path))
+            self.client.create_blob_from_path(container, posixpath.join(dest_path, rel_path),
+                                              local_path, max_connections=max_connections,
+                                              **kwargs)
+            progress.complete_file(os.path.getsize(local_path))
+
+        run_concurrently(upload_file, files)
+
+    def _list_remote_files(self, container, dest_path):
+        """
+        :return: Dictionary mapping the POSIX paths relative to ``dest_path`` of the blobs under it
+                 to their properties.
+        """
+        prefix = dest_path + "/" if dest_path else ""
+        remote_files = {}
+        marker = None
+        while True:
+            results = self.client.list_blobs(container, prefix=prefix, marker=marker)
+            for r in results:
+                remote_files[r.name[len(prefix):]] = r.properties
+            if results.next_marker:
+                marker = results.next_marker
+            else:
+                break
+        return remote_files
 
     def list_artifacts(self, path=None):
         from azure.storage.blob.models import BlobPrefix
@@ -113,7 +185,74 @@ class AzureBlobArtifactRepository(ArtifactRepository):
                 break
         return sorted(infos, key=lambda f: f.path)
 
+    def open_stream(self, artifact_path):
+        from azure.common import AzureMissingResourceHttpError
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        try:
+            size = self.client.get_blob_properties(
+                container, remote_full_path).properties.content_length
+        except AzureMissingResourceHttpError:
+            raise MlflowException("No such artifact file: '{}'".format(artifact_path),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+
+        def fetch_range(start, end):
+            # The end of ranges downloaded from Azure Blob Storage is inclusive
+            return self.client.get_blob_to_bytes(
+                container, remote_full_path, start_range=start, end_range=end - 1).content
+
+        return ArtifactStream(size, lambda offset: RangeReader(fetch_range, offset, size))
+
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        infos = [file_info for file_info, _ in self._list_files_with_versions(path)]
+        return get_recursive_listing(path, infos, max_depth)
+
+    def _list_files_with_versions(self, path):
+        (container, _, artifact_path) = self.parse_wasbs_uri(self.artifact_uri)
+        dest_path = posixpath.join(artifact_path, path) if path else artifact_path
+        prefix = dest_path + "/" if dest_path else ""
+        files = []
+        marker = None  # Used to make next list request if this one exceeded the result limit
+        while True:
+            results = self.client.list_blobs(container, prefix=prefix, marker=marker)
+            for r in results:
+                if not r.name.startswith(artifact_path):
+                    raise MlflowException(
+                        "The name of the listed Azure blob does not begin with the specified"
+                        " artifact path. Artifact path: {artifact_path}. Blob name:"
+                        " {blob_name}".format(artifact_path=artifact_path, blob_name=r.name))
+                file_name = posixpath.relpath(path=r.name, start=artifact_path) \
+                    if artifact_path else r.name
+                etag = r.properties.etag
+                files.append((FileInfo(file_name, False, r.properties.content_length),
+                              "%s-%s" % (etag.strip('"'), r.properties.content_length)
+                              if etag else None))
+            if results.next_marker:
+                marker = results.next_marker
+            else:
+                break
+        return files
+
+    def _get_file_version(self, remote_file_path):
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, remote_file_path)
+        properties = self.client.get_blob_properties(container, remote_full_path).properties
+        return "%s-%s" % (properties.etag.strip('"'), properties.content_length)
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
-        self.client.get_blob_to_path(container, remote_full_path, local_path)
+        self.client.get_blob_to_path(container, remote_full_path, local_path,
+                                     max_connections=self._get_max_connections())
+
+
+def _get_base64_md5(local_path):
+    return base64.b64encode(compute_file_md5(local_path)).decode("ascii")
+
+
+def _is_same_file(local_path, properties):
+    """:return: True if the contents of the local file are the same as those of the blob."""
+    content_md5 = properties.content_settings.content_md5
+    if not content_md5 or os.path.getsize(local_path) != properties.content_length:
+        return False
+    return _get_base64_md5(local_path) == content_md5
@@ -0,0 +1,129 @@
+"""
+Content-addressed storage of artifact files, so that identical files logged by many runs (e.g. the
+same tokenizer, vocabulary or base model weights) are stored and uploaded only once.
+
+The layout is enabled by setting the ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` environment variable to
+the root URI of a blob store, which must be on the same storage as the artifact repositories
+logging to it. Logged files are hashed before being transferred, and stored once as blobs at
+``<blob store URI>/sha256/<first two hex digits>/<SHA-256 hex digest>``. Blobs already in the
+store are not uploaded again.
+
+- ``LocalArtifactRepository`` logs files as hard links to their blobs, which can then be read
+  like any other file. Files are copied if the blob store is on another filesystem.
+- ``S3ArtifactRepository`` records the blobs of the files logged to an artifact directory in a
+  new manifest object named ``.mlflow-manifest-<timestamp>-<random ID>.json`` in that directory.
+  Manifests are never updated, so that concurrent writers, e.g. several processes logging to the
+  same run, do not overwrite each other's entries. The manifests of a directory are merged when
+  it is read, and files recorded in several manifests have the entry of the latest one, up to
+  clock differences between the hosts that wrote them. Objects stored directly at the path of an
+  artifact take precedence over manifest entries, so that files overwritten without the blob
+  store are read correctly.
+
+Artifacts logged with a blob store can be read without setting ``MLFLOW_ARTIFACT_BLOB_STORE_URI``.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import time
+import uuid
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
+
+ARTIFACT_BLOB_STORE_URI_ENV_VAR = "MLFLOW_ARTIFACT_BLOB_STORE_URI"
+MANIFEST_FILE_PREFIX = ".mlflow-manifest-"
+MANIFEST_FILE_SUFFIX = ".json"
+MANIFEST_FORMAT_VERSION = 1
+
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def get_blob_store_uri():
+    """
+    :return: The URI of the blob store set by ``MLFLOW_ARTIFACT_BLOB_STORE_URI``, or ``None`` if
+             artifacts are not stored in a blob store.
+    """
+    return os.environ.get(ARTIFACT_BLOB_STORE_URI_ENV_VAR) or None
+
+
+def compute_file_digest(local_path):
+    """:return: The SHA-256 hex digest of the contents of the specified local file."""
+    sha256 = hashlib.sha256()
+    with open(local_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_BUFFER_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def get_blob_path(digest):
+    """
+    :return: The POSIX path, relative to the root of the blob store, of the blob with the
+             specified SHA-256 hex digest.
+    """
+    return posixpath.join("sha256", digest[:2], digest)
+
+
+def is_manifest_file(path):
+    """:return: True if the file at the specified POSIX path is an artifact manifest."""
+    name = posixpath.basename(path)
+    return name.startswith(MANIFEST_FILE_PREFIX) and name.endswith(MANIFEST_FILE_SUFFIX)
+
+
+def new_manifest_file_name():
+    """
+    :return: A new unique name of manifest file. Names sort in the order they were created in, up
+             to clock differences between hosts.
+    """
+    return "%s%016x-%s%s" % (MANIFEST_FILE_PREFIX, int(time.time() * 1000000), uuid.uuid4().hex,
+                             MANIFEST_FILE_SUFFIX)
+
+
+def merge_manifests(manifests):
+    """
+    :param manifests: Dictionary mapping the POSIX paths of manifests to their entries.
+    :return: Dictionary mapping the paths of the files recorded in the manifests, relative to the
+             root of the paths of the manifests, to their entries. Files recorded in several
+             manifests of a directory have the entry of the latest manifest.
+    """
+    files = {}
+    for manifest_path in sorted(manifests):
+        rel_dir = posixpath.dirname(manifest_path)
+        for name, entry in manifests[manifest_path].items():
+            files[posixpath.join(rel_dir, name)] = entry
+    return files
+
+
+def make_manifest_entry(blob_uri, digest, size):
+    """:return: The manifest entry of a file stored in the blob at ``blob_uri``."""
+    return {"blob_uri": blob_uri, "sha256": digest, "size": size}
+
+
+def parse_manifest(contents, manifest_uri):
+    """
+    :param contents: Serialized manifest, as written by :py:func:`serialize_manifest`.
+    :param manifest_uri: URI of the manifest, used in error messages.
+    :return: Dictionary mapping the names of the files of the directory of the manifest to their
+             entries.
+    """
+    try:
+        manifest = json.loads(contents)
+        version = manifest.get("version")
+        files = manifest["files"]
+    except (ValueError, KeyError, AttributeError) as e:
+        raise MlflowException("Invalid artifact manifest %s: %s" % (manifest_uri, e),
+                              INTERNAL_ERROR)
+    if version != MANIFEST_FORMAT_VERSION:
+        raise MlflowException(
+            "Unsupported version %s of artifact manifest %s. Upgrade MLflow to read it." % (
+                version, manifest_uri), INTERNAL_ERROR)
+    return files
+
+
+def serialize_manifest(files):
+    """
+    :param files: Dictionary mapping names of files to their entries.
+    :return: The serialized manifest listing the specified files.
+    """
+    return json.dumps({"version": MANIFEST_FORMAT_VERSION, "files": files}, indent=2,
+                      sort_keys=True)
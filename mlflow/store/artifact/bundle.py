@@ -0,0 +1,235 @@
+"""
+Utilities for transferring a whole artifact directory as a single tar archive ("bundle"), which is
+produced on the fly from the contents of an artifact repository and extracted as it is received,
+without staging the archive on disk.
+"""
+import os
+import posixpath
+import shutil
+import tarfile
+import time
+import zlib
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_repo import STREAM_CHUNK_SIZE
+
+# Compression algorithms of artifact bundles. zstd compression requires the ``zstandard`` package.
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSIONS = [COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_ZSTD]
+
+_FILE_EXTENSIONS = {
+    COMPRESSION_NONE: ".tar",
+    COMPRESSION_GZIP: ".tar.gz",
+    COMPRESSION_ZSTD: ".tar.zst",
+}
+
+_MIMETYPES = {
+    COMPRESSION_NONE: "application/x-tar",
+    COMPRESSION_GZIP: "application/gzip",
+    COMPRESSION_ZSTD: "application/zstd",
+}
+
+
+def validate_compression(compression):
+    """
+    :return: The specified compression, or ``"none"`` if it is unspecified. zstd compression is
+             only valid if the ``zstandard`` package is installed.
+    """
+    compression = compression or COMPRESSION_NONE
+    if compression not in COMPRESSIONS:
+        raise MlflowException("Invalid compression '%s' for artifact bundles. Supported "
+                              "compressions are: %s" % (compression, ", ".join(COMPRESSIONS)),
+                              INVALID_PARAMETER_VALUE)
+    if compression == COMPRESSION_ZSTD:
+        try:
+            import zstandard  # pylint: disable=unused-variable
+        except ImportError:
+            raise MlflowException("zstd compression of artifact bundles requires the "
+                                  "'zstandard' package. Install it with `pip install zstandard`.",
+                                  INVALID_PARAMETER_VALUE)
+    return compression
+
+
+def get_bundle_filename(path, compression):
+    """:return: The file name of the bundle of the specified artifact path."""
+    name = posixpath.basename(path.strip("/")) if path else ""
+    return (name or "artifacts") + _FILE_EXTENSIONS[validate_compression(compression)]
+
+
+def get_bundle_mimetype(compression):
+    return _MIMETYPES[validate_compression(compression)]
+
+
+class ArtifactBundle(object):
+    """
+    Tar archive of an artifact file or directory, whose contents are read from the artifact
+    repository as the archive is iterated over.
+
+    The archive contains the artifacts under the basename of ``path``, or directly at its root if
+    ``path`` is the root directory of the repository, so that extracting it to a directory yields
+    the same layout as :py:meth:`ArtifactRepository.download_artifacts` with that directory as
+    ``dst_path``.
+
+    The artifacts are listed when the bundle is created, so that a missing artifact is reported
+    before any of the archive is produced.
+
+    :param repo: The :py:class:`ArtifactRepository` containing the artifacts.
+    :param path: Relative source path of the artifact file or directory to archive.
+    :param compression: One of ``"none"`` (the default), ``"gzip"`` or ``"zstd"``.
+    """
+
+    def __init__(self, repo, path=None, compression=None):
+        self.compression = validate_compression(compression)
+        self._repo = repo
+        self._mtime = int(time.time())
+        self._first_stream = None
+        path = path.strip("/") if path else ""
+        self._entries = []
+        infos = repo.list_artifacts_recursive(path or None)
+        if infos:
+            prefix = path + "/" if path else ""
+            root_name = posixpath.basename(path)
+            if root_name:
+                self._entries.append((root_name, None, None))
+            for file_info in infos:
+                name = posixpath.join(root_name, file_info.path[len(prefix):])
+                self._entries.append((name, file_info.path, file_info.file_size)
+                                     if not file_info.is_dir else (name, None, None))
+        elif path:
+            # The path is a file, or does not exist in which case opening it fails
+            self._first_stream = repo.open_stream(path)
+            self._entries.append((posixpath.basename(path), path, self._first_stream.size))
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    def close(self):
+        """Close the stream opened when creating the bundle of a file, if it was not consumed."""
+        if self._first_stream is not None:
+            self._first_stream.close()
+            self._first_stream = None
+
+    def iter_chunks(self):
+        """Yield the (compressed) contents of the archive."""
+        compressor = _get_compressor(self.compression)
+        for data in self._iter_tar_chunks():
+            if compressor is None:
+                yield data
+            else:
+                data = compressor.compress(data)
+                if data:
+                    yield data
+        if compressor is not None:
+            yield compressor.flush()
+
+    def _iter_tar_chunks(self):
+        num_bytes = 0
+        try:
+            for (name, artifact_path, size) in self._entries:
+                stream = None
+                if artifact_path is not None:
+                    stream = self._open_stream(artifact_path)
+                    size = stream.size
+                try:
+                    header = self._get_header(name, size if stream is not None else None)
+                    num_bytes += len(header)
+                    yield header
+                    if stream is None:
+                        continue
+                    for data in stream.iter_chunks(chunk_size=STREAM_CHUNK_SIZE):
+                        num_bytes += len(data)
+                        yield data
+                    # A truncated file would corrupt the rest of the archive
+                    if stream.tell() != size:
+                        raise MlflowException("Artifact '%s' ended after %d of %d bytes" % (
+                            artifact_path, stream.tell(), size))
+                finally:
+                    if stream is not None:
+                        stream.close()
+                padding = _get_padding(num_bytes, tarfile.BLOCKSIZE)
+                num_bytes += len(padding)
+                yield padding
+        finally:
+            self.close()
+        # The archive ends with two empty blocks, padded to a whole record like tarfile does
+        end = tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+        yield end + _get_padding(num_bytes + len(end), tarfile.RECORDSIZE)
+
+    def _open_stream(self, artifact_path):
+        if self._first_stream is not None:
+            stream, self._first_stream = self._first_stream, None
+            return stream
+        return self._repo.open_stream(artifact_path)
+
+    def _get_header(self, name, size):
+        info = tarfile.TarInfo(name)
+        info.mtime = self._mtime
+        if size is None:
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+        else:
+            info.size = size
+            info.mode = 0o644
+        return info.tobuf(format=tarfile.PAX_FORMAT, encoding="utf-8")
+
+
+def _get_padding(num_bytes, block_size):
+    remainder = num_bytes % block_size
+    return tarfile.NUL * (block_size - remainder) if remainder else b""
+
+
+def _get_compressor(compression):
+    if compression == COMPRESSION_GZIP:
+        # A window size of 16 + 15 bits produces a gzip stream with its header and trailer
+        return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+        return zstandard.ZstdCompressor().compressobj()
+    return None
+
+
+def extract_artifact_bundle(fileobj, dst_path, compression=None):
+    """
+    Extract an artifact bundle as it is read from a binary file-like object, such as the body of
+    an HTTP response, to the specified local directory.
+
+    Only regular files and directories are extracted, and members whose path would escape
+    ``dst_path`` are rejected, as bundles may come from an untrusted server.
+
+    :param fileobj: Readable binary file-like object over the contents of the bundle.
+    :param dst_path: Local directory to which to extract the bundle. It must already exist.
+    :param compression: Compression of the bundle, one of ``"none"``, ``"gzip"`` or ``"zstd"``.
+    """
+    compression = validate_compression(compression)
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+        fileobj = zstandard.ZstdDecompressor().stream_reader(fileobj)
+    mode = "r|gz" if compression == COMPRESSION_GZIP else "r|"
+    dst_path = os.path.abspath(dst_path)
+    with tarfile.open(fileobj=fileobj, mode=mode) as tar:
+        for member in tar:
+            local_path = _get_member_local_path(dst_path, member)
+            if member.isdir():
+                if not os.path.isdir(local_path):
+                    os.makedirs(local_path)
+                continue
+            local_dir = os.path.dirname(local_path)
+            if not os.path.isdir(local_dir):
+                os.makedirs(local_dir)
+            src = tar.extractfile(member)
+            with open(local_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+
+def _get_member_local_path(dst_path, member):
+    if not (member.isfile() or member.isdir()):
+        raise MlflowException("Invalid member '%s' in artifact bundle: only regular files and "
+                              "directories are supported" % member.name)
+    local_path = os.path.abspath(os.path.join(dst_path, *member.name.split("/")))
+    if member.name.startswith("/") or not local_path.startswith(os.path.join(dst_path, "")):
+        raise MlflowException("Invalid member '%s' in artifact bundle: paths must be relative "
+                              "to the root of the bundle" % member.name)
+    return local_path
@@ -5,7 +5,7 @@ import click
 
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking import _get_store
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking.artifact_utils import _download_artifact_bundle, _download_artifact_from_uri
 from mlflow.utils.proto_json_utils import message_to_json
 
 _logger = logging.getLogger(__name__)
@@ -52,7 +52,10 @@ def log_artifact(local_file, run_id, artifact_path):
 @click.option("--artifact-path", "-a",
               help="If specified, we will log the artifact into this subdirectory of the " +
                    "run's artifact directory.")
-def log_artifacts(local_dir, run_id, artifact_path):
+@click.option("--sync", is_flag=True,
+              help="Only log the files that are new or whose contents differ from the artifacts "
+                   "already logged at their path.")
+def log_artifacts(local_dir, run_id, artifact_path, sync):
     """
     Log the files within a local directory as an artifact of a run, optionally
     within a run-specific artifact path. Run artifacts can be organized into
@@ -61,7 +64,10 @@ def log_artifacts(local_dir, run_id, artifact_path):
     store = _get_store()
     artifact_uri = store.get_run(run_id).info.artifact_uri
     artifact_repo = get_artifact_repository(artifact_uri)
-    artifact_repo.log_artifacts(local_dir, artifact_path)
+    if sync:
+        artifact_repo.log_artifacts(local_dir, artifact_path, sync=True)
+    else:
+        artifact_repo.log_artifacts(local_dir, artifact_path)
     _logger.info("Logged artifact from local dir %s to artifact_path=%s", local_dir, artifact_path)
 
 
@@ -103,6 +109,11 @@ def download_artifacts(run_id, artifact_path, artifact_uri):
     The output is the name of the file or directory on the local disk.
 
     Either ``--run-id`` or ``--artifact-uri`` must be provided.
+
+    If MLFLOW_TRACKING_URI is the URL of a tracking server, the artifacts of runs are streamed by
+    the server as a single tar archive, compressed with the algorithm set in the
+    MLFLOW_ARTIFACT_BUNDLE_COMPRESSION environment variable ("none", "gzip" or "zstd"). Set
+    MLFLOW_ARTIFACT_BUNDLE_DOWNLOAD=false to download them from the artifact store instead.
     """
     if run_id is None and artifact_uri is None:
         _logger.error("Either ``--run-id`` or ``--artifact-uri`` must be provided.")
@@ -112,6 +123,11 @@ def download_artifacts(run_id, artifact_path, artifact_uri):
         print(_download_artifact_from_uri(artifact_uri))
         return
 
+    artifact_location = _download_artifact_bundle(run_id, artifact_path)
+    if artifact_location is not None:
+        print(artifact_location)
+        return
+
     artifact_path = artifact_path if artifact_path is not None else ""
     store = _get_store()
     artifact_uri = store.get_run(run_id).info.artifact_uri
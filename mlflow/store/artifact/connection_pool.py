@@ -0,0 +1,87 @@
+"""
+Pool of connections to servers of artifact repositories that require a connection to be opened
+and authenticated before use (e.g. FTP and SFTP), so that consecutive operations, and concurrent
+transfers of the files of a directory, reuse connections instead of opening new ones.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from mlflow.store.artifact.transfer import get_max_workers
+
+_logger = logging.getLogger(__name__)
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of connections created by ``connect()`` and closed by ``close(connection)``.
+    Connections are created on demand, and at most ``max_idle_connections`` connections are kept
+    open while unused.
+
+    :param is_alive: Optional function checking that a connection that has been idle for more than
+                     ``idle_check_seconds`` is still usable, e.g. by sending a no-op command.
+    """
+
+    def __init__(self, connect, close, is_alive=None, max_idle_connections=None,
+                 idle_check_seconds=10):
+        self._connect = connect
+        self._close = close
+        self._is_alive = is_alive
+        self.max_idle_connections = max_idle_connections or get_max_workers()
+        self._idle_check_seconds = idle_check_seconds
+        # List of (connection, time at which it was released)
+        self._idle_connections = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager acquiring a connection from the pool, which is released to the pool after
+        the block, or closed if the block raises an exception as it may be in an unknown state.
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        except BaseException:
+            self._close_quietly(connection)
+            raise
+        self._release(connection)
+
+    def _acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle_connections:
+                    break
+                connection, released_time = self._idle_connections.pop()
+            if self._is_alive is None or \
+                    time.time() - released_time < self._idle_check_seconds:
+                return connection
+            try:
+                if self._is_alive(connection):
+                    return connection
+            except Exception:  # pylint: disable=broad-except
+                pass
+            self._close_quietly(connection)
+        return self._connect()
+
+    def _release(self, connection):
+        with self._lock:
+            if len(self._idle_connections) < self.max_idle_connections:
+                self._idle_connections.append((connection, time.time()))
+                return
+        self._close_quietly(connection)
+
+    def _close_quietly(self, connection):
+        try:
+            self._close(connection)
+        except Exception as e:  # pylint: disable=broad-except
+            _logger.debug("Failed to close connection: %s", e)
+
+    def close(self):
+        """Close the idle connections of the pool."""
+        with self._lock:
+            idle_connections = self._idle_connections
+            self._idle_connections = []
+        for connection, _ in idle_connections:
+            self._close_quietly(connection)
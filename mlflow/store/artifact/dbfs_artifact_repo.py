@@ -7,15 +7,17 @@ from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.rest_store import RestStore
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.transfer import TransferProgress, get_max_workers, list_local_files, \
+    run_concurrently
 from mlflow.tracking._tracking_service import utils
-from mlflow.utils.file_utils import relative_path_to_artifact_path
-from mlflow.utils.rest_utils import http_request, http_request_safe, RESOURCE_DOES_NOT_EXIST
+from mlflow.utils.rest_utils import http_request, http_request_safe, get_request_session, \
+    RESOURCE_DOES_NOT_EXIST
 from mlflow.utils.string_utils import strip_prefix
 import mlflow.utils.databricks_utils
 
 LIST_API_ENDPOINT = '/api/2.0/dbfs/list'
 GET_STATUS_ENDPOINT = '/api/2.0/dbfs/get-status'
-DOWNLOAD_CHUNK_SIZE = 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 USE_FUSE_ENV_VAR = "MLFLOW_ENABLE_DBFS_FUSE_ARTIFACT_REPO"
 
 
@@ -25,6 +27,10 @@ class DbfsRestArtifactRepository(ArtifactRepository):
 
     This repository is used with URIs of the form ``dbfs:/<path>``. The repository can only be used
     together with the RestStore.
+
+    Requests share a pool of keep-alive connections, so that the files of a directory, which are
+    uploaded and downloaded concurrently using up to ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS``
+    threads (8 by default), do not each open a new connection.
     """
     def __init__(self, artifact_uri):
         super(DbfsRestArtifactRepository, self).__init__(artifact_uri)
@@ -34,14 +40,20 @@ class DbfsRestArtifactRepository(ArtifactRepository):
         if not artifact_uri.startswith('dbfs:/'):
             raise MlflowException('DbfsArtifactRepository URI must start with dbfs:/')
 
+    @staticmethod
+    def _get_session():
+        return get_request_session(max(10, get_max_workers()))
+
     def _databricks_api_request(self, endpoint, **kwargs):
         host_creds = self.get_host_creds()
-        return http_request_safe(host_creds=host_creds, endpoint=endpoint, **kwargs)
+        return http_request_safe(host_creds=host_creds, endpoint=endpoint,
+                                 session=self._get_session(), **kwargs)
 
     def _dbfs_list_api(self, json):
         host_creds = self.get_host_creds()
         return http_request(
-            host_creds=host_creds, endpoint=LIST_API_ENDPOINT, method='GET', json=json)
+            host_creds=host_creds, endpoint=LIST_API_ENDPOINT, method='GET', json=json,
+            session=self._get_session())
 
     def _dbfs_download(self, output_path, endpoint):
         with open(output_path, 'wb') as f:
@@ -86,17 +98,20 @@ class DbfsRestArtifactRepository(ArtifactRepository):
                 self._databricks_api_request(
                     endpoint=http_endpoint, method='POST', data=f, allow_redirects=False)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
         artifact_path = artifact_path or ''
-        for (dirpath, _, filenames) in os.walk(local_dir):
-            artifact_subdir = artifact_path
-            if dirpath != local_dir:
-                rel_path = os.path.relpath(dirpath, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_subdir = posixpath.join(artifact_path, rel_path)
-            for name in filenames:
-                file_path = os.path.join(dirpath, name)
-                self.log_artifact(file_path, artifact_subdir)
+        files = list_local_files(local_dir)
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % posixpath.join(self.artifact_uri, artifact_path),
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+
+        def upload_file(local_path, rel_path):
+            artifact_subdir = posixpath.join(artifact_path, posixpath.dirname(rel_path))
+            self.log_artifact(local_path, artifact_subdir)
+            progress.complete_file(os.path.getsize(local_path))
+
+        run_concurrently(upload_file, files)
 
     def list_artifacts(self, path=None):
         if path:
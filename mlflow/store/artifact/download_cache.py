@@ -0,0 +1,190 @@
+"""
+On-disk cache of artifact files downloaded from remote artifact repositories, so that loading the
+same model repeatedly (e.g. on every restart of a serving process) does not download it again.
+
+The cache is enabled by setting the ``MLFLOW_ARTIFACT_CACHE_DIR`` environment variable to the
+directory in which to store cached files. Entries are keyed by the full URI of the artifact file
+and a version of its contents reported by the storage backend (e.g. its ETag), so that files
+overwritten in the artifact repository are downloaded again. The least recently used entries
+are evicted when the total size of the cache exceeds ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` bytes
+(10 GiB by default). Only the S3, Google Cloud Storage and Azure Blob Storage repositories report
+versions of their files, so files of other repositories are not cached.
+
+The cache can be shared by multiple processes: entries are downloaded to temporary files and
+atomically renamed into place, and eviction is serialized with a file lock where supported.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+
+from mlflow.store.artifact.transfer import get_positive_int_from_env
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+ARTIFACT_CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+ARTIFACT_CACHE_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+DEFAULT_MAX_SIZE_BYTES = 10 * 1024 ** 3
+
+_logger = logging.getLogger(__name__)
+
+_download_caches = {}
+_download_caches_lock = threading.Lock()
+
+
+class ArtifactDownloadCache(object):
+    """
+    Content-addressed cache of downloaded artifact files, stored under ``root_dir``.
+
+    :param root_dir: Local directory in which cached files are stored. Created if needed.
+    :param max_size_bytes: Maximum total size of the cached files, above which the least recently
+                           used files are evicted.
+
+    The total size of the cached files is computed when the first file is added to the cache, then
+    tracked as files are added, and only recomputed by evictions. Files added by other processes
+    sharing the cache are thus only accounted for by the next eviction.
+    """
+
+    def __init__(self, root_dir, max_size_bytes=DEFAULT_MAX_SIZE_BYTES):
+        self.root_dir = os.path.abspath(root_dir)
+        self.max_size_bytes = max_size_bytes
+        self._objects_dir = os.path.join(self.root_dir, "objects")
+        self._tmp_dir = os.path.join(self.root_dir, "tmp")
+        self._size_lock = threading.Lock()
+        self._tracked_size = None
+        for directory in [self._objects_dir, self._tmp_dir]:
+            if not os.path.isdir(directory):
+                try:
+                    os.makedirs(directory)
+                except OSError:
+                    # The directory may have been created concurrently by another process
+                    if not os.path.isdir(directory):
+                        raise
+
+    def _get_entry_path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._objects_dir, digest[:2], digest)
+
+    def download(self, key, local_path, download_file):
+        """
+        Write the file cached under ``key`` to ``local_path``, calling
+        ``download_file(path)`` to download it into the cache first if it is not cached yet.
+
+        :param key: Key identifying the contents of the file, e.g. its URI and ETag.
+        :param download_file: Function downloading the file to the specified local path.
+        :return: True if the file was cached, False if it was downloaded.
+        """
+        entry_path = self._get_entry_path(key)
+        if self._copy_entry(entry_path, local_path):
+            return True
+        entry_dir = os.path.dirname(entry_path)
+        if not os.path.isdir(entry_dir):
+            try:
+                os.makedirs(entry_dir)
+            except OSError:
+                if not os.path.isdir(entry_dir):
+                    raise
+        tmp_path = os.path.join(self._tmp_dir, uuid.uuid4().hex)
+        try:
+            download_file(tmp_path)
+            shutil.copyfile(tmp_path, local_path)
+            size = os.path.getsize(tmp_path)
+            self._publish(tmp_path, entry_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._add_to_size(size)
+        return False
+
+    def _add_to_size(self, size):
+        """Track the addition of a file to the cache, evicting files if the cache is too large."""
+        with self._size_lock:
+            if self._tracked_size is None:
+                self._tracked_size = self.get_size()
+            else:
+                self._tracked_size += size
+            needs_eviction = self._tracked_size > self.max_size_bytes
+        if needs_eviction:
+            self.evict()
+
+    @staticmethod
+    def _copy_entry(entry_path, local_path):
+        try:
+            # Record the use of the entry for LRU eviction
+            os.utime(entry_path, None)
+            shutil.copyfile(entry_path, local_path)
+            return True
+        except (IOError, OSError):
+            # The entry does not exist, or was evicted by another process
+            return False
+
+    @staticmethod
+    def _publish(tmp_path, entry_path):
+        try:
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # On Windows, renaming fails if another process published the same entry first
+            if not os.path.exists(entry_path):
+                raise
+
+    def _iter_entries(self):
+        for subdir in os.listdir(self._objects_dir):
+            subdir_path = os.path.join(self._objects_dir, subdir)
+            if not os.path.isdir(subdir_path):
+                continue
+            for name in os.listdir(subdir_path):
+                path = os.path.join(subdir_path, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def get_size(self):
+        """:return: The total size of the cached files in bytes."""
+        return sum(size for _, _, size in self._iter_entries())
+
+    def evict(self):
+        """
+        Delete the least recently used cached files until their total size is at most
+        ``max_size_bytes``.
+        """
+        with open(os.path.join(self.root_dir, ".lock"), "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries = sorted(self._iter_entries(), key=lambda entry: entry[1])
+            total_size = sum(size for _, _, size in entries)
+            for path, _, size in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total_size -= size
+                except OSError as e:
+                    _logger.debug("Failed to evict cached artifact %s: %s", path, e)
+            with self._size_lock:
+                self._tracked_size = total_size
+
+
+def get_artifact_download_cache():
+    """
+    :return: The :py:class:`ArtifactDownloadCache` configured by the ``MLFLOW_ARTIFACT_CACHE_DIR``
+             and ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` environment variables, or ``None`` if
+             caching is disabled. The cache is shared by all callers in the process, so that the
+             size of the cache is tracked across downloads.
+    """
+    root_dir = os.environ.get(ARTIFACT_CACHE_DIR_ENV_VAR)
+    if not root_dir:
+        return None
+    max_size_bytes = get_positive_int_from_env(ARTIFACT_CACHE_MAX_SIZE_ENV_VAR,
+                                               DEFAULT_MAX_SIZE_BYTES)
+    key = (os.path.abspath(root_dir), max_size_bytes)
+    with _download_caches_lock:
+        if key not in _download_caches:
+            _download_caches[key] = ArtifactDownloadCache(root_dir, max_size_bytes)
+        return _download_caches[key]
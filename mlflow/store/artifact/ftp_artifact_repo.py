@@ -1,14 +1,25 @@
 import os
 import ftplib
+import threading
 from ftplib import FTP
-from contextlib import contextmanager
 
 import posixpath
 from six.moves import urllib
 
 from mlflow.entities.file_info import FileInfo
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact.connection_pool import ConnectionPool
+from mlflow.store.artifact.transfer import TransferProgress, list_local_dirs, list_local_files, \
+    run_concurrently
+
+# Connection pools shared by all repositories connecting to the same server as the same user
+_ftp_connection_pools = {}
+_ftp_connection_pools_lock = threading.Lock()
+
+
+def _is_alive(ftp):
+    ftp.voidcmd("NOOP")
+    return True
 
 
 class FTPArtifactRepository(ArtifactRepository):
@@ -30,13 +41,25 @@ class FTPArtifactRepository(ArtifactRepository):
 
         super(FTPArtifactRepository, self).__init__(artifact_uri)
 
-    @contextmanager
-    def get_ftp_client(self):
+    def _connect(self):
         ftp = FTP()
         ftp.connect(self.config['host'], self.config['port'])
         ftp.login(self.config['username'], self.config['password'])
-        yield ftp
-        ftp.close()
+        return ftp
+
+    def get_ftp_client(self):
+        """
+        :return: Context manager providing a logged in FTP client, from a pool of connections
+                 shared by the repositories of the same server and user.
+        """
+        key = (self.config['host'], self.config['port'], self.config['username'],
+               self.config['password'])
+        with _ftp_connection_pools_lock:
+            if key not in _ftp_connection_pools:
+                _ftp_connection_pools[key] = ConnectionPool(
+                    self._connect, close=lambda ftp: ftp.close(), is_alive=_is_alive)
+            pool = _ftp_connection_pools[key]
+        return pool.connection()
 
     @staticmethod
     def _is_dir(ftp, full_file_path):
@@ -72,30 +95,46 @@ class FTPArtifactRepository(ArtifactRepository):
                 ftp.cwd(artifact_dir)
                 ftp.storbinary('STOR ' + os.path.basename(local_file), f)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    @staticmethod
+    def _mkdirs(ftp, artifact_dir, sub_dirs):
+        """
+        Create ``artifact_dir`` and its parents if needed, and the subdirectories ``sub_dirs`` of
+        ``artifact_dir``, which must be sorted such that parents come before their subdirectories.
+        """
+        FTPArtifactRepository._mkdir(ftp, artifact_dir)
+        for sub_dir in sub_dirs:
+            try:
+                ftp.mkd(posixpath.join(artifact_dir, sub_dir))
+            except ftplib.error_perm:
+                # The directory already exists
+                pass
+
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        Create all the directories of the uploaded tree with a single connection, then upload the
+        files concurrently over pooled connections, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads (8 by default).
+        """
         dest_path = posixpath.join(self.path, artifact_path) \
             if artifact_path else self.path
-
         dest_path = posixpath.join(
             dest_path, os.path.split(local_dir)[1])
-        dest_path_re = os.path.split(local_dir)[1]
-        if artifact_path:
-            dest_path_re = posixpath.join(
-                artifact_path, os.path.split(local_dir)[1])
-
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path_re, rel_path)
-            if not filenames:
-                with self.get_ftp_client() as ftp:
-                    self._mkdir(ftp, posixpath.join(self.path, upload_path))
-            for f in filenames:
-                if os.path.isfile(os.path.join(root, f)):
-                    self.log_artifact(os.path.join(root, f), upload_path)
+
+        files = list_local_files(local_dir)
+        with self.get_ftp_client() as ftp:
+            self._mkdirs(ftp, dest_path, list_local_dirs(local_dir))
+        # The artifact URI is not logged as it may contain a password
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % dest_path,
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+
+        def upload_file(local_path, rel_path):
+            with self.get_ftp_client() as ftp, open(local_path, 'rb') as f:
+                ftp.storbinary('STOR ' + posixpath.join(dest_path, rel_path), f)
+            progress.complete_file(os.path.getsize(local_path))
+
+        run_concurrently(upload_file, files)
 
     def list_artifacts(self, path=None):
         with self.get_ftp_client() as ftp:
@@ -1,11 +1,35 @@
+import base64
 import os
+import threading
 
 import posixpath
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream, RangeReader, \
+    get_recursive_listing
+from mlflow.store.artifact.transfer import TransferProgress, compute_file_md5, \
+    download_file_in_chunks, filter_changed_files, get_positive_int_from_env, list_local_files, \
+    run_concurrently
+
+# Environment variables tuning the transfers of individual files: the size of the chunks in which
+# files are uploaded with resumable uploads (if unset, files are uploaded in a single request),
+# the size of the ranges in which large files are downloaded, and the maximum number of ranges of
+# a file downloaded concurrently.
+GCS_UPLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_GCS_UPLOAD_CHUNK_SIZE"
+GCS_DOWNLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE"
+GCS_MAX_CONCURRENCY_ENV_VAR = "MLFLOW_GCS_MAX_CONCURRENCY"
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+# Chunk sizes of resumable uploads must be multiples of 256 KiB
+_UPLOAD_CHUNK_SIZE_MULTIPLE = 256 * 1024
+
+# Environment variables affecting the configuration of storage clients, which are cached by value
+_CLIENT_ENV_VARS = ["GOOGLE_APPLICATION_CREDENTIALS", "GOOGLE_CLOUD_PROJECT",
+                    "STORAGE_EMULATOR_HOST"]
+_gcs_clients = {}
+_gcs_clients_lock = threading.Lock()
 
 
 class GCSArtifactRepository(ArtifactRepository):
@@ -35,13 +59,39 @@ class GCSArtifactRepository(ArtifactRepository):
             path = path[1:]
         return parsed.netloc, path
 
-    def _get_bucket(self, bucket):
+    def _get_client(self):
+        """
+        :return: A storage client, shared by all repositories using the same storage module and
+                 credentials, as creating a client looks up credentials and opens new connections.
+        """
         from google.auth.exceptions import DefaultCredentialsError
-        try:
-            storage_client = self.gcs.Client()
-        except DefaultCredentialsError:
-            storage_client = self.gcs.Client.create_anonymous_client()
-        return storage_client.bucket(bucket)
+        key = (self.gcs,) + tuple(os.environ.get(env_var) for env_var in _CLIENT_ENV_VARS)
+        with _gcs_clients_lock:
+            if key not in _gcs_clients:
+                try:
+                    _gcs_clients[key] = self.gcs.Client()
+                except DefaultCredentialsError:
+                    _gcs_clients[key] = self.gcs.Client.create_anonymous_client()
+            return _gcs_clients[key]
+
+    def _get_bucket(self, bucket):
+        return self._get_client().bucket(bucket)
+
+    @staticmethod
+    def _get_upload_chunk_size():
+        chunk_size = get_positive_int_from_env(GCS_UPLOAD_CHUNK_SIZE_ENV_VAR, None)
+        if chunk_size is not None and chunk_size % _UPLOAD_CHUNK_SIZE_MULTIPLE != 0:
+            raise MlflowException("Environment variable %s must be a multiple of %d, got %d" % (
+                GCS_UPLOAD_CHUNK_SIZE_ENV_VAR, _UPLOAD_CHUNK_SIZE_MULTIPLE, chunk_size),
+                INVALID_PARAMETER_VALUE)
+        return chunk_size
+
+    @staticmethod
+    def _upload_file(gcs_bucket, dest_path, local_file, chunk_size):
+        blob = gcs_bucket.blob(dest_path)
+        if chunk_size is not None:
+            blob.chunk_size = chunk_size
+        blob.upload_from_filename(local_file)
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -51,25 +101,39 @@ class GCSArtifactRepository(ArtifactRepository):
             dest_path, os.path.basename(local_file))
 
         gcs_bucket = self._get_bucket(bucket)
-        blob = gcs_bucket.blob(dest_path)
-        blob.upload_from_filename(local_file)
+        self._upload_file(gcs_bucket, dest_path, local_file, self._get_upload_chunk_size())
+
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        Upload the files of ``local_dir`` concurrently, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads (8 by default). Large files are uploaded
+        in chunks of ``MLFLOW_GCS_UPLOAD_CHUNK_SIZE`` bytes with resumable uploads if it is set.
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+        With ``sync=True``, files are compared with the blobs at their path by size and MD5 hash.
+        Composite blobs, which have no MD5 hash, are always uploaded again.
+        """
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         gcs_bucket = self._get_bucket(bucket)
-
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+        chunk_size = self._get_upload_chunk_size()
+        files = list_local_files(local_dir)
+        if sync:
+            prefix = dest_path + "/" if dest_path else ""
+            remote_files = dict((blob.name[len(prefix):], blob)
+                                for blob in gcs_bucket.list_blobs(prefix=prefix))
+            files = filter_changed_files(files, remote_files, _is_same_file)
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % posixpath.join(self.artifact_uri, artifact_path or ""),
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+
+        def upload_file(local_path, rel_path):
+            self._upload_file(gcs_bucket, posixpath.join(dest_path, rel_path), local_path,
+                              chunk_size)
+            progress.complete_file(os.path.getsize(local_path))
+
+        run_concurrently(upload_file, files)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -89,6 +153,24 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        infos = [file_info for file_info, _ in self._list_files_with_versions(path)]
+        return get_recursive_listing(path, infos, max_depth)
+
+    def _list_files_with_versions(self, path):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = posixpath.join(artifact_path, path) if path else artifact_path
+        prefix = dest_path + "/" if dest_path else ""
+        files = []
+        for blob in self._get_bucket(bucket).list_blobs(prefix=prefix):
+            # Skip the empty objects that some tools create to represent directories
+            if blob.name.endswith("/"):
+                continue
+            blob_path = blob.name[len(artifact_path) + 1:] if artifact_path else blob.name
+            files.append((FileInfo(blob_path, False, blob.size),
+                          "%s-%s" % (blob.generation, blob.size)))
+        return files
+
     def _list_folders(self, bkt, prefix, artifact_path):
         results = bkt.list_blobs(prefix=prefix, delimiter="/")
         dir_paths = set()
@@ -97,8 +179,63 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return [FileInfo(path[len(artifact_path) + 1:-1], True, None) for path in dir_paths]
 
+    def open_stream(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).get_blob(remote_full_path)
+        if blob is None:
+            raise MlflowException("No such artifact file: '{}'".format(artifact_path),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+
+        def fetch_range(start, end):
+            # The end of ranges downloaded from GCS is inclusive
+            return blob.download_as_string(start=start, end=end - 1)
+
+        return ArtifactStream(blob.size,
+                              lambda offset: RangeReader(fetch_range, offset, blob.size))
+
+    def _get_file_version(self, remote_file_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, remote_file_path)
+        blob = self._get_bucket(bucket).get_blob(remote_full_path)
+        if blob is None:
+            raise MlflowException("No such artifact file: '{}'".format(remote_file_path),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+        # The generation of a blob changes whenever it is overwritten
+        return "%s-%s" % (blob.generation, blob.size)
+
     def _download_file(self, remote_file_path, local_path):
+        """
+        Download the file, in ranges of ``MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE`` bytes (64 MiB by
+        default) downloaded by up to ``MLFLOW_GCS_MAX_CONCURRENCY`` threads (4 by default) if it
+        is larger than one range.
+        """
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
         gcs_bucket = self._get_bucket(bucket)
-        gcs_bucket.blob(remote_full_path).download_to_filename(local_path)
+        chunk_size = get_positive_int_from_env(GCS_DOWNLOAD_CHUNK_SIZE_ENV_VAR,
+                                               DEFAULT_DOWNLOAD_CHUNK_SIZE)
+        blob = gcs_bucket.get_blob(remote_full_path)
+        if blob is None:
+            raise MlflowException("No such artifact file: '{}'".format(remote_file_path),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+        if blob.size <= chunk_size:
+            blob.download_to_filename(local_path)
+            return
+
+        def fetch_range(start, end):
+            # The end of ranges downloaded from GCS is inclusive. Blobs fetched with get_blob are
+            # downloaded from their media link, which specifies their generation, so all ranges are
+            # downloaded from the same version of the blob.
+            return blob.download_as_string(start=start, end=end - 1)
+
+        download_file_in_chunks(
+            fetch_range, blob.size, local_path, chunk_size,
+            max_workers=get_positive_int_from_env(GCS_MAX_CONCURRENCY_ENV_VAR, 4))
+
+
+def _is_same_file(local_path, blob):
+    """:return: True if the contents of the local file are the same as those of the blob."""
+    if blob.md5_hash is None or os.path.getsize(local_path) != blob.size:
+        return False
+    return base64.b64encode(compute_file_md5(local_path)).decode("ascii") == blob.md5_hash
@@ -1,14 +1,23 @@
 import os
 import posixpath
+import shutil
 import tempfile
+import threading
 from contextlib import contextmanager
 
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import mkdir, relative_path_to_artifact_path
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream, \
+    validate_max_depth
+from mlflow.store.artifact.transfer import list_local_dirs, list_local_files, run_concurrently
+from mlflow.utils.file_utils import mkdir
+
+# Filesystem handles shared by all repositories, keyed by their connection parameters
+_hdfs_filesystems = {}
+_hdfs_filesystems_lock = threading.Lock()
 
 
 class HdfsArtifactRepository(ArtifactRepository):
@@ -34,38 +43,28 @@ class HdfsArtifactRepository(ArtifactRepository):
         with hdfs_system(host=self.host, port=self.port) as hdfs:
             _, file_name = os.path.split(local_file)
             destination = posixpath.join(hdfs_base_path, file_name)
-            with hdfs.open(destination, 'wb') as output:
-                output.write(open(local_file, "rb").read())
+            _upload_hdfs_file(hdfs, local_file, destination)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
         """
             Log artifacts in hdfs.
-            Missing remote sub-directories will be created if needed.
+            Missing remote sub-directories will be created if needed. Files are uploaded
+            concurrently, using up to ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads.
         :param local_dir: source dir path
         :param artifact_path: when specified will attempt to write under artifact_uri/artifact_path
         """
         hdfs_base_path = _resolve_base_path(self.path, artifact_path)
 
         with hdfs_system(host=self.host, port=self.port) as hdfs:
+            # Creating a directory also creates its parents and succeeds if it already exists
+            hdfs.mkdir(hdfs_base_path)
+            for relative_path in list_local_dirs(local_dir):
+                hdfs.mkdir(posixpath.join(hdfs_base_path, relative_path))
 
-            if not hdfs.exists(hdfs_base_path):
-                hdfs.mkdir(hdfs_base_path)
-
-            for subdir_path, _, files in os.walk(local_dir):
-
-                relative_path = _relative_path_local(local_dir, subdir_path)
-
-                hdfs_subdir_path = posixpath.join(hdfs_base_path, relative_path) \
-                    if relative_path else hdfs_base_path
-
-                if not hdfs.exists(hdfs_subdir_path):
-                    hdfs.mkdir(hdfs_subdir_path)
-
-                for each_file in files:
-                    source = os.path.join(subdir_path, each_file)
-                    destination = posixpath.join(hdfs_subdir_path, each_file)
-                    with hdfs.open(destination, 'wb') as output_stream:
-                        output_stream.write(open(source, "rb").read())
+            run_concurrently(
+                lambda source, relative_path: _upload_hdfs_file(
+                    hdfs, source, posixpath.join(hdfs_base_path, relative_path)),
+                list_local_files(local_dir))
 
     def list_artifacts(self, path=None):
         """
@@ -82,31 +81,58 @@ class HdfsArtifactRepository(ArtifactRepository):
             paths = []
             if hdfs.exists(hdfs_base_path):
                 for file_detail in hdfs.ls(hdfs_base_path, detail=True):
-                    file_name = file_detail.get("name")
-                    # Strip off anything that comes before the artifact root e.g. hdfs://name
-                    offset = file_name.index(self.path)
-                    rel_path = _relative_path_remote(self.path, file_name[offset:])
+                    rel_path = _relative_path_remote(self.path,
+                                                     self._get_path(file_detail.get("name")))
                     is_dir = file_detail.get("kind") == "directory"
                     size = file_detail.get("size")
                     paths.append(FileInfo(rel_path, is_dir, size))
             return sorted(paths, key=lambda f: paths)
 
+    def _get_path(self, file_name):
+        # Strip off anything that comes before the artifact root e.g. hdfs://name
+        return file_name[file_name.index(self.path):]
+
     def _walk_path(self, hdfs, hdfs_path):
-        if hdfs.exists(hdfs_path):
-            if hdfs.isdir(hdfs_path):
-                for subdir, _, files in hdfs.walk(hdfs_path):
-                    if subdir != hdfs_path:
-                        yield subdir, hdfs.isdir(subdir), hdfs.info(subdir).get("size")
-                    for f in files:
-                        file_path = posixpath.join(subdir, f)
-                        yield file_path, hdfs.isdir(file_path), hdfs.info(file_path).get("size")
-            else:
-                yield hdfs_path, False, hdfs.info(hdfs_path).get("size")
+        """
+        Yield ``(path, is_dir, size)`` for every file and directory under ``hdfs_path``, or for
+        ``hdfs_path`` itself if it is a file. Directories are listed with their details in a
+        single call each, and come before their contents.
+        """
+        if not hdfs.exists(hdfs_path):
+            return
+        if not hdfs.isdir(hdfs_path):
+            yield hdfs_path, False, hdfs.info(hdfs_path).get("size")
+            return
+        dirs = [hdfs_path]
+        while dirs:
+            for file_detail in hdfs.ls(dirs.pop(0), detail=True):
+                path = self._get_path(file_detail.get("name"))
+                is_dir = file_detail.get("kind") == "directory"
+                if is_dir:
+                    dirs.append(path)
+                yield path, is_dir, file_detail.get("size")
+
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        validate_max_depth(max_depth)
+        hdfs_base_path = _resolve_base_path(self.path, path)
+        with hdfs_system(host=self.host, port=self.port) as hdfs:
+            if not hdfs.exists(hdfs_base_path) or not hdfs.isdir(hdfs_base_path):
+                return []
+            infos = []
+            for file_path, is_dir, size in self._walk_path(hdfs, hdfs_base_path):
+                depth = _relative_path_remote(hdfs_base_path, file_path).count(posixpath.sep) + 1
+                if max_depth is not None and depth > max_depth:
+                    # Directories are walked level by level, so all the remaining paths are deeper
+                    break
+                infos.append(FileInfo(_relative_path_remote(self.path, file_path), is_dir,
+                                      None if is_dir else size))
+            return sorted(infos, key=lambda f: f.path)
 
     def download_artifacts(self, artifact_path, dst_path=None):
         """
             Download an artifact file or directory to a local directory/file if applicable, and
-            return a local path for it.
+            return a local path for it. The files of a directory are downloaded concurrently,
+            using up to ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads.
             The caller is responsible for managing the lifecycle of the downloaded artifacts.
 
             (self.path contains the base path - hdfs:/some/path/run_id/artifacts)
@@ -132,6 +158,7 @@ class HdfsArtifactRepository(ArtifactRepository):
                 _download_hdfs_file(hdfs, hdfs_base_path, local_path)
                 return local_path
 
+            download_args = []
             for path, is_dir, _ in self._walk_path(hdfs, hdfs_base_path):
 
                 relative_path = _relative_path_remote(hdfs_base_path, path)
@@ -141,11 +168,31 @@ class HdfsArtifactRepository(ArtifactRepository):
                 if is_dir:
                     mkdir(local_path)
                 else:
-                    _download_hdfs_file(hdfs, path, local_path)
+                    download_args.append((path, local_path))
+            run_concurrently(lambda path, local_path: _download_hdfs_file(hdfs, path, local_path),
+                             download_args)
             return local_dir
 
+    def open_stream(self, artifact_path):
+        hdfs_base_path = _resolve_base_path(self.path, artifact_path)
+        # The filesystem handle is shared, so it stays open after the stream is closed
+        with hdfs_system(host=self.host, port=self.port) as hdfs:
+            if not hdfs.exists(hdfs_base_path) or hdfs.isdir(hdfs_base_path):
+                raise MlflowException("No such artifact file: '{}'".format(artifact_path),
+                                      error_code=RESOURCE_DOES_NOT_EXIST)
+            size = hdfs.info(hdfs_base_path)['size']
+
+        def open_reader(offset):
+            f = hdfs.open(hdfs_base_path, 'rb')
+            f.seek(offset)
+            return f
+
+        return ArtifactStream(size, open_reader)
+
     def _download_file(self, remote_file_path, local_path):
-        raise MlflowException('This is not implemented. Should never be called.')
+        with hdfs_system(host=self.host, port=self.port) as hdfs:
+            _download_hdfs_file(hdfs, _resolve_base_path(self.path, remote_file_path),
+                                local_path)
 
 
 @contextmanager
@@ -154,6 +201,10 @@ def hdfs_system(host, port):
         hdfs system context - Attempt to establish the connection to hdfs
         and yields HadoopFileSystem
 
+        The connection is shared by all repositories with the same host, port, driver, Kerberos
+        settings and extra configuration, and is kept open for later operations. It is only
+        discarded if an operation fails with an I/O error, which may be due to the connection.
+
     :param host: hostname or when relaying on the core-site.xml config use 'default'
     :param port: port or when relaying on the core-site.xml config use 0
     """
@@ -162,16 +213,26 @@ def hdfs_system(host, port):
     driver = os.getenv('MLFLOW_HDFS_DRIVER') or 'libhdfs'
     kerb_ticket = os.getenv('MLFLOW_KERBEROS_TICKET_CACHE')
     kerberos_user = os.getenv('MLFLOW_KERBEROS_USER')
-    extra_conf = _parse_extra_conf(os.getenv('MLFLOW_PYARROW_EXTRA_CONF'))
-
-    connected = pa.hdfs.connect(host=host or 'default',
-                                port=port or 0,
-                                user=kerberos_user,
-                                driver=driver,
-                                kerb_ticket=kerb_ticket,
-                                extra_conf=extra_conf)
-    yield connected
-    connected.close()
+    extra_conf = os.getenv('MLFLOW_PYARROW_EXTRA_CONF')
+
+    key = (host or 'default', port or 0, driver, kerb_ticket, kerberos_user, extra_conf)
+    with _hdfs_filesystems_lock:
+        if key not in _hdfs_filesystems:
+            _hdfs_filesystems[key] = pa.hdfs.connect(host=host or 'default',
+                                                     port=port or 0,
+                                                     user=kerberos_user,
+                                                     driver=driver,
+                                                     kerb_ticket=kerb_ticket,
+                                                     extra_conf=_parse_extra_conf(extra_conf))
+        connected = _hdfs_filesystems[key]
+    try:
+        yield connected
+    except (IOError, OSError):
+        # The connection is not closed as it may still be used by other threads
+        with _hdfs_filesystems_lock:
+            if _hdfs_filesystems.get(key) is connected:
+                del _hdfs_filesystems[key]
+        raise
 
 
 def _resolve_connection_params(artifact_uri):
@@ -192,11 +253,6 @@ def _relative_path(base_dir, subdir_path, path_module):
     return relative_path if relative_path != '.' else None
 
 
-def _relative_path_local(base_dir, subdir_path):
-    rel_path = _relative_path(base_dir, subdir_path, os.path)
-    return relative_path_to_artifact_path(rel_path) if rel_path is not None else None
-
-
 def _relative_path_remote(base_dir, subdir_path):
     return _relative_path(base_dir, subdir_path, posixpath)
 
@@ -210,8 +266,13 @@ def _download_hdfs_file(hdfs, remote_file_path, local_file_path):
     dirs = os.path.dirname(local_file_path)
     if not os.path.exists(dirs):
         os.makedirs(dirs)
-    with open(local_file_path, 'wb') as f:
-        f.write(hdfs.open(remote_file_path, 'rb').read())
+    with open(local_file_path, 'wb') as f, hdfs.open(remote_file_path, 'rb') as remote_file:
+        shutil.copyfileobj(remote_file, f)
+
+
+def _upload_hdfs_file(hdfs, local_file_path, remote_file_path):
+    with open(local_file_path, 'rb') as f, hdfs.open(remote_file_path, 'wb') as output_stream:
+        shutil.copyfileobj(f, output_stream)
 
 
 def _parse_extra_conf(extra_conf):
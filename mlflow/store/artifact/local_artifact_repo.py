@@ -1,14 +1,36 @@
 import distutils.dir_util as dir_util
+import filecmp
 import os
+import posixpath
 import shutil
+import uuid
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.entities import FileInfo
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path, \
+    open_local_file_stream, validate_max_depth
+from mlflow.store.artifact.blob_store import ARTIFACT_BLOB_STORE_URI_ENV_VAR, \
+    compute_file_digest, get_blob_path, get_blob_store_uri
+from mlflow.store.artifact.local_transfer import COPY, HARDLINK, REFLINK, get_transfer_mode, \
+    transfer_file
+from mlflow.store.artifact.transfer import filter_changed_files, list_local_dirs, \
+    list_local_files, run_concurrently
 from mlflow.utils.file_utils import mkdir, list_all, get_file_info, local_file_uri_to_path, \
     relative_path_to_artifact_path
+from mlflow.utils.uri import is_local_uri
 
 
 class LocalArtifactRepository(ArtifactRepository):
-    """Stores artifacts as files in a local directory."""
+    """
+    Stores artifacts as files in a local directory.
+
+    Files are copied into the directory unless another transfer mode is set with the
+    ``MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE`` environment variable, to hard link, clone or move them
+    instead (see :py:mod:`mlflow.store.artifact.local_transfer`). If a blob store is set with the
+    ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` environment variable, files are stored once in the blob store
+    and hard linked into the directory (see :py:mod:`mlflow.store.artifact.blob_store`).
+    """
 
     def __init__(self, *args, **kwargs):
         super(LocalArtifactRepository, self).__init__(*args, **kwargs)
@@ -29,9 +51,22 @@ class LocalArtifactRepository(ArtifactRepository):
             self.artifact_dir
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
-        shutil.copy(local_file, artifact_dir)
+        dst = os.path.join(artifact_dir, os.path.basename(local_file))
+        blob_store_dir = _get_blob_store_dir()
+        mode = get_transfer_mode()
+        if blob_store_dir is not None:
+            _log_file_to_blob_store(local_file, dst, blob_store_dir)
+        elif mode == COPY:
+            _unlink_if_hard_linked(dst)
+            shutil.copy(local_file, artifact_dir)
+        else:
+            transfer_file(local_file, dst, mode)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        With ``sync=True``, files are compared with the artifacts at their path by size and
+        modification time, and by contents if their modification times differ.
+        """
         verify_artifact_path(artifact_path)
         # NOTE: The artifact_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
@@ -41,7 +76,38 @@ class LocalArtifactRepository(ArtifactRepository):
             self.artifact_dir
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
-        dir_util.copy_tree(src=local_dir, dst=artifact_dir)
+        files = list_local_files(local_dir)
+        if sync:
+            existing_files = {}
+            for _, rel_path in files:
+                dst = os.path.join(artifact_dir, os.path.normpath(rel_path))
+                if os.path.isfile(dst):
+                    existing_files[rel_path] = dst
+            files = filter_changed_files(
+                files, existing_files, lambda local_path, dst: filecmp.cmp(local_path, dst))
+        files = [(local_path, os.path.join(artifact_dir, os.path.normpath(rel_path)))
+                 for local_path, rel_path in files]
+        blob_store_dir = _get_blob_store_dir()
+        mode = get_transfer_mode()
+        if blob_store_dir is None and mode == COPY:
+            for _, dst in files:
+                _unlink_if_hard_linked(dst)
+            if not sync:
+                dir_util.copy_tree(src=local_dir, dst=artifact_dir)
+                return
+        for rel_dir in list_local_dirs(local_dir):
+            dir_path = os.path.join(artifact_dir, os.path.normpath(rel_dir))
+            if not os.path.isdir(dir_path):
+                os.mkdir(dir_path)
+        if blob_store_dir is not None:
+            run_concurrently(_log_file_to_blob_store,
+                             [(local_path, dst, blob_store_dir) for local_path, dst in files])
+        elif mode == COPY:
+            # Modification times are preserved, so that unchanged files are found without
+            # comparing their contents when the directory is synchronized again
+            run_concurrently(shutil.copy2, files)
+        else:
+            run_concurrently(transfer_file, [(local_path, dst, mode) for local_path, dst in files])
 
     def download_artifacts(self, artifact_path, dst_path=None):
         """
@@ -81,8 +147,102 @@ class LocalArtifactRepository(ArtifactRepository):
         else:
             return []
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        if not hasattr(os, "scandir"):
+            return super(LocalArtifactRepository, self).list_artifacts_recursive(path, max_depth)
+        validate_max_depth(max_depth)
+        # NOTE: The path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        if path:
+            path = os.path.normpath(path)
+        list_dir = os.path.join(self.artifact_dir, path) if path else self.artifact_dir
+        if not os.path.isdir(list_dir):
+            return []
+        # Walk the tree with scandir, whose entries provide the file types without a stat call
+        infos = []
+        dirs = [(list_dir, 1)]
+        while dirs:
+            dir_path, depth = dirs.pop()
+            for entry in os.scandir(dir_path):
+                rel_path = relative_path_to_artifact_path(
+                    os.path.relpath(entry.path, self.artifact_dir))
+                if entry.is_dir():
+                    infos.append(FileInfo(rel_path, True, None))
+                    if max_depth is None or depth < max_depth:
+                        dirs.append((entry.path, depth + 1))
+                else:
+                    infos.append(FileInfo(rel_path, False, entry.stat().st_size))
+        return sorted(infos, key=lambda f: f.path)
+
+    def open_stream(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        return open_local_file_stream(
+            os.path.join(self.artifact_dir, os.path.normpath(artifact_path)))
+
     def _download_file(self, remote_file_path, local_path):
         # NOTE: The remote_file_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
-        shutil.copyfile(remote_file_path, local_path)
+        if get_transfer_mode() == COPY:
+            shutil.copyfile(remote_file_path, local_path)
+        else:
+            # Downloaded files are only cloned, since hard linking or moving them would let
+            # modifications of the downloaded files alter the logged artifacts
+            transfer_file(remote_file_path, local_path, REFLINK)
+
+
+def _get_blob_store_dir():
+    """
+    :return: The local directory of the blob store set by ``MLFLOW_ARTIFACT_BLOB_STORE_URI``, or
+             ``None`` if no blob store is set.
+    """
+    blob_store_uri = get_blob_store_uri()
+    if blob_store_uri is None:
+        return None
+    if not is_local_uri(blob_store_uri):
+        raise MlflowException(
+            "Environment variable %s must be a local path to store artifacts in local "
+            "directories, got '%s'" % (ARTIFACT_BLOB_STORE_URI_ENV_VAR, blob_store_uri),
+            INVALID_PARAMETER_VALUE)
+    return local_file_uri_to_path(blob_store_uri)
+
+
+def _log_file_to_blob_store(local_file, dst, blob_store_dir):
+    """
+    Store the specified local file in the blob store if it is not stored yet, and hard link its
+    blob to ``dst``.
+    """
+    digest = compute_file_digest(local_file)
+    blob_path = os.path.join(blob_store_dir, *get_blob_path(digest).split(posixpath.sep))
+    if not os.path.exists(blob_path):
+        blob_dir = os.path.dirname(blob_path)
+        if not os.path.isdir(blob_dir):
+            try:
+                os.makedirs(blob_dir)
+            except OSError:
+                # The directory may have been created concurrently
+                if not os.path.isdir(blob_dir):
+                    raise
+        # Write the blob to a temporary file renamed into place, so that concurrent writers of
+        # the same blob never expose partially written blobs
+        tmp_path = "%s.%s.tmp" % (blob_path, uuid.uuid4().hex)
+        try:
+            transfer_file(local_file, tmp_path, REFLINK)
+            try:
+                os.rename(tmp_path, blob_path)
+            except OSError:
+                # On Windows, renaming fails if the blob was stored concurrently
+                if not os.path.exists(blob_path):
+                    raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    transfer_file(blob_path, dst, HARDLINK)
+
+
+def _unlink_if_hard_linked(path):
+    # Files logged with a blob store are hard links to blobs shared with other artifacts, which
+    # must be replaced rather than overwritten
+    if os.path.isfile(path) and os.stat(path).st_nlink > 1:
+        os.remove(path)
@@ -0,0 +1,171 @@
+"""
+Transfer of files to artifact roots on the local filesystem (including network filesystems mounted
+locally), avoiding copying file contents where the filesystem allows it.
+
+The transfer mode is set by the ``MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE`` environment variable:
+
+- ``copy`` (default): Files are copied.
+- ``reflink``: Files are cloned, sharing their storage until either copy is modified, on
+  filesystems supporting it (e.g. Btrfs, XFS, APFS-like copy-on-write filesystems, or NFS 4.2
+  servers supporting server-side copies). This is indistinguishable from a copy.
+- ``hardlink``: Files are hard linked when the artifact root is on the same filesystem, so that
+  logging does not copy any data. The logged artifacts then share their contents with the source
+  files, which must not be modified afterwards.
+- ``move``: Files are atomically renamed into the artifact root when it is on the same
+  filesystem. The source files are removed.
+
+When a file cannot be transferred with the selected mode (e.g. a hard link across filesystems),
+it is cloned if possible, or copied otherwise. Large files are copied in chunks of
+``MLFLOW_LOCAL_ARTIFACT_COPY_CHUNK_SIZE`` bytes (64 MiB by default) by multiple threads.
+"""
+import errno
+import logging
+import os
+import shutil
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.transfer import get_max_workers, get_positive_int_from_env, \
+    run_concurrently
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOCAL_ARTIFACT_TRANSFER_MODE_ENV_VAR = "MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE"
+LOCAL_ARTIFACT_COPY_CHUNK_SIZE_ENV_VAR = "MLFLOW_LOCAL_ARTIFACT_COPY_CHUNK_SIZE"
+
+COPY = "copy"
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+MOVE = "move"
+TRANSFER_MODES = [COPY, REFLINK, HARDLINK, MOVE]
+
+DEFAULT_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+# Size of the buffers used to copy chunks of files
+_COPY_BUFFER_SIZE = 8 * 1024 * 1024
+# Linux ioctl cloning a file into another, see ioctl_ficlone(2)
+_FICLONE = 0x40049409
+
+_logger = logging.getLogger(__name__)
+
+
+def get_transfer_mode():
+    """:return: The transfer mode set by ``MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE``."""
+    mode = (os.environ.get(LOCAL_ARTIFACT_TRANSFER_MODE_ENV_VAR) or COPY).lower()
+    if mode not in TRANSFER_MODES:
+        raise MlflowException(
+            "Environment variable %s must be one of %s, got '%s'" % (
+                LOCAL_ARTIFACT_TRANSFER_MODE_ENV_VAR, ", ".join(TRANSFER_MODES), mode),
+            INVALID_PARAMETER_VALUE)
+    return mode
+
+
+def transfer_file(src, dst, mode):
+    """
+    Transfer the file at ``src`` to the path ``dst`` with the specified transfer mode, replacing
+    any existing file at ``dst``.
+
+    :return: The method by which the file was transferred: ``"rename"``, ``"hardlink"``,
+             ``"reflink"`` or ``"copy"``, or ``None`` if ``src`` and ``dst`` are the same file.
+    """
+    if os.path.lexists(dst):
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return None
+        # Replace the file rather than overwriting it, as it may be hard linked to other files
+        os.remove(dst)
+    if mode == MOVE:
+        try:
+            getattr(os, "replace", os.rename)(src, dst)
+            return "rename"
+        except OSError as e:
+            _logger.debug("Failed to rename %s to %s, copying it instead: %s", src, dst, e)
+    elif mode == HARDLINK:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError as e:
+            _logger.debug("Failed to hard link %s to %s, copying it instead: %s", src, dst, e)
+
+    if mode != COPY and _clone_file(src, dst):
+        method = "reflink"
+    else:
+        _copy_file(src, dst)
+        method = "copy"
+    shutil.copymode(src, dst)
+    if mode == MOVE:
+        os.remove(src)
+    return method
+
+
+def _clone_file(src, dst):
+    """
+    Clone ``src`` to ``dst`` with the FICLONE ioctl, or with ``copy_file_range``, which lets the
+    filesystem share extents or copy data without transferring it through user space.
+
+    :return: True if the file was cloned, False if the filesystem does not support it.
+    """
+    if fcntl is None and not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+                return True
+            except (IOError, OSError) as e:
+                _logger.debug("Failed to clone %s with FICLONE: %s", src, e)
+        if not hasattr(os, "copy_file_range"):
+            return False
+        remaining = os.fstat(src_file.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                               errno.EPERM, errno.ENOTSUP):
+                raise
+            _logger.debug("Failed to clone %s with copy_file_range: %s", src, e)
+            return False
+        return remaining == 0
+
+
+def _copy_file(src, dst):
+    """
+    Copy ``src`` to ``dst``, in chunks copied concurrently for files larger than
+    ``MLFLOW_LOCAL_ARTIFACT_COPY_CHUNK_SIZE`` bytes if the platform supports positional I/O.
+    """
+    chunk_size = get_positive_int_from_env(LOCAL_ARTIFACT_COPY_CHUNK_SIZE_ENV_VAR,
+                                           DEFAULT_COPY_CHUNK_SIZE)
+    size = os.path.getsize(src)
+    if size <= chunk_size or not hasattr(os, "pread"):
+        shutil.copyfile(src, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.ftruncate(dst_fd, size)
+
+            def copy_chunk(start):
+                end = min(start + chunk_size, size)
+                while start < end:
+                    data = os.pread(src_fd, min(_COPY_BUFFER_SIZE, end - start), start)
+                    if not data:
+                        raise MlflowException("Unexpected end of file %s at offset %d" % (
+                            src, start))
+                    written = 0
+                    while written < len(data):
+                        written += os.pwrite(dst_fd, data[written:], start + written)
+                    start += len(data)
+
+            run_concurrently(copy_chunk, [(start,) for start in range(0, size, chunk_size)],
+                             max_workers=get_max_workers())
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
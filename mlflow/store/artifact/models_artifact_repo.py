@@ -57,16 +57,24 @@ class ModelsArtifactRepository(ArtifactRepository):
     def get_underlying_uri(uri):
         # Note: to support a registry URI that is different from the tracking URI here,
         # we'll need to add setting of registry URIs via environment variables.
+        from mlflow.store.artifact import resolution_cache
         from mlflow.tracking import MlflowClient
+        from mlflow.tracking._tracking_service.utils import get_tracking_uri
         client = MlflowClient()
+        registry_uri = get_tracking_uri()
         (name, version, stage) = ModelsArtifactRepository._parse_uri(uri)
         if stage is not None:
-            latest = client.get_latest_versions(name, [stage])
-            if len(latest) == 0:
-                raise MlflowException("No versions of model with name '{name}' and "
-                                      "stage '{stage}' found".format(name=name, stage=stage))
-            version = latest[0].version
-        return client.get_model_version_download_uri(name, version)
+            def get_version():
+                latest = client.get_latest_versions(name, [stage])
+                if len(latest) == 0:
+                    raise MlflowException("No versions of model with name '{name}' and "
+                                          "stage '{stage}' found".format(name=name, stage=stage))
+                return latest[0].version
+            version = resolution_cache.get_model_stage_version(registry_uri, name, stage,
+                                                               get_version)
+        return resolution_cache.get_model_version_download_uri(
+            registry_uri, name, version,
+            lambda: client.get_model_version_download_uri(name, version))
 
     def log_artifact(self, local_file, artifact_path=None):
         """
@@ -81,7 +89,7 @@ class ModelsArtifactRepository(ArtifactRepository):
         raise ValueError(
             "log_artifact is not supported for models:/ URIs. Use register_model instead.")
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
         """
         Log the files in the specified local directory as artifacts, optionally taking
         an ``artifact_path`` to place them in within the run's artifacts.
@@ -104,6 +112,9 @@ class ModelsArtifactRepository(ArtifactRepository):
         """
         return self.repo.list_artifacts(path)
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        return self.repo.list_artifacts_recursive(path, max_depth)
+
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
@@ -121,6 +132,9 @@ class ModelsArtifactRepository(ArtifactRepository):
         """
         return self.repo.download_artifacts(artifact_path, dst_path)
 
+    def open_stream(self, artifact_path):
+        return self.repo.open_stream(artifact_path)
+
     def _download_file(self, remote_file_path, local_path):
         """
         Download the file at the specified relative remote path and saves
@@ -0,0 +1,155 @@
+"""
+In-process caches of the resolution of ``runs:/`` and ``models:/`` artifact URIs to the URIs of
+the underlying artifact locations, so that repeatedly loading the same model (e.g. in a serving or
+batch scoring process) does not query the tracking and model registry servers every time.
+
+- The artifact root URI of a run and the download URI of a model version are cached for
+  ``MLFLOW_ARTIFACT_URI_CACHE_TTL`` seconds (300 by default).
+- The version currently in a given stage, used to resolve ``models:/<name>/<stage>`` URIs, changes
+  when model versions are transitioned between stages and is therefore only cached for
+  ``MLFLOW_MODEL_STAGE_URI_CACHE_TTL`` seconds (30 by default). These entries are also invalidated
+  when a registered model or model version is updated or deleted through this process, and can be
+  invalidated explicitly with :py:func:`invalidate_model_uri_cache`.
+
+Setting either TTL to 0 disables the corresponding cache.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+ARTIFACT_URI_CACHE_TTL_ENV_VAR = "MLFLOW_ARTIFACT_URI_CACHE_TTL"
+MODEL_STAGE_URI_CACHE_TTL_ENV_VAR = "MLFLOW_MODEL_STAGE_URI_CACHE_TTL"
+DEFAULT_ARTIFACT_URI_CACHE_TTL_SECONDS = 300
+DEFAULT_MODEL_STAGE_URI_CACHE_TTL_SECONDS = 30
+
+
+def _get_ttl_from_env(env_var, default):
+    value = os.environ.get(env_var)
+    if not value:
+        return default
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = -1
+    if ttl < 0:
+        raise MlflowException("Environment variable %s must be a non-negative number of seconds, "
+                              "got '%s'" % (env_var, value), INVALID_PARAMETER_VALUE)
+    return ttl
+
+
+class TTLCache(object):
+    """
+    Thread-safe mapping whose entries expire ``ttl_seconds`` after they are computed. At most
+    ``max_entries`` entries are kept, evicting the least recently used ones.
+
+    :param get_ttl_seconds: Function returning the current TTL of entries in seconds, so that
+                            changes of the configuring environment variable take effect.
+    """
+
+    def __init__(self, get_ttl_seconds, max_entries=1000):
+        self._get_ttl_seconds = get_ttl_seconds
+        self.max_entries = max_entries
+        # Mapping from key to (value, expiration time)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """
+        :return: The cached value of ``key`` if it has not expired, or the result of ``compute()``
+                 otherwise, which is then cached. Exceptions raised by ``compute`` are not cached.
+        """
+        ttl_seconds = self._get_ttl_seconds()
+        if ttl_seconds <= 0:
+            return compute()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[1] > now:
+                self._entries[key] = entry
+                return entry[0]
+        value = compute()
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, predicate=None):
+        """
+        Remove the entries whose key satisfies ``predicate``, or all entries if it is ``None``.
+        """
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def _get_artifact_uri_cache_ttl():
+    return _get_ttl_from_env(ARTIFACT_URI_CACHE_TTL_ENV_VAR, DEFAULT_ARTIFACT_URI_CACHE_TTL_SECONDS)
+
+
+def _get_model_stage_uri_cache_ttl():
+    return _get_ttl_from_env(MODEL_STAGE_URI_CACHE_TTL_ENV_VAR,
+                             DEFAULT_MODEL_STAGE_URI_CACHE_TTL_SECONDS)
+
+
+# Keyed by (tracking URI, run ID)
+_run_artifact_root_cache = TTLCache(_get_artifact_uri_cache_ttl)
+# Keyed by (registry URI, model name, version)
+_model_version_download_uri_cache = TTLCache(_get_artifact_uri_cache_ttl)
+# Keyed by (registry URI, model name, stage)
+_model_stage_version_cache = TTLCache(_get_model_stage_uri_cache_ttl)
+
+
+def get_run_artifact_root(tracking_uri, run_id, get_artifact_root):
+    """
+    :return: The artifact root URI of the specified run, computed by ``get_artifact_root()`` if it
+             is not cached.
+    """
+    return _run_artifact_root_cache.get_or_compute((tracking_uri, run_id), get_artifact_root)
+
+
+def get_model_version_download_uri(registry_uri, name, version, get_download_uri):
+    """
+    :return: The download URI of the specified model version, computed by ``get_download_uri()``
+             if it is not cached.
+    """
+    return _model_version_download_uri_cache.get_or_compute(
+        (registry_uri, name, str(version)), get_download_uri)
+
+
+def get_model_stage_version(registry_uri, name, stage, get_version):
+    """
+    :return: The version of the specified model in the specified stage, computed by
+             ``get_version()`` if it is not cached.
+    """
+    return _model_stage_version_cache.get_or_compute((registry_uri, name, stage), get_version)
+
+
+def invalidate_model_uri_cache(name=None):
+    """
+    Invalidate the cached resolution of ``models:/`` URIs of the specified registered model, or of
+    all registered models if ``name`` is ``None``. This should be called after transitioning model
+    versions between stages in another process, for ``models:/<name>/<stage>`` URIs to resolve to
+    the new versions before the cached ones expire.
+    """
+    predicate = None if name is None else (lambda key: key[1] == name)
+    _model_stage_version_cache.invalidate(predicate)
+    _model_version_download_uri_cache.invalidate(predicate)
+
+
+def clear_caches():
+    """Clear all cached resolutions of ``runs:/`` and ``models:/`` URIs."""
+    _run_artifact_root_cache.invalidate()
+    _model_version_download_uri_cache.invalidate()
+    _model_stage_version_cache.invalidate()
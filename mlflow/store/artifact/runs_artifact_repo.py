@@ -1,3 +1,5 @@
+import posixpath
+
 from six.moves import urllib
 
 from mlflow.exceptions import MlflowException
@@ -27,9 +29,13 @@ class RunsArtifactRepository(ArtifactRepository):
 
     @staticmethod
     def get_underlying_uri(runs_uri):
+        from mlflow.store.artifact.resolution_cache import get_run_artifact_root
         from mlflow.tracking.artifact_utils import get_artifact_uri
+        from mlflow.tracking._tracking_service.utils import get_tracking_uri
         (run_id, artifact_path) = RunsArtifactRepository.parse_runs_uri(runs_uri)
-        uri = get_artifact_uri(run_id, artifact_path)
+        uri = get_run_artifact_root(get_tracking_uri(), run_id, lambda: get_artifact_uri(run_id))
+        if artifact_path is not None:
+            uri = posixpath.join(uri, artifact_path)
         assert not RunsArtifactRepository.is_runs_uri(uri)  # avoid an infinite loop
         return uri
 
@@ -73,7 +79,7 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         self.repo.log_artifact(local_file, artifact_path)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
         """
         Log the files in the specified local directory as artifacts, optionally taking
         an ``artifact_path`` to place them in within the run's artifacts.
@@ -81,8 +87,9 @@ class RunsArtifactRepository(ArtifactRepository):
         :param local_dir: Directory of local artifacts to log
         :param artifact_path: Directory within the run's artifact directory in which to log the
                               artifacts
+        :param sync: If True, only upload the files that are new or changed.
         """
-        self.repo.log_artifacts(local_dir, artifact_path)
+        self.repo.log_artifacts(local_dir, artifact_path, sync=sync)
 
     def list_artifacts(self, path):
         """
@@ -95,6 +102,9 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         return self.repo.list_artifacts(path)
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        return self.repo.list_artifacts_recursive(path, max_depth)
+
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
@@ -112,6 +122,9 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         return self.repo.download_artifacts(artifact_path, dst_path)
 
+    def open_stream(self, artifact_path):
+        return self.repo.open_stream(artifact_path)
+
     def _download_file(self, remote_file_path, local_path):
         """
         Download the file at the specified relative remote path and saves
@@ -1,4 +1,7 @@
+import binascii
+import hashlib
 import os
+import threading
 
 import posixpath
 from six.moves import urllib
@@ -6,12 +9,52 @@ from six.moves import urllib
 from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream, \
+    get_recursive_listing
+from mlflow.store.artifact.blob_store import ARTIFACT_BLOB_STORE_URI_ENV_VAR, \
+    MANIFEST_FILE_PREFIX, compute_file_digest, get_blob_path, get_blob_store_uri, \
+    is_manifest_file, make_manifest_entry, merge_manifests, new_manifest_file_name, \
+    parse_manifest, serialize_manifest
+from mlflow.store.artifact.transfer import TransferProgress, compute_file_md5, \
+    filter_changed_files, get_max_workers, get_positive_int_from_env, list_local_files, \
+    run_concurrently
+
+# Environment variables tuning the boto3 transfers of individual files: the size from which
+# files are transferred in multiple parts, the size of the parts, and the maximum number of
+# parts of a file transferred concurrently.
+S3_MULTIPART_THRESHOLD_ENV_VAR = "MLFLOW_S3_MULTIPART_THRESHOLD"
+S3_MULTIPART_CHUNKSIZE_ENV_VAR = "MLFLOW_S3_MULTIPART_CHUNKSIZE"
+S3_MAX_CONCURRENCY_ENV_VAR = "MLFLOW_S3_MAX_CONCURRENCY"
+
+# Environment variables affecting the configuration of boto3 clients, which are cached by value
+_CLIENT_ENV_VARS = ["MLFLOW_S3_ENDPOINT_URL", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY",
+                    "AWS_SESSION_TOKEN", "AWS_PROFILE", "AWS_DEFAULT_REGION"]
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+# Size of the buffers used to compute the ETags of local files
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def _is_not_found_error(error):
+    return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
 
 
 class S3ArtifactRepository(ArtifactRepository):
-    """Stores artifacts on Amazon S3."""
+    """
+    Stores artifacts on Amazon S3.
+
+    If a blob store is set with the ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` environment variable, files
+    are stored once in the blob store and recorded in a manifest of each artifact directory (see
+    :py:mod:`mlflow.store.artifact.blob_store`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(S3ArtifactRepository, self).__init__(*args, **kwargs)
+        # Manifest entries of the files stored in a blob store, keyed by their path relative to
+        # the artifact URI, as found by the latest listings
+        self._manifest_entries = {}
+
     @staticmethod
     def parse_s3_uri(uri):
         """Parse an S3 URI, returning (bucket, path)"""
@@ -24,36 +67,265 @@ class S3ArtifactRepository(ArtifactRepository):
         return parsed.netloc, path
 
     def _get_s3_client(self):
+        """
+        :return: A boto3 S3 client, shared by all repositories as clients are thread-safe and
+                 expensive to create. Its connection pool is sized for concurrent transfers.
+        """
         import boto3
-        s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
-        return boto3.client('s3', endpoint_url=s3_endpoint_url)
+        from botocore.config import Config
+        max_pool_connections = max(10, get_max_workers() * self._get_max_concurrency())
+        key = tuple(os.environ.get(env_var) for env_var in _CLIENT_ENV_VARS) + \
+            (max_pool_connections,)
+        with _s3_clients_lock:
+            if key not in _s3_clients:
+                s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
+                _s3_clients[key] = boto3.client(
+                    's3', endpoint_url=s3_endpoint_url,
+                    config=Config(max_pool_connections=max_pool_connections))
+            return _s3_clients[key]
+
+    @staticmethod
+    def _get_max_concurrency():
+        return get_positive_int_from_env(S3_MAX_CONCURRENCY_ENV_VAR, 10)
+
+    def _get_transfer_config(self):
+        from boto3.s3.transfer import TransferConfig, MB
+        return TransferConfig(
+            multipart_threshold=get_positive_int_from_env(S3_MULTIPART_THRESHOLD_ENV_VAR, 8 * MB),
+            multipart_chunksize=get_positive_int_from_env(S3_MULTIPART_CHUNKSIZE_ENV_VAR, 8 * MB),
+            max_concurrency=self._get_max_concurrency())
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
+        if self._get_blob_store() is not None:
+            self._log_files_to_blob_store([(local_file, os.path.basename(local_file))], dest_path)
+            return
         dest_path = posixpath.join(
             dest_path, os.path.basename(local_file))
         s3_client = self._get_s3_client()
-        s3_client.upload_file(local_file, bucket, dest_path)
+        s3_client.upload_file(local_file, bucket, dest_path, Config=self._get_transfer_config())
+
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        Upload the files of ``local_dir`` concurrently, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads (8 by default). Large files are
+        additionally uploaded in parts, as configured by the ``MLFLOW_S3_MULTIPART_THRESHOLD``,
+        ``MLFLOW_S3_MULTIPART_CHUNKSIZE`` and ``MLFLOW_S3_MAX_CONCURRENCY`` environment variables.
 
-    def log_artifacts(self, local_dir, artifact_path=None):
+        With ``sync=True``, files are compared with the objects at their path by size and ETag,
+        which is derived from the MD5 digest of the contents of objects uploaded without
+        server-side encryption by KMS, or with the SHA-256 digest of files stored in a blob store.
+        """
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                s3_client.upload_file(
-                        os.path.join(root, f),
-                        bucket,
-                        posixpath.join(upload_path, f))
+        transfer_config = self._get_transfer_config()
+        files = list_local_files(local_dir)
+        if sync:
+            files = filter_changed_files(files, self._list_remote_files(bucket, dest_path),
+                                         self._is_same_file)
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % posixpath.join(self.artifact_uri, artifact_path or ""),
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+        if self._get_blob_store() is not None:
+            self._log_files_to_blob_store(files, dest_path, progress)
+            return
+
+        def upload_file(local_path, rel_path):
+            s3_client.upload_file(local_path, bucket, posixpath.join(dest_path, rel_path),
+                                  Config=transfer_config, Callback=progress.add_bytes)
+            progress.complete_file()
+
+        run_concurrently(upload_file, files)
+
+    def _list_remote_files(self, bucket, dest_path):
+        """
+        :return: Dictionary mapping the POSIX paths relative to the S3 key ``dest_path`` of the
+                 files under it to their size and either the ETag of their object, or their
+                 manifest entry if they are stored in a blob store.
+        """
+        prefix = dest_path + "/" if dest_path else ""
+        remote_files = {}
+        manifest_keys = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in result.get("Contents", []):
+                key = obj.get("Key")
+                if is_manifest_file(key):
+                    manifest_keys.append(key)
+                elif not key.endswith("/"):
+                    remote_files[key[len(prefix):]] = {"size": int(obj.get("Size")),
+                                                       "etag": obj.get("ETag").strip('"')}
+        manifests = self._read_manifests(bucket, manifest_keys)
+        for rel_path, entry in merge_manifests(
+                {manifest_key[len(prefix):]: manifest
+                 for manifest_key, manifest in manifests.items()}).items():
+            # Objects at the path of files take precedence over their manifest entries
+            remote_files.setdefault(rel_path, entry)
+        return remote_files
+
+    def _is_same_file(self, local_path, remote_file):
+        """
+        :param remote_file: Metadata of a remote file returned by ``_list_remote_files``.
+        :return: True if the contents of the local file are the same as those of the remote file.
+        """
+        size = os.path.getsize(local_path)
+        if size != remote_file["size"]:
+            return False
+        if "etag" not in remote_file:
+            return compute_file_digest(local_path) == remote_file["sha256"]
+        etag = remote_file["etag"]
+        if "-" not in etag:
+            return binascii.hexlify(compute_file_md5(local_path)).decode("ascii") == etag
+        # The ETag of an object uploaded in N parts is the MD5 digest of the concatenated MD5
+        # digests of its parts, followed by "-N". Parts have the size configured for uploads.
+        from s3transfer.utils import ChunksizeAdjuster
+        part_size = ChunksizeAdjuster().adjust_chunksize(
+            self._get_transfer_config().multipart_chunksize, size)
+        num_parts = (size + part_size - 1) // part_size
+        (etag_digest, etag_num_parts) = etag.split("-", 1)
+        if etag_num_parts != str(num_parts):
+            return False
+        md5 = hashlib.md5()
+        with open(local_path, "rb") as f:
+            for _ in range(num_parts):
+                part_md5 = hashlib.md5()
+                remaining = part_size
+                while remaining > 0:
+                    chunk = f.read(min(remaining, _HASH_BUFFER_SIZE))
+                    if not chunk:
+                        break
+                    part_md5.update(chunk)
+                    remaining -= len(chunk)
+                md5.update(part_md5.digest())
+        return md5.hexdigest() == etag_digest
+
+    @staticmethod
+    def _get_blob_store():
+        """
+        :return: The ``(bucket, prefix)`` of the blob store set by
+                 ``MLFLOW_ARTIFACT_BLOB_STORE_URI``, or ``None`` if no blob store is set.
+        """
+        blob_store_uri = get_blob_store_uri()
+        if blob_store_uri is None:
+            return None
+        if not blob_store_uri.startswith("s3://"):
+            raise MlflowException(
+                "Environment variable %s must be an S3 URI to store artifacts on S3, got '%s'" % (
+                    ARTIFACT_BLOB_STORE_URI_ENV_VAR, blob_store_uri), INVALID_PARAMETER_VALUE)
+        return data.parse_s3_uri(blob_store_uri)
+
+    def _log_files_to_blob_store(self, files, dest_path, progress=None):
+        """
+        Store the specified local files in the blob store, skipping those whose blob is already
+        stored, and record them in new manifests of their destination directories.
+
+        :param files: List of ``(local_path, rel_path)`` pairs, where ``rel_path`` is the POSIX
+                      path of the destination of the file relative to the S3 key ``dest_path``.
+        """
+        from botocore.exceptions import ClientError
+        (bucket, _) = data.parse_s3_uri(self.artifact_uri)
+        (blob_bucket, blob_prefix) = self._get_blob_store()
+        s3_client = self._get_s3_client()
+        transfer_config = self._get_transfer_config()
+
+        def store_blob(local_path):
+            digest = compute_file_digest(local_path)
+            size = os.path.getsize(local_path)
+            blob_key = posixpath.join(blob_prefix, get_blob_path(digest))
+            try:
+                s3_client.head_object(Bucket=blob_bucket, Key=blob_key)
+                skipped_bytes = size
+            except ClientError as e:
+                if not _is_not_found_error(e):
+                    raise
+                s3_client.upload_file(local_path, blob_bucket, blob_key, Config=transfer_config,
+                                      Callback=progress.add_bytes if progress else None)
+                skipped_bytes = 0
+            if progress:
+                progress.complete_file(skipped_bytes)
+            return make_manifest_entry("s3://%s/%s" % (blob_bucket, blob_key), digest, size)
+
+        entries = run_concurrently(store_blob, [(local_path,) for local_path, _ in files])
+        manifests = {}
+        for (_, rel_path), entry in zip(files, entries):
+            key = posixpath.join(dest_path, rel_path)
+            manifests.setdefault(posixpath.dirname(key), {})[posixpath.basename(key)] = entry
+        manifest_name = new_manifest_file_name()
+        for dir_key, dir_entries in manifests.items():
+            s3_client.put_object(Bucket=bucket, Key=posixpath.join(dir_key, manifest_name),
+                                 Body=serialize_manifest(dir_entries).encode("utf-8"))
+        # Delete the objects previously logged at the paths of the files, which would otherwise
+        # take precedence over their manifest entries
+        keys = [posixpath.join(dest_path, rel_path) for _, rel_path in files]
+        for start in range(0, len(keys), 1000):
+            s3_client.delete_objects(Bucket=bucket, Delete={
+                "Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True})
+
+    def _read_manifest(self, bucket, manifest_key):
+        """
+        :return: The entries of the manifest stored at the specified key, or an empty dictionary
+                 if there is no manifest.
+        """
+        from botocore.exceptions import ClientError
+        try:
+            contents = self._get_s3_client().get_object(Bucket=bucket, Key=manifest_key)["Body"]
+        except ClientError as e:
+            if _is_not_found_error(e):
+                return {}
+            raise
+        return parse_manifest(contents.read().decode("utf-8"),
+                              "s3://%s/%s" % (bucket, manifest_key))
+
+    def _read_manifests(self, bucket, manifest_keys):
+        """
+        :return: Dictionary mapping the specified manifest keys to the entries of their manifests.
+        """
+        manifests = run_concurrently(self._read_manifest,
+                                     [(bucket, manifest_key) for manifest_key in manifest_keys])
+        return dict(zip(manifest_keys, manifests))
+
+    def _add_manifest_files(self, bucket, artifact_path, infos, manifest_keys):
+        """
+        Add to ``infos`` the files recorded in the specified manifests, except those overwritten by
+        objects at their path, and remember their manifest entries to download them.
+        """
+        listed_paths = set(info.path for info in infos)
+        for path in listed_paths:
+            self._manifest_entries.pop(path, None)
+        manifests = self._read_manifests(bucket, manifest_keys)
+        for rel_path, entry in merge_manifests(
+                {posixpath.relpath(manifest_key, artifact_path) if artifact_path else manifest_key:
+                 manifest for manifest_key, manifest in manifests.items()}).items():
+            if rel_path not in listed_paths:
+                self._manifest_entries[rel_path] = entry
+                infos.append(FileInfo(rel_path, False, entry["size"]))
+
+    def _get_manifest_entry(self, remote_file_path):
+        """
+        :return: The manifest entry of the specified file if it is stored in a blob store, or
+                 ``None``. Called when there is no object at the path of the file.
+        """
+        entry = self._manifest_entries.get(remote_file_path)
+        if entry is None:
+            (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+            manifest_prefix = posixpath.join(
+                s3_root_path, posixpath.dirname(remote_file_path), MANIFEST_FILE_PREFIX)
+            paginator = self._get_s3_client().get_paginator("list_objects_v2")
+            manifest_keys = [obj["Key"]
+                             for result in paginator.paginate(Bucket=bucket, Prefix=manifest_prefix)
+                             for obj in result.get("Contents", [])
+                             if is_manifest_file(obj["Key"])]
+            entry = merge_manifests(self._read_manifests(bucket, manifest_keys)).get(
+                posixpath.join(posixpath.dirname(manifest_prefix),
+                               posixpath.basename(remote_file_path)))
+            if entry is not None:
+                self._manifest_entries[remote_file_path] = entry
+        return entry
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
@@ -61,6 +333,7 @@ class S3ArtifactRepository(ArtifactRepository):
         if path:
             dest_path = posixpath.join(dest_path, path)
         infos = []
+        manifest_keys = []
         prefix = dest_path + "/"
         s3_client = self._get_s3_client()
         paginator = s3_client.get_paginator("list_objects_v2")
@@ -81,11 +354,48 @@ class S3ArtifactRepository(ArtifactRepository):
                 file_path = obj.get("Key")
                 self._verify_listed_object_contains_artifact_path_prefix(
                     listed_object_path=file_path, artifact_path=artifact_path)
+                if is_manifest_file(file_path):
+                    manifest_keys.append(file_path)
+                    continue
                 file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
                 file_size = int(obj.get('Size'))
                 infos.append(FileInfo(file_rel_path, False, file_size))
+        self._add_manifest_files(bucket, artifact_path, infos, manifest_keys)
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None, max_depth=None):
+        infos = [file_info for file_info, _ in self._list_files_with_versions(path)]
+        return get_recursive_listing(path, infos, max_depth)
+
+    def _list_files_with_versions(self, path):
+        (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = posixpath.join(artifact_path, path) if path else artifact_path
+        prefix = dest_path + "/" if dest_path else ""
+        infos = []
+        versions = {}
+        manifest_keys = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in result.get("Contents", []):
+                file_path = obj.get("Key")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=file_path, artifact_path=artifact_path)
+                # Skip the empty objects that some tools create to represent directories
+                if file_path.endswith("/"):
+                    continue
+                if is_manifest_file(file_path):
+                    manifest_keys.append(file_path)
+                    continue
+                file_rel_path = posixpath.relpath(path=file_path, start=artifact_path) \
+                    if artifact_path else file_path
+                infos.append(FileInfo(file_rel_path, False, int(obj.get("Size"))))
+                versions[file_rel_path] = "%s-%s" % (obj["ETag"].strip('"'), obj["Size"])
+        self._add_manifest_files(bucket, artifact_path, infos, manifest_keys)
+        # Files not listed as objects are stored in a blob store
+        return [(file_info, versions.get(file_info.path) or
+                 "sha256-%s" % self._manifest_entries[file_info.path]["sha256"])
+                for file_info in infos]
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -95,8 +405,64 @@ class S3ArtifactRepository(ArtifactRepository):
                 " {object_path}.".format(
                     artifact_path=artifact_path, object_path=listed_object_path))
 
-    def _download_file(self, remote_file_path, local_path):
+    def open_stream(self, artifact_path):
+        from botocore.exceptions import ClientError
         (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
-        s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        s3_client = self._get_s3_client()
+        entry = self._manifest_entries.get(artifact_path)
+        if entry is None:
+            try:
+                size = s3_client.head_object(Bucket=bucket, Key=s3_full_path)["ContentLength"]
+            except ClientError as e:
+                if not _is_not_found_error(e):
+                    raise
+                entry = self._get_manifest_entry(artifact_path)
+                if entry is None:
+                    raise MlflowException("No such artifact file: '{}'".format(artifact_path),
+                                          error_code=RESOURCE_DOES_NOT_EXIST)
+        if entry is not None:
+            (bucket, s3_full_path) = data.parse_s3_uri(entry["blob_uri"])
+            size = entry["size"]
+
+        def open_reader(offset):
+            return s3_client.get_object(
+                Bucket=bucket, Key=s3_full_path, Range="bytes=%d-" % offset)["Body"]
+
+        return ArtifactStream(size, open_reader)
+
+    def _get_file_version(self, remote_file_path):
+        from botocore.exceptions import ClientError
+        entry = self._manifest_entries.get(remote_file_path)
+        if entry is None:
+            (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+            s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+            try:
+                head = self._get_s3_client().head_object(Bucket=bucket, Key=s3_full_path)
+                return "%s-%s" % (head["ETag"].strip('"'), head["ContentLength"])
+            except ClientError as e:
+                entry = self._get_manifest_entry(remote_file_path) \
+                    if _is_not_found_error(e) else None
+                if entry is None:
+                    raise
+        return "sha256-%s" % entry["sha256"]
+
+    def _download_file(self, remote_file_path, local_path):
+        from botocore.exceptions import ClientError
         s3_client = self._get_s3_client()
-        s3_client.download_file(bucket, s3_full_path, local_path)
+        entry = self._manifest_entries.get(remote_file_path)
+        if entry is None:
+            (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+            s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+            try:
+                s3_client.download_file(bucket, s3_full_path, local_path,
+                                        Config=self._get_transfer_config())
+                return
+            except ClientError as e:
+                entry = self._get_manifest_entry(remote_file_path) \
+                    if _is_not_found_error(e) else None
+                if entry is None:
+                    raise
+        (blob_bucket, blob_key) = data.parse_s3_uri(entry["blob_uri"])
+        s3_client.download_file(blob_bucket, blob_key, local_path,
+                                Config=self._get_transfer_config())
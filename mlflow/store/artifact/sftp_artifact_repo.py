@@ -1,10 +1,26 @@
 import os
+import stat
+import threading
+from contextlib import contextmanager
 
 import posixpath
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream
+from mlflow.store.artifact.connection_pool import ConnectionPool
+from mlflow.store.artifact.transfer import TransferProgress, list_local_dirs, list_local_files, \
+    run_concurrently
+
+# Connection pools shared by all repositories connecting with the same configuration
+_sftp_connection_pools = {}
+_sftp_connection_pools_lock = threading.Lock()
+
+
+def _is_alive(sftp):
+    return sftp.sftp_client.get_channel().get_transport().is_active()
 
 
 class SFTPArtifactRepository(ArtifactRepository):
@@ -23,6 +39,7 @@ class SFTPArtifactRepository(ArtifactRepository):
 
         if client:
             self.sftp = client
+            self._connection_pool = None
         else:
             import pysftp
             import paramiko
@@ -53,40 +70,122 @@ class SFTPArtifactRepository(ArtifactRepository):
             if 'identityfile' in user_config:
                 self.config['private_key'] = user_config['identityfile'][0]
 
-            self.sftp = pysftp.Connection(**self.config)
+            config = dict(self.config)
+            key = tuple(sorted(config.items()))
+            with _sftp_connection_pools_lock:
+                if key not in _sftp_connection_pools:
+                    # The liveness of idle connections is checked locally, without a round trip
+                    _sftp_connection_pools[key] = ConnectionPool(
+                        lambda: pysftp.Connection(**config), close=lambda sftp: sftp.close(),
+                        is_alive=_is_alive, idle_check_seconds=0)
+                self._connection_pool = _sftp_connection_pools[key]
+            # Connect eagerly so that invalid configurations are reported on creation
+            with self._connection_pool.connection():
+                pass
 
         super(SFTPArtifactRepository, self).__init__(artifact_uri)
 
+    @contextmanager
+    def _get_sftp_client(self):
+        """
+        Context manager providing the client passed to the constructor if any, or a connection
+        from a pool of connections shared by the repositories with the same configuration.
+        """
+        if self._connection_pool is None:
+            yield self.sftp
+        else:
+            with self._connection_pool.connection() as sftp:
+                yield sftp
+
     def log_artifact(self, local_file, artifact_path=None):
         artifact_dir = posixpath.join(self.path, artifact_path) \
             if artifact_path else self.path
-        self.sftp.makedirs(artifact_dir)
-        self.sftp.put(local_file,
-                      posixpath.join(
-                          artifact_dir, os.path.basename(local_file)))
-
-    def log_artifacts(self, local_dir, artifact_path=None):
+        with self._get_sftp_client() as sftp:
+            sftp.makedirs(artifact_dir)
+            sftp.put(local_file,
+                     posixpath.join(
+                         artifact_dir, os.path.basename(local_file)))
+
+    def log_artifacts(self, local_dir, artifact_path=None, sync=False):
+        """
+        Create all the directories of the uploaded tree with a single connection, then upload the
+        files concurrently over pooled connections, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads (8 by default). Uploads are not confirmed
+        with an additional ``stat`` of each file, as SFTP acknowledges every write.
+        """
         artifact_dir = posixpath.join(self.path, artifact_path) \
             if artifact_path else self.path
-        self.sftp.makedirs(artifact_dir)
-        self.sftp.put_r(local_dir, artifact_dir)
+        files = list_local_files(local_dir)
+        with self._get_sftp_client() as sftp:
+            sftp.makedirs(artifact_dir)
+            for sub_dir in list_local_dirs(local_dir):
+                try:
+                    sftp.mkdir(posixpath.join(artifact_dir, sub_dir))
+                except IOError:
+                    # The directory already exists
+                    pass
+        # The artifact URI is not logged as it may contain a password
+        progress = TransferProgress(
+            "Uploading artifacts to %s" % artifact_dir,
+            num_files=len(files),
+            num_bytes=sum(os.path.getsize(local_path) for local_path, _ in files))
+
+        def upload_file(local_path, rel_path):
+            with self._get_sftp_client() as sftp:
+                sftp.put(local_path, posixpath.join(artifact_dir, rel_path), confirm=False)
+            progress.complete_file(os.path.getsize(local_path))
+
+        run_concurrently(upload_file, files, max_workers=self._get_max_download_workers())
 
     def list_artifacts(self, path=None):
         artifact_dir = self.path
         list_dir = posixpath.join(artifact_dir, path) if path else artifact_dir
-        if not self.sftp.isdir(list_dir):
-            return []
-        artifact_files = self.sftp.listdir(list_dir)
-        infos = []
-        for file_name in artifact_files:
-            file_path = file_name if path is None else posixpath.join(path, file_name)
-            full_file_path = posixpath.join(list_dir, file_name)
-            if self.sftp.isdir(full_file_path):
-                infos.append(FileInfo(file_path, True, None))
-            else:
-                infos.append(FileInfo(file_path, False, self.sftp.stat(full_file_path).st_size))
+        with self._get_sftp_client() as sftp:
+            try:
+                # The attributes of all the entries are listed in a single request
+                attrs = sftp.listdir_attr(list_dir)
+            except IOError:
+                # The path does not exist or is not a directory
+                return []
+            infos = []
+            for attr in attrs:
+                file_path = attr.filename if path is None else posixpath.join(path, attr.filename)
+                if stat.S_ISLNK(attr.st_mode):
+                    # Symbolic links are listed with their own attributes, not their target's
+                    attr = sftp.stat(posixpath.join(list_dir, attr.filename))
+                if stat.S_ISDIR(attr.st_mode):
+                    infos.append(FileInfo(file_path, True, None))
+                else:
+                    infos.append(FileInfo(file_path, False, attr.st_size))
         return infos
 
+    def open_stream(self, artifact_path):
+        remote_full_path = posixpath.join(self.path, artifact_path)
+        with self._get_sftp_client() as sftp:
+            if not sftp.isfile(remote_full_path):
+                raise MlflowException("No such artifact file: '{}'".format(artifact_path),
+                                      error_code=RESOURCE_DOES_NOT_EXIST)
+            size = sftp.stat(remote_full_path).st_size
+        # The stream holds a connection until it is closed, so that it is not closed by the pool
+        # while files are open on it
+        stream_client = self._get_sftp_client()
+        stream_sftp = stream_client.__enter__()
+
+        def open_reader(offset):
+            f = stream_sftp.open(remote_full_path, 'rb')
+            f.seek(offset)
+            return f
+
+        return ArtifactStream(size, open_reader,
+                              on_close=lambda: stream_client.__exit__(None, None, None))
+
+    def _get_max_download_workers(self):
+        if self._connection_pool is None:
+            # All transfers share the client passed to the constructor
+            return 1
+        return super(SFTPArtifactRepository, self)._get_max_download_workers()
+
     def _download_file(self, remote_file_path, local_path):
         remote_full_path = posixpath.join(self.path, remote_file_path)
-        self.sftp.get(remote_full_path, local_path)
+        with self._get_sftp_client() as sftp:
+            sftp.get(remote_full_path, local_path)
@@ -0,0 +1,205 @@
+"""
+Utilities for artifact repositories transferring many files to or from their storage backend
+concurrently, such as the files of a directory logged with ``log_artifacts``.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.file_utils import relative_path_to_artifact_path
+
+# Environment variable setting the maximum number of files transferred concurrently
+ARTIFACT_TRANSFER_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 8
+
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+_logger = logging.getLogger(__name__)
+
+
+def get_positive_int_from_env(env_var, default):
+    """
+    :return: The value of the specified environment variable as a positive integer, or
+             ``default`` if the variable is not set.
+    """
+    value = os.environ.get(env_var)
+    if not value:
+        return default
+    try:
+        parsed_value = int(value)
+    except ValueError:
+        parsed_value = 0
+    if parsed_value <= 0:
+        raise MlflowException("Environment variable %s must be a positive integer, got '%s'" % (
+            env_var, value), INVALID_PARAMETER_VALUE)
+    return parsed_value
+
+
+def get_max_workers():
+    """:return: The maximum number of files to transfer concurrently."""
+    return get_positive_int_from_env(ARTIFACT_TRANSFER_MAX_WORKERS_ENV_VAR, DEFAULT_MAX_WORKERS)
+
+
+def list_local_files(local_dir):
+    """
+    :return: List of ``(local_path, relative_artifact_path)`` pairs for all files in the specified
+             local directory and its subdirectories, where ``relative_artifact_path`` is the
+             POSIX path of the file relative to ``local_dir``.
+    """
+    local_dir = os.path.abspath(local_dir)
+    files = []
+    for (root, _, filenames) in os.walk(local_dir):
+        for filename in filenames:
+            local_path = os.path.join(root, filename)
+            rel_path = relative_path_to_artifact_path(os.path.relpath(local_path, local_dir))
+            files.append((local_path, rel_path))
+    return sorted(files, key=lambda f: f[1])
+
+
+def list_local_dirs(local_dir):
+    """
+    :return: Sorted list of the POSIX paths, relative to ``local_dir``, of all subdirectories of the
+             specified local directory. Parent directories come before their subdirectories.
+    """
+    local_dir = os.path.abspath(local_dir)
+    dirs = []
+    for (root, dirnames, _) in os.walk(local_dir):
+        for dirname in dirnames:
+            dirs.append(relative_path_to_artifact_path(
+                os.path.relpath(os.path.join(root, dirname), local_dir)))
+    return sorted(dirs)
+
+
+def compute_file_md5(local_path):
+    """:return: The MD5 digest of the contents of the specified local file, as bytes."""
+    md5 = hashlib.md5()
+    with open(local_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_BUFFER_SIZE), b""):
+            md5.update(chunk)
+    return md5.digest()
+
+
+def filter_changed_files(files, remote_files, is_same_file):
+    """
+    Select the local files to upload to synchronize a remote directory with a local directory,
+    i.e. the files that are new or whose contents differ from the remote file at the same path.
+
+    :param files: List of ``(local_path, relative_artifact_path)`` pairs, as returned by
+                  :py:func:`list_local_files`.
+    :param remote_files: Dictionary mapping the relative POSIX paths of the remote files to their
+                         metadata (e.g. their size and checksum).
+    :param is_same_file: Function called with the local path of a file and the metadata of the
+                         remote file at the same path, returning True if both have the same
+                         contents. Called concurrently, as it may need to hash the local file.
+    :return: The ``(local_path, relative_artifact_path)`` pairs of the files to upload.
+    """
+    existing_files = [(local_path, remote_files[rel_path]) for local_path, rel_path in files
+                      if rel_path in remote_files]
+    same_files = run_concurrently(is_same_file, existing_files)
+    unchanged_paths = set(local_path for (local_path, _), same in zip(existing_files, same_files)
+                          if same)
+    _logger.debug("Skipping %d unchanged files out of %d", len(unchanged_paths), len(files))
+    return [(local_path, rel_path) for local_path, rel_path in files
+            if local_path not in unchanged_paths]
+
+
+class TransferProgress(object):
+    """
+    Thread-safe progress of a transfer of multiple files, logged at most every
+    ``log_interval_seconds`` and once all files have been transferred.
+
+    :param description: Description of the transfer used in log messages, e.g.
+                        "Uploading artifacts to s3://bucket/path".
+    """
+
+    def __init__(self, description, num_files, num_bytes, log_interval_seconds=10):
+        self.description = description
+        self.num_files = num_files
+        self.num_bytes = num_bytes
+        self.files_done = 0
+        self.bytes_done = 0
+        self._log_interval_seconds = log_interval_seconds
+        self._last_log_time = time.time()
+        self._lock = threading.Lock()
+
+    def add_bytes(self, num_bytes):
+        """
+        Record that ``num_bytes`` more bytes were transferred. Can be passed as the ``Callback``
+        of boto3 transfers.
+        """
+        with self._lock:
+            self.bytes_done += num_bytes
+        self._maybe_log()
+
+    def complete_file(self, num_bytes=0):
+        """
+        Record that a file was transferred, along with ``num_bytes`` of its bytes that were not
+        recorded with :py:meth:`add_bytes`.
+        """
+        with self._lock:
+            self.files_done += 1
+            self.bytes_done += num_bytes
+        self._maybe_log()
+
+    def _maybe_log(self):
+        with self._lock:
+            now = time.time()
+            done = self.files_done == self.num_files
+            if not done and now - self._last_log_time < self._log_interval_seconds:
+                return
+            self._last_log_time = now
+            files_done, bytes_done = self.files_done, self.bytes_done
+        _logger.info("%s: %d/%d files, %d/%d bytes", self.description, files_done,
+                     self.num_files, bytes_done, self.num_bytes)
+
+
+def run_concurrently(func, args_list, max_workers=None):
+    """
+    Call ``func(*args)`` for each element of ``args_list`` using up to ``max_workers`` threads,
+    and wait for all calls to complete. If any call raises an exception, the calls that have not
+    started yet are cancelled and the first exception is raised.
+
+    :param max_workers: Maximum number of concurrent calls. Defaults to :py:func:`get_max_workers`.
+    :return: List of the results of the calls, in the order of ``args_list``.
+    """
+    max_workers = max_workers or get_max_workers()
+    if max_workers == 1 or len(args_list) <= 1:
+        return [func(*args) for args in args_list]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        futures = [executor.submit(func, *args) for args in args_list]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def download_file_in_chunks(fetch_range, file_size, local_path, chunk_size, max_workers):
+    """
+    Download a file of ``file_size`` bytes to ``local_path`` in chunks of ``chunk_size`` bytes,
+    downloaded concurrently by up to ``max_workers`` threads and written at their offset.
+
+    :param fetch_range: Function returning the bytes of the file from offset ``start`` (inclusive)
+                        to offset ``end`` (exclusive) when called as ``fetch_range(start, end)``.
+    """
+    with open(local_path, "wb") as f:
+        f.truncate(file_size)
+
+    def download_chunk(start):
+        end = min(start + chunk_size, file_size)
+        chunk = fetch_range(start, end)
+        if len(chunk) != end - start:
+            raise MlflowException("Downloaded %d bytes instead of %d from offset %d of %s" % (
+                len(chunk), end - start, start, local_path))
+        with open(local_path, "r+b") as f:
+            f.seek(start)
+            f.write(chunk)
+
+    run_concurrently(download_chunk, [(start,) for start in range(0, file_size, chunk_size)],
+                     max_workers=max_workers)
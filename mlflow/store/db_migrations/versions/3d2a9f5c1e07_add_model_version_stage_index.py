@@ -0,0 +1,27 @@
+"""add index on model versions by stage
+
+Revision ID: 3d2a9f5c1e07
+Revises: 2b4d017a5e9b
+Create Date: 2026-10-18 10:12:44.512036
+
+"""
+from alembic import op
+
+from mlflow.store.model_registry.dbmodels.models import SqlModelVersion
+
+# revision identifiers, used by Alembic.
+revision = '3d2a9f5c1e07'
+down_revision = '2b4d017a5e9b'
+branch_labels = None
+depends_on = None
+
+_INDEX_NAME = 'index_model_versions_name_current_stage_version'
+
+
+def upgrade():
+    op.create_index(_INDEX_NAME, SqlModelVersion.__tablename__,
+                    ['name', 'current_stage', 'version'])
+
+
+def downgrade():
+    op.drop_index(_INDEX_NAME, table_name=SqlModelVersion.__tablename__)
@@ -0,0 +1,46 @@
+"""add registry events tables
+
+Revision ID: 45c3f3eb69e0
+Revises: a8c4a736bde6
+Create Date: 2026-10-18 23:58:41.527083
+
+"""
+from alembic import op
+from sqlalchemy import Column, String, Integer, BigInteger, PrimaryKeyConstraint
+
+from mlflow.store.model_registry.dbmodels.models import SqlRegistryEvent, \
+    SqlRegistryEventSequence, REGISTRY_EVENT_SEQUENCE_ID
+
+# revision identifiers, used by Alembic.
+revision = '45c3f3eb69e0'
+down_revision = 'a8c4a736bde6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(SqlRegistryEvent.__tablename__,
+                    Column('id', Integer, autoincrement=True, nullable=False),
+                    Column('sequence', BigInteger, nullable=True),
+                    Column('timestamp', BigInteger, nullable=False),
+                    Column('event_type', String(50), nullable=False),
+                    Column('name', String(256), nullable=False),
+                    Column('version', Integer, nullable=True),
+                    Column('stage', String(20), nullable=True),
+                    Column('previous_name', String(256), nullable=True),
+                    PrimaryKeyConstraint('id', name='registry_event_pk'))
+    op.create_index('index_registry_events_sequence', SqlRegistryEvent.__tablename__,
+                    ['sequence'], unique=False)
+    registry_event_sequence = op.create_table(
+        SqlRegistryEventSequence.__tablename__,
+        Column('id', Integer, autoincrement=False, nullable=False),
+        Column('last_sequence', BigInteger, nullable=False),
+        PrimaryKeyConstraint('id', name='registry_event_sequence_pk'))
+    # The events start from the current state of the registry, which is not recorded as events
+    op.bulk_insert(registry_event_sequence,
+                   [{'id': REGISTRY_EVENT_SEQUENCE_ID, 'last_sequence': 0}])
+
+
+def downgrade():
+    op.drop_table(SqlRegistryEventSequence.__tablename__)
+    op.drop_table(SqlRegistryEvent.__tablename__)
@@ -0,0 +1,38 @@
+"""add max version to registered models
+
+Revision ID: a8c4a736bde6
+Revises: 3d2a9f5c1e07
+Create Date: 2026-10-18 23:52:09.318274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from mlflow.store.model_registry.dbmodels.models import SqlRegisteredModel, SqlModelVersion
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4a736bde6'
+down_revision = '3d2a9f5c1e07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(SqlRegisteredModel.__tablename__,
+                  sa.Column('max_version', sa.Integer(), nullable=False, server_default='0'))
+    # Versions are never renumbered, so the counter starts from the highest version number of
+    # each model, including deleted versions
+    registered_models = sa.table(SqlRegisteredModel.__tablename__,
+                                 sa.column('name'), sa.column('max_version'))
+    model_versions = sa.table(SqlModelVersion.__tablename__,
+                              sa.column('name'), sa.column('version'))
+    max_version = sa.select([sa.func.coalesce(sa.func.max(model_versions.c.version), 0)]) \
+        .where(model_versions.c.name == registered_models.c.name) \
+        .as_scalar()
+    op.execute(registered_models.update().values(max_version=max_version))
+
+
+def downgrade():
+    # Use batch mode so that we can run "ALTER TABLE" statements against SQLite databases
+    with op.batch_alter_table(SqlRegisteredModel.__tablename__) as batch_op:
+        batch_op.drop_column('max_version')
@@ -0,0 +1,10 @@
+# Maximum numbers of results of a single page of model versions or registered models
+SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD = 1000
+LIST_REGISTERED_MODELS_MAX_RESULTS_THRESHOLD = 1000
+
+# Default and maximum numbers of registry events returned at once, and maximum number of seconds a
+# request for registry events waits for a new event. Long polls must end before the server's
+# workers time out, which is after 30 seconds by default with gunicorn.
+REGISTRY_EVENTS_MAX_RESULTS_DEFAULT = 100
+REGISTRY_EVENTS_MAX_RESULTS_THRESHOLD = 1000
+REGISTRY_EVENTS_MAX_TIMEOUT_SECONDS = 20
@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABCMeta
 
 from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
+from mlflow.store.model_registry import REGISTRY_EVENTS_MAX_RESULTS_DEFAULT
 
 
 class AbstractStore:
@@ -60,11 +61,20 @@ class AbstractStore:
         pass
 
     @abstractmethod
-    def list_registered_models(self):
+    def list_registered_models(self, max_results=None, order_by=None, page_token=None):
         """
         List of all registered models.
 
-        :return: List of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects.
+        :param max_results: Maximum number of registered models desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``creation_timestamp`` and
+                         ``last_updated_timestamp`` of models, like ``creation_timestamp DESC``.
+                         Models are ordered by name if unspecified, which is also the tiebreak.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``list_registered_models`` call.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
         pass
 
@@ -152,16 +162,47 @@ class AbstractStore:
         pass
 
     @abstractmethod
-    def search_model_versions(self, filter_string):
+    def search_model_versions(self, filter_string, max_results=None, order_by=None,
+                              page_token=None):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression, made of comparisons joined with ``AND``
+                              on the ``name``, ``run_id``, ``source_path``, ``current_stage``,
+                              ``version``, ``creation_timestamp`` and ``last_updated_timestamp``
+                              of model versions, like ``name LIKE 'fraud-%' AND
+                              current_stage = 'Production'`` or ``run_id IN ('a1b2', 'c3d4')``.
+        :param max_results: Maximum number of model versions desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``version``, ``current_stage``,
+                         ``creation_timestamp`` and ``last_updated_timestamp`` of model versions,
+                         like ``creation_timestamp DESC``. Tiebreaks are done by name ASC,
+                         followed by version DESC.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``search_model_versions`` call.
 
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersionDetailed`
-                 objects.
+                 objects. The token of the next page of results is set if there may be more
+                 results.
+        """
+        pass
+
+    @abstractmethod
+    def get_registry_events(self, since=0, max_results=REGISTRY_EVENTS_MAX_RESULTS_DEFAULT,
+                            timeout_seconds=0):
+        """
+        Get the changes made to the registry after the specified event, in the order in which they
+        were made. Clients can follow these events to keep a local copy of registry state, such
+        as the latest versions of models, up to date instead of polling for it.
+
+        :param since: Sequence number of the last event already received.
+        :param max_results: Maximum number of events desired. If 0, no event is returned and only
+                            the sequence number of the latest event is.
+        :param timeout_seconds: Maximum number of seconds to wait for an event later than
+                                ``since`` if there is none yet.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegistryEvent` objects.
+                 Its token is the sequence number of the last returned event, or of the latest
+                 event if none was returned, to pass as ``since`` to get the subsequent events.
         """
         pass
 
@@ -1,11 +1,11 @@
 import time
 
 from sqlalchemy import (
-    Column, String, ForeignKey, Integer, BigInteger, PrimaryKeyConstraint)
+    Column, String, ForeignKey, Integer, BigInteger, PrimaryKeyConstraint, Index, event)
 from sqlalchemy.orm import relationship, backref
 
 from mlflow.entities.model_registry import (RegisteredModel, RegisteredModelDetailed,
-                                            ModelVersion, ModelVersionDetailed)
+                                            ModelVersion, ModelVersionDetailed, RegistryEvent)
 from mlflow.entities.model_registry.model_version_stages import STAGE_NONE, STAGE_DELETED_INTERNAL
 from mlflow.entities.model_registry.model_version_status import ModelVersionStatus
 from mlflow.store.db.base_sql_model import Base
@@ -22,6 +22,10 @@ class SqlRegisteredModel(Base):
 
     description = Column(String(5000), nullable=True)
 
+    # Highest version number allocated to the versions of the model, including deleted versions.
+    # New versions are numbered by incrementing it.
+    max_version = Column(Integer, default=0, nullable=False)
+
     __table_args__ = (
         PrimaryKeyConstraint('name', name='registered_model_pk'),
     )
@@ -35,18 +39,26 @@ class SqlRegisteredModel(Base):
     def to_mlflow_entity(self):
         return RegisteredModel(self.name)
 
-    def to_mlflow_detailed_entity(self):
-        # SqlRegisteredModel has backref to all "model_versions". Filter latest for each stage.
-        latest_versions = {}
-        for mv in self.model_versions:
-            stage = mv.current_stage
-            if stage != STAGE_DELETED_INTERNAL and (stage not in latest_versions or
-                                                    latest_versions[stage].version < mv.version):
-                latest_versions[stage] = mv
+    def to_mlflow_detailed_entity(self, latest_versions=None):
+        """
+        :param latest_versions: The latest :py:class:`SqlModelVersion` of each stage of the model,
+                                if already queried. Otherwise, they are found among all the
+                                versions of the model, which are loaded from the database.
+        """
+        if latest_versions is None:
+            # SqlRegisteredModel has backref to all "model_versions". Filter latest for each stage.
+            latest_by_stage = {}
+            for mv in self.model_versions:
+                stage = mv.current_stage
+                if stage != STAGE_DELETED_INTERNAL and \
+                        (stage not in latest_by_stage or
+                         latest_by_stage[stage].version < mv.version):
+                    latest_by_stage[stage] = mv
+            latest_versions = latest_by_stage.values()
         return RegisteredModelDetailed(self.name, self.creation_time, self.last_updated_time,
                                        self.description,
                                        [mvd.to_mlflow_detailed_entity()
-                                        for mvd in latest_versions.values()])
+                                        for mvd in latest_versions])
 
 
 class SqlModelVersion(Base):
@@ -82,6 +94,9 @@ class SqlModelVersion(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint('name', 'version', name='model_version_pk'),
+        # Serves queries for the latest version of each stage of a model
+        Index('index_model_versions_name_current_stage_version',
+              'name', 'current_stage', 'version'),
     )
 
     # entity mappers
@@ -93,3 +108,62 @@ class SqlModelVersion(Base):
                                     self.creation_time, self.last_updated_time, self.description,
                                     self.user_id, self.current_stage, self.source, self.run_id,
                                     self.status, self.status_message)
+
+
+class SqlRegistryEvent(Base):
+    __tablename__ = 'registry_events'
+
+    id = Column(Integer, autoincrement=True, nullable=False)
+
+    # Events are numbered after the transaction of their change is committed, and have no sequence
+    # number until then
+    sequence = Column(BigInteger, nullable=True)
+
+    timestamp = Column(BigInteger, nullable=False)
+
+    event_type = Column(String(50), nullable=False)
+
+    # Events are kept after the registered model is deleted, so the name is not a foreign key
+    name = Column(String(256), nullable=False)
+
+    version = Column(Integer, nullable=True)
+
+    stage = Column(String(20), nullable=True)
+
+    previous_name = Column(String(256), nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='registry_event_pk'),
+        Index('index_registry_events_sequence', 'sequence'),
+    )
+
+    # entity mappers
+    def to_mlflow_entity(self):
+        return RegistryEvent(self.sequence, self.timestamp, self.event_type, self.name,
+                             self.version, self.stage, self.previous_name)
+
+
+class SqlRegistryEventSequence(Base):
+    """
+    Single row holding the sequence number of the latest registry event. Committed events are
+    numbered by incrementing it in a separate transaction, which locks the row so that events are
+    numbered by one transaction at a time, and commits their sequence numbers along with it.
+    """
+    __tablename__ = 'registry_event_sequence'
+
+    id = Column(Integer, autoincrement=False, nullable=False)
+
+    last_sequence = Column(BigInteger, default=0, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='registry_event_sequence_pk'),
+    )
+
+
+# ID of the row of the registry_event_sequence table
+REGISTRY_EVENT_SEQUENCE_ID = 1
+
+
+@event.listens_for(SqlRegistryEventSequence.__table__, 'after_create')
+def _insert_registry_event_sequence(target, connection, **kw):  # pylint: disable=unused-argument
+    connection.execute(target.insert().values(id=REGISTRY_EVENT_SEQUENCE_ID, last_sequence=0))
@@ -1,11 +1,13 @@
 from mlflow.entities.model_registry import RegisteredModel, RegisteredModelDetailed, \
-    ModelVersion, ModelVersionDetailed
+    ModelVersion, ModelVersionDetailed, RegistryEvent
 from mlflow.protos.model_registry_pb2 import ModelRegistryService, CreateRegisteredModel, \
     UpdateRegisteredModel, DeleteRegisteredModel, ListRegisteredModels, \
     GetRegisteredModelDetails, GetLatestVersions, CreateModelVersion, UpdateModelVersion, \
     DeleteModelVersion, GetModelVersionDetails, GetModelVersionDownloadUri, SearchModelVersions, \
-    GetModelVersionStages
+    GetModelVersionStages, GetRegistryEvents
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.model_registry import SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD, \
+    REGISTRY_EVENTS_MAX_RESULTS_DEFAULT
 from mlflow.store.model_registry.abstract_store import AbstractStore
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
@@ -78,16 +80,29 @@ class RestStore(AbstractStore):
             registered_model=registered_model.to_proto()))
         self._call_endpoint(DeleteRegisteredModel, req_body)
 
-    def list_registered_models(self):
+    def list_registered_models(self, max_results=None, order_by=None, page_token=None):
         """
         List of all registered models.
 
-        :return: List of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects.
+        :param max_results: Maximum number of registered models desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``creation_timestamp`` and
+                         ``last_updated_timestamp`` of models, like ``creation_timestamp DESC``.
+                         Models are ordered by name if unspecified, which is also the tiebreak.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``list_registered_models`` call.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
-        req_body = message_to_json(ListRegisteredModels())
+        req_body = message_to_json(ListRegisteredModels(max_results=max_results, order_by=order_by,
+                                                        page_token=page_token))
         response_proto = self._call_endpoint(ListRegisteredModels, req_body)
-        return [RegisteredModelDetailed.from_proto(registered_model_detailed)
-                for registered_model_detailed in response_proto.registered_models_detailed]
+        registered_models_detailed = [
+            RegisteredModelDetailed.from_proto(registered_model_detailed)
+            for registered_model_detailed in response_proto.registered_models_detailed]
+        # If next_page_token is not set, we will see it as "". We need to convert this to None.
+        return PagedList(registered_models_detailed, response_proto.next_page_token or None)
 
     def get_registered_model_details(self, registered_model):
         """
@@ -182,22 +197,72 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetModelVersionDownloadUri, req_body)
         return response_proto.artifact_uri
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(self, filter_string, max_results=None, order_by=None,
+                              page_token=None):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression, made of comparisons joined with ``AND``
+                              on the ``name``, ``run_id``, ``source_path``, ``current_stage``,
+                              ``version``, ``creation_timestamp`` and ``last_updated_timestamp``
+                              of model versions, like ``name LIKE 'fraud-%' AND
+                              current_stage = 'Production'`` or ``run_id IN ('a1b2', 'c3d4')``.
+        :param max_results: Maximum number of model versions desired, or None for all of them, which
+                            are requested in pages of the maximum size.
+        :param order_by: List of order_by clauses on the ``name``, ``version``, ``current_stage``,
+                         ``creation_timestamp`` and ``last_updated_timestamp`` of model versions,
+                         like ``creation_timestamp DESC``. Tiebreaks are done by name ASC,
+                         followed by version DESC.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``search_model_versions`` call.
 
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersionDetailed`
-                 objects.
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
-        req_body = message_to_json(SearchModelVersions(filter=filter_string))
+        if max_results is None:
+            model_versions_detailed = []
+            while True:
+                page = self._search_model_versions_page(
+                    filter_string, SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD, order_by,
+                    page_token)
+                model_versions_detailed.extend(page)
+                page_token = page.token
+                if page_token is None:
+                    return PagedList(model_versions_detailed, None)
+        return self._search_model_versions_page(filter_string, max_results, order_by, page_token)
+
+    def _search_model_versions_page(self, filter_string, max_results, order_by, page_token):
+        req_body = message_to_json(SearchModelVersions(filter=filter_string,
+                                                       max_results=max_results, order_by=order_by,
+                                                       page_token=page_token))
         response_proto = self._call_endpoint(SearchModelVersions, req_body)
         model_versions_detailed = [ModelVersionDetailed.from_proto(mvd)
                                    for mvd in response_proto.model_versions_detailed]
-        return PagedList(model_versions_detailed, None)
+        # If next_page_token is not set, we will see it as "". We need to convert this to None.
+        return PagedList(model_versions_detailed, response_proto.next_page_token or None)
+
+    def get_registry_events(self, since=0, max_results=REGISTRY_EVENTS_MAX_RESULTS_DEFAULT,
+                            timeout_seconds=0):
+        """
+        Get the changes made to the registry after the specified event, in the order in which they
+        were made.
+
+        :param since: Sequence number of the last event already received.
+        :param max_results: Maximum number of events desired. If 0, no event is returned and only
+                            the sequence number of the latest event is.
+        :param timeout_seconds: Maximum number of seconds for the server to wait for an event
+                                later than ``since`` if there is none yet.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegistryEvent` objects.
+                 Its token is the sequence number of the last returned event, or of the latest
+                 event if none was returned, to pass as ``since`` to get the subsequent events.
+        """
+        req_body = message_to_json(GetRegistryEvents(since=since, max_results=max_results,
+                                                     timeout_seconds=timeout_seconds))
+        response_proto = self._call_endpoint(GetRegistryEvents, req_body)
+        events = [RegistryEvent.from_proto(event) for event in response_proto.events]
+        return PagedList(events, response_proto.last_sequence)
 
     def get_model_version_stages(self, model_version):
         """
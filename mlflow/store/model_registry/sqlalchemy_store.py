@@ -5,19 +5,30 @@ import sqlalchemy
 
 from mlflow.entities.model_registry.model_version_stages import get_canonical_stage, \
     DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS, STAGE_DELETED_INTERNAL
+from mlflow.entities.model_registry.registry_event_type import RegistryEventType
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS, \
     INVALID_STATE, RESOURCE_DOES_NOT_EXIST
 import mlflow.store.db.utils
 from mlflow.store.db.base_sql_model import Base
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.model_registry import SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD, \
+    LIST_REGISTERED_MODELS_MAX_RESULTS_THRESHOLD, REGISTRY_EVENTS_MAX_RESULTS_DEFAULT, \
+    REGISTRY_EVENTS_MAX_RESULTS_THRESHOLD, REGISTRY_EVENTS_MAX_TIMEOUT_SECONDS
 from mlflow.store.model_registry.abstract_store import AbstractStore
-from mlflow.store.model_registry.dbmodels.models import SqlRegisteredModel, SqlModelVersion
+from mlflow.store.model_registry.dbmodels.models import SqlRegisteredModel, SqlModelVersion, \
+    SqlRegistryEvent, SqlRegistryEventSequence, REGISTRY_EVENT_SEQUENCE_ID
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 
 _logger = logging.getLogger(__name__)
 
+# Key of the info of sessions that recorded registry events, which are numbered once committed
+_RECORDED_EVENTS_SESSION_KEY = "mlflow_recorded_registry_events"
+
+# Interval in seconds at which the database is queried for new registry events while waiting for one
+REGISTRY_EVENTS_POLL_INTERVAL_SECONDS = 0.5
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -47,8 +58,6 @@ class SqlAlchemyStore(AbstractStore):
     :py:class:`mlflow.store.model_registry.models.ModelVersion`
     """
 
-    CREATE_MODEL_VERSION_RETRIES = 3
-
     def __init__(self, db_uri):
         """
         Create a database backed store.
@@ -70,6 +79,7 @@ class SqlAlchemyStore(AbstractStore):
         SqlAlchemyStore._verify_registry_tables_exist(self.engine)
         Base.metadata.bind = self.engine
         SessionMaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
+        sqlalchemy.event.listen(SessionMaker, "after_commit", self._number_recorded_events)
         self.ManagedSessionMaker = mlflow.store.db.utils._get_managed_session_maker(SessionMaker)
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
@@ -82,6 +92,8 @@ class SqlAlchemyStore(AbstractStore):
         expected_tables = [
             SqlRegisteredModel.__tablename__,
             SqlModelVersion.__tablename__,
+            SqlRegistryEvent.__tablename__,
+            SqlRegistryEventSequence.__tablename__,
         ]
         if any([table not in inspected_tables for table in expected_tables]):
             # TODO: Replace the MlflowException with the following line once it's possible to run
@@ -118,6 +130,8 @@ class SqlAlchemyStore(AbstractStore):
                                                       last_updated_time=creation_time)
                 self._save_to_db(session, registered_model)
                 session.flush()
+                self._record_event(session, RegistryEventType.CREATE_REGISTERED_MODEL,
+                                   creation_time, name)
                 return registered_model.to_mlflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
                 raise MlflowException('Registered Model (name={}) already exists. '
@@ -162,6 +176,13 @@ class SqlAlchemyStore(AbstractStore):
                 self._save_to_db(session,
                                  [sql_registered_model] + sql_registered_model.model_versions)
                 session.flush()
+                if new_name is not None:
+                    self._record_event(session, RegistryEventType.RENAME_REGISTERED_MODEL,
+                                       updated_time, new_name,
+                                       previous_name=registered_model.name)
+                if description is not None:
+                    self._record_event(session, RegistryEventType.UPDATE_REGISTERED_MODEL,
+                                       updated_time, sql_registered_model.name)
                 return sql_registered_model.to_mlflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
                 raise MlflowException('Registered Model (name={}) already exists. '
@@ -179,16 +200,79 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, registered_model.name)
             session.delete(sql_registered_model)
+            self._record_event(session, RegistryEventType.DELETE_REGISTERED_MODEL, now(),
+                               registered_model.name)
 
-    def list_registered_models(self):
+    @classmethod
+    def _get_latest_sql_model_versions(cls, session, names=None, stages=None):
         """
-        List of all registered models.
+        Query the latest version of each stage of the specified registered models (or of all
+        registered models), without loading the other versions. The maximum version of each
+        stage is read from the ``(name, current_stage, version)`` index of model versions.
 
-        :return: List of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects.
+        :param names: Names of the registered models, or None for all registered models.
+        :param stages: Canonical names of the stages whose latest versions to return, or None for
+                       all stages.
+
+        :return: List of :py:class:`SqlModelVersion` objects.
+        """
+        conditions = [SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL]
+        if names is not None:
+            conditions.append(SqlModelVersion.name.in_(names))
+        if stages is not None:
+            conditions.append(SqlModelVersion.current_stage.in_(stages))
+        latest = session \
+            .query(SqlModelVersion.name, SqlModelVersion.current_stage,
+                   sqlalchemy.func.max(SqlModelVersion.version).label("version")) \
+            .filter(*conditions) \
+            .group_by(SqlModelVersion.name, SqlModelVersion.current_stage) \
+            .subquery()
+        return session.query(SqlModelVersion).join(
+            latest, sqlalchemy.and_(SqlModelVersion.name == latest.c.name,
+                                    SqlModelVersion.current_stage == latest.c.current_stage,
+                                    SqlModelVersion.version == latest.c.version)).all()
+
+    def list_registered_models(self, max_results=None, order_by=None, page_token=None):
+        """
+        List of all registered models. The latest versions of the models of a page are queried at
+        once.
+
+        :param max_results: Maximum number of registered models desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``creation_timestamp`` and
+                         ``last_updated_timestamp`` of models, like ``creation_timestamp DESC``.
+                         Models are ordered by name if unspecified, which is also the tiebreak.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``list_registered_models`` call.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
+        if max_results is not None:
+            _validate_max_results(max_results, LIST_REGISTERED_MODELS_MAX_RESULTS_THRESHOLD)
+        order_by_clauses = _get_order_by_clauses(
+            order_by, SearchUtils.VALID_ORDER_BY_KEYS_FOR_REGISTERED_MODELS,
+            _REGISTERED_MODEL_COLUMNS, [("name", True)])
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
         with self.ManagedSessionMaker() as session:
-            return [sql_registered_model.to_mlflow_detailed_entity()
-                    for sql_registered_model in session.query(SqlRegisteredModel).all()]
+            query = session.query(SqlRegisteredModel).order_by(*order_by_clauses).offset(offset)
+            if max_results is not None:
+                query = query.limit(max_results)
+            sql_registered_models = query.all()
+            latest_versions = dict((sql_registered_model.name, [])
+                                   for sql_registered_model in sql_registered_models)
+            # Only the latest versions of the models of the page are queried if it is not all of
+            # them
+            names = None if max_results is None else list(latest_versions)
+            if names != []:
+                for sql_model_version in self._get_latest_sql_model_versions(session, names=names):
+                    latest_versions.setdefault(sql_model_version.name, []).append(
+                        sql_model_version)
+            registered_models = [sql_registered_model.to_mlflow_detailed_entity(
+                latest_versions=latest_versions[sql_registered_model.name])
+                for sql_registered_model in sql_registered_models]
+            return PagedList(registered_models,
+                             _get_next_page_token(offset, max_results, len(registered_models)))
 
     def get_registered_model_details(self, registered_model):
         """
@@ -197,8 +281,10 @@ class SqlAlchemyStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed` object.
         """
         with self.ManagedSessionMaker() as session:
-            return self._get_registered_model(session,
-                                              registered_model.name).to_mlflow_detailed_entity()
+            sql_registered_model = self._get_registered_model(session, registered_model.name)
+            return sql_registered_model.to_mlflow_detailed_entity(
+                latest_versions=self._get_latest_sql_model_versions(
+                    session, names=[sql_registered_model.name]))
 
     def get_latest_versions(self, registered_model, stages=None):
         """
@@ -211,16 +297,16 @@ class SqlAlchemyStore(AbstractStore):
 
         :return: List of `:py:class:`mlflow.entities.model_registry.ModelVersionDetailed` objects.
         """
+        if stages is None or len(stages) == 0:
+            expected_stages = set([get_canonical_stage(stage) for stage
+                                   in DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS])
+        else:
+            expected_stages = set([get_canonical_stage(stage) for stage in stages])
         with self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, registered_model.name)
-            # Convert to RegisteredModelDetailed entity first and then extract latest_versions
-            latest_versions = sql_registered_model.to_mlflow_detailed_entity().latest_versions
-            if stages is None or len(stages) == 0:
-                expected_stages = set([get_canonical_stage(stage) for stage
-                                       in DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS])
-            else:
-                expected_stages = set([get_canonical_stage(stage) for stage in stages])
-            return [mv for mv in latest_versions if mv.current_stage in expected_stages]
+            return [sql_model_version.to_mlflow_detailed_entity()
+                    for sql_model_version in self._get_latest_sql_model_versions(
+                        session, names=[sql_registered_model.name], stages=expected_stages)]
 
     # CRUD API for ModelVersion objects
 
@@ -235,31 +321,104 @@ class SqlAlchemyStore(AbstractStore):
         :return: A single object of :py:class:`mlflow.entities.model_registry.ModelVersion`
         created in the backend.
         """
-        def next_version(sql_registered_model):
-            if sql_registered_model.model_versions:
-                return max([mv.version for mv in sql_registered_model.model_versions]) + 1
-            else:
-                return 1
         with self.ManagedSessionMaker() as session:
             creation_time = now()
-            for attempt in range(self.CREATE_MODEL_VERSION_RETRIES):
-                try:
-                    sql_registered_model = self._get_registered_model(session, name)
-                    sql_registered_model.last_updated_time = creation_time
-                    model_version = SqlModelVersion(name=name,
-                                                    version=next_version(sql_registered_model),
-                                                    creation_time=creation_time,
-                                                    last_updated_time=creation_time,
-                                                    source=source, run_id=run_id)
-                    self._save_to_db(session, [sql_registered_model, model_version])
-                    session.flush()
-                    return model_version.to_mlflow_entity()
-                except sqlalchemy.exc.IntegrityError:
-                    more_retries = self.CREATE_MODEL_VERSION_RETRIES - attempt - 1
-                    _logger.info('Model Version creation error (name=%s) Retrying %s more time%s.',
-                                 name, str(more_retries), 's' if more_retries > 1 else '')
-        raise MlflowException('Model Version creation error (name={}). Giving up after '
-                              '{} attempts.'.format(name, self.CREATE_MODEL_VERSION_RETRIES))
+            version = self._allocate_version(session, name, creation_time)
+            model_version = SqlModelVersion(name=name, version=version,
+                                            creation_time=creation_time,
+                                            last_updated_time=creation_time,
+                                            source=source, run_id=run_id)
+            self._save_to_db(session, model_version)
+            self._record_event(session, RegistryEventType.CREATE_MODEL_VERSION, creation_time,
+                               name, version=version)
+            return model_version.to_mlflow_entity()
+
+    @classmethod
+    def _allocate_version(cls, session, name, update_time):
+        """
+        Allocate the number of a new version of the registered model by incrementing its maximum
+        version in a single statement, which locks the row of the model until the end of the
+        transaction so that concurrent allocations for the same model are serialized.
+
+        :return: The allocated version number.
+        """
+        num_updated = session.query(SqlRegisteredModel) \
+            .filter(SqlRegisteredModel.name == name) \
+            .update({SqlRegisteredModel.max_version: SqlRegisteredModel.max_version + 1,
+                     SqlRegisteredModel.last_updated_time: update_time},
+                    synchronize_session=False)
+        if num_updated == 0:
+            raise MlflowException('Registered Model with name={} not found'.format(name),
+                                  RESOURCE_DOES_NOT_EXIST)
+        # The transaction reads its own update of the locked row
+        return session.query(SqlRegisteredModel.max_version) \
+            .filter(SqlRegisteredModel.name == name).scalar()
+
+    @classmethod
+    def _record_event(cls, session, event_type, timestamp, name, version=None, stage=None,
+                      previous_name=None):
+        """
+        Record an event of the registry change feed in the transaction of its change. The event
+        has no sequence number until the transaction is committed, so recording it takes no lock
+        shared by changes to different models.
+
+        :param event_type: A :py:class:`RegistryEventType` value.
+        """
+        session.add(SqlRegistryEvent(timestamp=timestamp,
+                                     event_type=RegistryEventType.to_string(event_type),
+                                     name=name, version=version, stage=stage,
+                                     previous_name=previous_name))
+        session.flush()
+        session.info[_RECORDED_EVENTS_SESSION_KEY] = True
+
+    def _number_recorded_events(self, session):
+        """
+        Number the committed events once a transaction recording events is committed, by
+        incrementing the latest sequence number. Its row stays locked until the numbers are
+        committed, which serializes the numbering of events but not the changes recording them.
+        Events are committed before they are numbered, so readers never skip an event, and an event
+        that could not be numbered, e.g. because the server stopped, is numbered after the next
+        change to the registry.
+        """
+        if not session.info.pop(_RECORDED_EVENTS_SESSION_KEY, False):
+            return
+        try:
+            with self.ManagedSessionMaker() as numbering_session:
+                # Lock the row first, so that events are numbered by one transaction at a time
+                num_updated = numbering_session.query(SqlRegistryEventSequence) \
+                    .filter(SqlRegistryEventSequence.id == REGISTRY_EVENT_SEQUENCE_ID) \
+                    .update({SqlRegistryEventSequence.last_sequence:
+                             SqlRegistryEventSequence.last_sequence},
+                            synchronize_session=False)
+                if num_updated == 0:
+                    raise MlflowException("The registry event sequence is not initialized. Run "
+                                          "manual upgrade.", INVALID_STATE)
+                event_ids = [event_id for (event_id,) in numbering_session
+                             .query(SqlRegistryEvent.id)
+                             .filter(SqlRegistryEvent.sequence.is_(None))
+                             .order_by(SqlRegistryEvent.id)]
+                if not event_ids:
+                    return
+                last_sequence = self._get_last_event_sequence(numbering_session)
+                for event_id in event_ids:
+                    last_sequence += 1
+                    numbering_session.query(SqlRegistryEvent) \
+                        .filter(SqlRegistryEvent.id == event_id) \
+                        .update({SqlRegistryEvent.sequence: last_sequence},
+                                synchronize_session=False)
+                numbering_session.query(SqlRegistryEventSequence) \
+                    .filter(SqlRegistryEventSequence.id == REGISTRY_EVENT_SEQUENCE_ID) \
+                    .update({SqlRegistryEventSequence.last_sequence: last_sequence},
+                            synchronize_session=False)
+        except MlflowException as e:
+            # The change itself is committed, so it must not be reported as failed
+            _logger.warning("Failed to number registry events, which will be numbered after the "
+                            "next change to the registry: %s", e)
+
+    @classmethod
+    def _get_last_event_sequence(cls, session):
+        return session.query(SqlRegistryEventSequence.last_sequence) \
+            .filter(SqlRegistryEventSequence.id == REGISTRY_EVENT_SEQUENCE_ID).scalar()
 
     @classmethod
     def _get_sql_model_version(cls, session, model_version):
@@ -304,6 +463,14 @@ class SqlAlchemyStore(AbstractStore):
                 sql_model_version.description = description
             sql_model_version.last_updated_time = updated_time
             self._save_to_db(session, updated_objs + [sql_model_version])
+            if stage is not None:
+                self._record_event(session, RegistryEventType.TRANSITION_MODEL_VERSION_STAGE,
+                                   updated_time, sql_model_version.name,
+                                   version=sql_model_version.version,
+                                   stage=sql_model_version.current_stage)
+            if description is not None:
+                self._record_event(session, RegistryEventType.UPDATE_MODEL_VERSION, updated_time,
+                                   sql_model_version.name, version=sql_model_version.version)
 
     def delete_model_version(self, model_version):
         """
@@ -326,6 +493,8 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version.run_id = "REDACTED-RUN-ID"
             sql_model_version.status_message = None
             self._save_to_db(session, [sql_registered_model, sql_model_version])
+            self._record_event(session, RegistryEventType.DELETE_MODEL_VERSION, updated_time,
+                               sql_model_version.name, version=sql_model_version.version)
 
     def get_model_version_details(self, model_version):
         """
@@ -351,44 +520,181 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version = self._get_sql_model_version(session, model_version)
             return sql_model_version.source
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(self, filter_string, max_results=None, order_by=None,
+                              page_token=None):
         """
-        Search for model versions in backend that satisfy the filter criteria.
-
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        Search for model versions in backend that satisfy the filter criteria. The filter and
+        order_by clauses are compiled to a single SQL query of the page of results.
+
+        :param filter_string: A filter string expression, made of comparisons joined with ``AND``
+                              on the ``name``, ``run_id``, ``source_path``, ``current_stage``,
+                              ``version``, ``creation_timestamp`` and ``last_updated_timestamp``
+                              of model versions, like ``name LIKE 'fraud-%' AND
+                              current_stage = 'Production'`` or ``run_id IN ('a1b2', 'c3d4')``.
+        :param max_results: Maximum number of model versions desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``version``, ``current_stage``,
+                         ``creation_timestamp`` and ``last_updated_timestamp`` of model versions,
+                         like ``creation_timestamp DESC``. Tiebreaks are done by name ASC,
+                         followed by version DESC.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``search_model_versions`` call.
 
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersionDetailed`
-                 objects.
-        """
-        parsed_filter = SearchUtils.parse_filter_for_model_registry(filter_string)
-        if len(parsed_filter) == 0:
-            conditions = []
-        elif len(parsed_filter) == 1:
-            filter_dict = parsed_filter[0]
-            if filter_dict["comparator"] != "=":
-                raise MlflowException('Model Registry search filter only supports equality(=) '
-                                      'comparator. Input filter string: %s' % filter_string,
-                                      error_code=INVALID_PARAMETER_VALUE)
-            if filter_dict["key"] == "name":
-                conditions = [SqlModelVersion.name == filter_dict["value"]]
-            elif filter_dict["key"] == "source_path":
-                conditions = [SqlModelVersion.source == filter_dict["value"]]
-            elif filter_dict["key"] == "run_id":
-                conditions = [SqlModelVersion.run_id == filter_dict["value"]]
-            else:
-                raise MlflowException('Invalid filter string: %s' % filter_string,
-                                      error_code=INVALID_PARAMETER_VALUE)
+                 objects. The token of the next page of results is set if there may be more
+                 results.
+        """
+        if max_results is not None:
+            _validate_max_results(max_results, SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD)
+        conditions = _get_model_version_filter_clauses(
+            SearchUtils.parse_filter_for_model_registry(filter_string))
+        conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
+        order_by_clauses = _get_order_by_clauses(
+            order_by, SearchUtils.VALID_ORDER_BY_KEYS_FOR_MODEL_VERSIONS, _MODEL_VERSION_COLUMNS,
+            [("name", True), ("version", False)])
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        with self.ManagedSessionMaker() as session:
+            query = session.query(SqlModelVersion) \
+                .filter(*conditions) \
+                .order_by(*order_by_clauses) \
+                .offset(offset)
+            if max_results is not None:
+                query = query.limit(max_results)
+            sql_model_versions = query.all()
+            model_versions_detailed = [mv.to_mlflow_detailed_entity() for mv in sql_model_versions]
+            return PagedList(model_versions_detailed,
+                             _get_next_page_token(offset, max_results,
+                                                  len(model_versions_detailed)))
+
+    # Change feed API
+
+    def get_registry_events(self, since=0, max_results=REGISTRY_EVENTS_MAX_RESULTS_DEFAULT,
+                            timeout_seconds=0):
+        """
+        Get the changes made to the registry after the specified event, in the order in which they
+        were made. While there is no new event, the latest sequence number is queried every
+        ``REGISTRY_EVENTS_POLL_INTERVAL_SECONDS`` until ``timeout_seconds`` have elapsed.
+
+        :param since: Sequence number of the last event already received.
+        :param max_results: Maximum number of events desired. If 0, no event is returned and only
+                            the sequence number of the latest event is.
+        :param timeout_seconds: Maximum number of seconds to wait for an event later than
+                                ``since`` if there is none yet.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegistryEvent` objects.
+                 Its token is the sequence number of the last returned event, or of the latest
+                 event if none was returned, to pass as ``since`` to get the subsequent events.
+        """
+        _validate_registry_events_request(since, max_results, timeout_seconds)
+        deadline = time.time() + timeout_seconds
+        while True:
+            with self.ManagedSessionMaker() as session:
+                # Events are numbered after they are committed, along with the latest sequence
+                # number, so all the events up to it are visible
+                last_sequence = self._get_last_event_sequence(session)
+                if last_sequence > since and max_results > 0:
+                    sql_events = session.query(SqlRegistryEvent) \
+                        .filter(SqlRegistryEvent.sequence > since,
+                                SqlRegistryEvent.sequence <= last_sequence) \
+                        .order_by(SqlRegistryEvent.sequence) \
+                        .limit(max_results).all()
+                    events = [sql_event.to_mlflow_entity() for sql_event in sql_events]
+                    return PagedList(events, events[-1].sequence if events else last_sequence)
+            remaining_seconds = deadline - time.time()
+            if last_sequence != since or max_results == 0 or remaining_seconds <= 0:
+                return PagedList([], last_sequence)
+            time.sleep(min(REGISTRY_EVENTS_POLL_INTERVAL_SECONDS, remaining_seconds))
+
+
+# Columns of registered models and model versions by their key in filters and order_by clauses
+_REGISTERED_MODEL_COLUMNS = {
+    "name": SqlRegisteredModel.name,
+    "creation_timestamp": SqlRegisteredModel.creation_time,
+    "last_updated_timestamp": SqlRegisteredModel.last_updated_time,
+}
+
+_MODEL_VERSION_COLUMNS = {
+    "name": SqlModelVersion.name,
+    "version": SqlModelVersion.version,
+    "run_id": SqlModelVersion.run_id,
+    "source_path": SqlModelVersion.source,
+    "current_stage": SqlModelVersion.current_stage,
+    "creation_timestamp": SqlModelVersion.creation_time,
+    "last_updated_timestamp": SqlModelVersion.last_updated_time,
+}
+
+
+def _validate_max_results(max_results, threshold):
+    if max_results < 1 or max_results > threshold:
+        raise MlflowException("Invalid value for request parameter max_results. It must be "
+                              "between 1 and {}, but got value {}".format(threshold, max_results),
+                              INVALID_PARAMETER_VALUE)
+
+
+def _validate_registry_events_request(since, max_results, timeout_seconds):
+    if since < 0:
+        raise MlflowException("Invalid value for request parameter since. It must be at least 0, "
+                              "but got value {}".format(since), INVALID_PARAMETER_VALUE)
+    if max_results < 0 or max_results > REGISTRY_EVENTS_MAX_RESULTS_THRESHOLD:
+        raise MlflowException("Invalid value for request parameter max_results. It must be "
+                              "between 0 and {}, but got value {}".format(
+                                  REGISTRY_EVENTS_MAX_RESULTS_THRESHOLD, max_results),
+                              INVALID_PARAMETER_VALUE)
+    if timeout_seconds < 0 or timeout_seconds > REGISTRY_EVENTS_MAX_TIMEOUT_SECONDS:
+        raise MlflowException("Invalid value for request parameter timeout_seconds. It must be "
+                              "between 0 and {}, but got value {}".format(
+                                  REGISTRY_EVENTS_MAX_TIMEOUT_SECONDS, timeout_seconds),
+                              INVALID_PARAMETER_VALUE)
+
+
+def _get_next_page_token(offset, max_results, num_results):
+    if max_results is not None and num_results == max_results:
+        return SearchUtils.create_page_token(offset + max_results)
+    return None
+
+
+def _get_model_version_filter_clauses(parsed_filter):
+    """
+    :param parsed_filter: Comparisons parsed by ``SearchUtils.parse_filter_for_model_registry``.
+
+    :return: List of SQL conditions on model versions.
+    """
+    clauses = []
+    for comparison in parsed_filter:
+        column = _MODEL_VERSION_COLUMNS[comparison["key"]]
+        comparator = comparison["comparator"]
+        value = comparison["value"]
+        # Stages are stored in their canonical form, which patterns must match as is
+        if comparison["key"] == "current_stage" and comparator not in ("LIKE", "ILIKE"):
+            value = [get_canonical_stage(stage) for stage in value] if comparator == "IN" \
+                else get_canonical_stage(value)
+        if comparator == "IN":
+            clauses.append(column.in_(value))
+        elif comparator == "LIKE":
+            clauses.append(column.like(value))
+        elif comparator == "ILIKE":
+            clauses.append(column.ilike(value))
         else:
-            raise MlflowException('Model Registry expects filter to be one of '
-                                  '"name = \'<model_name>\'" or '
-                                  '"source_path = \'<source_path>\'" or "run_id = \'<run_id>\'.'
-                                  'Input filter string: %s. ' % filter_string,
-                                  error_code=INVALID_PARAMETER_VALUE)
+            clauses.append(SearchUtils.filter_ops[comparator](column, value))
+    return clauses
 
-        with self.ManagedSessionMaker() as session:
-            conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
-            sql_model_version = session.query(SqlModelVersion).filter(*conditions).all()
-            model_versions_detailed = [mv.to_mlflow_detailed_entity() for mv in sql_model_version]
-            return PagedList(model_versions_detailed, None)
+
+def _get_order_by_clauses(order_by_list, valid_keys, columns, tiebreaks):
+    """
+    :param order_by_list: List of order_by clauses of the form ``<key> [ASC|DESC]``.
+    :param valid_keys: Set of the keys by which results may be ordered.
+    :param columns: Dictionary mapping keys to their column.
+    :param tiebreaks: List of ``(key, ascending)`` tuples by which results are ordered after the
+                      order_by clauses, unless they already order results by the key.
+
+    :return: List of SQL ordering clauses.
+    """
+    ordering = [SearchUtils.parse_order_by_for_model_registry(order_by, valid_keys)
+                for order_by in order_by_list or []]
+    clauses = []
+    ordered_keys = set()
+    # Some databases reject ordering by the same column more than once
+    for key, ascending in ordering + tiebreaks:
+        if key not in ordered_keys:
+            ordered_keys.add(key)
+            clauses.append(columns[key].asc() if ascending else columns[key].desc())
+    return clauses
@@ -117,6 +117,19 @@ class AbstractStore:
         """
         pass
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from the backend store. Each run is returned with the same contents as
+        :py:func:`get_run`. Subclasses should override this method with a batched implementation
+        where the backend allows it; the default implementation fetches runs one at a time.
+
+        :param run_ids: List of unique identifiers for the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the same order as
+                 ``run_ids``. Raises an exception if any of the runs does not exist.
+        """
+        return [self.get_run(run_id) for run_id in run_ids]
+
     @abstractmethod
     def update_run_info(self, run_id, run_status, end_time):
         """
@@ -4,6 +4,7 @@ import posixpath
 import sys
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.entities import Experiment, Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
     ViewType, SourceType, ExperimentTag
@@ -27,6 +28,9 @@ from mlflow.utils.string_utils import is_string_type
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
 
+# Number of threads used by ``FileStore.get_runs`` to read run directories concurrently
+_GET_RUNS_MAX_WORKERS = 8
+
 
 def _default_root_dir():
     return get_env(_TRACKING_DIR_ENV_VAR) or os.path.abspath(DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH)
@@ -401,6 +405,17 @@ class FileStore(AbstractStore):
         tags = self.get_all_tags(run_id)
         return Run(run_info, RunData(metrics, params, tags))
 
+    def get_runs(self, run_ids):
+        """
+        Note: Will get both active and deleted runs. Runs are read concurrently, since fetching a
+        single run requires reading one file per metric, param, and tag.
+        """
+        run_ids = list(run_ids)
+        if len(run_ids) <= 1:
+            return [self.get_run(run_id) for run_id in run_ids]
+        with ThreadPoolExecutor(max_workers=min(_GET_RUNS_MAX_WORKERS, len(run_ids))) as executor:
+            return list(executor.map(self.get_run, run_ids))
+
     def _get_run_info(self, run_uuid):
         """
         Note: Will get both active and deleted runs.
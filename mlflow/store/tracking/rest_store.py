@@ -1,15 +1,21 @@
+import os
+import posixpath
+
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
-    GetRun, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, SetTag, \
+    GetRun, GetRuns, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, SetTag, \
     UpdateRun, CreateRun, DeleteRun, RestoreRun, DeleteExperiment, RestoreExperiment, \
     UpdateExperiment, LogBatch, DeleteTag, SetExperimentTag, GetExperimentByName
+from mlflow.store.artifact.bundle import extract_artifact_bundle, validate_compression
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.utils.proto_json_utils import message_to_json
-from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
+from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service, http_request, \
+    verify_rest_response, _can_parse_as_json
 
 _PATH_PREFIX = "/api/2.0"
+_ARTIFACT_BUNDLE_ENDPOINT = "/get-artifact-bundle"
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _PATH_PREFIX)
 
 
@@ -92,6 +98,19 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from backend store with a single request
+
+        :param run_ids: List of unique identifiers for the runs
+
+        :return: A list of Run objects in the order of ``run_ids``. Raises an Exception if any of
+                 the runs does not exist
+        """
+        req_body = message_to_json(GetRuns(run_ids=run_ids))
+        response_proto = self._call_endpoint(GetRuns, req_body)
+        return [Run.from_proto(run_proto) for run_proto in response_proto.runs]
+
     def update_run_info(self, run_id, run_status, end_time):
         """ Updates the metadata of the specified run. """
         req_body = message_to_json(UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status,
@@ -239,6 +258,37 @@ class RestStore(AbstractStore):
             LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id))
         self._call_endpoint(LogBatch, req_body)
 
+    def download_artifact_bundle(self, run_id, path, dst_path, compression=None):
+        """
+        Download an artifact file or directory of a run from the tracking server in a single
+        request, as a tar archive streamed by the server and extracted as it is received.
+
+        :param run_id: ID of the run whose artifacts to download.
+        :param path: Relative source path of the artifact file or directory to download, or
+                     ``None`` to download all the artifacts of the run.
+        :param dst_path: Local directory to which to download the artifacts. It must already
+                         exist. The artifacts are extracted under the basename of ``path``.
+        :param compression: Compression of the archive, one of ``"none"`` (the default),
+                            ``"gzip"`` or ``"zstd"``.
+        :return: Local path of the downloaded artifacts.
+        """
+        compression = validate_compression(compression)
+        params = {"run_id": run_id, "compression": compression}
+        if path:
+            params["path"] = path
+        response = http_request(self.get_host_creds(), _ARTIFACT_BUNDLE_ENDPOINT, method="GET",
+                                params=params, stream=True)
+        try:
+            if response.status_code == 404 and not _can_parse_as_json(response.text):
+                raise MlflowException("The tracking server does not serve artifact bundles",
+                                      databricks_pb2.ENDPOINT_NOT_FOUND)
+            verify_rest_response(response, _ARTIFACT_BUNDLE_ENDPOINT)
+            response.raw.decode_content = True
+            extract_artifact_bundle(response.raw, dst_path, compression)
+        finally:
+            response.close()
+        return os.path.join(dst_path, posixpath.basename(path.strip("/"))) if path else dst_path
+
 
 class DatabricksRestStore(RestStore):
     """
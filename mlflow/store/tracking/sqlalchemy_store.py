@@ -37,6 +37,10 @@ _logger = logging.getLogger(__name__)
 # and https://docs.sqlalchemy.org/en/latest/orm/mapping_api.html#sqlalchemy.orm.mapper.Mapper
 sqlalchemy.orm.configure_mappers()
 
+# Maximum number of run IDs bound into a single ``IN`` clause by ``get_runs``, chosen to stay below
+# the bound parameter limits of the supported databases (e.g. 999 for older SQLite versions)
+_GET_RUNS_BATCH_SIZE = 500
+
 
 class SqlAlchemyStore(AbstractStore):
     """
@@ -415,6 +419,28 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session, eager=True)
             return run.to_mlflow_entity()
 
+    def get_runs(self, run_ids):
+        run_ids = list(run_ids)
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        runs_by_id = {}
+        with self.ManagedSessionMaker() as session:
+            # Fetch runs with one ``IN`` query per batch of IDs, eagerly loading their summary
+            # metrics, params, and tags in a constant number of additional queries per batch
+            for start in range(0, len(run_ids), _GET_RUNS_BATCH_SIZE):
+                batch = run_ids[start:start + _GET_RUNS_BATCH_SIZE]
+                sql_runs = session \
+                    .query(SqlRun) \
+                    .options(*self._get_eager_run_query_options()) \
+                    .filter(SqlRun.run_uuid.in_(batch)).all()
+                for sql_run in sql_runs:
+                    runs_by_id[sql_run.run_uuid] = sql_run.to_mlflow_entity()
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in runs_by_id]
+        if missing_run_ids:
+            raise MlflowException('Runs with ids={} not found'.format(missing_run_ids),
+                                  RESOURCE_DOES_NOT_EXIST)
+        return [runs_by_id[run_id] for run_id in run_ids]
+
     def restore_run(self, run_id):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -6,6 +6,8 @@ exposed in the :py:mod:`mlflow.tracking` module.
 
 from mlflow.entities.model_registry import ModelVersion, RegisteredModel
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.resolution_cache import invalidate_model_uri_cache
+from mlflow.store.model_registry import REGISTRY_EVENTS_MAX_RESULTS_DEFAULT
 from mlflow.tracking._model_registry import utils
 
 
@@ -50,7 +52,10 @@ class ModelRegistryClient(object):
             raise MlflowException("Attempting to update registered model with no new field values.")
         if new_name is not None and new_name.strip() == "":
             raise MlflowException("The new name must not be an empty string.")
-        return self.store.update_registered_model(RegisteredModel(name), new_name, description)
+        updated_model = self.store.update_registered_model(RegisteredModel(name), new_name,
+                                                           description)
+        invalidate_model_uri_cache(name)
+        return updated_model
 
     def delete_registered_model(self, name):
         """
@@ -60,14 +65,25 @@ class ModelRegistryClient(object):
         :param name: Name of the registered model to update.
         """
         self.store.delete_registered_model(RegisteredModel(name))
+        invalidate_model_uri_cache(name)
 
-    def list_registered_models(self):
+    def list_registered_models(self, max_results=None, order_by=None, page_token=None):
         """
         List of all registered models.
 
-        :return: List of :py:class:`mlflow.entities.registry.RegisteredModel` objects.
+        :param max_results: Maximum number of registered models desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``creation_timestamp`` and
+                         ``last_updated_timestamp`` of models, like ``creation_timestamp DESC``.
+                         Models are ordered by name if unspecified, which is also the tiebreak.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``list_registered_models`` call.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
-        return self.store.list_registered_models()
+        return self.store.list_registered_models(max_results=max_results, order_by=order_by,
+                                                 page_token=page_token)
 
     def get_registered_model_details(self, name):
         """
@@ -100,7 +116,9 @@ class ModelRegistryClient(object):
         :return: Single :py:class:`mlflow.entities.model_registry.ModelVersion` object created by
                  backend.
         """
-        return self.store.create_model_version(name, source, run_id)
+        model_version = self.store.create_model_version(name, source, run_id)
+        invalidate_model_uri_cache(name)
+        return model_version
 
     def update_model_version(self, name, version, stage=None, description=None):
         """
@@ -117,6 +135,7 @@ class ModelRegistryClient(object):
             raise MlflowException("The stage must not be an empty string.")
         self.store.update_model_version(ModelVersion(RegisteredModel(name), version), stage,
                                         description)
+        invalidate_model_uri_cache(name)
 
     def delete_model_version(self, name, version):
         """
@@ -126,6 +145,7 @@ class ModelRegistryClient(object):
         :param version: Version number of the model version.
         """
         self.store.delete_model_version(ModelVersion(RegisteredModel(name), version))
+        invalidate_model_uri_cache(name)
 
     def get_model_version_details(self, name, version):
         """
@@ -146,16 +166,50 @@ class ModelRegistryClient(object):
         return self.store.get_model_version_download_uri(
             ModelVersion(RegisteredModel(name), version))
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(self, filter_string, max_results=None, order_by=None,
+                              page_token=None):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
-        :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
-        """
-        return self.store.search_model_versions(filter_string)
+        :param filter_string: A filter string expression, made of comparisons joined with ``AND``
+                              on the ``name``, ``run_id``, ``source_path``, ``current_stage``,
+                              ``version``, ``creation_timestamp`` and ``last_updated_timestamp``
+                              of model versions, like ``name LIKE 'fraud-%' AND
+                              current_stage = 'Production'`` or ``run_id IN ('a1b2', 'c3d4')``.
+        :param max_results: Maximum number of model versions desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``version``, ``current_stage``,
+                         ``creation_timestamp`` and ``last_updated_timestamp`` of model versions,
+                         like ``creation_timestamp DESC``. Tiebreaks are done by name ASC,
+                         followed by version DESC.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``search_model_versions`` call.
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersionDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
+        """
+        return self.store.search_model_versions(
+            filter_string, max_results=max_results, order_by=order_by, page_token=page_token)
+
+    def get_registry_events(self, since=0, max_results=REGISTRY_EVENTS_MAX_RESULTS_DEFAULT,
+                            timeout_seconds=0):
+        """
+        Get the changes made to the registry after the specified event, in the order in which they
+        were made. Clients can follow these events to keep a local copy of registry state, such
+        as the latest versions of models, up to date: get the latest sequence number with
+        ``max_results=0``, read the state, then repeatedly get the subsequent events, with a
+        ``timeout_seconds`` to wait for them, and update the state of the models they name.
+
+        :param since: Sequence number of the last event already received.
+        :param max_results: Maximum number of events desired. If 0, no event is returned and only
+                            the sequence number of the latest event is.
+        :param timeout_seconds: Maximum number of seconds to wait for an event later than
+                                ``since`` if there is none yet, up to 20.
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegistryEvent` objects.
+                 Its token is the sequence number of the last returned event, or of the latest
+                 event if none was returned, to pass as ``since`` to get the subsequent events.
+        """
+        return self.store.get_registry_events(
+            since=since, max_results=max_results, timeout_seconds=timeout_seconds)
 
     def get_model_version_stages(self, name, version):
         """
@@ -47,6 +47,20 @@ class TrackingServiceClient(object):
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from the backend store in a single batch. Each run has the same
+        contents as the result of :py:func:`get_run`.
+
+        :param run_ids: List of unique identifiers for the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the same order as
+                 ``run_ids``. Raises an exception if any of the runs does not exist.
+        """
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        return self.store.get_runs(run_ids)
+
     def get_metric_history(self, run_id, key):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
@@ -247,16 +261,22 @@ class TrackingServiceClient(object):
         else:
             artifact_repo.log_artifact(local_path, artifact_path)
 
-    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+    def log_artifacts(self, run_id, local_dir, artifact_path=None, sync=False):
         """
         Write a directory of files to the remote ``artifact_uri``.
 
         :param local_dir: Path to the directory of files to write.
         :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+        :param sync: If True, only write the files that are new or whose contents differ from the
+                     files already written to the same path.
         """
         run = self.get_run(run_id)
         artifact_repo = get_artifact_repository(run.info.artifact_uri)
-        artifact_repo.log_artifacts(local_dir, artifact_path)
+        if sync:
+            artifact_repo.log_artifacts(local_dir, artifact_path, sync=True)
+        else:
+            # Artifact repositories of plugins may not support synchronization
+            artifact_repo.log_artifacts(local_dir, artifact_path)
 
     def list_artifacts(self, run_id, path=None):
         """
@@ -1,16 +1,30 @@
 """
 Utilities for dealing with artifacts in the context of a Run.
 """
+import logging
+import os
 import posixpath
+import tempfile
 
 from six.moves import urllib
 
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, INVALID_PARAMETER_VALUE, ErrorCode
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+from mlflow.store.tracking.rest_store import DatabricksRestStore, RestStore
 from mlflow.tracking._tracking_service.utils import _get_store
 
+# Environment variables controlling whether the artifacts of runs are downloaded from the tracking
+# server as a single archive when the tracking URI is a tracking server (set to "false" to
+# download them from the artifact store instead), and the compression of the archive ("none" by
+# default, "gzip" or "zstd").
+ARTIFACT_BUNDLE_DOWNLOAD_ENV_VAR = "MLFLOW_ARTIFACT_BUNDLE_DOWNLOAD"
+ARTIFACT_BUNDLE_COMPRESSION_ENV_VAR = "MLFLOW_ARTIFACT_BUNDLE_COMPRESSION"
+
+_logger = logging.getLogger(__name__)
+
 
 def get_artifact_uri(run_id, artifact_path=None):
     """
@@ -54,6 +68,12 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
     :param output_path: The local filesystem path to which to download the artifact. If unspecified,
                         a local output path will be created.
     """
+    if RunsArtifactRepository.is_runs_uri(artifact_uri):
+        (run_id, artifact_path) = RunsArtifactRepository.parse_runs_uri(artifact_uri)
+        local_path = _download_artifact_bundle(run_id, artifact_path, output_path)
+        if local_path is not None:
+            return local_path
+
     parsed_uri = urllib.parse.urlparse(artifact_uri)
     prefix = ""
     if parsed_uri.scheme and not parsed_uri.path.startswith("/"):
@@ -73,3 +93,32 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
 
     return get_artifact_repository(artifact_uri=root_uri).download_artifacts(
         artifact_path=artifact_path, dst_path=output_path)
+
+
+def _download_artifact_bundle(run_id, artifact_path=None, output_path=None):
+    """
+    Download an artifact file or directory of a run in a single request, as an archive streamed by
+    the tracking server, if the tracking URI is a tracking server that serves artifact bundles.
+
+    :return: The local path of the downloaded artifacts, or None if they must be downloaded from
+             the artifact store instead.
+    """
+    if os.environ.get(ARTIFACT_BUNDLE_DOWNLOAD_ENV_VAR, "true").lower() == "false":
+        return None
+    store = _get_store()
+    # Databricks does not serve the artifacts of runs through its tracking service
+    if not isinstance(store, RestStore) or isinstance(store, DatabricksRestStore):
+        return None
+    dst_path = output_path if output_path is not None else tempfile.mkdtemp()
+    try:
+        return store.download_artifact_bundle(
+            run_id, artifact_path, os.path.abspath(dst_path),
+            compression=os.environ.get(ARTIFACT_BUNDLE_COMPRESSION_ENV_VAR))
+    except MlflowException as e:
+        if e.error_code != ErrorCode.Name(ENDPOINT_NOT_FOUND):
+            raise
+        if output_path is None:
+            os.rmdir(dst_path)
+        _logger.debug("Downloading artifacts of run %s from the artifact store: %s", run_id,
+                      e.message)
+        return None
@@ -7,6 +7,7 @@ and is exposed in the :py:mod:`mlflow.tracking` module.
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import FEATURE_DISABLED
+from mlflow.store.model_registry import REGISTRY_EVENTS_MAX_RESULTS_DEFAULT
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._model_registry.client import ModelRegistryClient
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
@@ -91,6 +92,18 @@ class MlflowClient(object):
         """
         return self._tracking_client.get_run(run_id)
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from the backend store in a single batch, avoiding a separate request
+        per run. Each run has the same contents as the result of :py:func:`get_run`.
+
+        :param run_ids: List of unique identifiers for the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the same order as
+                 ``run_ids``. Raises an exception if any of the runs does not exist.
+        """
+        return self._tracking_client.get_runs(run_ids)
+
     def get_metric_history(self, run_id, key):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
@@ -250,14 +263,18 @@ class MlflowClient(object):
         """
         self._tracking_client.log_artifact(run_id, local_path, artifact_path)
 
-    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+    def log_artifacts(self, run_id, local_dir, artifact_path=None, sync=False):
         """
         Write a directory of files to the remote ``artifact_uri``.
 
         :param local_dir: Path to the directory of files to write.
         :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+        :param sync: If True, only write the files that are new or whose contents differ from the
+                     files already written to the same path, e.g. to log a checkpoint directory
+                     after every epoch. Supported by local, S3, GCS and Azure artifact
+                     repositories; other repositories write all the files.
         """
-        self._tracking_client.log_artifacts(run_id, local_dir, artifact_path)
+        self._tracking_client.log_artifacts(run_id, local_dir, artifact_path, sync=sync)
 
     def list_artifacts(self, run_id, path=None):
         """
@@ -368,13 +385,23 @@ class MlflowClient(object):
         self._get_registry_client().delete_registered_model(name)
 
     @experimental
-    def list_registered_models(self):
+    def list_registered_models(self, max_results=None, order_by=None, page_token=None):
         """
         List of all registered models.
 
-        :return: List of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects.
+        :param max_results: Maximum number of registered models desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``creation_timestamp`` and
+                         ``last_updated_timestamp`` of models, like ``creation_timestamp DESC``.
+                         Models are ordered by name if unspecified, which is also the tiebreak.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``list_registered_models`` call.
+
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModelDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
-        return self._get_registry_client().list_registered_models()
+        return self._get_registry_client().list_registered_models(
+            max_results=max_results, order_by=order_by, page_token=page_token)
 
     def get_registered_model_details(self, name):
         """
@@ -454,16 +481,51 @@ class MlflowClient(object):
         return self._get_registry_client().get_model_version_download_uri(name, version)
 
     @experimental
-    def search_model_versions(self, filter_string):
+    def search_model_versions(self, filter_string, max_results=None, order_by=None,
+                              page_token=None):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
-        :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        :param filter_string: A filter string expression, made of comparisons joined with ``AND``
+                              on the ``name``, ``run_id``, ``source_path``, ``current_stage``,
+                              ``version``, ``creation_timestamp`` and ``last_updated_timestamp``
+                              of model versions, like ``name LIKE 'fraud-%' AND
+                              current_stage = 'Production'`` or ``run_id IN ('a1b2', 'c3d4')``.
+        :param max_results: Maximum number of model versions desired, or None for all of them.
+        :param order_by: List of order_by clauses on the ``name``, ``version``, ``current_stage``,
+                         ``creation_timestamp`` and ``last_updated_timestamp`` of model versions,
+                         like ``creation_timestamp DESC``. Tiebreaks are done by name ASC,
+                         followed by version DESC.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                           a ``search_model_versions`` call.
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersionDetailed`
+                 objects. The token of the next page of results is set if there may be more
+                 results.
         """
-        return self._get_registry_client().search_model_versions(filter_string)
+        return self._get_registry_client().search_model_versions(
+            filter_string, max_results=max_results, order_by=order_by, page_token=page_token)
+
+    @experimental
+    def get_registry_events(self, since=0, max_results=REGISTRY_EVENTS_MAX_RESULTS_DEFAULT,
+                            timeout_seconds=0):
+        """
+        Get the changes made to the registry after the specified event, in the order in which they
+        were made. Clients can follow these events to keep a local copy of registry state, such
+        as the latest versions of models, up to date: get the latest sequence number with
+        ``max_results=0``, read the state, then repeatedly get the subsequent events, with a
+        ``timeout_seconds`` to wait for them, and update the state of the models they name.
+
+        :param since: Sequence number of the last event already received.
+        :param max_results: Maximum number of events desired. If 0, no event is returned and only
+                            the sequence number of the latest event is.
+        :param timeout_seconds: Maximum number of seconds to wait for an event later than
+                                ``since`` if there is none yet, up to 20.
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.RegistryEvent` objects.
+                 Its token is the sequence number of the last returned event, or of the latest
+                 event if none was returned, to pass as ``since`` to get the subsequent events.
+        """
+        return self._get_registry_client().get_registry_events(
+            since=since, max_results=max_results, timeout_seconds=timeout_seconds)
 
     @experimental
     def get_model_version_stages(self, name, version):
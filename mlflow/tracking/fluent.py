@@ -311,16 +311,20 @@ def log_artifact(local_path, artifact_path=None):
     MlflowClient().log_artifact(run_id, local_path, artifact_path)
 
 
-def log_artifacts(local_dir, artifact_path=None):
+def log_artifacts(local_dir, artifact_path=None, sync=False):
     """
     Log all the contents of a local directory as artifacts of the run. If no run is active,
     this method will create a new active run.
 
     :param local_dir: Path to the directory of files to write.
     :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+    :param sync: If True, only write the files that are new or whose contents differ from the
+                 files already written to the same path, e.g. to log a checkpoint directory
+                 after every epoch. Supported by local, S3, GCS and Azure artifact repositories;
+                 other repositories write all the files.
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_artifacts(run_id, local_dir, artifact_path)
+    MlflowClient().log_artifacts(run_id, local_dir, artifact_path, sync=sync)
 
 
 def get_experiment(experiment_id):
@@ -1,3 +1,6 @@
+import json
+import math
+
 from google.protobuf.json_format import MessageToJson, ParseDict
 
 
@@ -6,6 +9,48 @@ def message_to_json(message):
     return MessageToJson(message, preserving_proto_field_name=True)
 
 
+def dict_to_json(js_dict):
+    """
+    Compactly serializes a dictionary produced by an entity's ``_to_json_dict`` method. The
+    output is semantically equivalent to calling :py:func:`message_to_json` on the corresponding
+    proto, but avoids building the intermediate proto and pretty-printing the result.
+    """
+    return json.dumps(js_dict, separators=(",", ":"))
+
+
+def omit_unset_fields(js_dict):
+    """
+    :return: A copy of ``js_dict`` without its ``None`` values, which correspond to unset proto
+             fields and are omitted by :py:func:`message_to_json`.
+    """
+    return {key: value for key, value in js_dict.items() if value is not None}
+
+
+def int64_to_json(value):
+    """
+    Converts an int64 field value to JSON the way protobuf does, i.e. as a string. ``None`` is
+    returned as is.
+    """
+    if value is None:
+        return None
+    return str(int(value))
+
+
+def double_to_json(value):
+    """
+    Converts a double field value to JSON the way protobuf does, spelling out NaN/Infinity.
+    ``None`` is returned as is.
+    """
+    if value is None:
+        return None
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
 def _stringify_all_experiment_ids(x):
     """Converts experiment_id fields which are defined as ints into strings in the given json.
     This is necessary for backwards- and forwards-compatibility with MLflow clients/servers
@@ -2,8 +2,10 @@ import base64
 import time
 import logging
 import json
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
@@ -19,9 +21,30 @@ _DEFAULT_HEADERS = {
     'User-Agent': 'mlflow-python-client/%s' % __version__
 }
 
+_request_sessions = {}
+_request_sessions_lock = threading.Lock()
+
+
+def get_request_session(max_pool_connections=10):
+    """
+    :return: A ``requests.Session`` shared by all callers requesting the same connection pool size,
+             whose connections to each host are kept alive and reused by subsequent requests.
+             Sessions can be used by multiple threads at once, up to ``max_pool_connections``
+             threads per host without opening new connections.
+    """
+    with _request_sessions_lock:
+        if max_pool_connections not in _request_sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_pool_connections,
+                                  pool_maxsize=max_pool_connections)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _request_sessions[max_pool_connections] = session
+        return _request_sessions[max_pool_connections]
+
 
 def http_request(host_creds, endpoint, retries=3, retry_interval=3,
-                 max_rate_limit_interval=60, **kwargs):
+                 max_rate_limit_interval=60, session=None, **kwargs):
     """
     Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
     error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
@@ -31,6 +54,8 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3,
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param session: Optional ``requests.Session`` with which to make the request, e.g. from
+        :py:func:`get_request_session` to reuse connections across requests.
     :return: Parsed API response
     """
     hostname = host_creds.host
@@ -47,8 +72,10 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3,
 
     verify = not host_creds.ignore_tls_verification
 
+    request = session.request if session is not None else requests.request
+
     def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
+        response = request(**kwargs)
         time_left = max_rate_limit_interval
         sleep = 1
         while response.status_code == 429 and time_left > 0:
@@ -59,7 +86,7 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3,
                 sleep, time_left)
             time.sleep(sleep)
             time_left -= sleep
-            response = requests.request(**kwargs)
+            response = request(**kwargs)
             sleep = min(time_left, sleep*2)  # sleep for 1, 2, 4, ... seconds;
         return response
 
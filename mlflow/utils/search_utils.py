@@ -415,33 +415,108 @@ class SearchUtils(object):
     # TODO: Tech debt. Refactor search code into common utils, tracking server, and model
     #       registry specific code.
 
-    VALID_SEARCH_KEYS_FOR_MODEL_REGISTRY = set(["name", "run_id", "source_path"])
+    VALID_STRING_SEARCH_KEYS_FOR_MODEL_REGISTRY = set(["name", "run_id", "source_path",
+                                                       "current_stage"])
+    VALID_NUMERIC_SEARCH_KEYS_FOR_MODEL_REGISTRY = set(["version", "creation_timestamp",
+                                                        "last_updated_timestamp"])
+    VALID_SEARCH_KEYS_FOR_MODEL_REGISTRY = VALID_STRING_SEARCH_KEYS_FOR_MODEL_REGISTRY.union(
+        VALID_NUMERIC_SEARCH_KEYS_FOR_MODEL_REGISTRY)
+    VALID_STRING_COMPARATORS_FOR_MODEL_REGISTRY = set(['=', '!=', 'LIKE', 'ILIKE', 'IN'])
+    VALID_NUMERIC_COMPARATORS_FOR_MODEL_REGISTRY = set(['>', '>=', '!=', '=', '<', '<=', 'IN'])
+    VALID_ORDER_BY_KEYS_FOR_MODEL_VERSIONS = set(["name", "version", "current_stage",
+                                                  "creation_timestamp", "last_updated_timestamp"])
+    VALID_ORDER_BY_KEYS_FOR_REGISTERED_MODELS = set(["name", "creation_timestamp",
+                                                     "last_updated_timestamp"])
 
     @classmethod
-    def _get_comparison_for_model_registry(cls, comparison):
-        stripped_comparison = [token for token in comparison.tokens if not token.is_whitespace]
-        cls._validate_comparison(stripped_comparison)
-        key = stripped_comparison[0].value
+    def _get_value_for_model_registry(cls, key, token):
+        if key in cls.VALID_NUMERIC_SEARCH_KEYS_FOR_MODEL_REGISTRY:
+            if token.ttype not in TokenType.Literal.Number.Integer:
+                raise MlflowException("Expected an integer value for '{key}'. Got value "
+                                      "{value}".format(key=key, value=token.value),
+                                      error_code=INVALID_PARAMETER_VALUE)
+            return int(token.value)
+        if token.ttype not in cls.STRING_VALUE_TYPES:
+            raise MlflowException("Expected a quoted string value for '{key}'. Got value "
+                                  "{value}".format(key=key, value=token.value),
+                                  error_code=INVALID_PARAMETER_VALUE)
+        return cls._strip_quotes(token.value, expect_quoted_value=True)
+
+    @classmethod
+    def _get_comparison_for_model_registry(cls, tokens, expected):
+        """
+        Consume the tokens of the comparison at the start of ``tokens``.
+
+        :return: Dictionary with the ``key``, ``comparator`` and ``value`` of the comparison.
+        """
+        def next_token(description):
+            if not tokens:
+                raise MlflowException("Invalid filter: expected {} at the end of the filter. "
+                                      "{}".format(description, expected),
+                                      error_code=INVALID_PARAMETER_VALUE)
+            return tokens.pop(0)
+
+        # Keys may be tokenized as keywords, like "version"
+        key = next_token("a key").value
         if key not in cls.VALID_SEARCH_KEYS_FOR_MODEL_REGISTRY:
             raise MlflowException("Invalid attribute key '{}' specified. Valid keys "
-                                  " are '{}'".format(key, cls.VALID_SEARCH_KEYS_FOR_MODEL_REGISTRY))
-        value_token = stripped_comparison[2]
-        if value_token.ttype not in cls.STRING_VALUE_TYPES:
-            raise MlflowException("Expected a quoted string value for attributes. "
-                                  "Got value {value}".format(value=value_token.value),
+                                  " are '{}'".format(key, cls.VALID_SEARCH_KEYS_FOR_MODEL_REGISTRY),
                                   error_code=INVALID_PARAMETER_VALUE)
-        comp = {
-            "key": key,
-            "comparator": stripped_comparison[1].value,
-            "value": cls._strip_quotes(value_token.value, expect_quoted_value=True)
-        }
-        return comp
+        comparator = " ".join(next_token("a comparator").value.upper().split())
+        valid_comparators = cls.VALID_NUMERIC_COMPARATORS_FOR_MODEL_REGISTRY \
+            if key in cls.VALID_NUMERIC_SEARCH_KEYS_FOR_MODEL_REGISTRY \
+            else cls.VALID_STRING_COMPARATORS_FOR_MODEL_REGISTRY
+        if comparator not in valid_comparators:
+            raise MlflowException("Invalid comparator '{}' for '{}'. Valid comparators are "
+                                  "'{}'".format(comparator, key, valid_comparators),
+                                  error_code=INVALID_PARAMETER_VALUE)
+        if comparator != "IN":
+            value = cls._get_value_for_model_registry(key, next_token("a value"))
+        else:
+            if not next_token("a list of values").match(TokenType.Punctuation, "("):
+                raise MlflowException("Expected a list of values in parentheses for the IN "
+                                      "comparator of '{}'. {}".format(key, expected),
+                                      error_code=INVALID_PARAMETER_VALUE)
+            value = []
+            while True:
+                value.append(cls._get_value_for_model_registry(key, next_token("a value")))
+                separator = next_token("',' or ')'")
+                if separator.match(TokenType.Punctuation, ")"):
+                    break
+                if not separator.match(TokenType.Punctuation, ","):
+                    raise MlflowException("Invalid token '{}' in the list of values of '{}'. "
+                                          "{}".format(separator.value, key, expected),
+                                          error_code=INVALID_PARAMETER_VALUE)
+        return {"key": key, "comparator": comparator, "value": value}
+
+    @classmethod
+    def _flatten_for_model_registry(cls, token_list):
+        """Yield the non-whitespace tokens of the token list, with identifiers kept whole."""
+        for token in token_list.tokens:
+            if token.is_group and not isinstance(token, Identifier):
+                for sub_token in cls._flatten_for_model_registry(token):
+                    yield sub_token
+            elif not token.is_whitespace:
+                yield token
 
     @classmethod
     def parse_filter_for_model_registry(cls, filter_string):
+        """
+        Parse a filter of model versions, made of comparisons joined with ``AND``. Comparisons are
+        of the form ``<key> <comparator> <value>``, where the value is a quoted string for the
+        ``name``, ``run_id``, ``source_path`` and ``current_stage`` keys, which support the
+        ``=``, ``!=``, ``LIKE``, ``ILIKE`` and ``IN`` comparators, and an integer for the
+        ``version``, ``creation_timestamp`` and ``last_updated_timestamp`` keys, which support
+        ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` and ``IN``. The value of ``IN`` comparisons
+        is a list of values in parentheses, like ``run_id IN ('a1b2', 'c3d4')``.
+
+        :return: List of dictionaries with the ``key``, upper case ``comparator`` and ``value``
+                 of each comparison. The value of ``IN`` comparisons is a list of values.
+        """
         if not filter_string or filter_string == "":
             return []
-        expected = "Expected search filter with single comparison operator. e.g. name='myModelName'"
+        expected = "Expected search filter with comparisons joined with AND. " \
+                   "e.g. name='myModelName' AND current_stage='Production'"
         try:
             parsed = sqlparse.parse(filter_string)
         except Exception:
@@ -454,12 +529,38 @@ class SearchUtils(object):
             raise MlflowException("Search filter '%s' contains multiple expressions. "
                                   "%s " % (filter_string, expected),
                                   error_code=INVALID_PARAMETER_VALUE)
-        statement = parsed[0]
-        invalids = list(filter(cls._invalid_statement_token, statement.tokens))
-        if len(invalids) > 0:
-            invalid_clauses = ", ".join("'%s'" % token for token in invalids)
-            raise MlflowException("Invalid clause(s) in filter string: %s. "
-                                  "%s" % (invalid_clauses, expected),
+        # sqlparse does not group comparisons with IN or with keys that are SQL keywords, so the
+        # comparisons are read from the flattened tokens of the statement
+        tokens = list(cls._flatten_for_model_registry(parsed[0]))
+        comparisons = [cls._get_comparison_for_model_registry(tokens, expected)]
+        while tokens:
+            conjunction = tokens.pop(0)
+            if not conjunction.match(TokenType.Keyword, ["AND"]):
+                raise MlflowException("Invalid clause(s) in filter string: '%s'. "
+                                      "%s" % (conjunction.value, expected),
+                                      error_code=INVALID_PARAMETER_VALUE)
+            comparisons.append(cls._get_comparison_for_model_registry(tokens, expected))
+        return comparisons
+
+    @classmethod
+    def parse_order_by_for_model_registry(cls, order_by, valid_keys):
+        """
+        Parse an order_by clause of the form ``<key> [ASC|DESC]``.
+
+        :param valid_keys: Set of the keys by which results may be ordered.
+
+        :return: Tuple of the key and of whether to sort in ascending order.
+        """
+        tokens = order_by.split() if order_by else []
+        if len(tokens) == 2 and tokens[1].upper() in ("ASC", "DESC"):
+            is_ascending = tokens[1].upper() == "ASC"
+        elif len(tokens) == 1:
+            is_ascending = True
+        else:
+            raise MlflowException("Invalid order_by clause '%s'. Could not be parsed." %
+                                  order_by, error_code=INVALID_PARAMETER_VALUE)
+        if tokens[0] not in valid_keys:
+            raise MlflowException("Invalid order_by key '{}' specified. Valid keys "
+                                  " are '{}'".format(tokens[0], valid_keys),
                                   error_code=INVALID_PARAMETER_VALUE)
-        return [cls._get_comparison_for_model_registry(si)
-                for si in statement.tokens if isinstance(si, Comparison)]
+        return tokens[0], is_ascending
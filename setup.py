@@ -36,6 +36,7 @@ setup(
         'six>=1.10.0',
         'waitress; platform_system == "Windows"',
         'gunicorn; platform_system != "Windows"',
+        'futures; python_version < "3.0"',
         'Flask',
         'numpy',
         'pandas',
@@ -61,6 +62,8 @@ setup(
             'mleap>=0.8.1',
             'azure-storage',
             'google-cloud-storage',
+            # Required by `mlflow server --asgi`
+            "uvicorn; python_version >= '3.6'",
         ],
     },
     entry_points='''
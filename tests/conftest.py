@@ -1,5 +1,19 @@
+import sys
+
 import pytest
 
+from mlflow.store.artifact import resolution_cache
+
+# The ASGI server and its tests use async syntax, which requires Python 3.6 or later
+collect_ignore = ["server/test_asgi.py"] if sys.version_info < (3, 6) else []
+
+
+@pytest.fixture(autouse=True)
+def clear_artifact_uri_resolution_caches():
+    resolution_cache.clear_caches()
+    yield
+    resolution_cache.clear_caches()
+
 
 @pytest.fixture
 def reset_mock():
@@ -0,0 +1,50 @@
+import unittest
+
+from mlflow.entities.model_registry.registry_event import RegistryEvent
+from mlflow.entities.model_registry.registry_event_type import RegistryEventType
+from mlflow.protos.model_registry_pb2 import RegistryEventType as ProtoRegistryEventType
+
+
+class TestRegistryEvent(unittest.TestCase):
+    def _check(self, event, sequence, timestamp, event_type, name, version, stage,
+               previous_name):
+        self.assertIsInstance(event, RegistryEvent)
+        self.assertEqual(event.sequence, sequence)
+        self.assertEqual(event.timestamp, timestamp)
+        self.assertEqual(event.event_type, event_type)
+        self.assertEqual(event.name, name)
+        self.assertEqual(event.version, version)
+        self.assertEqual(event.stage, stage)
+        self.assertEqual(event.previous_name, previous_name)
+
+    def test_creation_and_hydration(self):
+        event = RegistryEvent(12, 1000, "TRANSITION_MODEL_VERSION_STAGE", "model", version=3,
+                              stage="Production")
+        self._check(event, 12, 1000, "TRANSITION_MODEL_VERSION_STAGE", "model", 3,
+                    "Production", None)
+        self.assertEqual(dict(event), {"sequence": 12, "timestamp": 1000,
+                                       "event_type": "TRANSITION_MODEL_VERSION_STAGE",
+                                       "name": "model", "version": 3, "stage": "Production",
+                                       "previous_name": None})
+
+        proto = event.to_proto()
+        self.assertEqual(proto.event_type, ProtoRegistryEventType.TRANSITION_MODEL_VERSION_STAGE)
+        self.assertFalse(proto.HasField("previous_name"))
+        self._check(RegistryEvent.from_proto(proto), 12, 1000, "TRANSITION_MODEL_VERSION_STAGE",
+                    "model", 3, "Production", None)
+
+    def test_optional_fields_are_unset(self):
+        event = RegistryEvent(13, 1001, "RENAME_REGISTERED_MODEL", "new", previous_name="old")
+        proto = event.to_proto()
+        self.assertFalse(proto.HasField("version"))
+        self.assertFalse(proto.HasField("stage"))
+        self._check(RegistryEvent.from_proto(proto), 13, 1001, "RENAME_REGISTERED_MODEL", "new",
+                    None, None, "old")
+
+    def test_event_type_conversion(self):
+        for event_type in ProtoRegistryEventType.keys():
+            self.assertEqual(
+                RegistryEventType.to_string(RegistryEventType.from_string(event_type)),
+                event_type)
+        with self.assertRaises(Exception):
+            RegistryEventType.from_string("UNKNOWN")
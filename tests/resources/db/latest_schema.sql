@@ -21,11 +21,32 @@ CREATE TABLE registered_models (
 	creation_time BIGINT,
 	last_updated_time BIGINT,
 	description VARCHAR(5000),
+	max_version INTEGER DEFAULT '0' NOT NULL,
 	CONSTRAINT registered_model_pk PRIMARY KEY (name),
 	UNIQUE (name)
 )
 
 
+CREATE TABLE registry_event_sequence (
+	id INTEGER NOT NULL, 
+	last_sequence BIGINT NOT NULL, 
+	CONSTRAINT registry_event_sequence_pk PRIMARY KEY (id)
+)
+
+
+CREATE TABLE registry_events (
+	id INTEGER NOT NULL, 
+	sequence BIGINT, 
+	timestamp BIGINT NOT NULL, 
+	event_type VARCHAR(50) NOT NULL, 
+	name VARCHAR(256) NOT NULL, 
+	version INTEGER, 
+	stage VARCHAR(20), 
+	previous_name VARCHAR(256), 
+	CONSTRAINT registry_event_pk PRIMARY KEY (id)
+)
+
+
 CREATE TABLE experiment_tags (
 	key VARCHAR(250) NOT NULL, 
 	value VARCHAR(5000), 
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import os
+import signal
+from subprocess import Popen
+
+import mock
+import pytest
+import requests
+
+from mlflow.server.asgi import WsgiToAsgi, _build_environ
+from mlflow.tracking import MlflowClient
+from tests.helper_functions import LOCALHOST, get_safe_port
+from tests.tracking.integration_test_utils import _await_server_up_or_die, \
+    _await_server_down_or_die
+
+
+def _http_scope(method, path, query_string=b"", headers=None):
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "root_path": "",
+        "query_string": query_string,
+        "headers": headers or [],
+        "server": ("testserver", 5000),
+        "client": ("127.0.0.1", 12345),
+    }
+
+
+def _call_asgi_app(app, scope, body=b""):
+    """Run an ASGI application on a single request, returning the messages it sends."""
+    sent = []
+    request_messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return request_messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.get_event_loop().run_until_complete(app(scope, receive, send))
+    return sent
+
+
+@pytest.fixture()
+def event_loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+
+
+def test_build_environ():
+    scope = _http_scope("POST", "/api/2.0/mlflow/runs/search", query_string=b"a=1",
+                        headers=[(b"content-type", b"application/json"),
+                                 (b"content-length", b"2"),
+                                 (b"x-forwarded-for", b"1.2.3.4"),
+                                 (b"x-forwarded-for", b"5.6.7.8")])
+    environ = _build_environ(scope, body=None)
+    assert environ["REQUEST_METHOD"] == "POST"
+    assert environ["PATH_INFO"] == "/api/2.0/mlflow/runs/search"
+    assert environ["QUERY_STRING"] == "a=1"
+    assert environ["SERVER_NAME"] == "testserver"
+    assert environ["SERVER_PORT"] == "5000"
+    assert environ["REMOTE_ADDR"] == "127.0.0.1"
+    assert environ["CONTENT_TYPE"] == "application/json"
+    assert environ["CONTENT_LENGTH"] == "2"
+    assert environ["HTTP_X_FORWARDED_FOR"] == "1.2.3.4,5.6.7.8"
+
+
+def test_asgi_app_serves_flask_app(event_loop):
+    # pylint: disable=unused-argument
+    from mlflow.server import app as flask_app
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as get_store_mock:
+        get_store_mock.return_value.list_experiments.return_value = []
+        sent = _call_asgi_app(WsgiToAsgi(flask_app, max_threads=2),
+                              _http_scope("GET", "/api/2.0/mlflow/experiments/list"))
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == 200
+    assert (b"content-type", b"application/json") in sent[0]["headers"]
+    body = b"".join(message["body"] for message in sent[1:])
+    assert json.loads(body.decode("utf-8")) == {}
+    assert sent[-1]["more_body"] is False
+
+
+def test_asgi_app_streams_response_in_chunks(event_loop):
+    # pylint: disable=unused-argument
+    chunks = [b"a" * 40000, b"b" * 40000, b"c" * 40000]
+    closed = []
+
+    class Body(object):
+        def __iter__(self):
+            return iter(chunks)
+
+        def close(self):
+            closed.append(True)
+
+    def wsgi_app(environ, start_response):
+        assert environ["wsgi.input"].read() == b"request-body"
+        start_response("200 OK", [("Content-Type", "application/octet-stream")])
+        return Body()
+
+    sent = _call_asgi_app(WsgiToAsgi(wsgi_app), _http_scope("POST", "/"), body=b"request-body")
+    body_messages = sent[1:]
+    assert len(body_messages) > 2
+    assert all(message["more_body"] for message in body_messages[:-1])
+    assert b"".join(message["body"] for message in body_messages) == b"".join(chunks)
+    assert closed == [True]
+
+
+@pytest.mark.large
+def test_asgi_server_serves_requests_while_downloads_are_stalled(tmpdir):
+    """
+    Responses are sent asynchronously in ASGI mode, so that clients which stop reading an artifact
+    download do not hold pool threads: with a single worker of two threads, other requests are
+    still served while more downloads than threads are stalled.
+    """
+    backend_uri = "sqlite:///%s" % tmpdir.join("mlflow.db").strpath
+    artifact_root = tmpdir.mkdir("artifacts").strpath
+    port = get_safe_port()
+    process = Popen(["mlflow", "server", "--backend-store-uri", backend_uri,
+                     "--default-artifact-root", artifact_root, "--host", LOCALHOST,
+                     "--port", str(port), "--workers", "1", "--asgi", "--asgi-max-threads", "2"],
+                    preexec_fn=os.setsid)
+    downloads = []
+    try:
+        _await_server_up_or_die(port)
+        server_url = "http://%s:%s" % (LOCALHOST, port)
+        client = MlflowClient(server_url)
+        run_id = client.create_run("0").info.run_id
+        # Large enough not to fit in the socket buffers of a stalled connection
+        local_file = tmpdir.join("model.bin")
+        local_file.write(b"\0" * (64 * 1024 * 1024), mode="wb")
+        client.log_artifact(run_id, local_file.strpath)
+
+        for _ in range(4):
+            response = requests.get(server_url + "/get-artifact",
+                                    params={"run_id": run_id, "path": "model.bin"}, stream=True)
+            assert response.status_code == 200
+            next(response.iter_content(chunk_size=1024))
+            downloads.append(response)
+        response = requests.get(server_url + "/api/2.0/mlflow/experiments/list", timeout=10)
+        assert response.status_code == 200
+        assert [experiment["experiment_id"] for experiment in response.json()["experiments"]] \
+            == ["0"]
+    finally:
+        for response in downloads:
+            response.close()
+        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        _await_server_down_or_die(process)
@@ -1,4 +1,6 @@
+import io
 import json
+import tarfile
 import uuid
 
 import mock
@@ -6,9 +8,10 @@ import pytest
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import ViewType, Run, RunInfo, RunData, Metric, Param, RunTag, \
+    LifecycleStage
 from mlflow.entities.model_registry import RegisteredModel, RegisteredModelDetailed, \
-    ModelVersionDetailed, ModelVersion
+    ModelVersionDetailed, ModelVersion, RegistryEvent
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, ErrorCode
 from mlflow.server.handlers import get_endpoints, _create_experiment, _get_request_message, \
@@ -16,14 +19,19 @@ from mlflow.server.handlers import get_endpoints, _create_experiment, _get_reque
     _update_registered_model, _delete_registered_model, _get_registered_model_details, \
     _list_registered_models, _get_latest_versions, _create_model_version, _update_model_version, \
     _delete_model_version, _get_model_version_download_uri, _get_model_version_stages, \
-    _search_model_versions, _get_model_version_details
+    _search_model_versions, _get_model_version_details, _get_run, _get_runs, _get_metric_history, \
+    _get_registry_events, _get_long_poll_limiter, \
+    _log_metric, _list_experiments
+from mlflow.server.rate_limiter import TokenBucketRateLimiter, ConcurrencyLimiter
+from mlflow.server.response_cache import InMemoryResponseCache
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns, GetRun, GetRuns, \
+    GetMetricHistory, LogMetric, ListExperiments
 from mlflow.protos.model_registry_pb2 import CreateRegisteredModel, UpdateRegisteredModel, \
     DeleteRegisteredModel, ListRegisteredModels, GetRegisteredModelDetails, GetLatestVersions, \
     CreateModelVersion, UpdateModelVersion, DeleteModelVersion, GetModelVersionDetails, \
-    GetModelVersionDownloadUri, SearchModelVersions, GetModelVersionStages
+    GetModelVersionDownloadUri, SearchModelVersions, GetModelVersionStages, GetRegistryEvents
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
 
@@ -88,6 +96,7 @@ def test_all_model_registry_endpoints_available():
         "GET": [
             _list_registered_models,
             _search_model_versions,
+            _get_registry_events,
         ]
     }
     # TODO: efficient mechanism to test endpoint path
@@ -123,6 +132,19 @@ def test_can_parse_get_json_with_unknown_fields():
     assert msg.name == "hello"
 
 
+def test_can_parse_get_json_with_repeated_fields():
+    request = mock.MagicMock()
+    request.method = "GET"
+    request.query_string = b"max_results=10&order_by=version+DESC"
+    msg = _get_request_message(SearchModelVersions(), flask_request=request)
+    assert msg.max_results == 10
+    assert list(msg.order_by) == ["version DESC"]
+
+    request.query_string = b"order_by=name&order_by=version+DESC"
+    msg = _get_request_message(SearchModelVersions(), flask_request=request)
+    assert list(msg.order_by) == ["name", "version DESC"]
+
+
 # Previous versions of the client sent a doubly string encoded JSON blob,
 # so this test ensures continued compliance with such clients.
 def test_can_parse_json_string():
@@ -145,6 +167,276 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
+def _create_run(run_id="run-id"):
+    run_info = RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                       status="FINISHED", start_time=1, end_time=2,
+                       lifecycle_stage=LifecycleStage.ACTIVE, artifact_uri="file:///artifacts")
+    run_data = RunData(metrics=[Metric("m", 0.5, 1, 0), Metric("n", float("nan"), 1, 0)],
+                       params=[Param("p", "v")], tags=[RunTag("t", "v")])
+    return Run(run_info, run_data)
+
+
+def test_get_run_response_matches_proto_json(mock_get_request_message, mock_tracking_store):
+    run = _create_run()
+    mock_get_request_message.return_value = GetRun(run_id="run-id")
+    mock_tracking_store.get_run.return_value = run
+    resp = _get_run()
+    expected = GetRun.Response()
+    expected.run.MergeFrom(run.to_proto())
+    assert json.loads(resp.get_data()) == json.loads(message_to_json(expected))
+
+
+def test_get_runs(mock_get_request_message, mock_tracking_store):
+    runs = [_create_run("run-2"), _create_run("run-1")]
+    mock_get_request_message.return_value = GetRuns(run_ids=["run-2", "run-1"])
+    mock_tracking_store.get_runs.return_value = runs
+    resp = _get_runs()
+    args, _ = mock_tracking_store.get_runs.call_args
+    assert list(args[0]) == ["run-2", "run-1"]
+    expected = GetRuns.Response()
+    expected.runs.extend([r.to_proto() for r in runs])
+    assert json.loads(resp.get_data()) == json.loads(message_to_json(expected))
+
+
+def test_search_runs_response_matches_proto_json(mock_get_request_message, mock_tracking_store):
+    runs = [_create_run("run-1"), _create_run("run-2")]
+    mock_get_request_message.return_value = SearchRuns(experiment_ids=["0"])
+    mock_tracking_store.search_runs.return_value = PagedList(runs, b"token")
+    resp = _search_runs()
+    expected = SearchRuns.Response(next_page_token="token")
+    expected.runs.extend([r.to_proto() for r in runs])
+    assert json.loads(resp.get_data()) == json.loads(message_to_json(expected))
+
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+    assert json.loads(_search_runs().get_data()) == {}
+
+
+def test_get_metric_history_response_matches_proto_json(mock_get_request_message,
+                                                        mock_tracking_store):
+    metrics = [Metric("m", float(i) / 3, i, i) for i in range(5)]
+    mock_get_request_message.return_value = GetMetricHistory(run_id="run-id", metric_key="m")
+    mock_tracking_store.get_metric_history.return_value = metrics
+    resp = _get_metric_history()
+    expected = GetMetricHistory.Response()
+    expected.metrics.extend([m.to_proto() for m in metrics])
+    assert json.loads(resp.get_data()) == json.loads(message_to_json(expected))
+
+
+@pytest.fixture()
+def response_cache():
+    cache = InMemoryResponseCache()
+    with mock.patch('mlflow.server.handlers._get_response_cache', return_value=cache):
+        yield cache
+
+
+def test_cached_responses_are_invalidated_by_mutating_handlers(
+        mock_get_request_message, mock_tracking_store, response_cache):
+    # pylint: disable=unused-argument
+    history_request = GetMetricHistory(run_id="run-id", metric_key="m")
+    search_request = SearchRuns(experiment_ids=["0"])
+    mock_tracking_store.get_metric_history.return_value = [Metric("m", 1.0, 1, 0)]
+    mock_tracking_store.search_runs.return_value = PagedList([_create_run()], None)
+
+    mock_get_request_message.return_value = history_request
+    first_history = _get_metric_history().get_data()
+    mock_get_request_message.return_value = search_request
+    first_search = _search_runs().get_data()
+    mock_get_request_message.return_value = history_request
+    assert _get_metric_history().get_data() == first_history
+    mock_get_request_message.return_value = search_request
+    assert _search_runs().get_data() == first_search
+    assert mock_tracking_store.get_metric_history.call_count == 1
+    assert mock_tracking_store.search_runs.call_count == 1
+
+    mock_get_request_message.return_value = LogMetric(
+        run_id="run-id", key="m", value=2.0, timestamp=2, step=1)
+    _log_metric()
+    mock_tracking_store.get_metric_history.return_value = [
+        Metric("m", 1.0, 1, 0), Metric("m", 2.0, 2, 1)]
+
+    mock_get_request_message.return_value = history_request
+    assert json.loads(_get_metric_history().get_data())["metrics"][1]["value"] == 2.0
+    mock_get_request_message.return_value = search_request
+    _search_runs()
+    assert mock_tracking_store.get_metric_history.call_count == 2
+    assert mock_tracking_store.search_runs.call_count == 2
+
+
+def test_error_responses_are_not_cached(mock_get_request_message, mock_tracking_store,
+                                        response_cache):
+    # pylint: disable=unused-argument
+    mock_get_request_message.return_value = ListExperiments()
+    mock_tracking_store.list_experiments.side_effect = MlflowException("error")
+    assert _list_experiments().status_code == 500
+    mock_tracking_store.list_experiments.side_effect = None
+    mock_tracking_store.list_experiments.return_value = []
+    assert _list_experiments().status_code == 200
+    assert mock_tracking_store.list_experiments.call_count == 2
+
+
+def test_unchanged_responses_are_not_modified(mock_tracking_store):
+    from mlflow.server import app
+    mock_tracking_store.list_experiments.return_value = []
+    client = app.test_client()
+    response = client.get("/api/2.0/mlflow/experiments/list")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/2.0/mlflow/experiments/list", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+    response = client.get("/api/2.0/mlflow/experiments/list",
+                          headers={"If-None-Match": '"other-etag"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+@pytest.fixture()
+def artifact_run(mock_tracking_store, tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.join("model.bin").write(b"0123456789", mode="wb")
+    artifact_dir.join("notes.txt").write("hello")
+    run = _create_run()
+    run.info._artifact_uri = artifact_dir.strpath
+    mock_tracking_store.get_run.return_value = run
+    return run
+
+
+def test_get_artifact_streams_artifact(artifact_run):
+    # pylint: disable=unused-argument
+    from mlflow.server import app
+    client = app.test_client()
+    response = client.get("/get-artifact?path=model.bin&run_uuid=run-id")
+    assert response.status_code == 200
+    assert response.get_data() == b"0123456789"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["Content-Length"] == "10"
+    assert response.headers["Content-Disposition"] == "attachment; filename=model.bin"
+
+    response = client.get("/get-artifact?path=notes.txt&run_uuid=run-id")
+    assert response.mimetype == "text/plain"
+    assert response.get_data() == b"hello"
+
+    response = client.get("/get-artifact?path=missing.bin&run_uuid=run-id")
+    assert response.status_code == 404
+
+
+def test_get_artifact_serves_byte_ranges(artifact_run):
+    # pylint: disable=unused-argument
+    from mlflow.server import app
+    client = app.test_client()
+    url = "/get-artifact?path=model.bin&run_uuid=run-id"
+    response = client.get(url, headers={"Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.get_data() == b"2345"
+    assert response.headers["Content-Range"] == "bytes 2-5/10"
+
+    response = client.get(url, headers={"Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.get_data() == b"789"
+
+    response = client.get(url, headers={"Range": "bytes=20-"})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */10"
+
+
+def test_get_artifact_bundle_streams_artifacts_as_archive(artifact_run, tmpdir):
+    # pylint: disable=unused-argument
+    from mlflow.server import app
+    tmpdir.join("artifacts").mkdir("model").join("MLmodel").write("flavors: {}")
+    client = app.test_client()
+
+    response = client.get("/get-artifact-bundle?run_id=run-id&path=model&compression=gzip")
+    assert response.status_code == 200
+    assert response.mimetype == "application/gzip"
+    assert response.headers["Content-Disposition"] == "attachment; filename=model.tar.gz"
+    assert "Content-Length" not in response.headers
+    with tarfile.open(fileobj=io.BytesIO(response.get_data()), mode="r:gz") as tar:
+        assert tar.getnames() == ["model", "model/MLmodel"]
+        assert tar.extractfile("model/MLmodel").read() == b"flavors: {}"
+
+    response = client.get("/get-artifact-bundle?run_uuid=run-id")
+    assert response.mimetype == "application/x-tar"
+    with tarfile.open(fileobj=io.BytesIO(response.get_data()), mode="r:") as tar:
+        assert sorted(tar.getnames()) == ["model", "model.bin", "model/MLmodel", "notes.txt"]
+
+    assert client.get("/get-artifact-bundle?run_id=run-id&path=missing").status_code == 404
+    response = client.get("/get-artifact-bundle?run_id=run-id&compression=bz2")
+    assert response.status_code == 400
+    assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+
+
+def test_list_artifacts_recursive(artifact_run, tmpdir):
+    # pylint: disable=unused-argument
+    from mlflow.server import app
+    model_dir = tmpdir.join("artifacts").mkdir("model")
+    model_dir.mkdir("data").join("weights.bin").write("weights")
+    model_dir.join("MLmodel").write("flavors: {}")
+    client = app.test_client()
+
+    def list_paths(query):
+        response = client.get("/api/2.0/mlflow/artifacts/list?run_id=run-id&" + query)
+        assert response.status_code == 200
+        return [f["path"] for f in json.loads(response.get_data())["files"]]
+
+    assert list_paths("path=model") == ["model/MLmodel", "model/data"]
+    assert list_paths("path=model&recursive=true") == [
+        "model/MLmodel", "model/data", "model/data/weights.bin"]
+    assert list_paths("recursive=true&max_depth=2") == [
+        "model", "model.bin", "model/MLmodel", "model/data", "notes.txt"]
+
+
+def test_rate_limited_requests_are_rejected(mock_tracking_store):
+    from mlflow.server import app
+    mock_tracking_store.list_experiments.return_value = []
+    client = app.test_client()
+    with mock.patch("mlflow.server.handlers._get_rate_limiter",
+                    return_value=TokenBucketRateLimiter(requests_per_second=0.1, burst=2)):
+        for _ in range(2):
+            assert client.get("/api/2.0/mlflow/experiments/list").status_code == 200
+        response = client.get("/api/2.0/mlflow/experiments/list")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "10"
+        assert json.loads(response.get_data())["error_code"] == "REQUEST_LIMIT_EXCEEDED"
+        # Requests from other clients and static files are not affected
+        response = client.get("/api/2.0/mlflow/experiments/list",
+                              environ_base={"REMOTE_ADDR": "10.0.0.1"})
+        assert response.status_code == 200
+        # Clients cannot evade the limit by sending made up credentials
+        response = client.get("/api/2.0/mlflow/experiments/list",
+                              headers={"Authorization": "Bearer %s" % uuid.uuid4().hex})
+        assert response.status_code == 429
+        for url in ["/get-artifact?path=model.bin&run_uuid=run-id",
+                    "/get-artifact-bundle?run_id=run-id"]:
+            assert client.get(url).status_code == 429
+        assert client.get("/static-files/missing.js").status_code == 404
+
+
+def test_expensive_requests_hold_concurrency_slots_until_sent(artifact_run):
+    # pylint: disable=unused-argument
+    from mlflow.server import app
+    client = app.test_client()
+    with mock.patch("mlflow.server.handlers._get_concurrency_limiter",
+                    return_value=ConcurrencyLimiter(max_concurrent_requests=1)):
+        url = "/get-artifact?path=model.bin&run_uuid=run-id"
+        streamed_response = client.get(url, buffered=False)
+        assert streamed_response.status_code == 200
+        response = client.get(url)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert client.get("/api/2.0/mlflow/artifacts/list?run_id=run-id").status_code == 429
+        assert b"".join(streamed_response.response) == b"0123456789"
+        streamed_response.close()
+        assert client.get(url, buffered=True).get_data() == b"0123456789"
+        assert client.get("/api/2.0/mlflow/artifacts/list?run_id=run-id",
+                          buffered=True).status_code == 200
+        # Slots are released when handlers fail
+        assert client.get("/get-artifact?path=missing.bin&run_uuid=run-id",
+                          buffered=True).status_code == 404
+        assert client.get(url, buffered=True).status_code == 200
+
+
 def test_log_batch_api_req(mock_get_request_json):
     mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
     response = _log_batch()
@@ -251,12 +543,22 @@ def test_list_registered_models(mock_get_request_message, mock_model_registry_st
                                 last_updated_timestamp=333, description="Another model",
                                 latest_versions=[]),
     ]
-    mock_model_registry_store.list_registered_models.return_value = rmds
+    mock_model_registry_store.list_registered_models.return_value = PagedList(rmds, None)
     resp = _list_registered_models()
-    args, _ = mock_model_registry_store.list_registered_models.call_args
-    assert args == ()
+    _, kwargs = mock_model_registry_store.list_registered_models.call_args
+    assert kwargs == {"max_results": None, "order_by": [], "page_token": ""}
     assert json.loads(resp.get_data()) == {"registered_models_detailed": jsonify(rmds)}
 
+    mock_get_request_message.return_value = ListRegisteredModels(
+        max_results=2, order_by=["creation_timestamp DESC"], page_token="previous")
+    mock_model_registry_store.list_registered_models.return_value = PagedList(rmds, b"next")
+    resp = _list_registered_models()
+    _, kwargs = mock_model_registry_store.list_registered_models.call_args
+    assert kwargs == {"max_results": 2, "order_by": ["creation_timestamp DESC"],
+                      "page_token": "previous"}
+    assert json.loads(resp.get_data()) == {"registered_models_detailed": jsonify(rmds),
+                                           "next_page_token": "next"}
+
 
 def test_get_latest_versions(mock_get_request_message, mock_model_registry_store):
     rm = RegisteredModel("model1")
@@ -380,8 +682,78 @@ def test_search_model_versions(mock_get_request_message, mock_model_registry_sto
                              source="A/B/CD",  run_id=uuid.uuid4().hex, status="READY",
                              status_message=None),
     ]
-    mock_model_registry_store.search_model_versions.return_value = mvds
+    mock_model_registry_store.search_model_versions.return_value = PagedList(mvds, None)
     resp = _search_model_versions()
-    args, _ = mock_model_registry_store.search_model_versions.call_args
+    args, kwargs = mock_model_registry_store.search_model_versions.call_args
     assert args == ("source_path = 'A/B/CD'", )
+    assert kwargs == {"max_results": 100, "order_by": [], "page_token": ""}
     assert json.loads(resp.get_data()) == {"model_versions_detailed": jsonify(mvds)}
+
+    mock_get_request_message.return_value = SearchModelVersions(
+        filter="current_stage = 'Production'", max_results=2, order_by=["version DESC"],
+        page_token="previous")
+    mock_model_registry_store.search_model_versions.return_value = PagedList(mvds[:2], b"next")
+    resp = _search_model_versions()
+    args, kwargs = mock_model_registry_store.search_model_versions.call_args
+    assert args == ("current_stage = 'Production'", )
+    assert kwargs == {"max_results": 2, "order_by": ["version DESC"], "page_token": "previous"}
+    assert json.loads(resp.get_data()) == {"model_versions_detailed": jsonify(mvds[:2]),
+                                           "next_page_token": "next"}
+
+
+def test_get_registry_events(mock_get_request_message, mock_model_registry_store):
+    mock_get_request_message.return_value = GetRegistryEvents(since=3, timeout_seconds=10)
+    events = [
+        RegistryEvent(4, 1000, "RENAME_REGISTERED_MODEL", "model_2", previous_name="model_1"),
+        RegistryEvent(5, 1001, "TRANSITION_MODEL_VERSION_STAGE", "model_2", version=1,
+                      stage="Production"),
+    ]
+    mock_model_registry_store.get_registry_events.return_value = PagedList(events, 5)
+    with mock.patch("mlflow.server.handlers._long_poll_limiter", ConcurrencyLimiter(1)):
+        resp = _get_registry_events()
+    args, kwargs = mock_model_registry_store.get_registry_events.call_args
+    assert args == ()
+    assert kwargs == {"since": 3, "max_results": 100, "timeout_seconds": 10}
+    assert json.loads(resp.get_data()) == {"events": jsonify(events), "last_sequence": "5"}
+
+
+def test_get_registry_events_bounds_concurrent_long_polls(
+        mock_get_request_message, mock_model_registry_store):
+    mock_model_registry_store.get_registry_events.return_value = PagedList([], 5)
+    with mock.patch("mlflow.server.handlers._long_poll_limiter", None), \
+            mock.patch.dict(os.environ, {"_MLFLOW_SERVER_MAX_CONCURRENT_LONG_POLLS": "1"}):
+        limiter = _get_long_poll_limiter()
+        limiter.acquire()
+        mock_get_request_message.return_value = GetRegistryEvents(since=5, timeout_seconds=10)
+        resp = _get_registry_events()
+        assert resp.status_code == 429
+        assert resp.headers["Retry-After"] == "1"
+        assert "long polls for registry events" in json.loads(resp.get_data())["message"]
+        mock_model_registry_store.get_registry_events.assert_not_called()
+        # Requests that do not wait for events are not limited
+        mock_get_request_message.return_value = GetRegistryEvents(since=5)
+        assert _get_registry_events().status_code == 200
+        limiter.release()
+
+        mock_get_request_message.return_value = GetRegistryEvents(since=5, timeout_seconds=10)
+        resp = _get_registry_events()
+        assert resp.status_code == 200
+        _, kwargs = mock_model_registry_store.get_registry_events.call_args
+        assert kwargs["timeout_seconds"] == 10
+        resp.close()
+        # The slot of the long poll is released once its response is sent
+        limiter.acquire()
+        limiter.release()
+
+
+@pytest.mark.parametrize("env", [{}, {"_MLFLOW_SERVER_MAX_CONCURRENT_LONG_POLLS": "0"}])
+def test_get_registry_events_returns_immediately_if_long_polling_is_disabled(
+        mock_get_request_message, mock_model_registry_store, env):
+    mock_model_registry_store.get_registry_events.return_value = PagedList([], 5)
+    mock_get_request_message.return_value = GetRegistryEvents(since=5, timeout_seconds=10)
+    os.environ.pop("_MLFLOW_SERVER_MAX_CONCURRENT_LONG_POLLS", None)
+    with mock.patch("mlflow.server.handlers._long_poll_limiter", None), \
+            mock.patch.dict(os.environ, env):
+        assert _get_registry_events().status_code == 200
+    _, kwargs = mock_model_registry_store.get_registry_events.call_args
+    assert kwargs["timeout_seconds"] == 0
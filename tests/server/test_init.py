@@ -0,0 +1,80 @@
+import gzip
+import io
+
+import mock
+import pytest
+
+from mlflow import server
+
+
+@pytest.fixture()
+def static_dir(tmpdir):
+    static_dir = tmpdir.mkdir("build")
+    static_dir.join("index.html").write("<html></html>")
+    js_dir = static_dir.mkdir("static").mkdir("js")
+    js_dir.join("main.1a2b3c4d.chunk.js").write("var x = 1;")
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode="wb") as f:
+        f.write(b"var x = 1;")
+    js_dir.join("main.1a2b3c4d.chunk.js.gz").write(compressed.getvalue(), mode="wb")
+    js_dir.join("main.1a2b3c4d.chunk.js.br").write(b"brotli", mode="wb")
+    with mock.patch("mlflow.server.STATIC_DIR", static_dir.strpath):
+        yield static_dir
+
+
+def test_serve_static_file_sends_precompressed_variants(static_dir):
+    # pylint: disable=unused-argument
+    client = server.app.test_client()
+    url = "/static-files/static/js/main.1a2b3c4d.chunk.js"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip, deflate, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.get_data() == b"brotli"
+    assert response.mimetype in ["application/javascript", "text/javascript"]
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    with gzip.GzipFile(fileobj=io.BytesIO(response.get_data())) as f:
+        assert f.read() == b"var x = 1;"
+
+    response = client.get(url)
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data() == b"var x = 1;"
+
+
+def test_serve_static_file_sets_cache_headers(static_dir):
+    # pylint: disable=unused-argument
+    client = server.app.test_client()
+    response = client.get("/static-files/static/js/main.1a2b3c4d.chunk.js")
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 365 * 24 * 3600
+
+    response = client.get("/")
+    assert response.get_data() == b"<html></html>"
+    assert response.cache_control.no_cache
+    assert not response.cache_control.immutable
+    response = client.get("/", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+
+
+def test_serve_static_file_rejects_paths_outside_static_dir(static_dir):
+    client = server.app.test_client()
+    static_dir.dirpath().join("secret.txt.gz").write("secret")
+    response = client.get("/static-files/static/..%2F..%2Fsecret.txt",
+                          headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("kwargs, max_concurrent_long_polls", [
+    ({}, None),
+    ({"asgi": True}, "2"),
+    ({"asgi": True, "max_concurrent_long_polls": 0}, "0"),
+    ({"gunicorn_opts": "--threads 8", "max_concurrent_long_polls": 4}, "4"),
+])
+def test_run_server_only_long_polls_with_asgi_by_default(kwargs, max_concurrent_long_polls):
+    with mock.patch("mlflow.server.exec_cmd") as exec_cmd_mock:
+        server._run_server("./mlruns", "./mlruns", "127.0.0.1", 5000, **kwargs)
+    _, exec_cmd_kwargs = exec_cmd_mock.call_args
+    env = exec_cmd_kwargs["env"]
+    assert env.get(server.MAX_CONCURRENT_LONG_POLLS_ENV_VAR) == max_concurrent_long_polls
@@ -0,0 +1,82 @@
+import mock
+from flask import Flask, Response
+from prometheus_client import REGISTRY
+
+from mlflow.server import handlers
+from mlflow.server.prometheus_exporter import instrument_store, instrument_artifact_repo, \
+    instrument_handler
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+
+def _get_count(metric_name, labels):
+    return REGISTRY.get_sample_value(metric_name + "_count", labels) or 0
+
+
+def test_instrument_handler_observes_latency_and_sizes():
+    def handler():
+        return Response("0123456789", status=200)
+
+    labels = {"handler": "_test_handler"}
+    latency_labels = dict(labels, status="200")
+    latency_count = _get_count("mlflow_handler_latency_seconds", latency_labels)
+    response_size_sum = REGISTRY.get_sample_value(
+        "mlflow_handler_response_size_bytes_sum", labels) or 0
+    instrumented = instrument_handler(handler, "_test_handler")
+    with Flask(__name__).test_request_context("/", method="POST", data="{}"):
+        assert instrumented().get_data() == b"0123456789"
+    assert _get_count("mlflow_handler_latency_seconds", latency_labels) == latency_count + 1
+    assert REGISTRY.get_sample_value("mlflow_handler_response_size_bytes_sum", labels) == \
+        response_size_sum + 10
+
+
+def test_instrument_store_observes_store_calls_and_pool_waits(tmpdir):
+    store = SqlAlchemyStore("sqlite:///%s" % tmpdir.join("mlflow.db").strpath,
+                            tmpdir.mkdir("artifacts").strpath)
+    call_labels = {"store": "tracking", "method": "list_experiments"}
+    call_count = _get_count("mlflow_store_call_latency_seconds", call_labels)
+    pool_wait_count = _get_count("mlflow_db_pool_wait_seconds", {"store": "tracking"})
+    instrument_store(store, "tracking")
+    assert len(store.list_experiments()) == 1
+    assert _get_count("mlflow_store_call_latency_seconds", call_labels) == call_count + 1
+    assert _get_count("mlflow_db_pool_wait_seconds", {"store": "tracking"}) > pool_wait_count
+
+
+def test_instrument_artifact_repo_observes_operations_and_payload_sizes(tmpdir):
+    tmpdir.join("model.bin").write(b"0123456789", mode="wb")
+    repo = LocalArtifactRepository(tmpdir.strpath)
+    labels = {"repository": "LocalArtifactRepository", "operation": "open_stream"}
+    latency_count = _get_count("mlflow_artifact_repo_latency_seconds", labels)
+    payload_sum = REGISTRY.get_sample_value(
+        "mlflow_artifact_repo_payload_size_bytes_sum", labels) or 0
+    instrument_artifact_repo(repo)
+    repo.open_stream("model.bin").close()
+    assert _get_count("mlflow_artifact_repo_latency_seconds", labels) == latency_count + 1
+    assert REGISTRY.get_sample_value("mlflow_artifact_repo_payload_size_bytes_sum", labels) == \
+        payload_sum + 10
+
+
+def _create_search_runs_app():
+    app = Flask(__name__)
+    app.add_url_rule("/api/2.0/mlflow/runs/search", "_search_runs",
+                     lambda: Response("{}", mimetype="application/json"), methods=["POST"])
+    return app
+
+
+def test_slow_request_log_includes_request_message():
+    app = _create_search_runs_app()
+    handlers.activate_slow_request_log(app, threshold_seconds=0)
+    with mock.patch("mlflow.server.handlers._logger") as logger_mock:
+        app.test_client().post("/api/2.0/mlflow/runs/search",
+                               json={"experiment_ids": ["1"], "filter": "metrics.m > 0"})
+    args = logger_mock.warning.call_args[0]
+    assert args[1:3] == ("POST", "/api/2.0/mlflow/runs/search")
+    assert args[5:] == ("SearchRuns", '{"experiment_ids":["1"],"filter":"metrics.m > 0"}')
+
+
+def test_slow_request_log_ignores_fast_requests():
+    app = _create_search_runs_app()
+    handlers.activate_slow_request_log(app, threshold_seconds=60)
+    with mock.patch("mlflow.server.handlers._logger") as logger_mock:
+        app.test_client().post("/api/2.0/mlflow/runs/search", json={"experiment_ids": ["1"]})
+    logger_mock.warning.assert_not_called()
@@ -0,0 +1,78 @@
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.service_pb2 import GetMetricHistory, SearchRuns
+from mlflow.server.response_cache import InMemoryResponseCache, ResponseCacheRegistry, \
+    _get_in_memory_response_cache, get_response_key, invalidate_scopes, compute_etag
+
+
+def test_in_memory_cache_evicts_least_recently_used_entries():
+    cache = InMemoryResponseCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_in_memory_cache_expires_entries():
+    cache = InMemoryResponseCache(ttl_seconds=5)
+    with mock.patch("time.time", return_value=100):
+        cache.set("a", b"1")
+    with mock.patch("time.time", return_value=104):
+        assert cache.get("a") == b"1"
+    with mock.patch("time.time", return_value=105):
+        assert cache.get("a") is None
+
+
+def test_get_in_memory_response_cache_parses_uri():
+    cache = _get_in_memory_response_cache("memory://?max_entries=10&ttl_seconds=0.5")
+    assert cache.max_entries == 10
+    assert cache.ttl_seconds == 0.5
+    cache = _get_in_memory_response_cache("memory://")
+    assert cache.max_entries == 1024
+    assert cache.ttl_seconds == 5
+    with pytest.raises(MlflowException, match="Invalid in-memory response cache URI"):
+        _get_in_memory_response_cache("memory://?max_entries=many")
+
+
+def test_registry_builds_cache_from_uri_scheme():
+    registry = ResponseCacheRegistry()
+    registry.register("memory", _get_in_memory_response_cache)
+    assert isinstance(registry.get_cache("memory://"), InMemoryResponseCache)
+    with pytest.raises(MlflowException, match="Unsupported URI 'redis://host'"):
+        registry.get_cache("redis://host")
+
+
+def test_registry_registers_entrypoints():
+    mock_entrypoint = mock.Mock()
+    mock_entrypoint.name = "mock-scheme"
+    with mock.patch("entrypoints.get_group_all", return_value=[mock_entrypoint]) as mock_get_group:
+        registry = ResponseCacheRegistry()
+        registry.register_entrypoints()
+    mock_get_group.assert_called_once_with("mlflow.response_cache")
+    mock_entrypoint.load.return_value.return_value = "cache"
+    assert registry.get_cache("mock-scheme://") == "cache"
+
+
+def test_response_key_depends_on_request_and_scopes():
+    cache = InMemoryResponseCache()
+    key = get_response_key(cache, SearchRuns(experiment_ids=["0"]), ["runs"])
+    assert key.startswith("mlflow-response:SearchRuns:")
+    assert get_response_key(cache, SearchRuns(experiment_ids=["0"]), ["runs"]) == key
+    assert get_response_key(cache, SearchRuns(experiment_ids=["1"]), ["runs"]) != key
+    assert get_response_key(cache, SearchRuns(experiment_ids=["0"]), ["experiments"]) != key
+
+    history_key = get_response_key(cache, GetMetricHistory(run_id="r"), ["runs/r/metrics"])
+    invalidate_scopes(cache, ["runs"])
+    assert get_response_key(cache, SearchRuns(experiment_ids=["0"]), ["runs"]) != key
+    assert get_response_key(cache, GetMetricHistory(run_id="r"), ["runs/r/metrics"]) == \
+        history_key
+
+
+def test_compute_etag_is_deterministic():
+    assert compute_etag(b"{}") == compute_etag(b"{}")
+    assert compute_etag(b"{}") != compute_etag(b"[]")
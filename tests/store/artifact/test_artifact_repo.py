@@ -1,8 +1,15 @@
+import io
+import os
+import posixpath
+import threading
+
 import mock
 import pytest
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStream, RangeReader, \
+    get_recursive_listing
 
 
 class ArtifactRepositoryImpl(ArtifactRepository):
@@ -40,3 +47,194 @@ def test_download_artifacts_does_not_infinitely_loop(base_uri, download_arg, lis
         list_artifacts_mock.side_effect = list_artifacts
         repo = ArtifactRepositoryImpl(base_uri)
         repo.download_artifacts(download_arg)
+
+
+def test_download_artifacts_downloads_nested_files_concurrently(tmpdir):
+    listings = {
+        "model": [FileInfo("model/MLmodel", False, 1), FileInfo("model/data", True, None)],
+        "model/data": [FileInfo("model/data/a.bin", False, 1),
+                       FileInfo("model/data/b.bin", False, 1)],
+    }
+    download_threads = set()
+    barrier = threading.Barrier(3)
+
+    def download_file(remote_file_path, local_path):
+        barrier.wait(timeout=10)
+        download_threads.add(threading.current_thread().name)
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts",
+                           side_effect=lambda path: listings.get(path, [])), \
+            mock.patch.object(ArtifactRepositoryImpl, "_download_file",
+                              side_effect=download_file):
+        local_path = ArtifactRepositoryImpl("uri").download_artifacts("model", tmpdir.strpath)
+
+    assert local_path == os.path.join(tmpdir.strpath, "model")
+    with open(os.path.join(local_path, "data", "b.bin")) as f:
+        assert f.read() == "model/data/b.bin"
+    assert os.path.exists(os.path.join(local_path, "MLmodel"))
+    assert len(download_threads) == 3
+
+
+def test_download_artifacts_uses_recursive_file_listing(tmpdir):
+    def download_file(remote_file_path, local_path):
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    with mock.patch.object(ArtifactRepositoryImpl, "_list_files_recursive",
+                           return_value=[FileInfo("a/b/c.txt", False, 1)]), \
+            mock.patch.object(ArtifactRepositoryImpl, "_download_file",
+                              side_effect=download_file):
+        local_path = ArtifactRepositoryImpl("uri").download_artifacts("a", tmpdir.strpath)
+    with open(os.path.join(local_path, "b", "c.txt")) as f:
+        assert f.read() == "a/b/c.txt"
+
+
+def test_download_artifacts_creates_empty_directories(tmpdir):
+    listings = {
+        None: [FileInfo("model", True, None), FileInfo("empty", True, None),
+               FileInfo("notes.txt", False, 5)],
+        "model": [FileInfo("model/empty", True, None)],
+    }
+    downloaded_paths = []
+    listed_paths = []
+
+    def list_artifacts(path=None):
+        listed_paths.append(path)
+        return listings.get(path, [])
+
+    def download_file(remote_file_path, local_path):
+        # Like artifact stores, leave an empty file behind when failing to download a file
+        open(local_path, "w").close()
+        parent = posixpath.dirname(remote_file_path) or None
+        if FileInfo(remote_file_path, False, 5) not in listings.get(parent, []):
+            raise IOError("No such file: %s" % remote_file_path)
+        downloaded_paths.append(remote_file_path)
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts", side_effect=list_artifacts), \
+            mock.patch.object(ArtifactRepositoryImpl, "_download_file",
+                              side_effect=download_file):
+        repo = ArtifactRepositoryImpl("uri")
+        # Directory containing only empty subdirectories
+        assert os.path.isdir(repo.download_artifacts("model", tmpdir.mkdir("a").strpath))
+        # Empty directory
+        assert os.path.isdir(repo.download_artifacts("empty", tmpdir.mkdir("b").strpath))
+        # Empty repository
+        listings.clear()
+        assert os.path.isdir(repo.download_artifacts("", tmpdir.mkdir("c").strpath))
+        assert downloaded_paths == []
+
+        listings[None] = [FileInfo("notes.txt", False, 5)]
+        del listed_paths[:]
+        local_path = repo.download_artifacts("notes.txt", tmpdir.mkdir("d").strpath)
+        assert os.path.isfile(local_path)
+        assert downloaded_paths == ["notes.txt"]
+        # Downloading a file does not list its parent directory
+        assert listed_paths == ["notes.txt"]
+        with pytest.raises(IOError, match="No such file"):
+            repo.download_artifacts("missing.txt", tmpdir.mkdir("e").strpath)
+
+
+def test_list_artifacts_recursive_lists_each_level_concurrently():
+    listings = {
+        "model": [FileInfo("model/MLmodel", False, 1), FileInfo("model/a", True, None),
+                  FileInfo("model/b", True, None)],
+        "model/a": [FileInfo("model/a/x.bin", False, 1), FileInfo("model/a/c", True, None)],
+        "model/b": [FileInfo("model/b", True, None), FileInfo("model/b/y.bin", False, 1)],
+        "model/a/c": [FileInfo("model/a/c/z.bin", False, 1)],
+    }
+    barrier = threading.Barrier(2)
+
+    def list_artifacts(path):
+        if path in ("model/a", "model/b"):
+            # Both subdirectories of the second level are listed at once
+            barrier.wait(timeout=10)
+        return listings.get(path, [])
+
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts", side_effect=list_artifacts):
+        repo = ArtifactRepositoryImpl("uri")
+        assert [f.path for f in repo.list_artifacts_recursive("model")] == [
+            "model/MLmodel", "model/a", "model/a/c", "model/a/c/z.bin", "model/a/x.bin",
+            "model/b", "model/b/y.bin"]
+        barrier.reset()
+        assert [f.path for f in repo.list_artifacts_recursive("model", max_depth=2)] == [
+            "model/MLmodel", "model/a", "model/a/c", "model/a/x.bin", "model/b",
+            "model/b/y.bin"]
+        assert [f.path for f in repo._list_files_recursive("model")] == [
+            "model/MLmodel", "model/a/c/z.bin", "model/a/x.bin", "model/b/y.bin"]
+        with pytest.raises(MlflowException, match="max_depth"):
+            repo.list_artifacts_recursive("model", max_depth=0)
+
+
+@pytest.mark.parametrize("path", ["model", "model/", None])
+def test_get_recursive_listing_adds_directories(path):
+    prefix = "model/" if path else ""
+    files = [FileInfo(prefix + p, False, 1) for p in ["MLmodel", "data/a/x.bin", "data/y.bin"]]
+    assert [f.path for f in get_recursive_listing(path, files)] == [
+        prefix + p for p in ["MLmodel", "data", "data/a", "data/a/x.bin", "data/y.bin"]]
+    assert [(f.path, f.is_dir) for f in get_recursive_listing(path, files, max_depth=1)] == [
+        (prefix + "MLmodel", False), (prefix + "data", True)]
+    assert [f.path for f in get_recursive_listing(path, files, max_depth=2)] == [
+        prefix + p for p in ["MLmodel", "data", "data/a", "data/y.bin"]]
+
+
+def test_open_stream_downloads_file_to_temporary_directory_deleted_on_close():
+    downloaded_paths = []
+
+    def download_file(remote_file_path, local_path):
+        assert remote_file_path == "dir/model.pkl"
+        downloaded_paths.append(local_path)
+        with open(local_path, "wb") as f:
+            f.write(b"0123456789")
+
+    with mock.patch.object(ArtifactRepositoryImpl, "_download_file", side_effect=download_file):
+        stream = ArtifactRepositoryImpl("uri").open_stream("dir/model.pkl")
+    assert stream.size == 10
+    stream.seek(3)
+    assert stream.read(4) == b"3456"
+    assert stream.read() == b"789"
+    assert os.path.exists(downloaded_paths[0])
+    stream.close()
+    assert not os.path.exists(os.path.dirname(downloaded_paths[0]))
+
+
+def test_artifact_stream_reads_from_current_position():
+    contents = b"".join(str(i).encode("utf-8") for i in range(1000))
+    opened_offsets = []
+
+    def open_reader(offset):
+        opened_offsets.append(offset)
+        return io.BytesIO(contents[offset:])
+
+    on_close = mock.Mock()
+    with ArtifactStream(len(contents), open_reader, on_close=on_close) as stream:
+        assert opened_offsets == []
+        assert stream.read(5) == contents[:5]
+        assert stream.read(5) == contents[5:10]
+        stream.seek(100)
+        assert list(stream.iter_chunks(length=250, chunk_size=100)) == \
+            [contents[100:200], contents[200:300], contents[300:350]]
+        assert stream.tell() == 350
+        assert b"".join(stream) == contents[350:]
+        assert stream.read(1) == b""
+    assert opened_offsets == [0, 100]
+    on_close.assert_called_once_with()
+
+
+def test_range_reader_fetches_chunks():
+    contents = b"x" * 10 + b"y" * 10 + b"z" * 5
+    fetched_ranges = []
+
+    def fetch_range(start, end):
+        fetched_ranges.append((start, end))
+        return contents[start:end]
+
+    stream = ArtifactStream(
+        len(contents), lambda offset: RangeReader(fetch_range, offset, len(contents), 10))
+    stream.seek(2)
+    assert stream.read(3) == contents[2:5]
+    assert stream.read() == contents[5:]
+    assert fetched_ranges == [(2, 12), (12, 25)]
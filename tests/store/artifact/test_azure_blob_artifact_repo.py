@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import os
 import posixpath
 import mock
@@ -118,7 +120,7 @@ def test_log_artifact(mock_client, tmpdir):
 
     repo.log_artifact(fpath)
     mock_client.create_blob_from_path.assert_called_with(
-        "container", TEST_ROOT_PATH + "/test.txt", fpath)
+        "container", TEST_ROOT_PATH + "/test.txt", fpath, max_connections=4)
 
 
 def test_log_artifacts(mock_client, tmpdir):
@@ -134,20 +136,50 @@ def test_log_artifacts(mock_client, tmpdir):
 
     mock_client.create_blob_from_path.assert_has_calls([
         mock.call("container", TEST_ROOT_PATH + "/a.txt",
-                  os.path.normpath(parentd.strpath + "/a.txt")),
+                  os.path.normpath(parentd.strpath + "/a.txt"), max_connections=4),
         mock.call("container", TEST_ROOT_PATH + "/subdir/b.txt",
-                  os.path.normpath(subd.strpath + "/b.txt")),
+                  os.path.normpath(subd.strpath + "/b.txt"), max_connections=4),
         mock.call("container", TEST_ROOT_PATH + "/subdir/c.txt",
-                  os.path.normpath(subd.strpath + "/c.txt")),
+                  os.path.normpath(subd.strpath + "/c.txt"), max_connections=4),
     ], any_order=True)
 
 
+def test_log_artifacts_with_sync_only_uploads_new_and_changed_files(mock_client, tmpdir):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    local_dir = tmpdir.mkdir("checkpoint")
+    for name, contents in [("same.bin", "same"), ("changed.bin", "new"), ("new.bin", "new!!"),
+                           ("no-md5.bin", "same")]:
+        local_dir.join(name).write(contents)
+    blobs = []
+    for name, contents, has_md5 in [("same.bin", b"same", True), ("changed.bin", b"old", True),
+                                    ("no-md5.bin", b"same", False)]:
+        props = BlobProperties()
+        props.content_length = len(contents)
+        if has_md5:
+            props.content_settings.content_md5 = base64.b64encode(
+                hashlib.md5(contents).digest()).decode("ascii")
+        blobs.append(Blob(posixpath.join(TEST_ROOT_PATH, "checkpoint", name), props=props))
+    mock_client.list_blobs.return_value = MockBlobList(blobs)
+
+    # The MD5 hash of files uploaded in multiple blocks is computed locally
+    with mock.patch.object(BlockBlobService, "MAX_SINGLE_PUT_SIZE", 4):
+        repo.log_artifacts(local_dir.strpath, "checkpoint", sync=True)
+    mock_client.list_blobs.assert_called_once_with(
+        "container", prefix=TEST_ROOT_PATH + "/checkpoint/", marker=None)
+    calls = sorted(mock_client.create_blob_from_path.call_args_list, key=lambda c: c[0][1])
+    assert [c[0][1] for c in calls] == [
+        TEST_ROOT_PATH + "/checkpoint/" + name for name in ["changed.bin", "new.bin", "no-md5.bin"]]
+    assert "content_settings" not in calls[0][1]
+    assert calls[1][1]["content_settings"].content_md5 == base64.b64encode(
+        hashlib.md5(b"new!!").digest()).decode("ascii")
+
+
 def test_download_file_artifact(mock_client, tmpdir):
     repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
 
     mock_client.list_blobs.return_value = MockBlobList([])
 
-    def create_file(container, cloud_path, local_path):
+    def create_file(container, cloud_path, local_path, **kwargs):
         # pylint: disable=unused-argument
         local_path = os.path.basename(local_path)
         f = tmpdir.join(local_path)
@@ -158,7 +190,7 @@ def test_download_file_artifact(mock_client, tmpdir):
     repo.download_artifacts("test.txt")
     assert os.path.exists(os.path.join(tmpdir.strpath, "test.txt"))
     mock_client.get_blob_to_path.assert_called_with(
-        "container", TEST_ROOT_PATH + "/test.txt", mock.ANY)
+        "container", TEST_ROOT_PATH + "/test.txt", mock.ANY, max_connections=4)
 
 
 def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_container_root(
@@ -191,7 +223,7 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_con
         else:
             return MockBlobList([])
 
-    def create_file(container, cloud_path, local_path):
+    def create_file(container, cloud_path, local_path, **kwargs):
         # pylint: disable=unused-argument
         fname = os.path.basename(local_path)
         f = tmpdir.join(fname)
@@ -235,6 +267,9 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         every level of the directory traversal.
         """
         # pylint: disable=unused-argument
+        if "delimiter" not in kwargs and kwargs["prefix"] == "":
+            # Flat listing of all blobs in the container
+            return MockBlobList([blob_1, blob_2])
         if posixpath.abspath(kwargs["prefix"]) == "/":
             return MockBlobList([dir_prefix])
         if posixpath.abspath(kwargs["prefix"]) == posixpath.abspath(subdir_path):
@@ -242,7 +277,7 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         else:
             return MockBlobList([])
 
-    def create_file(container, cloud_path, local_path):
+    def create_file(container, cloud_path, local_path, **kwargs):
         # pylint: disable=unused-argument
         fname = os.path.basename(local_path)
         f = tmpdir.join(fname)
@@ -290,3 +325,85 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_open_stream_downloads_ranges_of_blob(mock_client):
+    from azure.common import AzureMissingResourceHttpError
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    contents = b"0123456789"
+    mock_client.get_blob_properties.return_value = Blob(
+        props=BlobProperties(), content=None)
+    mock_client.get_blob_properties.return_value.properties.content_length = len(contents)
+    mock_client.get_blob_to_bytes.side_effect = lambda container, blob, start_range, end_range: \
+        Blob(content=contents[start_range:end_range + 1])
+
+    with repo.open_stream("model.bin") as stream:
+        assert stream.size == 10
+        stream.seek(4)
+        assert stream.read() == b"456789"
+    mock_client.get_blob_properties.assert_called_with(
+        "container", TEST_ROOT_PATH + "/model.bin")
+    mock_client.get_blob_to_bytes.assert_called_once_with(
+        "container", TEST_ROOT_PATH + "/model.bin", start_range=4, end_range=9)
+
+    mock_client.get_blob_properties.side_effect = AzureMissingResourceHttpError("missing", 404)
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo.open_stream("missing.bin")
+
+
+def test_list_files_recursive_uses_prefix_listings_without_delimiter(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blobs = []
+    for name in ["model/MLmodel", "model/data/weights.bin", "model/data/more/x.bin"]:
+        props = BlobProperties()
+        props.content_length = len(name)
+        blobs.append(Blob(posixpath.join(TEST_ROOT_PATH, name), props=props))
+    mock_client.list_blobs.side_effect = [MockBlobList(blobs[:2], next_marker="marker"),
+                                          MockBlobList(blobs[2:])]
+
+    files = repo._list_files_recursive("model")
+    assert [(f.path, f.file_size) for f in files] == [
+        ("model/MLmodel", 13), ("model/data/more/x.bin", 21), ("model/data/weights.bin", 22)]
+    assert mock_client.list_blobs.call_args_list == [
+        mock.call("container", prefix="some/path/model/", marker=None),
+        mock.call("container", prefix="some/path/model/", marker="marker")]
+
+    mock_client.list_blobs.side_effect = [MockBlobList(blobs)]
+    assert [f.path for f in repo.list_artifacts_recursive("model")] == [
+        "model/MLmodel", "model/data", "model/data/more", "model/data/more/x.bin",
+        "model/data/weights.bin"]
+
+
+def test_get_file_version_uses_blob_etag(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    properties = BlobProperties()
+    properties.etag = '"0x8D7"'
+    properties.content_length = 10
+    mock_client.get_blob_properties.return_value = Blob("some/path/model.pkl", props=properties)
+    assert repo._get_file_version("model.pkl") == "0x8D7-10"
+    mock_client.get_blob_properties.assert_called_once_with("container", "some/path/model.pkl")
+
+    # Versions reported by listings are the same, so that downloads do not need to request them
+    mock_client.list_blobs.return_value = MockBlobList(
+        [Blob("some/path/model.pkl", props=properties)])
+    assert [(f.path, version) for f, version in repo._list_files_with_versions(None)] == [
+        ("model.pkl", "0x8D7-10")]
+
+
+def test_log_artifacts_uses_max_connections_from_env(mock_client, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_AZURE_MAX_CONNECTIONS", "16")
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    tmpdir.join("a.txt").write("A")
+    repo.log_artifacts(tmpdir.strpath)
+    mock_client.create_blob_from_path.assert_called_once_with(
+        "container", TEST_ROOT_PATH + "/a.txt", tmpdir.join("a.txt").strpath, max_connections=16)
+
+
+def test_clients_are_reused_for_the_same_credentials(mock_client, monkeypatch):
+    # pylint: disable=unused-argument
+    monkeypatch.setenv("AZURE_STORAGE_ACCESS_KEY", "")
+    repo1 = AzureBlobArtifactRepository(TEST_URI)
+    repo2 = AzureBlobArtifactRepository(TEST_BLOB_CONTAINER_ROOT + "other/path")
+    assert repo1.client is repo2.client
+    monkeypatch.setenv("AZURE_STORAGE_ACCESS_KEY", "other")
+    assert AzureBlobArtifactRepository(TEST_URI).client is not repo1.client
@@ -0,0 +1,58 @@
+import hashlib
+import posixpath
+
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.blob_store import compute_file_digest, get_blob_path, \
+    is_manifest_file, make_manifest_entry, merge_manifests, new_manifest_file_name, \
+    parse_manifest, serialize_manifest
+
+
+def test_compute_file_digest(tmpdir):
+    data = b"x" * (3 * 1024 * 1024 + 7)
+    tmpdir.join("file.bin").write_binary(data)
+    digest = compute_file_digest(tmpdir.join("file.bin").strpath)
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert get_blob_path(digest) == "sha256/%s/%s" % (digest[:2], digest)
+
+
+def test_manifest_serialization_round_trips():
+    files = {"model.pkl": make_manifest_entry("s3://bucket/blobs/sha256/ab/abc", "abc", 3)}
+    assert parse_manifest(serialize_manifest(files), "manifest") == files
+
+
+def test_new_manifest_file_names_sort_in_creation_order():
+    with mock.patch("time.time", side_effect=[1000.0, 1000.000001, 1000.5]):
+        names = [new_manifest_file_name() for _ in range(3)]
+    assert sorted(names) == names
+    assert len(set(names)) == 3
+    assert all(is_manifest_file(posixpath.join("some/dir", name)) for name in names)
+    assert not is_manifest_file("some/dir/model.json")
+
+
+def test_merge_manifests_uses_entries_of_latest_manifests():
+    entries = {name: make_manifest_entry("s3://bucket/blobs/" + name, name, 1)
+               for name in ["v1", "v2", "other"]}
+    (old_name, new_name) = (new_manifest_file_name(), new_manifest_file_name())
+    assert merge_manifests({
+        posixpath.join("model", new_name): {"model.pkl": entries["v2"]},
+        posixpath.join("model", old_name): {"model.pkl": entries["v1"],
+                                            "conda.yaml": entries["other"]},
+        posixpath.join("model/data", old_name): {"model.pkl": entries["other"]},
+    }) == {
+        "model/model.pkl": entries["v2"],
+        "model/conda.yaml": entries["other"],
+        "model/data/model.pkl": entries["other"],
+    }
+
+
+@pytest.mark.parametrize("contents, message", [
+    ("not json", "Invalid artifact manifest"),
+    ('{"version": 1}', "Invalid artifact manifest"),
+    ('{"version": 2, "files": {}}', "Unsupported version 2"),
+])
+def test_parse_manifest_rejects_invalid_manifests(contents, message):
+    with pytest.raises(MlflowException, match=message):
+        parse_manifest(contents, "s3://bucket/path/.mlflow-manifest-0-0.json")
@@ -0,0 +1,140 @@
+import io
+import os
+import tarfile
+
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.bundle import ArtifactBundle, extract_artifact_bundle, \
+    get_bundle_filename, validate_compression
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+
+@pytest.fixture
+def local_repo(tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    model_dir = artifact_dir.mkdir("model")
+    model_dir.join("MLmodel").write("flavors: {}")
+    model_dir.mkdir("data").join("weights.bin").write(os.urandom(3000), mode="wb")
+    model_dir.mkdir("empty")
+    artifact_dir.join("notes.txt").write("hello")
+    return LocalArtifactRepository(artifact_dir.strpath)
+
+
+def _read_files(local_dir):
+    files = {}
+    for root, _, filenames in os.walk(local_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, local_dir).replace(os.sep, "/")] = f.read()
+    return files
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_bundle_of_directory_extracts_to_same_layout_as_download(local_repo, tmpdir,
+                                                                 compression):
+    data = b"".join(ArtifactBundle(local_repo, "model", compression=compression))
+    extract_dir = tmpdir.mkdir("extracted").strpath
+    extract_artifact_bundle(io.BytesIO(data), extract_dir, compression=compression)
+
+    download_dir = tmpdir.mkdir("downloaded").strpath
+    local_repo.download_artifacts("model", download_dir)
+    assert _read_files(extract_dir) == _read_files(download_dir)
+    assert set(_read_files(extract_dir)) == {"model/MLmodel", "model/data/weights.bin"}
+    assert os.path.isdir(os.path.join(extract_dir, "model", "empty"))
+
+
+def test_bundle_is_a_valid_tar_archive(local_repo):
+    data = b"".join(ArtifactBundle(local_repo, compression="gzip"))
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        names = tar.getnames()
+        assert tar.extractfile("notes.txt").read() == b"hello"
+    assert sorted(names) == ["model", "model/MLmodel", "model/data", "model/data/weights.bin",
+                             "model/empty", "notes.txt"]
+    assert len(b"".join(ArtifactBundle(local_repo))) % tarfile.RECORDSIZE == 0
+
+
+def test_bundle_of_file_contains_the_file(local_repo, tmpdir):
+    data = b"".join(ArtifactBundle(local_repo, "model/MLmodel"))
+    extract_dir = tmpdir.mkdir("extracted").strpath
+    extract_artifact_bundle(io.BytesIO(data), extract_dir)
+    assert _read_files(extract_dir) == {"MLmodel": b"flavors: {}"}
+
+
+def test_bundle_opens_streams_lazily_and_closes_them(local_repo):
+    streams = []
+    open_stream = local_repo.open_stream
+
+    def record_stream(path):
+        stream = open_stream(path)
+        streams.append(stream)
+        return stream
+
+    with mock.patch.object(local_repo, "open_stream", side_effect=record_stream):
+        chunks = iter(ArtifactBundle(local_repo, "model"))
+        assert streams == []
+        b"".join(chunks)
+    assert len(streams) == 2
+    assert all(stream.closed for stream in streams)
+
+
+def test_bundle_of_missing_artifact_fails_on_creation(local_repo):
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        ArtifactBundle(local_repo, "missing")
+
+
+def test_bundle_fails_if_artifact_is_truncated(local_repo):
+    bundle = ArtifactBundle(local_repo, "model/MLmodel")
+    bundle._first_stream.size += 1
+    with pytest.raises(MlflowException, match="ended after 11 of 12 bytes"):
+        b"".join(bundle)
+
+
+def test_validate_compression():
+    assert validate_compression(None) == "none"
+    assert validate_compression("gzip") == "gzip"
+    with pytest.raises(MlflowException, match="Invalid compression 'bz2'"):
+        validate_compression("bz2")
+    with mock.patch.dict("sys.modules", {"zstandard": None}):
+        with pytest.raises(MlflowException, match="requires the 'zstandard' package"):
+            validate_compression("zstd")
+
+
+def test_get_bundle_filename():
+    assert get_bundle_filename("path/to/model/", "gzip") == "model.tar.gz"
+    assert get_bundle_filename(None, None) == "artifacts.tar"
+
+
+def _make_archive(add_members):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        add_members(tar)
+    buf.seek(0)
+    return buf
+
+
+@pytest.mark.parametrize("name", ["../escaped.txt", "/tmp/absolute.txt", "a/../../escaped.txt"])
+def test_extract_artifact_bundle_rejects_paths_outside_destination(tmpdir, name):
+    def add_members(tar):
+        info = tarfile.TarInfo(name)
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"x"))
+
+    dst_dir = tmpdir.mkdir("dst")
+    with pytest.raises(MlflowException, match="paths must be relative"):
+        extract_artifact_bundle(_make_archive(add_members), dst_dir.strpath)
+    assert not tmpdir.join("escaped.txt").exists()
+
+
+def test_extract_artifact_bundle_rejects_links(tmpdir):
+    def add_members(tar):
+        info = tarfile.TarInfo("link")
+        info.type = tarfile.SYMTYPE
+        info.linkname = "/etc/passwd"
+        tar.addfile(info)
+
+    with pytest.raises(MlflowException, match="only regular files and directories"):
+        extract_artifact_bundle(_make_archive(add_members), tmpdir.strpath)
+    assert not tmpdir.join("link").exists()
@@ -2,12 +2,13 @@ import json
 import os
 import posixpath
 
+from click.testing import CliRunner
 from mock import mock
 
 import mlflow
 import mlflow.pyfunc
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.cli import _file_infos_to_json
+from mlflow.store.artifact.cli import _file_infos_to_json, list_artifacts
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.file_utils import TempDir
 from subprocess import Popen, STDOUT, PIPE
@@ -29,6 +30,19 @@ def test_file_info_to_json():
     }]
 
 
+def test_list_artifacts_prints_file_infos_without_downloading_bundle():
+    file_infos = [FileInfo("model/MLmodel", False, 12), FileInfo("model/data", True, None)]
+    with mock.patch("mlflow.store.artifact.cli._get_store"), \
+            mock.patch("mlflow.store.artifact.cli.get_artifact_repository") as get_repo_mock, \
+            mock.patch("mlflow.store.artifact.cli._download_artifact_bundle") as bundle_mock:
+        get_repo_mock.return_value.list_artifacts.return_value = file_infos
+        result = CliRunner().invoke(list_artifacts, ["--run-id", "run-id", "-a", "model"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == json.loads(_file_infos_to_json(file_infos))
+    get_repo_mock.return_value.list_artifacts.assert_called_once_with("model")
+    bundle_mock.assert_not_called()
+
+
 def test_download_from_uri():
     class TestArtifactRepo:
         def __init__(self, scheme):
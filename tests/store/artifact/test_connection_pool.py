@@ -0,0 +1,66 @@
+import mock
+import pytest
+
+from mlflow.store.artifact.connection_pool import ConnectionPool
+
+
+def _create_pool(**kwargs):
+    connections = iter(range(100))
+    close = mock.Mock()
+    return ConnectionPool(lambda: next(connections), close, **kwargs), close
+
+
+def test_connection_pool_reuses_released_connections():
+    pool, close = _create_pool()
+    with pool.connection() as connection1:
+        with pool.connection() as connection2:
+            assert connection1 != connection2
+    with pool.connection() as connection3:
+        assert connection3 in (connection1, connection2)
+    close.assert_not_called()
+
+
+def test_connection_pool_closes_connections_on_error():
+    pool, close = _create_pool()
+    with pytest.raises(ValueError):
+        with pool.connection() as connection:
+            raise ValueError()
+    close.assert_called_once_with(connection)
+    with pool.connection() as new_connection:
+        assert new_connection != connection
+
+
+def test_connection_pool_closes_connections_above_max_idle_connections():
+    pool, close = _create_pool(max_idle_connections=1)
+    with pool.connection() as connection1:
+        with pool.connection() as connection2:
+            pass
+    close.assert_called_once_with(connection1)
+    with pool.connection() as connection3:
+        assert connection3 == connection2
+    pool.close()
+    close.assert_called_with(connection2)
+
+
+def test_connection_pool_checks_idle_connections_are_alive():
+    is_alive = mock.Mock(side_effect=[False, True])
+    pool, close = _create_pool(is_alive=is_alive, idle_check_seconds=0)
+    with pool.connection() as connection1:
+        pass
+    with pool.connection() as connection2:
+        pass
+    is_alive.assert_called_once_with(connection1)
+    close.assert_called_once_with(connection1)
+    assert connection2 != connection1
+    with pool.connection() as connection3:
+        assert connection3 == connection2
+
+
+def test_connection_pool_does_not_check_recently_used_connections():
+    is_alive = mock.Mock()
+    pool, _ = _create_pool(is_alive=is_alive, idle_check_seconds=3600)
+    with pool.connection():
+        pass
+    with pool.connection():
+        pass
+    is_alive.assert_not_called()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
 import os
+import threading
 
 import pytest
 import mock
@@ -194,29 +195,20 @@ class TestDbfsArtifactRepository(object):
             assert len(list_on_file) == 0
 
     def test_download_artifacts(self, dbfs_artifact_repo):
-        with mock.patch(DBFS_ARTIFACT_REPOSITORY + '._dbfs_is_dir') as is_dir_mock,\
-                mock.patch(DBFS_ARTIFACT_REPOSITORY + '._dbfs_list_api') as list_mock, \
+        with mock.patch(DBFS_ARTIFACT_REPOSITORY + '._dbfs_list_api') as list_mock, \
                 mock.patch(DBFS_ARTIFACT_REPOSITORY + '._dbfs_download') as download_mock:
-            is_dir_mock.side_effect = [
-                True,
-                False,
-                True,
-            ]
             list_mock.side_effect = [
                 Mock(text=json.dumps(LIST_ARTIFACTS_RESPONSE)),
-                Mock(text='{}'),  # this call is for listing `/dir`.
-                Mock(text='{}')   # this call is for listing `/dir/a.txt`.
+                # this call is for listing `/dir`.
+                Mock(text=json.dumps({'files': [
+                    {'path': '/test/dir/b.txt', 'is_dir': False, 'file_size': 10}]})),
             ]
             dbfs_artifact_repo.download_artifacts('/')
-            assert list_mock.call_count == 3
-            assert download_mock.call_count == 2
-            chronological_download_calls = list(download_mock.call_args_list)
-            # Calls are in reverse chronological order by default
-            chronological_download_calls.reverse()
-            _, kwargs_call_1 = chronological_download_calls[0]
-            _, kwargs_call_2 = chronological_download_calls[1]
-            assert kwargs_call_1['endpoint'] == '/dbfs/test/dir'
-            assert kwargs_call_2['endpoint'] == '/dbfs/test/a.txt'
+            assert list_mock.call_count == 2
+            # Files are downloaded concurrently, in no particular order
+            download_endpoints = set(kwargs['endpoint'] for _, kwargs
+                                     in download_mock.call_args_list)
+            assert download_endpoints == {'/dbfs/test/a.txt', '/dbfs/test/dir/b.txt'}
 
 
 def test_get_host_creds_from_default_store_file_store():
@@ -230,3 +222,91 @@ def test_get_host_creds_from_default_store_rest_store():
     with mock.patch('mlflow.tracking._tracking_service.utils._get_store') as get_store_mock:
         get_store_mock.return_value = RestStore(lambda: MlflowHostCreds('http://host'))
         assert isinstance(_get_host_creds_from_default_store()(), MlflowHostCreds)
+
+
+@pytest.fixture()
+def dbfs_server():
+    """
+    Local stand-in for the DBFS API, storing files in memory. Yields the server, whose ``files``
+    map DBFS paths to their contents and whose ``connections`` are the client addresses of the
+    connections it accepted.
+    """
+    from six.moves import BaseHTTPServer, socketserver
+
+    class DbfsRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+        def _read_body(self):
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _respond(self, status, body):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            server.connections.add(self.client_address)
+            body = self._read_body()
+            if self.path == "/api/2.0/dbfs/list":
+                path = json.loads(body.decode("utf-8"))["path"].rstrip("/")
+                if path in server.files:
+                    listed = [path]
+                else:
+                    listed = set(p[:p.index("/", len(path) + 1)] if "/" in p[len(path) + 1:]
+                                 else p for p in server.files if p.startswith(path + "/"))
+                files = [{"path": p, "is_dir": p not in server.files,
+                          "file_size": len(server.files.get(p, b""))} for p in sorted(listed)]
+                self._respond(200, json.dumps({"files": files}).encode("utf-8"))
+            elif self.path[len("/dbfs"):] in server.files:
+                self._respond(200, server.files[self.path[len("/dbfs"):]])
+            else:
+                self._respond(404, b'{"error_code": "RESOURCE_DOES_NOT_EXIST"}')
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            server.connections.add(self.client_address)
+            server.files[self.path[len("/dbfs"):]] = self._read_body()
+            self._respond(200, b"{}")
+
+    class ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+        daemon_threads = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DbfsRequestHandler)
+    server.files = {}
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_log_and_download_artifacts_through_dbfs_api_reuse_connections(dbfs_server, tmpdir):
+    host = "http://%s:%d" % dbfs_server.server_address
+    with mock.patch(DBFS_ARTIFACT_REPOSITORY_PACKAGE + "._get_host_creds_from_default_store",
+                    return_value=lambda: MlflowHostCreds(host)):
+        repo = get_artifact_repository("dbfs:/runs/run1/artifacts")
+    local_dir = tmpdir.mkdir("model")
+    for i in range(10):
+        local_dir.join("data", "part-%d" % i).write("part %d" % i, ensure=True)
+    local_dir.join("MLmodel").write("flavors: {}")
+    local_dir.join("empty").write("")
+
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS": "4"}):
+        repo.log_artifacts(local_dir.strpath, "model")
+        assert dbfs_server.files["/runs/run1/artifacts/model/data/part-7"] == b"part 7"
+        assert dbfs_server.files["/runs/run1/artifacts/model/empty"] == b""
+
+        with mock.patch.object(repo, "_dbfs_list_api", wraps=repo._dbfs_list_api) as list_mock:
+            downloaded_dir = repo.download_artifacts("model", tmpdir.mkdir("dst").strpath)
+        # The directories of each level are listed concurrently
+        assert list_mock.call_count == 2
+    assert open(os.path.join(downloaded_dir, "data", "part-3")).read() == "part 3"
+    assert open(os.path.join(downloaded_dir, "MLmodel")).read() == "flavors: {}"
+    assert open(os.path.join(downloaded_dir, "empty")).read() == ""
+    # The 26 requests reused at most one connection per concurrent transfer
+    assert len(dbfs_server.connections) <= 4
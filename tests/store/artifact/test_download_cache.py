@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import mock
+
+from mlflow.store.artifact.download_cache import ArtifactDownloadCache, \
+    get_artifact_download_cache
+
+
+def _write(contents):
+    def download_file(path):
+        with open(path, "w") as f:
+            f.write(contents)
+    return download_file
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_download_cache_serves_cached_files(tmpdir):
+    cache = ArtifactDownloadCache(tmpdir.join("cache").strpath)
+    download_file = mock.Mock(side_effect=_write("model"))
+    first_path = tmpdir.join("first").strpath
+    second_path = tmpdir.join("second").strpath
+
+    assert not cache.download("s3://bucket/model.pkl@etag", first_path, download_file)
+    assert cache.download("s3://bucket/model.pkl@etag", second_path, download_file)
+    assert _read(first_path) == _read(second_path) == "model"
+    assert download_file.call_count == 1
+
+    # Other versions of the file are downloaded again
+    assert not cache.download("s3://bucket/model.pkl@other-etag", second_path, _write("new"))
+    assert _read(second_path) == "new"
+    assert os.listdir(tmpdir.join("cache", "tmp").strpath) == []
+
+
+def test_download_cache_evicts_least_recently_used_files(tmpdir):
+    cache = ArtifactDownloadCache(tmpdir.join("cache").strpath, max_size_bytes=25)
+    local_path = tmpdir.join("file").strpath
+    for i, key in enumerate(["a", "b"]):
+        cache.download(key, local_path, _write("0123456789"))
+        os.utime(cache._get_entry_path(key), (i, i))
+    # Using "a" makes "b" the least recently used file
+    assert cache.download("a", local_path, _write("0123456789"))
+    cache.download("c", local_path, _write("0123456789"))
+    assert cache.get_size() == 20
+    assert cache.download("a", local_path, _write("0123456789"))
+    assert not cache.download("b", local_path, _write("0123456789"))
+
+
+def test_download_cache_only_evicts_files_when_too_large(tmpdir):
+    cache = ArtifactDownloadCache(tmpdir.join("cache").strpath, max_size_bytes=25)
+    local_path = tmpdir.join("file").strpath
+    with mock.patch.object(cache, "evict", wraps=cache.evict) as evict_mock:
+        for key in ["a", "b"]:
+            cache.download(key, local_path, _write("0123456789"))
+        evict_mock.assert_not_called()
+        cache.download("c", local_path, _write("0123456789"))
+        assert evict_mock.call_count == 1
+        assert cache.get_size() == 20
+        cache.download("a", local_path, _write("0123456789"))
+        assert evict_mock.call_count == 2
+
+
+def _download_in_process(cache_dir, local_path):
+    cache = ArtifactDownloadCache(cache_dir)
+    cache.download("shared", local_path, _write("x" * 100000))
+    return _read(local_path)
+
+
+def test_download_cache_can_be_shared_by_processes(tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_download_in_process, [cache_dir] * 8,
+                                    [tmpdir.join("file%d" % i).strpath for i in range(8)]))
+    assert results == ["x" * 100000] * 8
+    assert ArtifactDownloadCache(cache_dir).get_size() == 100000
+
+
+def test_get_artifact_download_cache(tmpdir):
+    with mock.patch.dict(os.environ, {}, clear=True):
+        assert get_artifact_download_cache() is None
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_CACHE_DIR": tmpdir.strpath,
+                                      "MLFLOW_ARTIFACT_CACHE_MAX_SIZE": "1000"}):
+        cache = get_artifact_download_cache()
+        assert get_artifact_download_cache() is cache
+    assert cache.root_dir == tmpdir.strpath
+    assert cache.max_size_bytes == 1000
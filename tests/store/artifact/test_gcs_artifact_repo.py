@@ -1,10 +1,13 @@
 # pylint: disable=redefined-outer-name
+import base64
+import hashlib
 import os
 import mock
 import pytest
 
 from google.cloud.storage import client as gcs_client
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
 from google.auth.exceptions import DefaultCredentialsError
@@ -154,6 +157,31 @@ def test_log_artifacts(gcs_mock, tmpdir):
         ], any_order=True)
 
 
+def test_log_artifacts_with_sync_only_uploads_new_and_changed_files(gcs_mock, tmpdir):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    local_dir = tmpdir.mkdir("checkpoint")
+    for name, contents in [("same.bin", "same"), ("changed.bin", "new"), ("new.bin", "new"),
+                           ("composite.bin", "same")]:
+        local_dir.join(name).write(contents)
+    blobs = []
+    # Composite blobs have no MD5 hash
+    for name, contents, has_md5 in [("same.bin", b"same", True), ("changed.bin", b"old", True),
+                                    ("composite.bin", b"same", False)]:
+        blob = mock.Mock(size=len(contents))
+        blob.name = "some/path/checkpoint/" + name
+        blob.md5_hash = base64.b64encode(hashlib.md5(contents).digest()).decode("ascii") \
+            if has_md5 else None
+        blobs.append(blob)
+    bucket_mock = gcs_mock.Client.return_value.bucket.return_value
+    bucket_mock.list_blobs.return_value = blobs
+
+    repo.log_artifacts(local_dir.strpath, "checkpoint", sync=True)
+    bucket_mock.list_blobs.assert_called_once_with(prefix="some/path/checkpoint/")
+    assert sorted(args[0] for args, _ in bucket_mock.blob.call_args_list) == [
+        "some/path/checkpoint/changed.bin", "some/path/checkpoint/composite.bin",
+        "some/path/checkpoint/new.bin"]
+
+
 def test_download_artifacts_calls_expected_gcs_client_methods(gcs_mock, tmpdir):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
 
@@ -162,16 +190,17 @@ def test_download_artifacts_calls_expected_gcs_client_methods(gcs_mock, tmpdir):
         f = tmpdir.join(fname)
         f.write("hello world!")
 
-    gcs_mock.Client.return_value.bucket.return_value.blob.return_value\
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value.size = 12
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value\
         .download_to_filename.side_effect = mkfile
 
     repo.download_artifacts("test.txt")
     assert os.path.exists(os.path.join(tmpdir.strpath, "test.txt"))
     gcs_mock.Client().bucket.assert_called_with('test_bucket')
-    gcs_mock.Client().bucket().blob\
+    gcs_mock.Client().bucket().get_blob\
         .assert_called_with('some/path/test.txt')
     download_calls = \
-        gcs_mock.Client().bucket().blob().download_to_filename.call_args_list
+        gcs_mock.Client().bucket().get_blob().download_to_filename.call_args_list
     assert len(download_calls) == 1
     download_path_arg = download_calls[0][0][0]
     assert "test.txt" in download_path_arg
@@ -232,7 +261,8 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     gcs_mock.Client.return_value.bucket.return_value\
         .list_blobs.side_effect = get_mock_listing
 
-    gcs_mock.Client.return_value.bucket.return_value.blob.return_value\
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value.size = 12
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value\
         .download_to_filename.side_effect = mkfile
 
     # Ensure that the root directory can be downloaded successfully
@@ -241,3 +271,110 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_open_stream_downloads_ranges_of_blob(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    contents = b"0123456789"
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value
+    blob_mock.size = len(contents)
+    blob_mock.download_as_string.side_effect = lambda start, end: contents[start:end + 1]
+
+    with repo.open_stream("model.bin") as stream:
+        assert stream.size == 10
+        stream.seek(4)
+        assert stream.read() == b"456789"
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.assert_called_with(
+        "some/path/model.bin")
+    blob_mock.download_as_string.assert_called_once_with(start=4, end=9)
+
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value = None
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo.open_stream("missing.bin")
+
+
+def test_list_files_recursive_uses_single_prefix_listing(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blobs = []
+    for name, size in [("some/path/model/MLmodel", 1), ("some/path/model/data/", 0),
+                       ("some/path/model/data/weights.bin", 10)]:
+        blob = mock.Mock(size=size)
+        blob.name = name
+        blobs.append(blob)
+    list_blobs_mock = gcs_mock.Client.return_value.bucket.return_value.list_blobs
+    list_blobs_mock.return_value = blobs
+
+    files = repo._list_files_recursive("model")
+    assert [(f.path, f.is_dir, f.file_size) for f in files] == [
+        ("model/MLmodel", False, 1), ("model/data/weights.bin", False, 10)]
+    list_blobs_mock.assert_called_once_with(prefix="some/path/model/")
+
+    files = repo.list_artifacts_recursive("model", max_depth=1)
+    assert [(f.path, f.is_dir, f.file_size) for f in files] == [
+        ("model/MLmodel", False, 1), ("model/data", True, None)]
+
+
+def test_get_file_version_uses_blob_generation(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    get_blob_mock = gcs_mock.Client.return_value.bucket.return_value.get_blob
+    get_blob_mock.return_value = mock.Mock(generation=1234, size=10)
+    assert repo._get_file_version("model.pkl") == "1234-10"
+    get_blob_mock.assert_called_once_with("some/path/model.pkl")
+    get_blob_mock.return_value = None
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo._get_file_version("missing.pkl")
+
+    # Versions reported by listings are the same, so that downloads do not need to request them
+    blob = mock.Mock(generation=1234, size=10)
+    blob.name = "some/path/model.pkl"
+    gcs_mock.Client.return_value.bucket.return_value.list_blobs.return_value = [blob]
+    assert [(f.path, version) for f, version in repo._list_files_with_versions(None)] == [
+        ("model.pkl", "1234-10")]
+
+
+def test_download_file_downloads_large_blobs_in_concurrent_ranges(gcs_mock, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE", "4")
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    contents = b"0123456789"
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value
+    blob_mock.size = len(contents)
+    # Only the arguments supported by google-cloud-storage 1.14 are accepted
+    blob_mock.download_as_string.side_effect = lambda start, end: contents[start:end + 1]
+
+    local_path = tmpdir.join("model.pkl").strpath
+    repo._download_file("model.pkl", local_path)
+
+    with open(local_path, "rb") as f:
+        assert f.read() == contents
+    blob_mock.download_to_filename.assert_not_called()
+    blob_mock.download_as_string.assert_has_calls([
+        mock.call(start=0, end=3),
+        mock.call(start=4, end=7),
+        mock.call(start=8, end=9),
+    ], any_order=True)
+
+
+def test_download_file_raises_for_missing_blob(gcs_mock, tmpdir):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value = None
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo._download_file("missing", tmpdir.join("missing").strpath)
+
+
+def test_log_artifacts_uses_upload_chunk_size_from_env(gcs_mock, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_GCS_UPLOAD_CHUNK_SIZE", str(512 * 1024))
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    tmpdir.mkdir("data").join("a.txt").write("A")
+    repo.log_artifacts(tmpdir.join("data").strpath)
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.blob.return_value
+    assert blob_mock.chunk_size == 512 * 1024
+
+    monkeypatch.setenv("MLFLOW_GCS_UPLOAD_CHUNK_SIZE", "1000")
+    with pytest.raises(MlflowException, match="multiple of 262144"):
+        repo.log_artifacts(tmpdir.join("data").strpath)
+
+
+def test_storage_clients_are_reused(gcs_mock):
+    GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)._get_bucket("test_bucket")
+    GCSArtifactRepository("gs://other_bucket/path", gcs_mock)._get_bucket("other_bucket")
+    assert gcs_mock.Client.call_count == 1
@@ -8,11 +8,19 @@ from mock import call, mock_open
 from pyarrow import HadoopFileSystem
 
 from mlflow.entities import FileInfo
+from mlflow.store.artifact import hdfs_artifact_repo
 from mlflow.store.artifact.hdfs_artifact_repo import HdfsArtifactRepository, _resolve_base_path, \
     _relative_path_remote, _parse_extra_conf, _download_hdfs_file
 from mlflow.utils.file_utils import TempDir
 
 
+@pytest.fixture(autouse=True)
+def clear_cached_filesystems():
+    hdfs_artifact_repo._hdfs_filesystems.clear()
+    yield
+    hdfs_artifact_repo._hdfs_filesystems.clear()
+
+
 @mock.patch('pyarrow.hdfs.HadoopFileSystem')
 def test_log_artifact(hdfs_system_mock):
     repo = HdfsArtifactRepository('hdfs://host_name:8020/hdfs/path')
@@ -191,3 +199,64 @@ def test_download_artifacts():
                             os.path.join(tmp_dir.path(), artifact_path))
         with open(os.path.join(tmp_dir.path(), artifact_path), "rb") as fd:
             assert expected_data == fd.read()
+
+
+@mock.patch('pyarrow.hdfs.HadoopFileSystem')
+def test_filesystem_handle_is_reused_across_operations(hdfs_system_mock):
+    hdfs_system_mock.return_value.ls.return_value = []
+    repo = HdfsArtifactRepository('hdfs://host_name:8020/hdfs/path')
+    repo.list_artifacts()
+    HdfsArtifactRepository('hdfs://host_name:8020/hdfs/other/path').list_artifacts()
+    hdfs_system_mock.assert_called_once()
+    hdfs_system_mock.return_value.close.assert_not_called()
+
+    HdfsArtifactRepository('hdfs://other_host:8020/hdfs/path').list_artifacts()
+    assert hdfs_system_mock.call_count == 2
+
+
+@mock.patch('pyarrow.hdfs.HadoopFileSystem')
+def test_filesystem_handle_is_discarded_after_io_error(hdfs_system_mock):
+    hdfs_system_mock.return_value.exists.side_effect = [IOError("Connection lost"), False]
+    repo = HdfsArtifactRepository('hdfs://host_name:8020/hdfs/path')
+    with pytest.raises(IOError, match="Connection lost"):
+        repo.list_artifacts()
+    assert repo.list_artifacts() == []
+    assert hdfs_system_mock.call_count == 2
+
+
+@mock.patch('pyarrow.hdfs.HadoopFileSystem')
+def test_download_artifacts_lists_each_directory_once(hdfs_system_mock):
+    hdfs = hdfs_system_mock.return_value
+    listings = {
+        '/some/path/model': [
+            {'kind': 'file', 'name': 'hdfs://host/some/path/model/MLmodel', 'size': 2},
+            {'kind': 'directory', 'name': 'hdfs://host/some/path/model/data', 'size': 0},
+        ],
+        '/some/path/model/data': [
+            {'kind': 'file', 'name': 'hdfs://host/some/path/model/data/model.pkl', 'size': 3},
+        ],
+    }
+    hdfs.exists.return_value = True
+    hdfs.isdir.side_effect = lambda path: path in listings
+    hdfs.ls.side_effect = lambda path, detail: listings[path]
+    contents = {
+        '/some/path/model/MLmodel': b'ML',
+        '/some/path/model/data/model.pkl': b'pkl',
+    }
+    hdfs.open.side_effect = lambda path, mode: mock_open(read_data=contents[path])()
+
+    repo = HdfsArtifactRepository('hdfs://host/some/path')
+    with TempDir() as tmp_dir:
+        local_dir = repo.download_artifacts('model', tmp_dir.path())
+        with open(os.path.join(local_dir, 'MLmodel'), 'rb') as f:
+            assert f.read() == b'ML'
+        with open(os.path.join(local_dir, 'data', 'model.pkl'), 'rb') as f:
+            assert f.read() == b'pkl'
+
+    assert sorted(c[0][0] for c in hdfs.ls.call_args_list) == sorted(listings)
+    hdfs.info.assert_not_called()
+    hdfs.walk.assert_not_called()
+    assert repo._list_files_recursive('model') == [
+        FileInfo('model/MLmodel', False, 2), FileInfo('model/data/model.pkl', False, 3)]
+    assert repo.list_artifacts_recursive('model', max_depth=1) == [
+        FileInfo('model/MLmodel', False, 2), FileInfo('model/data', True, None)]
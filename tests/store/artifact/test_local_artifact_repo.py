@@ -1,4 +1,7 @@
 import os
+import shutil
+
+import mock
 import pytest
 import posixpath
 
@@ -30,6 +33,27 @@ def test_list_artifacts(local_artifact_repo, local_artifact_root):
     assert artifacts_list[0].path == artifact_rel_path
 
 
+def test_list_artifacts_recursive(local_artifact_repo, local_artifact_root):
+    assert local_artifact_repo.list_artifacts_recursive() == []
+    for rel_path in ["MLmodel", "data/model.pkl", "data/nested/weights.bin"]:
+        path = os.path.join(local_artifact_root, "model", *rel_path.split("/"))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(rel_path)
+    os.mkdir(os.path.join(local_artifact_root, "model", "empty"))
+
+    infos = local_artifact_repo.list_artifacts_recursive("model")
+    assert [(f.path, f.is_dir, f.file_size) for f in infos] == [
+        ("model/MLmodel", False, 7), ("model/data", True, None),
+        ("model/data/model.pkl", False, 14), ("model/data/nested", True, None),
+        ("model/data/nested/weights.bin", False, 23), ("model/empty", True, None)]
+    assert [f.path for f in local_artifact_repo.list_artifacts_recursive(max_depth=2)] == [
+        "model", "model/MLmodel", "model/data", "model/empty"]
+    assert local_artifact_repo.list_artifacts_recursive("model/MLmodel") == []
+    assert local_artifact_repo.list_artifacts_recursive("missing") == []
+
+
 def test_log_artifacts(local_artifact_repo, local_artifact_root):
     artifact_rel_path = "test.txt"
     artifact_text = "hello world!"
@@ -158,3 +182,124 @@ def test_hidden_files_are_logged_correctly(local_artifact_repo):
             f.write("42")
         local_artifact_repo.log_artifact(hidden_file)
         assert open(local_artifact_repo.download_artifacts(".mystery")).read() == "42"
+
+
+def test_open_stream(local_artifact_repo, tmpdir):
+    artifact_src_path = tmpdir.join("test.txt")
+    artifact_src_path.write("hello world!")
+    local_artifact_repo.log_artifact(artifact_src_path.strpath, "subdir")
+    with local_artifact_repo.open_stream("subdir/test.txt") as stream:
+        assert stream.size == 12
+        stream.seek(6)
+        assert stream.read() == b"world!"
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        local_artifact_repo.open_stream("subdir/missing.txt")
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        local_artifact_repo.open_stream("subdir")
+
+
+def test_log_artifacts_with_sync_only_copies_new_and_changed_files(
+        local_artifact_repo, tmpdir_factory):
+    src_dir = tmpdir_factory.mktemp("checkpoint")
+    src_dir.join("weights", "layer1.bin").write("1", ensure=True)
+    src_dir.join("weights", "layer2.bin").write("2")
+    src_dir.join("step.txt").write("1")
+    local_artifact_repo.log_artifacts(src_dir.strpath, "checkpoint", sync=True)
+
+    src_dir.join("weights", "layer2.bin").write("3")
+    src_dir.join("step.txt").write("2")
+    src_dir.join("optimizer.bin").write("4")
+    with mock.patch("shutil.copy2", wraps=shutil.copy2) as copy_mock:
+        local_artifact_repo.log_artifacts(src_dir.strpath, "checkpoint", sync=True)
+    assert sorted(os.path.basename(args[0]) for args, _ in copy_mock.call_args_list) == [
+        "layer2.bin", "optimizer.bin", "step.txt"]
+    for rel_path, contents in [("weights/layer1.bin", "1"), ("weights/layer2.bin", "3"),
+                               ("step.txt", "2"), ("optimizer.bin", "4")]:
+        path = local_artifact_repo.download_artifacts(posixpath.join("checkpoint", rel_path))
+        assert open(path).read() == contents
+
+    with mock.patch("shutil.copy2") as copy_mock:
+        local_artifact_repo.log_artifacts(src_dir.strpath, "checkpoint", sync=True)
+    copy_mock.assert_not_called()
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="Hard links are not supported")
+def test_log_artifacts_hard_links_files_in_hardlink_mode(local_artifact_repo, tmpdir_factory,
+                                                         monkeypatch):
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", "hardlink")
+    src_dir = tmpdir_factory.mktemp("src")
+    src_dir.join("subdir", "nested", "a.txt").write("A", ensure=True)
+    src_dir.join("subdir", "b.txt").write("B")
+    src_dir.join("c.txt").write("C")
+    local_artifact_repo.log_artifacts(src_dir.join("subdir").strpath, "dir")
+    local_artifact_repo.log_artifact(src_dir.join("c.txt").strpath)
+    for artifact_path, local_path in [("dir/nested/a.txt", src_dir.join("subdir/nested/a.txt")),
+                                      ("dir/b.txt", src_dir.join("subdir", "b.txt")),
+                                      ("c.txt", src_dir.join("c.txt"))]:
+        logged_path = local_artifact_repo.download_artifacts(artifact_path)
+        assert os.path.samefile(logged_path, local_path.strpath)
+
+    # Downloaded files are not linked to the logged artifacts
+    dst_dir = tmpdir_factory.mktemp("dst").strpath
+    downloaded_path = local_artifact_repo.download_artifacts("c.txt", dst_dir)
+    assert open(downloaded_path).read() == "C"
+    assert not os.path.samefile(downloaded_path, src_dir.join("c.txt").strpath)
+
+
+def test_log_artifacts_moves_files_in_move_mode(local_artifact_repo, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", "move")
+    tmpdir.join("subdir", "nested", "a.txt").write("A", ensure=True)
+    tmpdir.join("subdir", "b.txt").write("B")
+    local_artifact_repo.log_artifacts(tmpdir.join("subdir").strpath)
+    assert open(local_artifact_repo.download_artifacts("nested/a.txt")).read() == "A"
+    assert open(local_artifact_repo.download_artifacts("b.txt")).read() == "B"
+    assert not tmpdir.join("subdir", "nested", "a.txt").exists()
+    assert not tmpdir.join("subdir", "b.txt").exists()
+
+
+def test_log_artifact_throws_exception_for_invalid_transfer_mode(local_artifact_repo, tmpdir,
+                                                                 monkeypatch):
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", "symlink")
+    tmpdir.join("a.txt").write("A")
+    with pytest.raises(MlflowException, match="MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE"):
+        local_artifact_repo.log_artifact(tmpdir.join("a.txt").strpath)
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="Hard links are not supported")
+def test_log_artifacts_to_blob_store_hard_links_identical_files(tmpdir_factory, monkeypatch):
+    from mlflow.utils.file_utils import path_to_local_file_uri
+    blob_store_dir = tmpdir_factory.mktemp("blobs")
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", path_to_local_file_uri(
+        blob_store_dir.strpath))
+    src_dir = tmpdir_factory.mktemp("src")
+    src_dir.join("model", "data", "weights.bin").write("shared weights", ensure=True)
+    src_dir.join("model", "vocab.txt").write("shared vocabulary")
+    src_dir.join("conda.yaml").write("shared environment")
+
+    repos = [LocalArtifactRepository(tmpdir_factory.mktemp(run_id).strpath)
+             for run_id in ["run1", "run2"]]
+    for repo in repos:
+        repo.log_artifacts(src_dir.join("model").strpath, "model")
+        repo.log_artifact(src_dir.join("conda.yaml").strpath, "model")
+
+    assert len(blob_store_dir.join("sha256").listdir()) == 3
+    for path in ["model/data/weights.bin", "model/vocab.txt", "model/conda.yaml"]:
+        assert os.path.samefile(repos[0].download_artifacts(path),
+                                repos[1].download_artifacts(path))
+    assert open(repos[1].download_artifacts("model/vocab.txt")).read() == "shared vocabulary"
+    # Source files are not linked to the blobs
+    assert os.stat(src_dir.join("conda.yaml").strpath).st_nlink == 1
+
+    # Overwriting an artifact without the blob store does not alter the artifacts of other runs
+    monkeypatch.delenv("MLFLOW_ARTIFACT_BLOB_STORE_URI")
+    src_dir.join("conda.yaml").write("other environment")
+    repos[0].log_artifact(src_dir.join("conda.yaml").strpath, "model")
+    assert open(repos[0].download_artifacts("model/conda.yaml")).read() == "other environment"
+    assert open(repos[1].download_artifacts("model/conda.yaml")).read() == "shared environment"
+
+
+def test_blob_store_must_be_local(local_artifact_repo, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", "s3://bucket/blobs")
+    tmpdir.join("a.txt").write("A")
+    with pytest.raises(MlflowException, match="must be a local path"):
+        local_artifact_repo.log_artifact(tmpdir.join("a.txt").strpath)
@@ -0,0 +1,74 @@
+import errno
+import os
+import stat
+
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact import local_transfer
+from mlflow.store.artifact.local_transfer import get_transfer_mode, transfer_file
+
+
+def test_get_transfer_mode(monkeypatch):
+    monkeypatch.delenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", raising=False)
+    assert get_transfer_mode() == "copy"
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", "HardLink")
+    assert get_transfer_mode() == "hardlink"
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_TRANSFER_MODE", "symlink")
+    with pytest.raises(MlflowException, match="must be one of copy, reflink, hardlink, move"):
+        get_transfer_mode()
+
+
+@pytest.mark.parametrize("mode", ["copy", "reflink", "hardlink", "move"])
+def test_transfer_file_replaces_destination_and_preserves_mode(tmpdir, mode):
+    src = tmpdir.join("src.sh")
+    src.write("#!/bin/sh")
+    os.chmod(src.strpath, 0o755)
+    dst = tmpdir.join("dst.sh")
+    dst.write("previous contents")
+    transfer_file(src.strpath, dst.strpath, mode)
+    assert dst.read() == "#!/bin/sh"
+    assert stat.S_IMODE(os.stat(dst.strpath).st_mode) & 0o111
+    assert src.exists() == (mode != "move")
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="Hard links are not supported")
+def test_transfer_file_hard_links_file(tmpdir):
+    src = tmpdir.join("src.txt")
+    src.write("data")
+    assert transfer_file(src.strpath, tmpdir.join("dst.txt").strpath, "hardlink") == "hardlink"
+    assert os.path.samefile(src.strpath, tmpdir.join("dst.txt").strpath)
+
+
+def test_transfer_file_copies_file_when_it_cannot_be_linked_or_renamed(tmpdir):
+    src = tmpdir.join("src.txt")
+    src.write("data")
+    cross_device_error = OSError(errno.EXDEV, "Invalid cross-device link")
+    with mock.patch("os.link", side_effect=cross_device_error, create=True), \
+            mock.patch.object(local_transfer, "_clone_file", return_value=False):
+        assert transfer_file(src.strpath, tmpdir.join("linked.txt").strpath, "hardlink") == "copy"
+    assert tmpdir.join("linked.txt").read() == "data"
+    assert not os.path.samefile(src.strpath, tmpdir.join("linked.txt").strpath)
+
+    rename = "os.replace" if hasattr(os, "replace") else "os.rename"
+    with mock.patch(rename, side_effect=cross_device_error), \
+            mock.patch.object(local_transfer, "_clone_file", return_value=False):
+        assert transfer_file(src.strpath, tmpdir.join("moved.txt").strpath, "move") == "copy"
+    assert tmpdir.join("moved.txt").read() == "data"
+    assert not src.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "pread"), reason="Positional I/O is not supported")
+def test_copy_file_copies_large_files_in_chunks(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_COPY_CHUNK_SIZE", "1000")
+    data = os.urandom(4500)
+    src = tmpdir.join("src.bin")
+    src.write_binary(data)
+    dst = tmpdir.join("dst.bin")
+    dst.write_binary(b"x" * 10000)
+    with mock.patch.object(local_transfer, "run_concurrently",
+                           wraps=local_transfer.run_concurrently) as run_concurrently_mock:
+        local_transfer._copy_file(src.strpath, dst.strpath)
+    assert len(run_concurrently_mock.call_args[0][1]) == 5
+    assert dst.read_binary() == data
@@ -1,9 +1,12 @@
+import os
+
 import mock
 import pytest
 from mock import Mock
 
 from mlflow.entities.model_registry import ModelVersionDetailed, RegisteredModel
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact import resolution_cache
 from mlflow.store.artifact.dbfs_artifact_repo import DbfsRestArtifactRepository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
 from mlflow.tracking import MlflowClient
@@ -96,3 +99,49 @@ def test_models_artifact_repo_uses_repo_download_artifacts():
         models_repo.repo = Mock()
         models_repo.download_artifacts('artifact_path', 'dst_path')
         models_repo.repo.download_artifacts.assert_called_once()
+
+
+def test_models_artifact_repo_caches_resolution_of_stage_uri():
+    model_uri = "models:/MyModel/Production"
+    model_version_detailed = ModelVersionDetailed(RegisteredModel("MyModel"), 10, "2345671890",
+                                                  "234567890", "some description", "UserID",
+                                                  "Production", "source", "run12345")
+    get_latest_versions_patch = mock.patch.object(MlflowClient, "get_latest_versions",
+                                                  return_value=[model_version_detailed])
+    get_model_version_download_uri_patch = mock.patch.object(MlflowClient,
+                                                             "get_model_version_download_uri",
+                                                             return_value="s3://bucket/model")
+    with get_latest_versions_patch as get_latest_versions_mock, \
+            get_model_version_download_uri_patch as get_download_uri_mock:
+        for _ in range(3):
+            assert ModelsArtifactRepository.get_underlying_uri(model_uri) == "s3://bucket/model"
+        get_latest_versions_mock.assert_called_once_with("MyModel", ["Production"])
+        get_download_uri_mock.assert_called_once_with("MyModel", 10)
+
+        resolution_cache.invalidate_model_uri_cache("OtherModel")
+        ModelsArtifactRepository.get_underlying_uri(model_uri)
+        assert get_latest_versions_mock.call_count == 1
+
+        resolution_cache.invalidate_model_uri_cache("MyModel")
+        ModelsArtifactRepository.get_underlying_uri(model_uri)
+        assert get_latest_versions_mock.call_count == 2
+        assert get_download_uri_mock.call_count == 2
+
+
+def test_models_artifact_repo_does_not_cache_resolution_when_disabled():
+    get_model_version_download_uri_patch = mock.patch.object(MlflowClient,
+                                                             "get_model_version_download_uri",
+                                                             return_value="s3://bucket/model")
+    env_patch = mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_URI_CACHE_TTL": "0"})
+    with get_model_version_download_uri_patch as get_download_uri_mock, env_patch:
+        ModelsArtifactRepository.get_underlying_uri("models:/MyModel/12")
+        ModelsArtifactRepository.get_underlying_uri("models:/MyModel/12")
+        assert get_download_uri_mock.call_count == 2
+
+
+def test_models_artifact_repo_does_not_cache_missing_stage():
+    with mock.patch.object(MlflowClient, "get_latest_versions", return_value=[]) as latest_mock:
+        for _ in range(2):
+            with pytest.raises(MlflowException, match="No versions of model"):
+                ModelsArtifactRepository.get_underlying_uri("models:/MyModel/Staging")
+        assert latest_mock.call_count == 2
@@ -0,0 +1,58 @@
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.resolution_cache import TTLCache, _get_ttl_from_env
+
+
+def test_ttl_cache_returns_cached_values_until_they_expire():
+    cache = TTLCache(lambda: 10)
+    compute = mock.Mock(return_value="value")
+    with mock.patch("time.time", return_value=100):
+        assert cache.get_or_compute("key", compute) == "value"
+        assert cache.get_or_compute("key", compute) == "value"
+    assert compute.call_count == 1
+    with mock.patch("time.time", return_value=111):
+        assert cache.get_or_compute("key", compute) == "value"
+    assert compute.call_count == 2
+
+
+def test_ttl_cache_evicts_least_recently_used_entries():
+    cache = TTLCache(lambda: 10, max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("c", lambda: 3)
+    assert len(cache) == 2
+    assert cache.get_or_compute("a", lambda: -1) == 1
+    assert cache.get_or_compute("b", lambda: -2) == -2
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache(lambda: 10)
+    cache.get_or_compute(("uri", "model1", "1"), lambda: 1)
+    cache.get_or_compute(("uri", "model2", "1"), lambda: 2)
+    cache.invalidate(lambda key: key[1] == "model1")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_does_not_cache_exceptions_or_when_disabled():
+    cache = TTLCache(lambda: 0)
+    cache.get_or_compute("key", lambda: 1)
+    assert len(cache) == 0
+
+    cache = TTLCache(lambda: 10)
+    with pytest.raises(ValueError):
+        cache.get_or_compute("key", mock.Mock(side_effect=ValueError()))
+    assert len(cache) == 0
+
+
+def test_get_ttl_from_env(monkeypatch):
+    assert _get_ttl_from_env("MLFLOW_TEST_TTL", 30) == 30
+    monkeypatch.setenv("MLFLOW_TEST_TTL", "2.5")
+    assert _get_ttl_from_env("MLFLOW_TEST_TTL", 30) == 2.5
+    monkeypatch.setenv("MLFLOW_TEST_TTL", "-1")
+    with pytest.raises(MlflowException, match="MLFLOW_TEST_TTL"):
+        _get_ttl_from_env("MLFLOW_TEST_TTL", 30)
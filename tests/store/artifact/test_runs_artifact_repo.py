@@ -1,8 +1,12 @@
+import os
+
+import mock
 import pytest
 from mock import Mock
 
 import mlflow
 from mlflow.exceptions import MlflowException
+from mlflow.tracking.artifact_utils import get_artifact_uri
 from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 
@@ -62,3 +66,25 @@ def test_runs_artifact_repo_uses_repo_download_artifacts():
     runs_repo.repo = Mock()
     runs_repo.download_artifacts('artifact_path', 'dst_path')
     runs_repo.repo.download_artifacts.assert_called_once()
+
+
+@pytest.mark.usefixtures("tracking_uri_mock")
+def test_runs_artifact_repo_caches_run_artifact_root():
+    artifact_location = "s3://blah_bucket/"
+    experiment_id = mlflow.create_experiment("expr_cache", artifact_location)
+    with mlflow.start_run(experiment_id=experiment_id):
+        run_id = mlflow.active_run().info.run_id
+    expected_root = "%s%s/artifacts" % (artifact_location, run_id)
+
+    with mock.patch("mlflow.tracking.artifact_utils.get_artifact_uri",
+                    wraps=get_artifact_uri) as get_artifact_uri_mock:
+        uri = RunsArtifactRepository.get_underlying_uri("runs:/%s/model" % run_id)
+        assert uri == expected_root + "/model"
+        uri = RunsArtifactRepository.get_underlying_uri("runs:/%s/other/model" % run_id)
+        assert uri == expected_root + "/other/model"
+        assert RunsArtifactRepository.get_underlying_uri("runs:/%s" % run_id) == expected_root
+        assert get_artifact_uri_mock.call_count == 1
+
+        with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_URI_CACHE_TTL": "0"}):
+            RunsArtifactRepository.get_underlying_uri("runs:/%s/model" % run_id)
+        assert get_artifact_uri_mock.call_count == 2
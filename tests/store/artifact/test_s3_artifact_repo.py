@@ -1,9 +1,13 @@
+import hashlib
 import os
 import posixpath
 
+import mock
 import pytest
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.blob_store import get_blob_path, is_manifest_file
 
 from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
 from tests.helper_functions import mock_s3_bucket  # pylint: disable=unused-import
@@ -127,3 +131,270 @@ def test_download_file_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
     downloaded_file_path = repo.download_artifacts(file_a_name)
     with open(downloaded_file_path, "r") as f:
         assert f.read() == file_a_text
+
+
+def test_open_stream_reads_object_from_offset(s3_artifact_root, mock_s3_bucket):
+    import boto3
+    boto3.client("s3").put_object(
+        Bucket=mock_s3_bucket, Key="some/path/model.bin", Body=b"0123456789")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    with repo.open_stream("model.bin") as stream:
+        assert stream.size == 10
+        stream.seek(4)
+        assert stream.read(3) == b"456"
+        assert stream.read() == b"789"
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo.open_stream("missing.bin")
+
+
+def test_log_artifacts_uploads_files_concurrently_with_progress(s3_artifact_root, tmpdir):
+    local_dir = tmpdir.mkdir("saved_model")
+    variables_dir = local_dir.mkdir("variables")
+    local_dir.join("saved_model.pb").write("graph")
+    for i in range(20):
+        variables_dir.join("variables.data-%05d-of-00020" % i).write(str(i))
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    with mock.patch("mlflow.store.artifact.transfer._logger") as logger_mock, \
+            mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS": "4"}):
+        repo.log_artifacts(local_dir.strpath, "model")
+
+    assert len(repo.list_artifacts("model/variables")) == 20
+    downloaded_dir = repo.download_artifacts("model")
+    assert open(os.path.join(downloaded_dir, "saved_model.pb")).read() == "graph"
+    assert open(os.path.join(downloaded_dir, "variables", "variables.data-00007-of-00020")) \
+        .read() == "7"
+    # Progress is logged once all files are uploaded
+    args = logger_mock.info.call_args[0]
+    assert args[2:] == (21, 21, 35, 35)
+
+
+def test_download_artifacts_lists_directory_with_single_prefix_listing(
+        s3_artifact_root, mock_s3_bucket, tmpdir):
+    import boto3
+    s3_client = boto3.client("s3")
+    for key in ["some/path/model/MLmodel", "some/path/model/data/a/b.txt",
+                "some/path/model/data/c.txt", "some/path/other.txt", "some/path/model/empty/"]:
+        s3_client.put_object(Bucket=mock_s3_bucket, Key=key, Body=key.encode("utf-8"))
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    assert [f.path for f in repo._list_files_recursive("model")] == [
+        "model/MLmodel", "model/data/a/b.txt", "model/data/c.txt"]
+    assert [f.path for f in repo.list_artifacts_recursive("model", max_depth=2)] == [
+        "model/MLmodel", "model/data", "model/data/a", "model/data/c.txt"]
+    with mock.patch.object(repo, "list_artifacts") as list_artifacts_mock:
+        local_path = repo.download_artifacts("model", tmpdir.strpath)
+        list_artifacts_mock.assert_not_called()
+    with open(os.path.join(local_path, "data", "a", "b.txt")) as f:
+        assert f.read() == "some/path/model/data/a/b.txt"
+
+    root_repo = get_artifact_repository(s3_artifact_root)
+    assert len(root_repo._list_files_recursive("")) == 4
+
+
+def test_log_artifacts_raises_upload_errors(s3_artifact_root, tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    for i in range(5):
+        local_dir.join("file%d.txt" % i).write(str(i))
+    repo = get_artifact_repository(s3_artifact_root.replace("mock-bucket", "missing-bucket"))
+    with pytest.raises(Exception, match="NoSuchBucket|does not exist"):
+        repo.log_artifacts(local_dir.strpath)
+
+
+def test_s3_clients_are_cached(s3_artifact_root):
+    repo = get_artifact_repository(s3_artifact_root)
+    other_repo = get_artifact_repository(posixpath.join(s3_artifact_root, "other/path"))
+    assert repo._get_s3_client() is other_repo._get_s3_client()
+    with mock.patch.dict(os.environ, {"MLFLOW_S3_ENDPOINT_URL": "http://localhost:9000"}):
+        client = repo._get_s3_client()
+    assert client is not other_repo._get_s3_client()
+    assert client.meta.endpoint_url == "http://localhost:9000"
+
+
+def test_transfer_config_is_configurable(s3_artifact_root):
+    repo = get_artifact_repository(s3_artifact_root)
+    with mock.patch.dict(os.environ, {"MLFLOW_S3_MULTIPART_THRESHOLD": "1000",
+                                      "MLFLOW_S3_MULTIPART_CHUNKSIZE": "2000",
+                                      "MLFLOW_S3_MAX_CONCURRENCY": "3"}):
+        config = repo._get_transfer_config()
+    assert (config.multipart_threshold, config.multipart_chunksize, config.max_concurrency) == \
+        (1000, 2000, 3)
+    with mock.patch.dict(os.environ, {"MLFLOW_S3_MAX_CONCURRENCY": "zero"}), \
+            pytest.raises(MlflowException, match="must be a positive integer"):
+        repo._get_transfer_config()
+
+
+def test_download_artifacts_uses_download_cache(s3_artifact_root, mock_s3_bucket, tmpdir):
+    import boto3
+    s3_client = boto3.client("s3")
+    s3_client.put_object(Bucket=mock_s3_bucket, Key="some/path/model/model.pkl", Body=b"v1")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_CACHE_DIR": tmpdir.join("cache").strpath}), \
+            mock.patch.object(repo, "_download_file", wraps=repo._download_file) as download_mock:
+        for _ in range(2):
+            local_path = repo.download_artifacts("model")
+            assert open(os.path.join(local_path, "model.pkl")).read() == "v1"
+        assert open(repo.download_artifacts("model/model.pkl")).read() == "v1"
+        assert download_mock.call_count == 1
+
+        # Overwritten files are downloaded again
+        s3_client.put_object(Bucket=mock_s3_bucket, Key="some/path/model/model.pkl", Body=b"v2")
+        local_path = repo.download_artifacts("model")
+        assert open(os.path.join(local_path, "model.pkl")).read() == "v2"
+        assert download_mock.call_count == 2
+
+
+def test_log_artifacts_to_blob_store_stores_identical_files_once(
+        s3_artifact_root, mock_s3_bucket, tmpdir):
+    import boto3
+    s3_client = boto3.client("s3")
+    local_dir = tmpdir.mkdir("model")
+    local_dir.join("vocab.txt").write("shared vocabulary")
+    local_dir.mkdir("data").join("weights.bin").write("shared weights")
+    tmpdir.join("conda.yaml").write("shared environment")
+
+    repos = [get_artifact_repository(posixpath.join(s3_artifact_root, "runs", run_id))
+             for run_id in ["run1", "run2"]]
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_BLOB_STORE_URI":
+                                      posixpath.join(s3_artifact_root, "blobs")}):
+        for repo in repos:
+            with mock.patch.object(repo._get_s3_client(), "upload_file",
+                                   wraps=repo._get_s3_client().upload_file) as upload_mock:
+                repo.log_artifacts(local_dir.strpath, "model")
+                repo.log_artifact(tmpdir.join("conda.yaml").strpath, "model")
+            # Blobs are only uploaded by the first run
+            assert upload_mock.call_count == (3 if repo is repos[0] else 0)
+
+    blob_keys = [obj["Key"] for obj in s3_client.list_objects_v2(
+        Bucket=mock_s3_bucket, Prefix="blobs/")["Contents"]]
+    assert len(blob_keys) == 3
+    run_keys = sorted(obj["Key"] for obj in s3_client.list_objects_v2(
+        Bucket=mock_s3_bucket, Prefix="runs/run2/")["Contents"])
+    # Each logging call records its files in new manifests of their directories
+    assert [posixpath.dirname(key) for key in run_keys] == [
+        "runs/run2/model", "runs/run2/model", "runs/run2/model/data"]
+    assert all(is_manifest_file(key) for key in run_keys)
+
+    # Files are read from the blob store without setting it
+    repo = repos[1]
+    assert [(f.path, f.is_dir, f.file_size) for f in repo.list_artifacts("model")] == [
+        ("model/conda.yaml", False, 18), ("model/data", True, None),
+        ("model/vocab.txt", False, 17)]
+    downloaded_dir = repo.download_artifacts("model", tmpdir.mkdir("dst").strpath)
+    assert open(os.path.join(downloaded_dir, "data", "weights.bin")).read() == "shared weights"
+    assert open(repo.download_artifacts("model/vocab.txt")).read() == "shared vocabulary"
+    other_repo = get_artifact_repository(posixpath.join(s3_artifact_root, "runs/run2/model"))
+    assert open(other_repo.download_artifacts("conda.yaml")).read() == "shared environment"
+    with other_repo.open_stream("data/weights.bin") as stream:
+        assert stream.size == 14
+        stream.seek(7)
+        assert stream.read() == b"weights"
+    assert other_repo._get_file_version("data/weights.bin").startswith("sha256-")
+
+
+def test_concurrent_writers_to_blob_store_do_not_overwrite_manifests(
+        s3_artifact_root, tmpdir):
+    tmpdir.join("a.txt").write("A")
+    tmpdir.join("b.txt").write("B")
+    # Repositories of different processes logging to the same directory of the same run
+    repos = [get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+             for _ in range(2)]
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_BLOB_STORE_URI":
+                                      posixpath.join(s3_artifact_root, "blobs")}):
+        s3_client = repos[0]._get_s3_client()
+        # Manifests are written without reading the manifests of other writers
+        with mock.patch.object(s3_client, "get_object", wraps=s3_client.get_object) as get_mock:
+            repos[0].log_artifact(tmpdir.join("a.txt").strpath, "shared")
+            repos[1].log_artifact(tmpdir.join("b.txt").strpath, "shared")
+        get_mock.assert_not_called()
+
+        tmpdir.join("a.txt").write("A2")
+        repos[1].log_artifact(tmpdir.join("a.txt").strpath, "shared")
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    assert [(f.path, f.file_size) for f in repo.list_artifacts("shared")] == [
+        ("shared/a.txt", 2), ("shared/b.txt", 1)]
+    # Files recorded in several manifests have the entry of the latest one
+    assert open(repo.download_artifacts("shared/a.txt")).read() == "A2"
+    other_repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path/shared"))
+    assert open(other_repo.download_artifacts("a.txt")).read() == "A2"
+    assert open(other_repo.download_artifacts("b.txt")).read() == "B"
+
+
+def test_files_logged_without_blob_store_take_precedence_over_manifest(
+        s3_artifact_root, mock_s3_bucket, tmpdir):
+    import boto3
+    s3_client = boto3.client("s3")
+    tmpdir.join("model.pkl").write("v1")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(tmpdir.join("model.pkl").strpath)
+
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_BLOB_STORE_URI":
+                                      posixpath.join(s3_artifact_root, "blobs")}):
+        # Logging with the blob store deletes the object previously logged at the same path
+        tmpdir.join("model.pkl").write("v2")
+        repo.log_artifact(tmpdir.join("model.pkl").strpath)
+        assert "Contents" not in s3_client.list_objects_v2(
+            Bucket=mock_s3_bucket, Prefix="some/path/model.pkl")
+        assert open(repo.download_artifacts("model.pkl")).read() == "v2"
+
+    tmpdir.join("model.pkl").write("v3")
+    repo.log_artifact(tmpdir.join("model.pkl").strpath)
+    assert [(f.path, f.file_size) for f in repo.list_artifacts()] == [("model.pkl", 2)]
+    assert open(repo.download_artifacts("model.pkl")).read() == "v3"
+
+
+def test_log_artifacts_with_sync_only_uploads_new_and_changed_files(
+        s3_artifact_root, mock_s3_bucket, tmpdir):
+    local_dir = tmpdir.mkdir("checkpoint")
+    # Large files are uploaded in multiple parts, whose ETag is not the MD5 digest of the file
+    local_dir.join("weights.bin").write(b"0123456789" * 1100000, mode="wb")
+    local_dir.join("step.txt").write("1")
+    local_dir.mkdir("optimizer").join("state.bin").write("state1")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    s3_client = repo._get_s3_client()
+    with mock.patch.dict(os.environ, {"MLFLOW_S3_MULTIPART_THRESHOLD": str(5 * 1024 * 1024),
+                                      "MLFLOW_S3_MULTIPART_CHUNKSIZE": str(5 * 1024 * 1024)}):
+        repo.log_artifacts(local_dir.strpath, "checkpoint", sync=True)
+        assert s3_client.head_object(Bucket=mock_s3_bucket,
+                                     Key="some/path/checkpoint/weights.bin")["ETag"].endswith('-3"')
+
+        local_dir.join("step.txt").write("2")
+        local_dir.join("scheduler.bin").write("scheduler")
+        with mock.patch.object(s3_client, "upload_file", wraps=s3_client.upload_file) as upload:
+            repo.log_artifacts(local_dir.strpath, "checkpoint", sync=True)
+        assert sorted(args[2] for args, _ in upload.call_args_list) == [
+            "some/path/checkpoint/scheduler.bin", "some/path/checkpoint/step.txt"]
+        assert open(repo.download_artifacts("checkpoint/step.txt")).read() == "2"
+
+        with mock.patch.object(s3_client, "upload_file") as upload:
+            repo.log_artifacts(local_dir.strpath, "checkpoint", sync=True)
+        upload.assert_not_called()
+
+
+def test_log_artifacts_with_sync_compares_files_with_blob_store_manifests(
+        s3_artifact_root, tmpdir):
+    local_dir = tmpdir.mkdir("checkpoint")
+    local_dir.join("weights.bin").write("weights")
+    local_dir.join("step.txt").write("1")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    s3_client = repo._get_s3_client()
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_BLOB_STORE_URI":
+                                      posixpath.join(s3_artifact_root, "blobs")}):
+        repo.log_artifacts(local_dir.strpath, sync=True)
+        local_dir.join("step.txt").write("2")
+        with mock.patch.object(s3_client, "upload_file", wraps=s3_client.upload_file) as upload:
+            repo.log_artifacts(local_dir.strpath, sync=True)
+    assert [args[2] for args, _ in upload.call_args_list] == [
+        posixpath.join("blobs", get_blob_path(hashlib.sha256(b"2").hexdigest()))]
+    assert open(repo.download_artifacts("step.txt")).read() == "2"
+    assert open(repo.download_artifacts("weights.bin")).read() == "weights"
+
+
+def test_blob_store_must_be_on_s3(s3_artifact_root, tmpdir):
+    tmpdir.join("a.txt").write("A")
+    repo = get_artifact_repository(s3_artifact_root)
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_BLOB_STORE_URI": tmpdir.strpath}), \
+            pytest.raises(MlflowException, match="must be an S3 URI"):
+        repo.log_artifact(tmpdir.join("a.txt").strpath)
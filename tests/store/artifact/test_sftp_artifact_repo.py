@@ -1,3 +1,4 @@
+import mock
 from mock import MagicMock
 import pytest
 from tempfile import NamedTemporaryFile
@@ -7,6 +8,9 @@ from mlflow.store.artifact.sftp_artifact_repo import SFTPArtifactRepository
 from mlflow.utils.file_utils import TempDir
 import os
 import posixpath
+import stat
+
+from paramiko import SFTPAttributes
 
 
 @pytest.fixture
@@ -14,6 +18,14 @@ def sftp_mock():
     return MagicMock(autospec=pysftp.Connection)
 
 
+def _sftp_attributes(filename, mode, size=4096):
+    attr = SFTPAttributes()
+    attr.filename = filename
+    attr.st_mode = mode
+    attr.st_size = size
+    return attr
+
+
 @pytest.mark.large
 def test_artifact_uri_factory():
     from paramiko.ssh_exception import SSHException
@@ -24,9 +36,16 @@ def test_artifact_uri_factory():
 @pytest.mark.large
 def test_list_artifacts_empty(sftp_mock):
     repo = SFTPArtifactRepository("sftp://test_sftp/some/path", sftp_mock)
-    sftp_mock.listdir = MagicMock(return_value=[])
+    sftp_mock.listdir_attr = MagicMock(return_value=[])
     assert repo.list_artifacts() == []
-    sftp_mock.listdir.assert_called_once_with("/some/path")
+    sftp_mock.listdir_attr.assert_called_once_with("/some/path")
+
+
+@pytest.mark.large
+def test_list_artifacts_of_missing_directory_or_file(sftp_mock):
+    repo = SFTPArtifactRepository("sftp://test_sftp/some/path", sftp_mock)
+    sftp_mock.listdir_attr = MagicMock(side_effect=IOError("No such file"))
+    assert repo.list_artifacts("model.pkl") == []
 
 
 @pytest.mark.large
@@ -42,21 +61,17 @@ def test_list_artifacts(sftp_mock):
     file_path = "file"
     file_size = 678
     dir_path = "model"
-    sftp_mock.isdir = MagicMock(side_effect=lambda path: {
-            artifact_root_path: True,
-            os.path.join(artifact_root_path, file_path): False,
-            os.path.join(artifact_root_path, dir_path): True,
-        }[path])
-    sftp_mock.listdir = MagicMock(return_value=[file_path, dir_path])
-
-    file_stat = MagicMock()
-    file_stat.configure_mock(st_size=file_size)
-    sftp_mock.stat = MagicMock(return_value=file_stat)
+    sftp_mock.listdir_attr = MagicMock(return_value=[
+        _sftp_attributes(file_path, stat.S_IFREG | 0o644, file_size),
+        _sftp_attributes(dir_path, stat.S_IFDIR | 0o755),
+    ])
 
     artifacts = repo.list_artifacts(path=None)
 
-    sftp_mock.listdir.assert_called_once_with(artifact_root_path)
-    sftp_mock.stat.assert_called_once_with(artifact_root_path + file_path)
+    # Entries are listed with their attributes in a single request
+    sftp_mock.listdir_attr.assert_called_once_with(artifact_root_path)
+    sftp_mock.stat.assert_not_called()
+    sftp_mock.isdir.assert_not_called()
 
     assert len(artifacts) == 2
     assert artifacts[0].path == file_path
@@ -83,22 +98,17 @@ def test_list_artifacts_with_subdir(sftp_mock):
     file_size = 345
     subdir_name = 'variables'
 
-    sftp_mock.listdir = MagicMock(return_value=[file_path, subdir_name])
-
-    sftp_mock.isdir = MagicMock(side_effect=lambda path: {
-            posixpath.join(artifact_root_path, dir_name): True,
-            posixpath.join(artifact_root_path, dir_name, file_path): False,
-            posixpath.join(artifact_root_path, dir_name, subdir_name): True,
-        }[path])
-
-    file_stat = MagicMock()
-    file_stat.configure_mock(st_size=file_size)
-    sftp_mock.stat = MagicMock(return_value=file_stat)
+    sftp_mock.listdir_attr = MagicMock(return_value=[
+        _sftp_attributes(file_path, stat.S_IFREG | 0o644, file_size),
+        # Symbolic link to a directory
+        _sftp_attributes(subdir_name, stat.S_IFLNK | 0o777, 9),
+    ])
+    sftp_mock.stat = MagicMock(return_value=_sftp_attributes(None, stat.S_IFDIR | 0o755))
 
     artifacts = repo.list_artifacts(path=dir_name)
 
-    sftp_mock.listdir.assert_called_once_with(artifact_root_path + dir_name)
-    sftp_mock.stat.assert_called_once_with(artifact_root_path + dir_name + '/' + file_path)
+    sftp_mock.listdir_attr.assert_called_once_with(artifact_root_path + dir_name)
+    sftp_mock.stat.assert_called_once_with(artifact_root_path + dir_name + '/' + subdir_name)
 
     assert len(artifacts) == 2
     assert artifacts[0].path == posixpath.join(dir_name, file_path)
@@ -109,6 +119,29 @@ def test_list_artifacts_with_subdir(sftp_mock):
     assert artifacts[1].file_size is None
 
 
+@pytest.mark.large
+def test_log_artifacts_creates_directories_once_and_puts_files_without_confirmation(
+        sftp_mock, tmpdir):
+    repo = SFTPArtifactRepository("sftp://test_sftp/some/path", sftp_mock)
+    model = tmpdir.mkdir("model")
+    model.join("MLmodel").write("M")
+    model.mkdir("data").join("model.pkl").write("P")
+    model.join("data").mkdir("empty")
+    sftp_mock.mkdir.side_effect = [None, IOError("exists")]
+
+    repo.log_artifacts(model.strpath, "model")
+
+    sftp_mock.makedirs.assert_called_once_with("/some/path/model")
+    assert sftp_mock.mkdir.call_args_list == [
+        mock.call("/some/path/model/data"), mock.call("/some/path/model/data/empty")]
+    sftp_mock.put.assert_has_calls([
+        mock.call(model.join("MLmodel").strpath, "/some/path/model/MLmodel", confirm=False),
+        mock.call(model.join("data", "model.pkl").strpath, "/some/path/model/data/model.pkl",
+                  confirm=False),
+    ])
+    sftp_mock.put_r.assert_not_called()
+
+
 @pytest.mark.requires_ssh
 def test_log_artifact():
     for artifact_path in [None, "sub_dir", "very/nested/sub/dir"]:
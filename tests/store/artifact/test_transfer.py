@@ -0,0 +1,116 @@
+import hashlib
+import os
+import threading
+import time
+
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.transfer import TransferProgress, compute_file_md5, \
+    download_file_in_chunks, filter_changed_files, list_local_dirs, list_local_files, \
+    run_concurrently
+
+
+def test_list_local_files(tmpdir):
+    tmpdir.join("b.txt").write("b")
+    tmpdir.mkdir("sub").mkdir("nested").join("a.txt").write("a")
+    assert list_local_files(tmpdir.strpath) == [
+        (os.path.join(tmpdir.strpath, "b.txt"), "b.txt"),
+        (os.path.join(tmpdir.strpath, "sub", "nested", "a.txt"), "sub/nested/a.txt"),
+    ]
+
+
+def test_list_local_dirs(tmpdir):
+    tmpdir.mkdir("sub").mkdir("nested").join("a.txt").write("a")
+    tmpdir.mkdir("empty")
+    tmpdir.mkdir("sub-dir")
+    assert list_local_dirs(tmpdir.strpath) == ["empty", "sub", "sub-dir", "sub/nested"]
+
+
+def test_compute_file_md5(tmpdir):
+    path = tmpdir.join("model.bin")
+    path.write(b"0123456789" * 100000, mode="wb")
+    assert compute_file_md5(path.strpath) == hashlib.md5(b"0123456789" * 100000).digest()
+
+
+def test_filter_changed_files_skips_files_with_same_contents(tmpdir):
+    for name in ["new.txt", "changed.txt", "same.txt"]:
+        tmpdir.join(name).write(name)
+    files = list_local_files(tmpdir.strpath)
+    remote_files = {"changed.txt": "other contents", "same.txt": "same.txt",
+                    "deleted.txt": "deleted.txt"}
+
+    def is_same_file(local_path, remote_contents):
+        with open(local_path) as f:
+            return f.read() == remote_contents
+
+    assert filter_changed_files(files, remote_files, is_same_file) == [
+        (os.path.join(tmpdir.strpath, "changed.txt"), "changed.txt"),
+        (os.path.join(tmpdir.strpath, "new.txt"), "new.txt"),
+    ]
+
+
+def test_run_concurrently_uses_multiple_threads():
+    thread_names = set()
+    barrier = threading.Barrier(4)
+
+    def task(i):
+        barrier.wait(timeout=10)
+        thread_names.add(threading.current_thread().name)
+        return i * 2
+
+    assert run_concurrently(task, [(i,) for i in range(8)], max_workers=4) == \
+        [i * 2 for i in range(8)]
+    assert len(thread_names) == 4
+
+
+def test_run_concurrently_raises_first_error_and_cancels_pending_calls():
+    calls = []
+
+    def task(i):
+        calls.append(i)
+        if i == 0:
+            raise ValueError("failed")
+        time.sleep(0.1)
+
+    with pytest.raises(ValueError, match="failed"):
+        run_concurrently(task, [(i,) for i in range(100)], max_workers=2)
+    assert len(calls) < 100
+
+
+def test_transfer_progress_logs_periodically_and_when_done():
+    with mock.patch("mlflow.store.artifact.transfer._logger") as logger_mock:
+        progress = TransferProgress("Uploading", num_files=2, num_bytes=30,
+                                    log_interval_seconds=3600)
+        progress.add_bytes(10)
+        progress.complete_file()
+        logger_mock.info.assert_not_called()
+        progress.add_bytes(20)
+        progress.complete_file()
+        logger_mock.info.assert_called_once_with(
+            "%s: %d/%d files, %d/%d bytes", "Uploading", 2, 2, 30, 30)
+
+
+def test_transfer_progress_complete_file_records_bytes():
+    progress = TransferProgress("Uploading", num_files=1, num_bytes=30)
+    progress.complete_file(30)
+    assert progress.files_done == 1
+    assert progress.bytes_done == 30
+
+
+def test_download_file_in_chunks(tmpdir):
+    contents = b"0123456789"
+    fetch_range = mock.Mock(side_effect=lambda start, end: contents[start:end])
+    local_path = tmpdir.join("file").strpath
+    download_file_in_chunks(fetch_range, len(contents), local_path, chunk_size=3, max_workers=4)
+    with open(local_path, "rb") as f:
+        assert f.read() == contents
+    assert sorted(fetch_range.call_args_list) == [
+        mock.call(0, 3), mock.call(3, 6), mock.call(6, 9), mock.call(9, 10)]
+
+
+def test_download_file_in_chunks_raises_on_short_read(tmpdir):
+    with pytest.raises(MlflowException, match="Downloaded 1 bytes instead of 3"):
+        download_file_in_chunks(lambda start, end: b"0", 6, tmpdir.join("file").strpath,
+                                chunk_size=3, max_workers=2)
@@ -10,7 +10,7 @@ from mlflow.protos.model_registry_pb2 import CreateRegisteredModel, \
     UpdateRegisteredModel, DeleteRegisteredModel, ListRegisteredModels, \
     GetRegisteredModelDetails, GetLatestVersions, CreateModelVersion, UpdateModelVersion, \
     DeleteModelVersion, GetModelVersionDetails, GetModelVersionDownloadUri, SearchModelVersions, \
-    GetModelVersionStages
+    GetModelVersionStages, GetRegistryEvents
 from mlflow.store.model_registry.rest_store import RestStore
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import MlflowHostCreds
@@ -95,6 +95,12 @@ class TestRestStore(unittest.TestCase):
         self.store.list_registered_models()
         self._verify_requests(mock_http, "registered-models/list", "GET", ListRegisteredModels())
 
+        self.store.list_registered_models(max_results=10, order_by=["name DESC"],
+                                          page_token="token")
+        self._verify_requests(mock_http, "registered-models/list", "GET",
+                              ListRegisteredModels(max_results=10, order_by=["name DESC"],
+                                                   page_token="token"))
+
     @mock.patch('mlflow.utils.rest_utils.http_request')
     def test_get_registered_model_detailed(self, mock_http):
         rm = RegisteredModel("model_1")
@@ -177,8 +183,48 @@ class TestRestStore(unittest.TestCase):
     @mock.patch('mlflow.utils.rest_utils.http_request')
     def test_search_model_versions(self, mock_http):
         self.store.search_model_versions(filter_string="name='model_12'")
+        # All the model versions are requested in pages of the maximum size by default
+        self._verify_requests(mock_http, "model-versions/search", "GET",
+                              SearchModelVersions(filter="name='model_12'", max_results=1000))
+
+        self.store.search_model_versions(filter_string="name LIKE 'model_%'", max_results=10,
+                                         order_by=["version DESC"], page_token="token")
         self._verify_requests(mock_http, "model-versions/search", "GET",
-                              SearchModelVersions(filter="name='model_12'"))
+                              SearchModelVersions(filter="name LIKE 'model_%'", max_results=10,
+                                                  order_by=["version DESC"], page_token="token"))
+
+    def test_search_model_versions_follows_page_tokens_without_max_results(self):
+        pages = {
+            "": SearchModelVersions.Response(next_page_token="page2"),
+            "page2": SearchModelVersions.Response(next_page_token="page3"),
+            "page3": SearchModelVersions.Response(),
+        }
+        for page_token, num_versions in [("", 2), ("page2", 2), ("page3", 1)]:
+            for version in range(num_versions):
+                pages[page_token].model_versions_detailed.add().model_version.version = \
+                    len(page_token) * 10 + version
+
+        def call_endpoint(api, json_body):
+            self.assertEqual(api, SearchModelVersions)
+            request = json.loads(json_body)
+            self.assertEqual(request["max_results"], "1000")
+            return pages[request.get("page_token", "")]
+
+        with mock.patch.object(self.store, "_call_endpoint", side_effect=call_endpoint) as call:
+            model_versions = self.store.search_model_versions("name='model_12'")
+        assert call.call_count == 3
+        assert [mvd.version for mvd in model_versions] == [0, 1, 50, 51, 50]
+        assert model_versions.token is None
+
+    @mock.patch('mlflow.utils.rest_utils.http_request')
+    def test_get_registry_events(self, mock_http):
+        self.store.get_registry_events()
+        self._verify_requests(mock_http, "registry-events/get", "GET",
+                              GetRegistryEvents(since=0, max_results=100, timeout_seconds=0))
+
+        self.store.get_registry_events(since=12, max_results=0, timeout_seconds=10)
+        self._verify_requests(mock_http, "registry-events/get", "GET",
+                              GetRegistryEvents(since=12, max_results=0, timeout_seconds=10))
 
     @mock.patch('mlflow.utils.rest_utils.http_request')
     def test_get_model_version_stages(self, mock_http):
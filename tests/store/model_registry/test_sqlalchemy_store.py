@@ -2,17 +2,20 @@ import os
 import unittest
 
 import mock
+import sqlalchemy
 import tempfile
+import threading
 import uuid
 
 import mlflow
 import mlflow.db
 import mlflow.store.db.base_sql_model
 from mlflow.entities.model_registry import RegisteredModel, RegisteredModelDetailed, \
-    ModelVersionDetailed
+    ModelVersion, ModelVersionDetailed
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, \
     INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS
+from mlflow.store.model_registry.dbmodels.models import SqlModelVersion
 from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
 from tests.helper_functions import random_str
 
@@ -190,6 +193,64 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         self.assertEqual(self._extract_latest_by_stage(rmd5.latest_versions),
                          {"None": 1, "Production": 2, "Staging": 4})
 
+    def test_get_latest_versions_filters_stages(self):
+        name = "test_for_latest_versions_by_stage"
+        rm = self._rm_maker(name)
+        self._rm_maker("other_model")
+        self._mv_maker("other_model")
+        for stage in ["Production", "Staging", "Production", "None", "Staging"]:
+            mv = self._mv_maker(name)
+            if stage != "None":
+                self.store.update_model_version(mv, stage=stage)
+        self.store.delete_model_version(mv)
+
+        def latest_by_stage(stages):
+            return self._extract_latest_by_stage(self.store.get_latest_versions(rm, stages))
+
+        self.assertEqual(latest_by_stage(["Production"]), {"Production": 3})
+        self.assertEqual(latest_by_stage(["staging", "None"]), {"Staging": 2, "None": 4})
+        self.assertEqual(latest_by_stage(None), {"Production": 3, "Staging": 2})
+        self.assertEqual(latest_by_stage(["Archived"]), {})
+        self.assertEqual(self.store.get_latest_versions(rm, ["Production"])[0].registered_model,
+                         rm)
+
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.get_latest_versions(RegisteredModel("missing"), ["Production"])
+        assert exception_context.exception.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_latest_versions_are_queried_without_loading_version_histories(self):
+        name = "test_for_latest_versions_queries"
+        rm = self._rm_maker(name)
+        for _ in range(5):
+            self._mv_maker(name)
+        self.store.update_model_version(ModelVersion(rm, 4), stage="Production")
+        self._rm_maker("model_without_versions")
+
+        loaded_versions = []
+
+        def record_loaded_version(target, context):  # pylint: disable=unused-argument
+            loaded_versions.append(target.version)
+
+        sqlalchemy.event.listen(SqlModelVersion, "load", record_loaded_version)
+        try:
+            latest_versions = self.store.get_latest_versions(rm, ["Production"])
+            self.assertEqual([mv.version for mv in latest_versions], [4])
+            self.assertEqual(loaded_versions, [4])
+
+            del loaded_versions[:]
+            registered_models = dict((rmd.name, rmd)
+                                     for rmd in self.store.list_registered_models())
+            self.assertEqual(self._extract_latest_by_stage(registered_models[name].latest_versions),
+                             {"None": 5, "Production": 4})
+            self.assertEqual(registered_models["model_without_versions"].latest_versions, [])
+            self.assertEqual(sorted(loaded_versions), [4, 5])
+        finally:
+            sqlalchemy.event.remove(SqlModelVersion, "load", record_loaded_version)
+
+        indexes = sqlalchemy.inspect(self.store.engine).get_indexes(SqlModelVersion.__tablename__)
+        self.assertIn(["name", "current_stage", "version"],
+                      [index["column_names"] for index in indexes])
+
     def test_create_model_version(self):
         name = "test_for_update_MV"
         self._rm_maker(name)
@@ -224,6 +285,60 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         self.assertEqual(mv3.version, 3)
         self.assertEqual(mvd3.version, 3)
 
+    def test_create_model_version_does_not_reuse_numbers_of_deleted_versions(self):
+        name = "test_for_deleted_versions"
+        rm = self._rm_maker(name)
+        self._mv_maker(name)
+        self.store.delete_model_version(self._mv_maker(name))
+        self.assertEqual(self._mv_maker(name).version, 3)
+
+        # the numbering continues after the model is renamed
+        renamed = self.store.update_registered_model(rm, new_name="renamed_model")
+        self.assertEqual(self._mv_maker(renamed.name).version, 4)
+
+        with self.assertRaises(MlflowException) as exception_context:
+            self._mv_maker(name)
+        assert exception_context.exception.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_create_model_version_allocates_version_without_loading_versions(self):
+        name = "test_for_version_allocation_queries"
+        self._rm_maker(name)
+        for _ in range(3):
+            self._mv_maker(name)
+
+        loaded_versions = []
+
+        def record_loaded_version(target, context):  # pylint: disable=unused-argument
+            loaded_versions.append(target.version)
+
+        sqlalchemy.event.listen(SqlModelVersion, "load", record_loaded_version)
+        try:
+            self.assertEqual(self._mv_maker(name).version, 4)
+        finally:
+            sqlalchemy.event.remove(SqlModelVersion, "load", record_loaded_version)
+        self.assertEqual(loaded_versions, [])
+
+    def test_create_model_version_concurrently(self):
+        name = "test_for_concurrent_versions"
+        self._rm_maker(name)
+        versions = []
+        errors = []
+
+        def create_versions():
+            try:
+                for _ in range(5):
+                    versions.append(self._mv_maker(name).version)
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=create_versions) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(versions), list(range(1, 21)))
+
     def test_update_model_version(self):
         name = "test_for_update_MV"
         self._rm_maker(name)
@@ -372,3 +487,292 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         assert mvds[0].run_id == run_id_1
         assert mvds[0].source == "A/B"
         assert mvds[0].description == "Online prediction model!"
+
+    def _create_versions_for_search(self):
+        # Each model and model version is created or updated a millisecond after the previous
+        # one, from timestamp 1000
+        timestamps = iter(range(1000, 2000))
+        with mock.patch("mlflow.store.model_registry.sqlalchemy_store.now",
+                        side_effect=lambda: next(timestamps)):
+            run_ids = dict((name, uuid.uuid4().hex) for name in ["fraud", "churn"])
+            for name in ["fraud-detection", "fraud-scoring", "churn"]:
+                self._rm_maker(name)
+                for _ in range(3):
+                    self._mv_maker(name, source="s3://models/%s" % name,
+                                   run_id=run_ids[name.split("-")[0]])
+            self.store.update_model_version(ModelVersion(RegisteredModel("fraud-scoring"), 2),
+                                            stage="Production")
+            self.store.delete_model_version(ModelVersion(RegisteredModel("churn"), 1))
+        return run_ids
+
+    def test_search_model_versions_with_compound_filters(self):
+        run_ids = self._create_versions_for_search()
+
+        def search_versions(filter_string):
+            return [(mvd.registered_model.name, mvd.version)
+                    for mvd in self.store.search_model_versions(filter_string)]
+
+        self.assertEqual(search_versions("name LIKE 'fraud-%' AND version >= 2"),
+                         [("fraud-detection", 3), ("fraud-detection", 2),
+                          ("fraud-scoring", 3), ("fraud-scoring", 2)])
+        self.assertEqual(search_versions("name ILIKE 'FRAUD-S%' AND current_stage = 'production'"),
+                         [("fraud-scoring", 2)])
+        self.assertEqual(search_versions("current_stage != 'None'"), [("fraud-scoring", 2)])
+        self.assertEqual(search_versions("current_stage IN ('production', 'Staging')"),
+                         [("fraud-scoring", 2)])
+        self.assertEqual(search_versions("run_id IN ('%s', 'other') AND source_path = "
+                                         "'s3://models/churn'" % run_ids["churn"]),
+                         [("churn", 3), ("churn", 2)])
+        self.assertEqual(search_versions("name = 'fraud-detection' AND version IN (1, 3)"),
+                         [("fraud-detection", 3), ("fraud-detection", 1)])
+        # The versions of "fraud-scoring" are created at 1005 to 1007
+        self.assertEqual(
+            search_versions("creation_timestamp > 1005 AND creation_timestamp <= 1007"),
+            [("fraud-scoring", 3), ("fraud-scoring", 2)])
+        self.assertEqual(search_versions("last_updated_timestamp >= 1012"), [("fraud-scoring", 2)])
+
+        with self.assertRaises(MlflowException) as exception_context:
+            search_versions("current_stage = 'Prod'")
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        with self.assertRaises(MlflowException) as exception_context:
+            search_versions("name = 'churn' OR name = 'fraud-scoring'")
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_search_model_versions_pagination_and_order_by(self):
+        self._create_versions_for_search()
+
+        def search_all(max_results, order_by=None):
+            versions = []
+            page_token = None
+            while True:
+                page = self.store.search_model_versions("", max_results=max_results,
+                                                        order_by=order_by, page_token=page_token)
+                self.assertLessEqual(len(page), max_results)
+                versions.extend((mvd.registered_model.name, mvd.version) for mvd in page)
+                page_token = page.token
+                if page_token is None:
+                    return versions
+
+        # Versions are ordered by name, then from the newest by default
+        expected = [("churn", 3), ("churn", 2), ("fraud-detection", 3), ("fraud-detection", 2),
+                    ("fraud-detection", 1), ("fraud-scoring", 3), ("fraud-scoring", 2),
+                    ("fraud-scoring", 1)]
+        for max_results in [1, 3, 8, 100]:
+            self.assertEqual(search_all(max_results), expected)
+        # All the versions are returned without max_results
+        page = self.store.search_model_versions("")
+        self.assertEqual([(mvd.registered_model.name, mvd.version) for mvd in page], expected)
+        self.assertIsNone(page.token)
+        self.assertEqual(search_all(3, ["version", "name DESC"]),
+                         [("fraud-scoring", 1), ("fraud-detection", 1), ("fraud-scoring", 2),
+                          ("fraud-detection", 2), ("churn", 2), ("fraud-scoring", 3),
+                          ("fraud-detection", 3), ("churn", 3)])
+        self.assertEqual(search_all(2, ["current_stage DESC", "creation_timestamp DESC"])[:3],
+                         [("fraud-scoring", 2), ("churn", 3), ("churn", 2)])
+
+        # Only the versions of the page are loaded from the database
+        loaded_versions = []
+
+        def record_loaded_version(target, context):  # pylint: disable=unused-argument
+            loaded_versions.append((target.name, target.version))
+
+        sqlalchemy.event.listen(SqlModelVersion, "load", record_loaded_version)
+        try:
+            page = self.store.search_model_versions("name LIKE 'fraud%'", max_results=2)
+        finally:
+            sqlalchemy.event.remove(SqlModelVersion, "load", record_loaded_version)
+        self.assertEqual(loaded_versions, [("fraud-detection", 3), ("fraud-detection", 2)])
+        self.assertIsNotNone(page.token)
+
+        for max_results in [0, 1001]:
+            with self.assertRaises(MlflowException) as exception_context:
+                self.store.search_model_versions("", max_results=max_results)
+            assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.search_model_versions("", order_by=["run_id"])
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_list_registered_models_pagination_and_order_by(self):
+        self._create_versions_for_search()
+
+        def list_all(max_results, order_by=None):
+            registered_models = []
+            page_token = None
+            while True:
+                page = self.store.list_registered_models(max_results=max_results,
+                                                         order_by=order_by, page_token=page_token)
+                registered_models.extend(page)
+                page_token = page.token
+                if page_token is None:
+                    return registered_models
+
+        for max_results in [1, 2, 3]:
+            self.assertEqual([rmd.name for rmd in list_all(max_results)],
+                             ["churn", "fraud-detection", "fraud-scoring"])
+        registered_models = list_all(2, ["creation_timestamp DESC"])
+        self.assertEqual([rmd.name for rmd in registered_models],
+                         ["churn", "fraud-scoring", "fraud-detection"])
+        self.assertEqual([self._extract_latest_by_stage(rmd.latest_versions)
+                          for rmd in registered_models],
+                         [{"None": 3}, {"None": 3, "Production": 2}, {"None": 3}])
+        self.assertIsNone(self.store.list_registered_models().token)
+
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.list_registered_models(max_results=1001)
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.list_registered_models(order_by=["version"])
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def _get_events(self, since=0, max_results=1000):
+        return [(event.sequence, event.event_type, event.name, event.version, event.stage,
+                 event.previous_name)
+                for event in self.store.get_registry_events(since, max_results=max_results)]
+
+    def test_get_registry_events(self):
+        page = self.store.get_registry_events()
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.token, 0)
+
+        rm = self._rm_maker("model_1")
+        rm = self.store.update_registered_model(rm, new_name="model_2", description="desc")
+        mv1 = self._mv_maker("model_2")
+        mv2 = self._mv_maker("model_2")
+        self.store.update_model_version(mv1, stage="production", description="best")
+        self.store.update_model_version(mv2, description="other")
+        self.store.delete_model_version(mv2)
+        self.store.delete_registered_model(rm)
+        self.assertEqual(self._get_events(), [
+            (1, "CREATE_REGISTERED_MODEL", "model_1", None, None, None),
+            (2, "RENAME_REGISTERED_MODEL", "model_2", None, None, "model_1"),
+            (3, "UPDATE_REGISTERED_MODEL", "model_2", None, None, None),
+            (4, "CREATE_MODEL_VERSION", "model_2", 1, None, None),
+            (5, "CREATE_MODEL_VERSION", "model_2", 2, None, None),
+            (6, "TRANSITION_MODEL_VERSION_STAGE", "model_2", 1, "Production", None),
+            (7, "UPDATE_MODEL_VERSION", "model_2", 1, None, None),
+            (8, "UPDATE_MODEL_VERSION", "model_2", 2, None, None),
+            (9, "DELETE_MODEL_VERSION", "model_2", 2, None, None),
+            (10, "DELETE_REGISTERED_MODEL", "model_2", None, None, None),
+        ])
+        for event in self.store.get_registry_events():
+            self.assertGreater(event.timestamp, 0)
+
+        page = self.store.get_registry_events(since=3, max_results=2)
+        self.assertEqual([event.sequence for event in page], [4, 5])
+        self.assertEqual(page.token, 5)
+        page = self.store.get_registry_events(since=8)
+        self.assertEqual([event.sequence for event in page], [9, 10])
+        self.assertEqual(page.token, 10)
+        page = self.store.get_registry_events(since=10)
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.token, 10)
+
+        # max_results=0 returns the sequence number of the last event, to start following changes
+        page = self.store.get_registry_events(max_results=0)
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.token, 10)
+
+        for kwargs in [{"since": -1}, {"max_results": -1}, {"max_results": 1001},
+                       {"timeout_seconds": -1}, {"timeout_seconds": 21}]:
+            with self.assertRaises(MlflowException) as exception_context:
+                self.store.get_registry_events(**kwargs)
+            assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_get_registry_events_failed_changes_do_not_record_events(self):
+        self._rm_maker("model")
+        with self.assertRaises(MlflowException):
+            self._rm_maker("model")
+        self._mv_maker("model")
+        self.assertEqual([event.sequence for event in self.store.get_registry_events()], [1, 2])
+
+    @mock.patch("mlflow.store.model_registry.sqlalchemy_store."
+                "REGISTRY_EVENTS_POLL_INTERVAL_SECONDS", 0.05)
+    def test_get_registry_events_long_polling(self):
+        self._rm_maker("model")
+
+        # Without new events, the request returns no events after the timeout
+        page = self.store.get_registry_events(since=1, timeout_seconds=1)
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.token, 1)
+
+        # The request returns as soon as an event is recorded
+        timer = threading.Timer(0.2, self._mv_maker, args=["model"])
+        timer.start()
+        try:
+            page = self.store.get_registry_events(since=1, timeout_seconds=20)
+        finally:
+            timer.join()
+        self.assertEqual([(event.sequence, event.event_type) for event in page],
+                         [(2, "CREATE_MODEL_VERSION")])
+        self.assertEqual(page.token, 2)
+
+        # Requests for events already recorded return immediately
+        page = self.store.get_registry_events(since=0, timeout_seconds=20)
+        self.assertEqual([event.sequence for event in page], [1, 2])
+
+    def test_get_registry_events_of_concurrent_changes_are_consecutive(self):
+        self._rm_maker("model")
+        errors = []
+
+        def create_versions():
+            try:
+                for _ in range(5):
+                    self._mv_maker("model")
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=create_versions) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        events = list(self.store.get_registry_events())
+        self.assertEqual([event.sequence for event in events], list(range(1, 22)))
+        self.assertEqual(sorted(event.version for event in events[1:]), list(range(1, 21)))
+
+    def test_get_registry_events_of_concurrent_changes_to_different_models(self):
+        names = ["model_%d" % i for i in range(4)]
+        errors = []
+
+        def change_model(name):
+            try:
+                self._rm_maker(name)
+                for _ in range(5):
+                    self._mv_maker(name)
+                self.store.update_model_version(ModelVersion(RegisteredModel(name), 1),
+                                                stage="Production")
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=change_model, args=[name]) for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        events = list(self.store.get_registry_events())
+        self.assertEqual([event.sequence for event in events], list(range(1, 29)))
+        # The events of each model are in the order of its changes
+        for name in names:
+            self.assertEqual([(event.event_type, event.version) for event in events
+                              if event.name == name],
+                             [("CREATE_REGISTERED_MODEL", None)] +
+                             [("CREATE_MODEL_VERSION", version) for version in range(1, 6)] +
+                             [("TRANSITION_MODEL_VERSION_STAGE", 1)])
+
+    def test_get_registry_events_numbers_events_left_unnumbered_after_the_next_change(self):
+        self._rm_maker("model")
+        # Events of a committed change that could not be numbered, e.g. because the server stopped
+        with mock.patch.object(SqlAlchemyStore, "_get_last_event_sequence",
+                               side_effect=Exception("Connection lost")):
+            self._mv_maker("model")
+        page = self.store.get_registry_events()
+        self.assertEqual([event.sequence for event in page], [1])
+        self.assertEqual(page.token, 1)
+        self._mv_maker("model")
+        self.assertEqual(self._get_events(), [
+            (1, "CREATE_REGISTERED_MODEL", "model", None, None, None),
+            (2, "CREATE_MODEL_VERSION", "model", 1, None, None),
+            (3, "CREATE_MODEL_VERSION", "model", 2, None, None),
+        ])
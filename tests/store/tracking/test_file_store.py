@@ -319,6 +319,27 @@ class TestFileStore(unittest.TestCase):
             for run_id in runs:
                 self._verify_run(fs, run_id)
 
+    def test_get_runs(self):
+        fs = FileStore(self.test_root)
+        run_ids = [run_id for exp_id in self.experiments
+                   for run_id in self.exp_data[exp_id]["runs"]]
+        run_ids.reverse()
+        runs = fs.get_runs(run_ids)
+        assert [run.info.run_id for run in runs] == run_ids
+        for run in runs:
+            expected_run = fs.get_run(run.info.run_id)
+            assert run.info == expected_run.info
+            assert run.data.to_dictionary() == expected_run.data.to_dictionary()
+        assert fs.get_runs([]) == []
+        assert [run.info.run_id for run in fs.get_runs(run_ids[:1])] == run_ids[:1]
+
+    def test_get_runs_with_missing_run_raises(self):
+        fs = FileStore(self.test_root)
+        run_id = self.exp_data[FileStore.DEFAULT_EXPERIMENT_ID]["runs"][0]
+        with pytest.raises(MlflowException) as e:
+            fs.get_runs([run_id, uuid.uuid4().hex])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     def test_get_run_int_experiment_id_backcompat(self):
         fs = FileStore(self.test_root)
         exp_id = FileStore.DEFAULT_EXPERIMENT_ID
@@ -1,4 +1,6 @@
+import io
 import json
+import tarfile
 import unittest
 
 import mock
@@ -7,11 +9,11 @@ import six
 
 import mlflow
 from mlflow.entities import Param, Metric, RunTag, SourceType, ViewType, ExperimentTag, Experiment,\
-    LifecycleStage
+    LifecycleStage, Run, RunInfo, RunData
 from mlflow.exceptions import MlflowException
 from mlflow.protos.service_pb2 import CreateRun, DeleteExperiment, DeleteRun, LogBatch, \
     LogMetric, LogParam, RestoreExperiment, RestoreRun, RunTag as ProtoRunTag, SearchRuns, \
-    SetTag, DeleteTag, SetExperimentTag, GetExperimentByName, ListExperiments
+    SetTag, DeleteTag, SetExperimentTag, GetExperimentByName, ListExperiments, GetRuns
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ENDPOINT_NOT_FOUND,\
     REQUEST_LIMIT_EXCEEDED, INTERNAL_ERROR, ErrorCode
 from mlflow.store.tracking.rest_store import RestStore, DatabricksRestStore
@@ -249,6 +251,64 @@ class TestRestStore(object):
                                   message_to_json(expected_message))
             assert result.token == "67890fghij"
 
+    def test_get_runs(self):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        runs = [Run(RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                            status="RUNNING", start_time=1, end_time=None,
+                            lifecycle_stage=LifecycleStage.ACTIVE),
+                    RunData(metrics=[Metric("m", 1.0, 1, 0)]))
+                for run_id in ["b", "a"]]
+        with mock.patch('mlflow.utils.rest_utils.http_request') as mock_http:
+            response = mock.MagicMock
+            response.status_code = 200
+            response.text = json.dumps({
+                "runs": [json.loads(message_to_json(run.to_proto())) for run in runs]})
+            mock_http.return_value = response
+            result = store.get_runs(["b", "a"])
+            self._verify_requests(mock_http, creds,
+                                  "runs/get-batch", "POST",
+                                  message_to_json(GetRuns(run_ids=["b", "a"])))
+            assert mock_http.call_count == 1
+            assert [run.info.run_id for run in result] == ["b", "a"]
+            assert [run.data.metrics for run in result] == [{"m": 1.0}, {"m": 1.0}]
+
+    def test_download_artifact_bundle(self, tmpdir):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            info = tarfile.TarInfo("model/MLmodel")
+            info.size = 11
+            tar.addfile(info, io.BytesIO(b"flavors: {}"))
+        archive.seek(0)
+        response = mock.Mock(status_code=200, raw=archive)
+        with mock.patch('mlflow.store.tracking.rest_store.http_request',
+                        return_value=response) as mock_http:
+            local_path = store.download_artifact_bundle("run-id", "model", tmpdir.strpath,
+                                                        compression="gzip")
+        mock_http.assert_called_once_with(
+            creds, "/get-artifact-bundle", method="GET", stream=True,
+            params={"run_id": "run-id", "path": "model", "compression": "gzip"})
+        response.close.assert_called_once()
+        assert local_path == tmpdir.join("model").strpath
+        assert tmpdir.join("model", "MLmodel").read() == "flavors: {}"
+
+        # Servers predating artifact bundles respond with the HTML page of unknown routes
+        response = mock.Mock(status_code=404, text="<html>Not Found</html>")
+        with mock.patch('mlflow.store.tracking.rest_store.http_request', return_value=response):
+            with pytest.raises(MlflowException) as exc_info:
+                store.download_artifact_bundle("run-id", None, tmpdir.strpath)
+        assert exc_info.value.error_code == ErrorCode.Name(ENDPOINT_NOT_FOUND)
+        response.close.assert_called_once()
+
+        response = mock.Mock(status_code=404, text=json.dumps(
+            {"error_code": "RESOURCE_DOES_NOT_EXIST", "message": "No such artifact file"}))
+        with mock.patch('mlflow.store.tracking.rest_store.http_request', return_value=response):
+            with pytest.raises(MlflowException) as exc_info:
+                store.download_artifact_bundle("run-id", "missing", tmpdir.strpath)
+        assert exc_info.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     @pytest.mark.parametrize("store_class", [RestStore, DatabricksRestStore])
     def test_get_experiment_by_name(self, store_class):
         creds = MlflowHostCreds('https://hello')
@@ -407,6 +407,40 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         exp = self.store.get_experiment(run.info.experiment_id)
         exp.to_proto()
 
+    def test_get_runs(self):
+        exp_id = self._experiment_factory('test_get_runs')
+        runs = [self._run_factory(self._get_run_configs(exp_id)) for _ in range(3)]
+        for i, run in enumerate(runs):
+            run_id = run.info.run_id
+            self.store.log_metric(run_id, entities.Metric("m", i, 0, 0))
+            self.store.log_param(run_id, Param("p", str(i)))
+            self.store.set_tag(run_id, RunTag("t", str(i)))
+        self.store.delete_run(runs[1].info.run_id)
+
+        run_ids = [runs[2].info.run_id, runs[0].info.run_id, runs[1].info.run_id]
+        fetched_runs = self.store.get_runs(run_ids)
+        assert [run.info.run_id for run in fetched_runs] == run_ids
+        for run_id, fetched_run in zip(run_ids, fetched_runs):
+            expected_run = self.store.get_run(run_id)
+            assert fetched_run.info == expected_run.info
+            assert fetched_run.data.to_dictionary() == expected_run.data.to_dictionary()
+        assert self.store.get_runs([]) == []
+
+    def test_get_runs_uses_batched_in_clause(self):
+        exp_id = self._experiment_factory('test_get_runs_batches')
+        run_ids = [self._run_factory(self._get_run_configs(exp_id)).info.run_id for _ in range(5)]
+        with mock.patch("mlflow.store.tracking.sqlalchemy_store._GET_RUNS_BATCH_SIZE", 2):
+            fetched_runs = self.store.get_runs(run_ids)
+        assert [run.info.run_id for run in fetched_runs] == run_ids
+
+    def test_get_runs_with_missing_run_raises(self):
+        run_id = self._run_factory().info.run_id
+        missing_run_id = uuid.uuid4().hex
+        with pytest.raises(MlflowException) as e:
+            self.store.get_runs([run_id, missing_run_id])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+        assert missing_run_id in e.value.message
+
     def test_delete_run(self):
         run = self._run_factory()
 
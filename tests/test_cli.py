@@ -37,6 +37,26 @@ def test_server_default_artifact_root_validation():
         run_server_mock.assert_not_called()
 
 
+def test_server_asgi_mode():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server, ["--asgi", "--asgi-max-threads", "8"])
+        args, _ = run_server_mock.call_args
+        assert args[10:12] == (True, 8)
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--asgi", "--gunicorn-opts", "--log-level debug"])
+        assert isinstance(result.exception, NotImplementedError)
+        run_server_mock.assert_not_called()
+
+
+def test_server_rate_limits():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server, ["--rate-limit", "2.5", "--rate-limit-burst", "10",
+                                    "--max-concurrent-expensive-requests", "4",
+                                    "--rate-limit-trust-auth", "--max-concurrent-long-polls", "0"])
+        args, _ = run_server_mock.call_args
+        assert args[-5:] == (2.5, 10, 4, True, 0)
+
+
 @pytest.mark.parametrize("command", [server, ui])
 def test_tracking_uri_validation_failure(command):
     handlers._tracking_store = None
@@ -7,8 +7,9 @@ import pytest
 import mock
 
 from mlflow.entities.model_registry import ModelVersion, ModelVersionDetailed, RegisteredModel, \
-    RegisteredModelDetailed
+    RegisteredModelDetailed, RegistryEvent
 from mlflow.exceptions import MlflowException
+from mlflow.store.entities.paged_list import PagedList
 from mlflow.tracking._model_registry.client import ModelRegistryClient
 
 
@@ -81,9 +82,15 @@ def test_list_registered_models(mock_store):
         RegisteredModel("Model 2")
     ]
     result = newModelRegistryClient().list_registered_models()
-    mock_store.list_registered_models.assert_called_once()
+    mock_store.list_registered_models.assert_called_once_with(max_results=None, order_by=None,
+                                                              page_token=None)
     assert len(result) == 2
 
+    newModelRegistryClient().list_registered_models(max_results=10, order_by=["name DESC"],
+                                                    page_token="token")
+    mock_store.list_registered_models.assert_called_with(max_results=10, order_by=["name DESC"],
+                                                         page_token="token")
+
 
 def test_get_registered_model_details(mock_store):
     mock_store.get_registered_model_details.return_value = RegisteredModelDetailed(
@@ -128,6 +135,13 @@ def test_update_model_version(mock_store):
     mock_store.update_model_version.assert_called_once_with(ANY, "stageX", "new description")
 
 
+def test_update_model_version_invalidates_model_uri_cache(mock_store):
+    with mock.patch("mlflow.tracking._model_registry.client.invalidate_model_uri_cache") \
+            as invalidate_mock:
+        newModelRegistryClient().update_model_version("Model 1", 12, "Production")
+        invalidate_mock.assert_called_once_with("Model 1")
+
+
 def test_update_model_version_validation_errors(mock_store):
     with pytest.raises(MlflowException):
         newModelRegistryClient().update_model_version("Model 1", 12)
@@ -164,9 +178,28 @@ def test_search_model_versions(mock_store):
         ModelVersion(RegisteredModel("Model 1"), 2)
     ]
     result = newModelRegistryClient().search_model_versions("name=Model 1")
-    mock_store.search_model_versions.assert_called_once_with("name=Model 1")
+    mock_store.search_model_versions.assert_called_once_with(
+        "name=Model 1", max_results=None, order_by=None, page_token=None)
     assert len(result) == 2
 
+    newModelRegistryClient().search_model_versions("name=Model 1", max_results=10,
+                                                   order_by=["version DESC"], page_token="token")
+    mock_store.search_model_versions.assert_called_with(
+        "name=Model 1", max_results=10, order_by=["version DESC"], page_token="token")
+
+
+def test_get_registry_events(mock_store):
+    mock_store.get_registry_events.return_value = PagedList(
+        [RegistryEvent(8, 1234, "CREATE_MODEL_VERSION", "Model 1", version=3)], 8)
+    result = newModelRegistryClient().get_registry_events(since=7)
+    mock_store.get_registry_events.assert_called_once_with(since=7, max_results=100,
+                                                           timeout_seconds=0)
+    assert [event.sequence for event in result] == [8]
+    assert result.token == 8
+
+    newModelRegistryClient().get_registry_events(since=8, max_results=0, timeout_seconds=10)
+    mock_store.get_registry_events.assert_called_with(since=8, max_results=0, timeout_seconds=10)
+
 
 def test_get_model_version_stages(mock_store):
     mock_store.get_model_version_stages.return_value = ["Stage A", "Stage B"]
@@ -1,6 +1,12 @@
 import os
+import uuid
+
+import mock
 
 import mlflow
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND
+from mlflow.store.tracking.rest_store import RestStore
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 
 
@@ -45,3 +51,18 @@ def test_download_artifact_from_absolute_uri_persists_data_to_specified_output_d
     with open(os.path.join(
             artifact_output_path, logged_artifact_subdir, artifact_file_name), "r") as f:
         assert f.read() == artifact_text
+
+
+def test_download_artifact_from_runs_uri_falls_back_if_server_does_not_serve_bundles(tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.mkdir("dir").join("artifact.txt").write("Sample artifact text")
+    run_id = uuid.uuid4().hex
+    store = mock.Mock(spec=RestStore)
+    store.get_run.return_value.info.artifact_uri = artifact_dir.strpath
+    store.download_artifact_bundle.side_effect = MlflowException(
+        "The tracking server does not serve artifact bundles", ENDPOINT_NOT_FOUND)
+    with mock.patch("mlflow.tracking.artifact_utils._get_store", return_value=store):
+        local_path = _download_artifact_from_uri("runs:/%s/dir" % run_id)
+    store.download_artifact_bundle.assert_called_once()
+    with open(os.path.join(local_path, "artifact.txt")) as f:
+        assert f.read() == "Sample artifact text"
@@ -229,11 +229,59 @@ def test_create_and_query_model_version_flow(mlflow_client, backend_store_uri):
     mv3 = mlflow_client.create_model_version(name, "another_path/to/model", "run_id_2")
     assert mv3.version == 3
     assert [mvd1] == mlflow_client.search_model_versions("source_path = 'path/to/model'")
-    assert [mvd1, mvd2] == mlflow_client.search_model_versions("run_id = 'run_id_1'")
+    # Versions of a model are returned from the newest by default
+    assert [mvd2, mvd1] == mlflow_client.search_model_versions("run_id = 'run_id_1'")
 
     assert "path/to/model" == mlflow_client.get_model_version_download_uri(name, 1)
 
 
+def test_search_model_versions_and_list_registered_models_in_pages(mlflow_client,
+                                                                   backend_store_uri):
+    names = ["PagedSearchTest%d" % i for i in range(3)]
+    for name in names:
+        mlflow_client.create_registered_model(name)
+        for _ in range(3):
+            mlflow_client.create_model_version(name, "path/to/model", "run_id_paged")
+    mlflow_client.update_model_version(names[1], 2, stage="Production")
+
+    def search_all(filter_string, **kwargs):
+        versions = []
+        page_token = None
+        while True:
+            page = mlflow_client.search_model_versions(filter_string, max_results=4,
+                                                       page_token=page_token, **kwargs)
+            versions.extend((mv.registered_model.name, mv.version) for mv in page)
+            page_token = page.token
+            if page_token is None:
+                return versions
+
+    assert search_all("name LIKE 'PagedSearchTest%' AND version >= 2", order_by=["name DESC"]) == \
+        [(name, version) for name in reversed(names) for version in [3, 2]]
+    # Without max_results, all the versions are returned, which the REST store requests in pages
+    with mock.patch("mlflow.store.model_registry.rest_store."
+                    "SEARCH_MODEL_VERSIONS_MAX_RESULTS_THRESHOLD", 2):
+        page = mlflow_client.search_model_versions("name LIKE 'PagedSearchTest%'")
+    assert [(mv.registered_model.name, mv.version) for mv in page] == \
+        [(name, version) for name in names for version in [3, 2, 1]]
+    assert page.token is None
+    assert search_all("current_stage = 'production' AND run_id IN ('run_id_paged', 'other')") == \
+        [(names[1], 2)]
+
+    listed_models = []
+    page_token = None
+    while True:
+        page = mlflow_client.list_registered_models(max_results=2, page_token=page_token)
+        listed_models.extend(page)
+        page_token = page.token
+        if page_token is None:
+            break
+    assert [rm.name for rm in listed_models] == \
+        sorted(rm.name for rm in mlflow_client.list_registered_models())
+    # The latest versions of the models of each page are returned with them
+    assert [set((mv.current_stage, mv.version) for mv in rm.latest_versions)
+            for rm in listed_models if rm.name == names[1]] == [{("None", 3), ("Production", 2)}]
+
+
 def test_update_model_version_flow(mlflow_client, backend_store_uri):
     name = 'UpdateMVTest'
     start_time_0 = now()
@@ -322,6 +322,23 @@ def test_log_batch(mlflow_client, backend_store_uri):
     assert metric.step == 3
 
 
+def test_get_runs(mlflow_client, backend_store_uri):
+    experiment_id = mlflow_client.create_experiment('Get many runs')
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(3)]
+    for i, run_id in enumerate(run_ids):
+        mlflow_client.log_metric(run_id, "metric", i)
+        mlflow_client.log_param(run_id, "param", str(i))
+    requested_run_ids = [run_ids[1], run_ids[2], run_ids[0]]
+    runs = mlflow_client.get_runs(requested_run_ids)
+    assert [run.info.run_id for run in runs] == requested_run_ids
+    for run in runs:
+        expected_run = mlflow_client.get_run(run.info.run_id)
+        assert run.data.metrics == expected_run.data.metrics
+        assert run.data.params == expected_run.data.params
+    with pytest.raises(MlflowException):
+        mlflow_client.get_runs([run_ids[0], "not-a-real-run"])
+
+
 def test_set_terminated_defaults(mlflow_client):
     experiment_id = mlflow_client.create_experiment('Terminator 1')
     created_run = mlflow_client.create_run(experiment_id)
@@ -376,6 +393,34 @@ def test_artifacts(mlflow_client):
     assert open('%s/my.file' % dir_artifacts, 'r').read() == 'Hello, World!'
 
 
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_download_artifacts_as_bundle(mlflow_client, tracking_server_uri, tmpdir, compression):
+    from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+    experiment_id = mlflow_client.create_experiment('Bundled artifacts %s' % compression)
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    src_dir = tmpdir.mkdir("src")
+    src_dir.mkdir("data").join("weights.bin").write(b"\x00\x01" * 1000, mode="wb")
+    src_dir.join("MLmodel").write("flavors: {}")
+    mlflow_client.log_artifacts(run_id, src_dir.strpath, "model")
+
+    with mock.patch.dict(os.environ, {"MLFLOW_TRACKING_URI": tracking_server_uri,
+                                      "MLFLOW_ARTIFACT_BUNDLE_COMPRESSION": compression}), \
+            mock.patch("mlflow.tracking.artifact_utils.get_artifact_repository") as get_repo:
+        model_path = _download_artifact_from_uri("runs:/%s/model" % run_id)
+        output_path = tmpdir.mkdir("output").strpath
+        file_path = _download_artifact_from_uri("runs:/%s/model/MLmodel" % run_id, output_path)
+    get_repo.assert_not_called()
+    assert open(os.path.join(model_path, "data", "weights.bin"), "rb").read() == \
+        b"\x00\x01" * 1000
+    assert open(os.path.join(model_path, "MLmodel")).read() == "flavors: {}"
+    assert file_path == os.path.join(output_path, "MLmodel")
+    assert open(file_path).read() == "flavors: {}"
+
+    with mock.patch.dict(os.environ, {"MLFLOW_TRACKING_URI": tracking_server_uri}):
+        with pytest.raises(MlflowException, match="No such artifact file"):
+            _download_artifact_from_uri("runs:/%s/missing" % run_id)
+
+
 def test_search_pagination(mlflow_client, backend_store_uri):
     experiment_id = mlflow_client.create_experiment('search_pagination')
     runs = [mlflow_client.create_run(experiment_id, start_time=1).info.run_id for _ in range(0, 10)]
@@ -487,6 +487,21 @@ def test_log_artifact(tracking_uri_mock):
         assert len(dir_comparison.funny_files) == 0
 
 
+def test_log_artifacts_with_sync(tracking_uri_mock, tmpdir):
+    checkpoint_dir = tmpdir.mkdir("checkpoint")
+    checkpoint_dir.join("weights.bin").write("1")
+    with start_run():
+        run_artifact_dir = local_file_uri_to_path(mlflow.get_artifact_uri())
+        mlflow.log_artifacts(str(checkpoint_dir), "checkpoint", sync=True)
+        checkpoint_dir.join("weights.bin").write("2")
+        checkpoint_dir.join("step.txt").write("2")
+        mlflow.log_artifacts(str(checkpoint_dir), "checkpoint", sync=True)
+    dir_comparison = filecmp.dircmp(str(checkpoint_dir),
+                                    os.path.join(run_artifact_dir, "checkpoint"))
+    assert dir_comparison.left_only == dir_comparison.right_only == []
+    assert dir_comparison.diff_files == []
+
+
 def test_with_startrun():
     run_id = None
     t0 = int(time.time() * 1000)
@@ -1,10 +1,15 @@
 import json
 
-from mlflow.entities import Experiment, Metric
+import pytest
+
+from mlflow.entities import Experiment, Metric, Param, Run, RunData, RunInfo, RunTag, \
+    RunStatus, LifecycleStage
 from mlflow.protos.service_pb2 import Experiment as ProtoExperiment
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
+from mlflow.protos.service_pb2 import Run as ProtoRun
 
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict, _stringify_all_experiment_ids
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict, \
+    _stringify_all_experiment_ids, dict_to_json
 
 
 def test_message_to_json():
@@ -62,3 +67,64 @@ def test_back_compat():
                            "more_things": {"experiment_id": "7",
                                            "experiment_ids": ["2", "3", "4", "5"]}}}
     assert exp_json == in_json
+
+
+def _run_info(end_time=None, artifact_uri=None):
+    return RunInfo(run_uuid="run-id", run_id="run-id", experiment_id="0", user_id="us\u00e9r",
+                   status=RunStatus.to_string(RunStatus.RUNNING), start_time=1574000000000,
+                   end_time=end_time, lifecycle_stage=LifecycleStage.ACTIVE,
+                   artifact_uri=artifact_uri)
+
+
+@pytest.mark.parametrize("metric", [
+    Metric("acc", 0.1, 123, 0),
+    Metric("acc", 3, 123, 7),
+    Metric("acc", -2.5e-300, 0, -1),
+    Metric("acc", 1e300, 2 ** 62, 2 ** 40),
+    Metric("acc", float("nan"), 1, 1),
+    Metric("acc", float("inf"), 1, 1),
+    Metric("acc", float("-inf"), 1, 1),
+    Metric("\u00fcnicode \"quoted\" \\ key", 1.0, 1, 1),
+])
+def test_metric_json_dict_matches_message_to_json(metric):
+    assert dict_to_json(metric._to_json_dict()) == \
+        json.dumps(json.loads(message_to_json(metric.to_proto())), separators=(",", ":"))
+
+
+@pytest.mark.parametrize("run_info", [
+    _run_info(),
+    _run_info(end_time=1574000001000, artifact_uri="s3://bucket/path"),
+    _run_info(end_time=0, artifact_uri=""),
+])
+def test_run_info_json_dict_matches_message_to_json(run_info):
+    assert dict_to_json(run_info._to_json_dict()) == \
+        json.dumps(json.loads(message_to_json(run_info.to_proto())), separators=(",", ":"))
+
+
+def test_json_dicts_omit_unset_fields():
+    run_info = _run_info()
+    run_info._lifecycle_stage = None
+    proto = _run_info().to_proto()
+    proto.ClearField("lifecycle_stage")
+    assert dict_to_json(run_info._to_json_dict()) == \
+        json.dumps(json.loads(message_to_json(proto)), separators=(",", ":"))
+    assert Metric("acc", 0.5, None, None)._to_json_dict() == {"key": "acc", "value": 0.5}
+
+
+@pytest.mark.parametrize("run_data", [
+    None,
+    RunData(),
+    RunData(metrics=[Metric("m", 1.5, 1, 0), Metric("m", float("nan"), 2, 1)]),
+    RunData(metrics=[Metric("m", 1.5, 1, 0)],
+            params=[Param("p", "v"), Param("p\u00e9", "\u00fc")],
+            tags=[RunTag("mlflow.user", "me"), RunTag("t", "")]),
+])
+def test_run_json_dict_matches_message_to_json(run_data):
+    run = Run(_run_info(end_time=1574000001000, artifact_uri="file:///tmp"), run_data)
+    fast_json = dict_to_json(run._to_json_dict())
+    # Key order is preserved as well, so the only difference from the proto path is whitespace
+    assert fast_json == json.dumps(json.loads(message_to_json(run.to_proto())),
+                                   separators=(",", ":"))
+    parsed = ProtoRun()
+    parse_dict(json.loads(fast_json), parsed)
+    assert parsed.SerializeToString() == run.to_proto().SerializeToString()
@@ -5,7 +5,7 @@ import numpy
 import pytest
 
 from mlflow.utils.rest_utils import http_request, http_request_safe,\
-    MlflowHostCreds, _DEFAULT_HEADERS
+    MlflowHostCreds, _DEFAULT_HEADERS, get_request_session
 from mlflow.pyfunc.scoring_server import NumpyEncoder
 from mlflow.exceptions import MlflowException, RestException
 
@@ -139,6 +139,26 @@ def test_http_request_wrapper(request):
         http_request_safe(host_only, '/my/endpoint')
 
 
+def test_http_request_with_session():
+    session = get_request_session(4)
+    assert get_request_session(4) is session
+    assert get_request_session(5) is not session
+    assert session.get_adapter("https://my-host")._pool_maxsize == 4
+
+    response = mock.MagicMock()
+    response.status_code = 200
+    with mock.patch.object(session, "request", return_value=response) as request, \
+            mock.patch("requests.request") as default_request:
+        assert http_request(MlflowHostCreds("http://my-host"), '/my/endpoint', session=session) \
+            is response
+    request.assert_called_once_with(
+        url='http://my-host/my/endpoint',
+        verify=True,
+        headers=_DEFAULT_HEADERS,
+    )
+    default_request.assert_not_called()
+
+
 def test_numpy_encoder():
     test_number = numpy.int64(42)
     ne = NumpyEncoder()
@@ -387,3 +387,65 @@ def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException) as e:
         SearchUtils.paginate([], page_token, 1)
     assert error_message in e.value.message
+
+
+@pytest.mark.parametrize("filter_string, parsed_filter", [
+    ("name = 'model'", [{"key": "name", "comparator": "=", "value": "model"}]),
+    ("name like 'fraud-%' AND current_stage != 'None'",
+     [{"key": "name", "comparator": "LIKE", "value": "fraud-%"},
+      {"key": "current_stage", "comparator": "!=", "value": "None"}]),
+    ("source_path ILIKE 's3://%' and version >= 3",
+     [{"key": "source_path", "comparator": "ILIKE", "value": "s3://%"},
+      {"key": "version", "comparator": ">=", "value": 3}]),
+    ("run_id IN ('a1b2', 'c3d4') AND run_id in ('e5')",
+     [{"key": "run_id", "comparator": "IN", "value": ["a1b2", "c3d4"]},
+      {"key": "run_id", "comparator": "IN", "value": ["e5"]}]),
+    ("creation_timestamp > 1000 AND creation_timestamp <= 2000 AND version IN (1, 2)",
+     [{"key": "creation_timestamp", "comparator": ">", "value": 1000},
+      {"key": "creation_timestamp", "comparator": "<=", "value": 2000},
+      {"key": "version", "comparator": "IN", "value": [1, 2]}]),
+    ("", []),
+])
+def test_parse_filter_for_model_registry(filter_string, parsed_filter):
+    assert SearchUtils.parse_filter_for_model_registry(filter_string) == parsed_filter
+
+
+@pytest.mark.parametrize("filter_string, error_message", [
+    ("name = 'a' OR name = 'b'", "Invalid clause(s) in filter string: 'OR'"),
+    ("tag.key = 'value'", "Invalid attribute key 'tag.key'"),
+    ("name > 'a'", "Invalid comparator '>' for 'name'"),
+    ("version LIKE '1%'", "Invalid comparator 'LIKE' for 'version'"),
+    ("name NOT LIKE 'a%'", "Invalid comparator 'NOT LIKE' for 'name'"),
+    ("name = model", "Expected a quoted string value for 'name'"),
+    ("version = '1'", "Expected an integer value for 'version'"),
+    ("run_id IN 'a1b2'", "Expected a list of values in parentheses"),
+    ("run_id IN ('a1b2' 'c3d4')", "Invalid token ''c3d4'' in the list of values"),
+    ("name = 'a' AND", "expected a key at the end of the filter"),
+    ("run_id IN ('a1b2'", "expected ',' or ')' at the end of the filter"),
+])
+def test_parse_filter_for_model_registry_fails_on_invalid_filters(filter_string, error_message):
+    with pytest.raises(MlflowException) as e:
+        SearchUtils.parse_filter_for_model_registry(filter_string)
+    assert error_message in e.value.message
+
+
+@pytest.mark.parametrize("order_by, parsed_order_by", [
+    ("name", ("name", True)),
+    ("version DESC", ("version", False)),
+    ("creation_timestamp asc", ("creation_timestamp", True)),
+])
+def test_parse_order_by_for_model_registry(order_by, parsed_order_by):
+    assert SearchUtils.parse_order_by_for_model_registry(
+        order_by, SearchUtils.VALID_ORDER_BY_KEYS_FOR_MODEL_VERSIONS) == parsed_order_by
+
+
+@pytest.mark.parametrize("order_by, error_message", [
+    ("", "Invalid order_by clause ''"),
+    ("name DESC version", "Invalid order_by clause 'name DESC version'"),
+    ("run_id", "Invalid order_by key 'run_id'"),
+])
+def test_parse_order_by_for_model_registry_fails_on_invalid_clauses(order_by, error_message):
+    with pytest.raises(MlflowException) as e:
+        SearchUtils.parse_order_by_for_model_registry(
+            order_by, SearchUtils.VALID_ORDER_BY_KEYS_FOR_MODEL_VERSIONS)
+    assert error_message in e.value.message